@@ -1,6 +1,15 @@
 """Boomi API client layer — Platform API and DataHub MDM API wrappers."""
+from setup.api.async_client import AsyncBoomiClient, AsyncDataHubApi, AsyncPlatformApi
 from setup.api.client import BoomiApiError, BoomiClient
 from setup.api.datahub_api import DataHubApi
 from setup.api.platform_api import PlatformApi
 
-__all__ = ["BoomiApiError", "BoomiClient", "DataHubApi", "PlatformApi"]
+__all__ = [
+    "AsyncBoomiClient",
+    "AsyncDataHubApi",
+    "AsyncPlatformApi",
+    "BoomiApiError",
+    "BoomiClient",
+    "DataHubApi",
+    "PlatformApi",
+]
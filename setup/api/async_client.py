@@ -0,0 +1,462 @@
+"""Asyncio client for Boomi Platform and DataHub APIs.
+
+``AsyncBoomiClient`` mirrors ``BoomiClient`` (same get/post/put/delete
+signatures, 401 short-circuit, retry policy, BOM stripping) with
+awaitable methods.  ``requests`` is blocking, so each HTTP exchange, with
+its admission (window slot, then rate token), runs on a small thread pool;
+retry backoff and poll intervals are ``asyncio.sleep`` calls, so hundreds
+of pending calls or polls cost coroutines rather than threads.
+
+``AsyncPlatformApi`` and ``AsyncDataHubApi`` put the existing API wrappers
+on top of an ``AsyncBoomiClient``: every API method becomes awaitable, and
+the poll loops are native coroutines.
+"""
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+import logging
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
+
+import requests
+
+from setup.api.client import BoomiApiError, BoomiClient
+from setup.api.datahub_api import DataHubApi
+from setup.api.platform_api import PlatformApi
+from setup.api.polling import (
+    DEFAULT_BACKOFF, DEFAULT_MAX_INTERVAL, PollOp, default_deadline, apoll, apoll_many,
+)
+from setup.api.rate_limit import HostRateLimiter
+from setup.config import BoomiConfig
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """An in-flight coalesced GET."""
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.shared = False
+
+
+class AsyncBoomiClient:
+    """Awaitable counterpart of ``BoomiClient``.
+
+    Wraps a ``BoomiClient`` and shares its session, credentials and rate
+    limiter, so sync and async callers draw from the same per-host budget.
+    ``pool_size`` bounds how many HTTP exchanges are in flight at once.
+    """
+
+    def __init__(
+        self,
+        user: str,
+        token: str,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        pool_size: Optional[int] = None,
+    ) -> None:
+        client = BoomiClient(
+            user, token, rate=rate, burst=burst, rate_limiter=rate_limiter,
+            pool_size=pool_size,
+        )
+        self._init_from(client)
+
+    def _init_from(self, client: BoomiClient) -> None:
+        self._client = client
+        self._http_executor: Optional[ThreadPoolExecutor] = None
+        # Single flight for GETs (see BoomiClient.get); lives on the event loop
+        self._inflight: dict[tuple, _Flight] = {}
+
+    @classmethod
+    def from_client(cls, client: BoomiClient) -> AsyncBoomiClient:
+        """Wrap an existing ``BoomiClient`` (shares its session and limiter)."""
+        instance = cls.__new__(cls)
+        instance._init_from(client)
+        return instance
+
+    @property
+    def sync_client(self) -> BoomiClient:
+        """The underlying blocking client."""
+        return self._client
+
+    def with_auth_header(self, auth_header: str) -> AsyncBoomiClient:
+        """Build a sibling with different credentials and the same limiter."""
+        return AsyncBoomiClient.from_client(
+            self._client.with_auth_header(auth_header)
+        )
+
+    def _get_http_executor(self) -> ThreadPoolExecutor:
+        if self._http_executor is None:
+            self._http_executor = ThreadPoolExecutor(
+                max_workers=self._client._pool_size,
+                thread_name_prefix="boomi-async-http",
+            )
+        return self._http_executor
+
+    async def aclose(self) -> None:
+        """Shut down the HTTP pool and close the underlying client."""
+        if self._http_executor is not None:
+            self._http_executor.shutdown(wait=False)
+            self._http_executor = None
+        self._client.close()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[str] = None,
+        content_type: str = "application/json",
+        accept_xml: bool = False,
+        extra_headers: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Execute an HTTP request with rate limiting and retry."""
+        headers = self._client._build_headers(data, content_type, accept_xml)
+        headers.update(extra_headers or {})
+        loop = asyncio.get_running_loop()
+
+        attempt, wait = 0, 0.0
+
+        while True:
+            try:
+                resp = await loop.run_in_executor(
+                    self._get_http_executor(),
+                    functools.partial(
+                        self._client._send, method, url, data, headers, attempt,
+                        **kwargs,
+                    ),
+                )
+            except requests.RequestException as exc:
+                wait = self._client._retry_wait(method, url, attempt, wait, exc=exc)
+            else:
+                try:
+                    wait = self._client._retry_wait(method, url, attempt, wait, resp=resp)
+                except BoomiApiError:
+                    self._client._close_response(resp)
+                    raise
+                if wait is None:
+                    return resp
+                # Hand the connection back before retrying, as the blocking client does
+                self._client._close_response(resp)
+            await asyncio.sleep(wait)
+            attempt += 1
+
+    async def _write(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Non-GET request; ends the GET coalescing window like ``BoomiClient``."""
+        try:
+            return await self._request(method, url, **kwargs)
+        finally:
+            self._inflight.clear()
+
+    async def _hedged_get(self, url: str, hedge: bool, **kwargs: Any) -> requests.Response:
+        """Async ``BoomiClient._hedged_get``; the slower copy is cancelled."""
+        client = self._client
+        delay = client._timeouts.hedge_delay("GET", url) if hedge and client._hedge else None
+        if delay is None:
+            return await self._request("GET", url, **kwargs)
+        primary = asyncio.ensure_future(self._request("GET", url, **kwargs))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+        logger.debug("GET %s slower than p95 (%.2fs), sending hedge", url, delay)
+        pending = {primary, asyncio.ensure_future(self._request("GET", url, **kwargs))}
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            succeeded = [task for task in done if task.exception() is None]
+            if succeeded:
+                for task in pending:
+                    task.cancel()
+                return succeeded[0].result()
+            if not pending:
+                return done.pop().result()
+
+    async def get(
+        self,
+        url: str,
+        accept_xml: bool = False,
+        cache: bool = False,
+        hedge: bool = False,
+        **kwargs: Any,
+    ) -> dict | str:
+        """HTTP GET, returns parsed JSON dict or XML string.
+
+        ``cache=True`` uses the wrapped client's response cache; ``hedge``
+        and coalescing of identical concurrent calls as in ``BoomiClient.get``.
+        """
+        if kwargs:
+            return await self._get(url, accept_xml, cache, hedge, **kwargs)
+        key = (self._client._cache_account, url, accept_xml, cache)
+        flight = self._inflight.get(key)
+        if flight is not None:
+            flight.shared = True
+            return copy.deepcopy(await asyncio.shield(flight.task))
+        flight = self._inflight[key] = _Flight(
+            asyncio.ensure_future(self._get(url, accept_xml, cache, hedge))
+        )
+        try:
+            result = await asyncio.shield(flight.task)
+        finally:
+            if self._inflight.get(key) is flight:
+                del self._inflight[key]
+        return copy.deepcopy(result) if flight.shared else result
+
+    async def _get(
+        self, url: str, accept_xml: bool, cache: bool, hedge: bool, **kwargs: Any,
+    ) -> dict | str:
+        client = self._client
+        if not cache or client._cache is None:
+            resp = await self._hedged_get(url, hedge, accept_xml=accept_xml, **kwargs)
+            return BoomiClient._parse_response(resp, accept_xml=accept_xml)
+        entry = await asyncio.to_thread(client._cache_lookup, url)
+        if client._cache_fresh(entry):
+            return BoomiClient._parse_cached(entry, accept_xml)
+        resp = await self._hedged_get(
+            url, hedge, accept_xml=accept_xml,
+            extra_headers=entry.conditional_headers() if entry else None, **kwargs,
+        )
+        return await asyncio.to_thread(
+            client._cache_response, url, resp, entry, accept_xml,
+        )
+
+    def invalidate_cached(self, url: str) -> None:
+        """Drop cached reads of ``url`` (see ``BoomiClient.invalidate_cached``)."""
+        self._client.invalidate_cached(url)
+
+    async def post(
+        self,
+        url: str,
+        data: Optional[str] = None,
+        content_type: str = "application/json",
+        accept_xml: bool = False,
+        **kwargs: Any,
+    ) -> dict | str:
+        """HTTP POST, returns parsed JSON dict or XML string."""
+        resp = await self._write(
+            "POST", url, data=data, content_type=content_type,
+            accept_xml=accept_xml, **kwargs,
+        )
+        return BoomiClient._parse_response(resp, accept_xml=accept_xml)
+
+    async def put(
+        self,
+        url: str,
+        data: str,
+        content_type: str = "application/json",
+        accept_xml: bool = False,
+        **kwargs: Any,
+    ) -> dict | str:
+        """HTTP PUT, returns parsed JSON dict or XML string."""
+        resp = await self._write(
+            "PUT", url, data=data, content_type=content_type,
+            accept_xml=accept_xml, **kwargs,
+        )
+        return BoomiClient._parse_response(resp, accept_xml=accept_xml)
+
+    async def delete(self, url: str, accept_xml: bool = False, **kwargs: Any) -> dict | str:
+        """HTTP DELETE, returns parsed response."""
+        resp = await self._write("DELETE", url, accept_xml=accept_xml, **kwargs)
+        return BoomiClient._parse_response(resp, accept_xml=accept_xml)
+
+
+class _BlockingBridge:
+    """BoomiClient-shaped facade that runs AsyncBoomiClient calls on a loop.
+
+    Lets the existing (blocking) API wrappers drive an AsyncBoomiClient.
+    Must only be called from worker threads — calling it on the loop's own
+    thread would deadlock.
+    """
+
+    def __init__(self, client: AsyncBoomiClient, loop: asyncio.AbstractEventLoop) -> None:
+        self._client = client
+        self._loop = loop
+
+    def _run(self, coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def get(self, url: str, accept_xml: bool = False, **kwargs: Any) -> dict | str:
+        return self._run(self._client.get(url, accept_xml=accept_xml, **kwargs))
+
+    def post(self, url: str, data: Optional[str] = None, **kwargs: Any) -> dict | str:
+        return self._run(self._client.post(url, data=data, **kwargs))
+
+    def put(self, url: str, data: str, **kwargs: Any) -> dict | str:
+        return self._run(self._client.put(url, data=data, **kwargs))
+
+    def delete(self, url: str, accept_xml: bool = False, **kwargs: Any) -> dict | str:
+        return self._run(self._client.delete(url, accept_xml=accept_xml, **kwargs))
+
+    def invalidate_cached(self, url: str) -> None:
+        self._client.invalidate_cached(url)
+
+    def raw_request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        # Unretried probe; already on a worker thread, so call through directly
+        return self._client.sync_client.raw_request(method, url, **kwargs)
+
+    def stream_xml(self, url: str, tag: str, **kwargs: Any) -> Iterator[ET.Element]:
+        # Blocking generator; already on a worker thread, so call through directly
+        return self._client.sync_client.stream_xml(url, tag, **kwargs)
+
+    def map(
+        self, fn: Callable[..., Any], items: Iterable[Any], return_exceptions: bool = False,
+    ) -> list[Any]:
+        return self._client.sync_client.map(fn, items, return_exceptions=return_exceptions)
+
+    def with_auth_header(self, auth_header: str) -> _BlockingBridge:
+        return _BlockingBridge(self._client.with_auth_header(auth_header), self._loop)
+
+
+class AsyncApi:
+    """Awaitable view of a PlatformApi/DataHubApi running on AsyncBoomiClient.
+
+    Any method of the wrapped API can be awaited, e.g.
+    ``await api.get_component(comp_id)``; it runs on a worker thread whose
+    HTTP calls are routed back through the async client.  Subclasses
+    override the poll loops with native coroutines.
+    """
+
+    api_class: type = object
+
+    def __init__(self, client: AsyncBoomiClient, config: BoomiConfig) -> None:
+        self._client = client
+        self._config = config
+        self._api: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bound_api(self) -> Any:
+        """The wrapped API, bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._api = self.api_class(_BlockingBridge(self._client, loop), self._config)
+            self._loop = loop
+        return self._api
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_") or not callable(getattr(self.api_class, name, None)):
+            raise AttributeError(name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            method = getattr(self._bound_api(), name)
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        call.__name__ = name
+        return call
+
+
+class AsyncPlatformApi(AsyncApi):
+    """Awaitable PlatformApi with native poll loops."""
+
+    api_class = PlatformApi
+
+    async def poll_branch_ready(
+        self,
+        branch_id: str,
+        interval: int = 5,
+        max_retries: int = 6,
+        deadline: Optional[float] = None,
+    ) -> dict | str:
+        """Poll GET /Branch/{id} until ready=true."""
+        return await apoll(
+            lambda: self.get_branch(branch_id), PlatformApi.is_branch_ready,
+            f"Branch {branch_id}", "ready", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL, deadline=default_deadline(interval, max_retries, deadline),
+        )
+
+    async def poll_branches_ready(
+        self,
+        branch_ids: Iterable[str],
+        interval: int = 5,
+        max_retries: int = 6,
+        deadline: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> dict[str, Any]:
+        """Poll several branches concurrently; returns branch id → GET /Branch result."""
+        ops = [
+            PollOp(branch_id, functools.partial(self.get_branch, branch_id),
+                   PlatformApi.is_branch_ready, f"Branch {branch_id}")
+            for branch_id in dict.fromkeys(branch_ids)
+        ]
+        return await apoll_many(
+            ops, "ready", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL,
+            deadline=default_deadline(interval, max_retries, deadline), return_exceptions=return_exceptions,
+        )
+
+    async def poll_merge_status(
+        self,
+        merge_request_id: str,
+        interval: int = 5,
+        max_retries: int = 12,
+        deadline: Optional[float] = None,
+    ) -> dict | str:
+        """Poll GET /MergeRequest/{id} until MERGED or FAILED_TO_MERGE."""
+        return await apoll(
+            lambda: self.get_merge_request(merge_request_id), PlatformApi.is_merge_finished,
+            f"Merge {merge_request_id}", "complete", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL, deadline=default_deadline(interval, max_retries, deadline),
+        )
+
+
+class AsyncDataHubApi(AsyncApi):
+    """Awaitable DataHubApi with native poll loops."""
+
+    api_class = DataHubApi
+
+    async def poll_repo_created(
+        self,
+        repo_id: str,
+        interval: int = 3,
+        max_retries: int = 20,
+        deadline: Optional[float] = None,
+    ) -> str:
+        """Poll get_repo_creation_status until SUCCESS or failure."""
+        return await apoll(
+            lambda: self.get_repo_creation_status(repo_id),
+            lambda status: DataHubApi.is_repo_created(repo_id, status),
+            f"Repository {repo_id}", "ready", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL, deadline=default_deadline(interval, max_retries, deadline),
+        )
+
+    async def poll_model_deployed(
+        self,
+        model_id: str,
+        deployment_id: str,
+        interval: int = 3,
+        max_retries: int = 20,
+        deadline: Optional[float] = None,
+    ) -> str:
+        """Poll deployment status until SUCCESS or failure."""
+        return await apoll(
+            lambda: self.get_deployment_status(model_id, deployment_id),
+            lambda status: DataHubApi.is_model_deployed(model_id, status),
+            f"Model {model_id}", "deployed", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL, deadline=default_deadline(interval, max_retries, deadline),
+        )
+
+    async def poll_models_deployed(
+        self,
+        deployments: Mapping[str, str],
+        interval: int = 3,
+        max_retries: int = 20,
+        deadline: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> dict[str, Any]:
+        """Poll several deployments (model ID → deployment ID) concurrently."""
+        ops = [
+            PollOp(
+                model_id,
+                functools.partial(self.get_deployment_status, model_id, deployment_id),
+                functools.partial(DataHubApi.is_model_deployed, model_id),
+                f"Model {model_id}",
+            )
+            for model_id, deployment_id in deployments.items()
+        ]
+        return await apoll_many(
+            ops, "deployed", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL,
+            deadline=default_deadline(interval, max_retries, deadline), return_exceptions=return_exceptions,
+        )
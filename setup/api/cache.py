@@ -0,0 +1,177 @@
+"""On-disk conditional-GET cache for Boomi API reads."""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+DEFAULT_CACHE_FILE = ".boomi-api-cache.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    account       TEXT NOT NULL,
+    url           TEXT NOT NULL,
+    body          TEXT NOT NULL,
+    content_type  TEXT NOT NULL,
+    etag          TEXT,
+    last_modified TEXT,
+    stored_at     REAL NOT NULL,
+    accessed_at   REAL NOT NULL,
+    size          INTEGER NOT NULL,
+    PRIMARY KEY (account, url)
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+"""
+
+
+def account_key(auth_header: str) -> str:
+    """Short, non-reversible fingerprint of a credential for cache keys."""
+    return hashlib.sha256(auth_header.encode()).hexdigest()[:16]
+
+
+class CachedResponse(NamedTuple):
+    """A cached GET response body and its validators."""
+
+    url: str
+    body: str
+    content_type: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidation."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """SQLite-backed GET cache keyed by (account, URL), LRU-evicted.
+
+    Entries with an ETag or Last-Modified are revalidated with a
+    conditional GET (a 304 serves the cached body).  Entries without
+    validators are served for ``ttl`` seconds, then refetched.  The total
+    body size is capped at ``max_bytes``; least recently used entries go
+    first.  Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CACHE_FILE,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 300.0,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """True if ``entry`` may be served without contacting the server."""
+        return not entry.has_validators and time.time() - entry.stored_at < self.ttl
+
+    def get(self, account: str, url: str) -> Optional[CachedResponse]:
+        """Look up an entry and mark it recently used."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT url, body, content_type, etag, last_modified, stored_at "
+                "FROM responses WHERE account = ? AND url = ?",
+                (account, url),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE account = ? AND url = ?",
+                (time.time(), account, url),
+            )
+        return CachedResponse(*row)
+
+    def refresh(self, account: str, url: str) -> None:
+        """Restart an entry's TTL after a 304 revalidation."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? "
+                "WHERE account = ? AND url = ?",
+                (now, now, account, url),
+            )
+
+    def put(
+        self,
+        account: str,
+        url: str,
+        body: str,
+        content_type: str = "",
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a response body, then evict down to the size cap."""
+        size = len(body.encode())
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(account, url, body, content_type, etag, last_modified, "
+                " stored_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (account, url, body, content_type, etag, last_modified, now, now, size),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT account, url, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        for account, url, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute(
+                "DELETE FROM responses WHERE account = ? AND url = ?", (account, url)
+            )
+            total -= size
+
+    def invalidate(self, url: str) -> None:
+        """Drop every cached variant of ``url`` (any account, any query string)."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM responses WHERE url = ? OR substr(url, 1, ?) = ?",
+                (url, len(url) + 1, url + "?"),
+            )
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def stats(self) -> dict:
+        """Entry count and total cached bytes."""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"entries": count, "bytes": total}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
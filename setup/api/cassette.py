@@ -0,0 +1,191 @@
+"""Record/replay of Boomi API traffic for offline runs and benchmarks.
+
+A ``Cassette`` wraps the transport inside ``BoomiClient`` (see
+``setup.api.transport``).  In
+record mode every exchange goes to the network and is appended to the
+cassette; ``save()`` writes it as gzip-compressed JSON.  In replay mode no
+network is used: each request is answered with the next recorded response
+for the same method, URL and body, optionally after the recorded latency.
+
+Request headers are never stored (so no Authorization header reaches the
+file) and request bodies are stored only as a SHA-256 digest.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Optional
+
+import requests
+
+from setup.api.transport import Transport, make_response
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+# Response headers the client reads; everything else is dropped
+_KEPT_RESPONSE_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After", "Location")
+
+
+class CassetteMissError(requests.RequestException):
+    """Raised in replay mode when no recorded response matches a request.
+
+    A ``RequestException`` so callers that tolerate transport failures (the
+    Repository API auth probe, for one) treat a miss like an unreachable
+    server; it is never retried.
+    """
+
+
+def _body_digest(data: Any) -> str:
+    if data is None:
+        return ""
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+class _CassetteTransport:
+    """Transport that records to or replays from a Cassette."""
+
+    def __init__(self, cassette: Cassette, transport: Transport) -> None:
+        self._cassette = cassette
+        self._transport = transport
+
+    def request(self, method: str, url: str, data: Any = None, **kwargs: Any) -> requests.Response:
+        # Match on the decoded body, so compression settings may differ on replay
+        body = data
+        if (kwargs.get("headers") or {}).get("Content-Encoding") == "gzip":
+            body = gzip.decompress(data)
+        if self._cassette.mode == "replay":
+            return self._cassette.play(method, url, body)
+        started = time.monotonic()
+        resp = self._transport.request(method, url, data=data, **kwargs)
+        self._cassette.append(method, url, body, resp, time.monotonic() - started)
+        return resp
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class Cassette:
+    """Recorded API interactions; see the module docstring.
+
+    ``latency_scale`` (replay only) sleeps for the recorded response time
+    multiplied by the factor: 0 replays as fast as possible, 1 reproduces
+    the recorded run's network timing.
+    """
+
+    def __init__(self, path: Path | str, mode: str, latency_scale: float = 0.0) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"mode must be 'record' or 'replay', got {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._interactions: list[dict] = []
+        self._lock = threading.Lock()
+        # Replay indices: exact (method, url, body digest) and loose (method, url)
+        self._used: list[bool] = []
+        self._exact: dict[tuple, deque[int]] = defaultdict(deque)
+        self._loose: dict[tuple, deque[int]] = defaultdict(deque)
+
+    @classmethod
+    def record(cls, path: Path | str) -> Cassette:
+        return cls(path, "record")
+
+    @classmethod
+    def replay(cls, path: Path | str, latency_scale: float = 0.0) -> Cassette:
+        cassette = cls(path, "replay", latency_scale)
+        cassette.load()
+        return cassette
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def wrap(self, transport: Transport) -> _CassetteTransport:
+        """Wrap a client transport so its traffic goes through this cassette."""
+        return _CassetteTransport(self, transport)
+
+    # -- Record --
+
+    def append(
+        self, method: str, url: str, data: Any, resp: requests.Response, elapsed: float,
+    ) -> None:
+        """Record one exchange."""
+        headers = {
+            name: resp.headers[name]
+            for name in _KEPT_RESPONSE_HEADERS
+            if name in resp.headers
+        }
+        interaction = {
+            "method": method.upper(),
+            "url": url,
+            "body_sha256": _body_digest(data),
+            "status": resp.status_code,
+            "headers": headers,
+            "body": resp.text,
+            "elapsed": round(elapsed, 4),
+        }
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def save(self) -> None:
+        """Write the recorded interactions (record mode only)."""
+        if self.mode != "record":
+            return
+        with self._lock:
+            payload = {"version": CASSETTE_VERSION, "interactions": list(self._interactions)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        logger.info("Recorded %d API interactions to %s", len(payload["interactions"]), self.path)
+
+    # -- Replay --
+
+    def load(self) -> None:
+        """Read the cassette file and index it for replay."""
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != CASSETTE_VERSION:
+            raise ValueError(
+                f"Unsupported cassette version {payload.get('version')!r} in {self.path}"
+            )
+        self._interactions = payload["interactions"]
+        self._used = [False] * len(self._interactions)
+        for index, item in enumerate(self._interactions):
+            self._exact[(item["method"], item["url"], item["body_sha256"])].append(index)
+            self._loose[(item["method"], item["url"])].append(index)
+
+    def _take(self, queue: deque[int]) -> Optional[int]:
+        while queue:
+            index = queue.popleft()
+            if not self._used[index]:
+                self._used[index] = True
+                return index
+        return None
+
+    def play(self, method: str, url: str, data: Any = None) -> requests.Response:
+        """Return the next recorded response for this request.
+
+        Prefers an exact body match; falls back to the next unused response
+        for the same method and URL (bodies that embed timestamps or
+        generated names differ between runs).
+        """
+        method = method.upper()
+        with self._lock:
+            index = self._take(self._exact[(method, url, _body_digest(data))])
+            if index is None:
+                index = self._take(self._loose[(method, url)])
+        if index is None:
+            raise CassetteMissError(f"No recorded response for {method} {url}")
+        item = self._interactions[index]
+        if self.latency_scale > 0 and item.get("elapsed"):
+            time.sleep(item["elapsed"] * self.latency_scale)
+
+        return make_response(item["status"], item["body"], item.get("headers", {}), url=url)
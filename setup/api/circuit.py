@@ -0,0 +1,233 @@
+"""Circuit breakers for Boomi API calls, one per host and endpoint family."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional
+
+from setup.api.rate_limit import HostRateLimiter
+from setup.api.stats import endpoint_template
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# listener(circuit, old_state, new_state)
+Listener = Callable[[str, str, str], None]
+
+
+def circuit_key(url: str) -> str:
+    """``host family`` for a request URL, e.g. ``api.boomi.com Component``.
+
+    The family is the first path segment after the account prefix, so
+    ``/Component/{id}`` and ``/Component/{id}/x`` share a circuit while
+    ``/ComponentMetadata/query`` gets its own.
+    """
+    path = endpoint_template("GET", url).split(" ", 1)[1]
+    family = next((seg for seg in path.split("/") if seg and seg != "{id}"), "/")
+    return f"{HostRateLimiter.host_of(url)} {family}"
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for one endpoint family.
+
+    ``failure_threshold`` consecutive failures (transport errors or 5xx)
+    open the circuit: calls are refused without touching the network.
+    After ``reset_timeout`` seconds the circuit is half-open and lets a
+    single probe call through; its success closes the circuit, its
+    failure opens it for another ``reset_timeout``.  Any success while
+    closed resets the failure count.  Thread-safe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        listener: Optional[Listener] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got {failure_threshold}")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._listener = listener
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._opens = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit takes a probe (0 unless open)."""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def allow(self) -> bool:
+        """True if a call may go out now; the caller must then report its outcome."""
+        with self._lock:
+            old = self._state
+            if old == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                allowed = True
+            else:
+                allowed = self._state == CLOSED
+            if not allowed:
+                self._rejected += 1
+            new = self._state
+        self._notify(old, new)
+        return allowed
+
+    def on_success(self) -> None:
+        """The call got an answer from a healthy server."""
+        with self._lock:
+            old = self._state
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+        self._notify(old, CLOSED)
+
+    def on_failure(self) -> None:
+        """The call failed with a transport error or a 5xx."""
+        with self._lock:
+            old = self._state
+            self._failures += 1
+            self._probing = False
+            if old == HALF_OPEN or (old == CLOSED and self._failures >= self.failure_threshold):
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._opens += 1
+            new = self._state
+        self._notify(old, new)
+
+    def release(self) -> None:
+        """The allowed call never went out; frees the half-open probe slot."""
+        with self._lock:
+            self._probing = False
+
+    def _notify(self, old: str, new: str) -> None:
+        if old != new and self._listener is not None:
+            self._listener(self.name, old, new)
+
+    def snapshot(self) -> dict:
+        """Current state and counters, JSON-serializable."""
+        retry_in = self.retry_in()
+        with self._lock:
+            return {
+                "state": self._state,
+                "failures": self._failures,
+                "opens": self._opens,
+                "rejected": self._rejected,
+                "retry_in": round(retry_in, 1),
+            }
+
+
+class CircuitBreakers:
+    """One CircuitBreaker per host and endpoint family (see ``circuit_key``).
+
+    Share one instance between the Platform and Repository API clients.
+    ``subscribe()`` registers a listener for state transitions of any
+    circuit, which the Engine uses to pause work while an endpoint is down.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        CircuitBreaker("", failure_threshold, reset_timeout)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._listeners: list[Listener] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener: Listener) -> None:
+        """Call ``listener(circuit, old_state, new_state)`` on every transition."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def _notify(self, circuit: str, old: str, new: str) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(circuit, old, new)
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        """Return the breaker for the URL's endpoint family, creating it on first use."""
+        key = circuit_key(url)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    key, self.failure_threshold, self.reset_timeout,
+                    listener=self._notify, clock=self._clock,
+                )
+                self._breakers[key] = breaker
+            return breaker
+
+    def open_circuits(self) -> dict[str, float]:
+        """Open circuits and the seconds until each takes a probe."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {b.name: b.retry_in() for b in breakers if b.state == OPEN}
+
+    def rejected(self) -> int:
+        """Calls refused by open circuits so far, across all circuits."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return sum(b.snapshot()["rejected"] for b in breakers)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-circuit snapshots keyed by circuit name."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {key: breaker.snapshot() for key, breaker in sorted(breakers.items())}
+
+
+class _ClosedBreaker(CircuitBreaker):
+    """Breaker that always admits calls and never trips."""
+
+    def allow(self) -> bool:
+        return True
+
+    def on_success(self) -> None:
+        return None
+
+    def on_failure(self) -> None:
+        return None
+
+
+class NullCircuitBreakers(CircuitBreakers):
+    """No circuit breaking (threshold 0); reports no circuits."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._closed = _ClosedBreaker("")
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        return self._closed
+
+    def open_circuits(self) -> dict[str, float]:
+        return {}
+
+    def rejected(self) -> int:
+        return 0
+
+    def snapshot(self) -> dict[str, dict]:
+        return {}
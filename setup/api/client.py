@@ -2,22 +2,83 @@
 from __future__ import annotations
 
 import base64
+import copy
+import gzip
+import io
+import json
 import logging
+import threading
 import time
-from typing import Any, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
 
 import requests
 
+from setup.api.cache import CachedResponse, ResponseCache, account_key
+from setup.api.cassette import Cassette
+from setup.api.circuit import CircuitBreakers, NullCircuitBreakers
+from setup.api.concurrency import HostConcurrency, NullConcurrency
+from setup.api.rate_limit import HostRateLimiter, NullRateLimiter
+from setup.api.retry import RetryBudget, RetryPolicy
+from setup.api.singleflight import SingleFlight
+from setup.api.stats import ApiStats
+from setup.api.timeouts import AdaptiveTimeouts
+from setup.api.transport import RequestsTransport, Transport
+from setup.api.xmlstream import iter_elements
+
 logger = logging.getLogger(__name__)
 
-# Minimum gap between API calls (seconds) to respect rate limits
-_MIN_CALL_INTERVAL = 0.120
+# Safety cap on calls per second per host.  The adaptive in-flight window
+# sets the actual pace; the token bucket only stops runaway bursts.
+_MAX_CALL_RATE = 20.0
+# Calls a host may receive back-to-back before the cap applies
+_BURST_SIZE = 4
+
+# Concurrency: worker threads for submit()/map() and pooled connections per host
+_DEFAULT_WORKERS = 4
+_DEFAULT_POOL_SIZE = 10
+# Adaptive in-flight window per host: starting size and ceiling
+_INITIAL_IN_FLIGHT = 2
+_MAX_IN_FLIGHT = 16
+
+# Request bodies at least this large are gzipped when compression is on
+_COMPRESS_MIN_BYTES = 1024
+
+# Read timeout (seconds) before an endpoint has enough latency samples, and
+# the cap on the adaptive per-endpoint read timeout
+_DEFAULT_READ_TIMEOUT = 60.0
+_MAX_READ_TIMEOUT = 120.0
+
+T = TypeVar("T")
 
 # Retry configuration
 _MAX_RETRIES = 3
-_BACKOFF_SECONDS = [1, 2, 4]
+_RETRY_BASE_SECONDS = 1.0
+_RETRY_CAP_SECONDS = 30.0
+# Total backoff one run may spend on retries before errors surface
+_RETRY_BUDGET_SECONDS = 120.0
 _RETRYABLE_STATUS_CODES = {429, 503}
 
+# Circuit breaker: consecutive failures (transport errors, 5xx) that open an
+# endpoint family's circuit, and seconds it stays open before a probe
+_BREAKER_THRESHOLD = 5
+_BREAKER_RESET_SECONDS = 30.0
+
+
+class _CountingReader:
+    """File-like wrapper that counts the bytes read through it."""
+
+    def __init__(self, raw: Any) -> None:
+        self._raw = raw
+        self.count = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        self.count += len(chunk)
+        return chunk
+
 
 class BoomiApiError(Exception):
     """Raised when a Boomi API call fails."""
@@ -31,25 +92,328 @@ class BoomiApiError(Exception):
         )
 
 
+class CircuitOpenError(BoomiApiError):
+    """Raised without a request while the endpoint family's circuit is open."""
+
+    def __init__(self, circuit: str, retry_in: float, url: str = "") -> None:
+        self.circuit = circuit
+        self.retry_in = retry_in
+        super().__init__(
+            503, f"circuit open for {circuit}; next probe in {retry_in:.0f}s", url,
+        )
+
+
 class BoomiClient:
-    """Low-level HTTP client with auth, rate limiting, and retry logic."""
+    """Low-level HTTP client with auth, rate limiting, and retry logic.
 
-    def __init__(self, user: str, token: str) -> None:
+    Calls in flight per host are capped by an AIMD window (see
+    ``HostConcurrency``) that grows while window-limited calls succeed and
+    halves on 429/503, so each account settles at its fastest safe
+    concurrency.  A token bucket per host (see ``HostRateLimiter``) is a
+    loose safety cap on top: ``rate`` is the maximum sustained
+    calls/second and ``burst`` the number of calls allowed back-to-back.
+    Pass ``rate_limiter`` to share buckets between clients that talk to
+    the same hosts.
+
+    The client is safe to share between threads.  ``submit()`` and ``map()``
+    run calls on a pool of ``max_workers`` threads; the shared windows and
+    limiter keep the combined load within the account's budget.
+    ``pool_size`` sets how many keep-alive connections are pooled per host.
+
+    HTTP goes through ``transport`` (see ``setup.api.transport``), by
+    default a pooled ``RequestsTransport``.  Credentials are sent per
+    request, so siblings share one transport and its connection pool; pass
+    an ``InMemoryTransport`` to run the whole client stack without a network.
+
+    Retries follow ``retry_policy`` (see ``RetryPolicy``): Retry-After is
+    honored, other waits are jittered, and all of them draw from one retry
+    budget shared with sibling clients.
+
+    With a ``cache`` (see ``ResponseCache``), ``get(..., cache=True)``
+    serves repeat reads from disk, revalidating with ETag/Last-Modified
+    where the server sends them; ``invalidate_cached()`` drops an entry
+    after a write.
+
+    With a ``cassette`` (see ``Cassette``), all traffic of this client and
+    its siblings is recorded to, or replayed from, a file.  A replaying
+    client skips the rate limiter and in-flight windows.
+
+    Every exchange is counted in ``stats`` (see ``ApiStats``), shared with
+    siblings: calls, bytes, status codes and latency per endpoint.
+
+    Read timeouts adapt per endpoint to its observed latency (see
+    ``AdaptiveTimeouts``); ``max_timeout`` caps them.  With ``hedge=True``,
+    a ``get(..., hedge=True)`` still unanswered after the endpoint's p95
+    latency is sent a second time and the first answer wins.  Only
+    idempotent reads opt in.
+
+    Responses are requested gzip-compressed.  With
+    ``compress_requests=True``, request bodies of at least 1 KB (component
+    XML, mostly) are sent gzipped too; a host that answers 415 gets plain
+    bodies from then on.  Stats count decoded and on-the-wire bytes.
+
+    Each host and endpoint family has a circuit breaker (see
+    ``CircuitBreakers``), shared with siblings: after ``breaker_threshold``
+    consecutive transport errors or 5xx responses, calls to that family
+    raise ``CircuitOpenError`` at once instead of retrying, until a probe
+    call after ``breaker_reset`` seconds succeeds.  A threshold of 0
+    disables the breakers.
+
+    Identical GETs in flight at the same time (same credentials, URL and
+    options) are folded into one exchange whose parsed result every caller
+    receives (see ``SingleFlight``).  Any write through the client ends
+    the coalescing window, so a read issued after a write never reuses a
+    response that was requested before it.
+    """
+
+    def __init__(
+        self,
+        user: str,
+        token: str,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        max_workers: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[float] = None,
+        concurrency: Optional[HostConcurrency] = None,
+        max_in_flight: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        cassette: Optional[Cassette] = None,
+        stats: Optional[ApiStats] = None,
+        transport: Optional[Transport] = None,
+        timeouts: Optional[AdaptiveTimeouts] = None,
+        max_timeout: Optional[float] = None,
+        hedge: bool = False,
+        compress_requests: bool = False,
+        breakers: Optional[CircuitBreakers] = None,
+        breaker_threshold: Optional[int] = None,
+        breaker_reset: Optional[float] = None,
+    ) -> None:
         auth_string = f"BOOMI_TOKEN.{user}:{token}"
         encoded = base64.b64encode(auth_string.encode()).decode()
         self._auth_header = f"Basic {encoded}"
-        self._last_call_time: float = 0.0
-        self._session = requests.Session()
-        self._session.headers["Authorization"] = self._auth_header
-        self._session.headers["Accept"] = "application/json"
-
-    def _rate_limit(self) -> None:
-        """Enforce minimum gap between API calls."""
-        now = time.monotonic()
-        elapsed = now - self._last_call_time
-        if elapsed < _MIN_CALL_INTERVAL:
-            time.sleep(_MIN_CALL_INTERVAL - elapsed)
-        self._last_call_time = time.monotonic()
+        # Replay has no server to protect: skip pacing and in-flight limits
+        replaying = cassette is not None and cassette.mode == "replay"
+        if replaying:
+            rate_limiter = rate_limiter or NullRateLimiter()
+            concurrency = concurrency or NullConcurrency()
+        self._limiter = rate_limiter or HostRateLimiter(
+            rate or _MAX_CALL_RATE, burst or _BURST_SIZE,
+        )
+        self._max_workers = max(1, max_workers or _DEFAULT_WORKERS)
+        self._pool_size = max(pool_size or _DEFAULT_POOL_SIZE, self._max_workers)
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_retries=_MAX_RETRIES,
+            base=_RETRY_BASE_SECONDS,
+            cap=_RETRY_CAP_SECONDS,
+            budget=RetryBudget(
+                _RETRY_BUDGET_SECONDS if retry_budget is None else retry_budget
+            ),
+        )
+        self._concurrency = concurrency or HostConcurrency(
+            _INITIAL_IN_FLIGHT, maximum=max_in_flight or _MAX_IN_FLIGHT,
+        )
+        self._cache = cache
+        self._cache_account = account_key(self._auth_header)
+        self._cassette = cassette
+        self._stats = stats or ApiStats()
+        ceiling = max_timeout or _MAX_READ_TIMEOUT
+        self._timeouts = timeouts or AdaptiveTimeouts(
+            self._stats, default=_DEFAULT_READ_TIMEOUT,
+            floor=min(5.0, ceiling), ceiling=ceiling,
+        )
+        self._hedge = hedge
+        self._inflight = SingleFlight()
+        self._compress = compress_requests
+        self._gzip_refused: set[str] = set()
+        if breakers is None:
+            threshold = _BREAKER_THRESHOLD if breaker_threshold is None else breaker_threshold
+            breakers = NullCircuitBreakers() if threshold == 0 else CircuitBreakers(
+                threshold,
+                _BREAKER_RESET_SECONDS if breaker_reset is None else breaker_reset,
+            )
+        self._breakers = breakers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # A caller-supplied transport is the caller's to close
+        self._owns_transport = transport is None
+        transport = transport or RequestsTransport(self._pool_size)
+        if cassette is not None:
+            transport = cassette.wrap(transport)
+        self._transport: Transport = transport
+
+    def with_auth_header(self, auth_header: str) -> BoomiClient:
+        """Build a sibling client with different credentials.
+
+        The sibling shares this client's rate limiter, retry policy,
+        concurrency windows and response cache (entries are keyed by
+        credential), so per-host budgets hold across both (e.g. Platform
+        API and Repository API clients).  It also shares the circuit
+        breakers and the transport;
+        closing the sibling leaves the transport open.
+        """
+        sibling = BoomiClient.__new__(BoomiClient)
+        sibling._auth_header = auth_header
+        sibling._limiter = self._limiter
+        sibling._retry_policy = self._retry_policy
+        sibling._concurrency = self._concurrency
+        sibling._cache = self._cache
+        sibling._cache_account = account_key(auth_header)
+        sibling._cassette = self._cassette
+        sibling._stats = self._stats
+        sibling._timeouts = self._timeouts
+        sibling._hedge = self._hedge
+        sibling._inflight = self._inflight
+        sibling._compress = self._compress
+        sibling._gzip_refused = self._gzip_refused
+        sibling._breakers = self._breakers
+        sibling._max_workers = self._max_workers
+        sibling._pool_size = self._pool_size
+        sibling._executor = None
+        sibling._hedge_executor = None
+        sibling._executor_lock = threading.Lock()
+        sibling._transport = self._transport
+        sibling._owns_transport = False
+        return sibling
+
+    # -- Concurrency --
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="boomi-api",
+                )
+            return self._executor
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        # Separate from the worker pool: hedged GETs are often issued from
+        # worker threads, which must not wait on their own pool
+        with self._executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=2 * self._max_workers, thread_name_prefix="boomi-hedge",
+                )
+            return self._hedge_executor
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
+        """Run ``fn(*args, **kwargs)`` on the worker pool; returns a Future.
+
+        ``fn`` is typically a client or API method, e.g.
+        ``client.submit(platform_api.get_component, comp_id)``.
+        """
+        return self._get_executor().submit(fn, *args, **kwargs)
+
+    def map(
+        self,
+        fn: Callable[..., T],
+        items: Iterable[Any],
+        return_exceptions: bool = False,
+    ) -> list[T | Exception]:
+        """Call ``fn(item)`` for every item in parallel; results keep input order.
+
+        With ``return_exceptions=True`` a failed call yields its exception in
+        the result list instead of raising, so one bad item does not discard
+        the others.  With a single worker, calls run inline on this thread.
+        """
+        items = list(items)
+        if self._max_workers == 1 or len(items) <= 1:
+            futures = []
+            for item in items:
+                future: Future = Future()
+                try:
+                    future.set_result(fn(item))
+                except Exception as exc:  # noqa: BLE001 — surfaced below
+                    future.set_exception(exc)
+                futures.append(future)
+        else:
+            executor = self._get_executor()
+            futures = [executor.submit(fn, item) for item in items]
+
+        results: list[T | Exception] = []
+        for future in futures:
+            exc = future.exception()
+            if exc is not None:
+                if not return_exceptions:
+                    raise exc
+                results.append(exc)
+            else:
+                results.append(future.result())
+        return results
+
+    def imap(self, fn: Callable[..., T], items: Iterable[Any]) -> Iterator[T]:
+        """Lazy ``map``: yields ``fn(item)`` results in input order.
+
+        ``items`` is consumed only a little ahead of the results (at most
+        two calls per worker in flight), so a long or generated input is
+        never held in memory at once.  The first failed call raises.
+        """
+        if self._max_workers == 1:
+            for item in items:
+                yield fn(item)
+            return
+        executor = self._get_executor()
+        ahead = 2 * self._max_workers
+        in_flight: deque[Future[T]] = deque()
+        try:
+            for item in items:
+                in_flight.append(executor.submit(fn, item))
+                if len(in_flight) >= ahead:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def close(self) -> None:
+        """Shut down the worker pool and close the transport if this client made it."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._hedge_executor is not None:
+                self._hedge_executor.shutdown(wait=True)
+                self._hedge_executor = None
+        if self._owns_transport:
+            self._transport.close()
+
+    @property
+    def stats(self) -> ApiStats:
+        """Per-endpoint call statistics for this client and its siblings."""
+        return self._stats
+
+    @property
+    def breakers(self) -> CircuitBreakers:
+        """Circuit breakers for this client and its siblings."""
+        return self._breakers
+
+    def concurrency_snapshot(self) -> dict[str, dict]:
+        """Per-host AIMD window and throttle counts (see ``AimdWindow.snapshot``)."""
+        return self._concurrency.snapshot()
+
+    def raw_request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Single rate-limited exchange through this client's transport.
+
+        No retry and no status handling — for probes that interpret the
+        status code themselves.  ``kwargs`` go to ``Transport.request``
+        (``headers`` override the client's Authorization and Accept).
+        """
+        headers = {
+            "Authorization": self._auth_header,
+            "Accept": "application/json",
+            **(kwargs.pop("headers", None) or {}),
+        }
+        kwargs.setdefault("timeout", self._timeouts.for_request(method, url))
+        self._rate_limit(url)
+        return self._transport.request(method, url, headers=headers, **kwargs)
+
+    def _rate_limit(self, url: str) -> None:
+        """Wait for a token from the URL host's bucket."""
+        self._limiter.acquire(url)
 
     def _request(
         self,
@@ -58,44 +422,226 @@ class BoomiClient:
         data: Optional[str] = None,
         content_type: str = "application/json",
         accept_xml: bool = False,
+        extra_headers: Optional[dict[str, str]] = None,
         **kwargs: Any,
     ) -> requests.Response:
         """Execute an HTTP request with rate limiting and retry."""
-        headers: dict[str, str] = {}
+        headers = self._build_headers(data, content_type, accept_xml)
+        headers.update(extra_headers or {})
+        attempt, wait = 0, 0.0
+
+        try:
+            while True:
+                try:
+                    resp = self._send(method, url, data, headers, attempt, **kwargs)
+                except requests.RequestException as exc:
+                    wait = self._retry_wait(method, url, attempt, wait, exc=exc)
+                else:
+                    try:
+                        wait = self._retry_wait(method, url, attempt, wait, resp=resp)
+                    except BoomiApiError:
+                        self._close_response(resp)
+                        raise
+                    if wait is None:
+                        return resp
+                    # Hand the connection back (matters for stream=True)
+                    self._close_response(resp)
+                time.sleep(wait)
+                attempt += 1
+        finally:
+            if method != "GET":
+                self._inflight.forget()
+
+    # -- Request building blocks (shared with AsyncBoomiClient) --
+
+    @staticmethod
+    def _build_headers(
+        data: Optional[str], content_type: str, accept_xml: bool,
+    ) -> dict[str, str]:
+        """Content negotiation headers for one request (auth is added in ``_send``)."""
+        headers = {
+            "Accept": "application/xml" if accept_xml else "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        }
         if data is not None:
             headers["Content-Type"] = content_type
-        if accept_xml:
-            headers["Accept"] = "application/xml"
+        return headers
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[str],
+        headers: dict[str, str],
+        attempt: int,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Perform a single admitted HTTP exchange (no retry).
 
-        for attempt in range(_MAX_RETRIES + 1):
-            self._rate_limit()
+        Takes a slot in the host's AIMD window first and only then a rate
+        token, so calls queued for a slot do not run the bucket into debt.
+        Holds the slot for the duration of the call, feeds the outcome back
+        into the window and records the exchange in stats.  Without an
+        explicit ``timeout``, the endpoint's adaptive timeout applies.
+        Raises ``CircuitOpenError`` before any of that while the endpoint
+        family's circuit is open, and reports the outcome to its breaker.
+        """
+        breaker = self._breakers.breaker_for(url)
+        if not breaker.allow():
+            raise CircuitOpenError(breaker.name, breaker.retry_in(), url)
+        kwargs.setdefault("timeout", self._timeouts.for_request(method, url))
+        window = self._concurrency.window_for(url)
+        ticket = window.acquire()
+        resp: Optional[requests.Response] = None
+        started: Optional[float] = None
+        payload: Optional[str | bytes] = data
+        try:
+            self._rate_limit(url)
+            started = time.perf_counter()
             logger.debug("%s %s (attempt %d)", method, url, attempt + 1)
+            payload, send_headers = self._encode_body(url, data, headers)
+            resp = self._transport.request(
+                method, url, data=payload,
+                headers={"Authorization": self._auth_header, **send_headers}, **kwargs,
+            )
+            if payload is not data and resp.status_code == 415:
+                host = HostRateLimiter.host_of(url)
+                logger.warning("%s rejected a gzip request body; sending plain bodies", host)
+                self._gzip_refused.add(host)
+                resp.close()
+                payload = data
+                resp = self._transport.request(
+                    method, url, data=data,
+                    headers={"Authorization": self._auth_header, **headers}, **kwargs,
+                )
+            return resp
+        finally:
+            if resp is None:
+                window.release(ticket)
+            elif resp.status_code in _RETRYABLE_STATUS_CODES:
+                window.on_throttle(ticket)
+            elif resp.status_code < 400:
+                window.on_success(ticket)
+            else:
+                window.release(ticket)
+            if started is None:
+                breaker.release()
+            elif resp is None or resp.status_code >= 500:
+                breaker.on_failure()
+            else:
+                breaker.on_success()
+            if started is not None and resp is not None and kwargs.get("stream"):
+                # Body not read yet: recorded by ``_close_response`` once it has been
+                resp.__dict__["_boomi_stream_stats"] = (method, url, data, payload, started)
+            elif started is not None:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self._record_stats(method, url, data, payload, resp, elapsed_ms)
+
+    def _close_response(self, resp: requests.Response, bytes_in: int = 0) -> None:
+        """Close ``resp``; a streamed one is recorded in stats now that its body is done.
+
+        ``bytes_in`` is the decoded body size the caller read (streamed
+        bodies are never loaded into ``resp.content``).
+        """
+        resp.close()
+        pending = resp.__dict__.pop("_boomi_stream_stats", None)
+        if pending is not None:
+            method, url, data, payload, started = pending
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._record_stats(method, url, data, payload, resp, elapsed_ms, bytes_in=bytes_in)
+
+    def _encode_body(
+        self, url: str, data: Optional[str], headers: dict[str, str],
+    ) -> tuple[Optional[str | bytes], dict[str, str]]:
+        """Gzip ``data`` if compression is on, it is large enough and the host accepts it."""
+        if not self._compress or not data:
+            return data, headers
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        if len(raw) < _COMPRESS_MIN_BYTES or HostRateLimiter.host_of(url) in self._gzip_refused:
+            return data, headers
+        # mtime=0 keeps the bytes (and cassette digests) identical across runs
+        return gzip.compress(raw, mtime=0), {**headers, "Content-Encoding": "gzip"}
+
+    def _record_stats(
+        self,
+        method: str,
+        url: str,
+        data: Optional[str],
+        payload: Optional[str | bytes],
+        resp: Optional[requests.Response],
+        elapsed_ms: float,
+        bytes_in: int = 0,
+    ) -> None:
+        def size(body: Optional[str | bytes]) -> int:
+            return len(body.encode() if isinstance(body, str) else body) if body else 0
+
+        wire_in = None
+        if resp is not None:
+            content = getattr(resp, "_content", None)
+            if isinstance(content, bytes):
+                bytes_in = len(content)
+            # urllib3 counts the (possibly compressed) bytes read off the socket
+            read = getattr(getattr(resp, "raw", None), "tell", None)
+            wire = read() if callable(read) else None
+            if isinstance(wire, int) and wire > 0:
+                wire_in = wire
+        self._stats.record(
+            method, url, resp.status_code if resp is not None else None,
+            elapsed_ms, bytes_in=bytes_in, bytes_out=size(data),
+            wire_in=wire_in, wire_out=size(payload),
+        )
+
+    def _retry_wait(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        previous_wait: float,
+        resp: Optional[requests.Response] = None,
+        exc: Optional[requests.RequestException] = None,
+    ) -> Optional[float]:
+        """Classify the outcome of one attempt.
 
-            resp = self._session.request(
-                method, url, data=data, headers=headers, **kwargs
+        Returns None for a successful response, or the backoff (seconds)
+        before the next attempt.  Raises BoomiApiError for 401 (never
+        retried) and other error statuses, and re-raises ``exc`` for
+        transport errors that may not be retried; both also once retries or
+        the retry budget are exhausted.
+        """
+        policy = self._retry_policy
+        if exc is not None:
+            wait = None
+            if policy.is_retryable_exception(method, exc):
+                wait = policy.next_wait(attempt, previous_wait)
+            if wait is None:
+                raise exc
+            logger.warning(
+                "%s on %s %s, retrying in %.1fs", type(exc).__name__, method, url, wait
             )
+            return wait
 
-            if resp.status_code == 401:
-                raise BoomiApiError(resp.status_code, resp.text, url)
+        assert resp is not None
+        if resp.status_code == 401:
+            raise BoomiApiError(resp.status_code, resp.text, url)
 
-            if resp.status_code in _RETRYABLE_STATUS_CODES and attempt < _MAX_RETRIES:
-                wait = _BACKOFF_SECONDS[attempt]
+        if resp.status_code in _RETRYABLE_STATUS_CODES:
+            wait = policy.next_wait(
+                attempt, previous_wait, retry_after=resp.headers.get("Retry-After"),
+            )
+            if wait is not None:
                 logger.warning(
-                    "Retryable %d from %s, waiting %ds", resp.status_code, url, wait
+                    "Retryable %d from %s, waiting %.1fs", resp.status_code, url, wait
                 )
-                time.sleep(wait)
-                continue
+                return wait
 
-            if resp.status_code >= 400:
-                raise BoomiApiError(resp.status_code, resp.text, url)
+        if resp.status_code >= 400:
+            raise BoomiApiError(resp.status_code, resp.text, url)
 
-            return resp
-
-        # Should not reach here, but handle edge case
-        raise BoomiApiError(resp.status_code, resp.text, url)  # type: ignore[possibly-undefined]
+        return None
 
+    @staticmethod
     def _parse_response(
-        self, resp: requests.Response, accept_xml: bool = False
+        resp: requests.Response, accept_xml: bool = False
     ) -> dict | str:
         """Parse response as JSON dict or XML string."""
         content_type = resp.headers.get("Content-Type", "")
@@ -107,11 +653,148 @@ class BoomiClient:
             return resp.text.lstrip("\ufeff")
         return resp.json()
 
-    def get(self, url: str, accept_xml: bool = False, **kwargs: Any) -> dict | str:
-        """HTTP GET, returns parsed JSON dict or XML string."""
-        resp = self._request("GET", url, accept_xml=accept_xml, **kwargs)
+    # -- Response cache --
+
+    def _cache_lookup(self, url: str) -> Optional[CachedResponse]:
+        """Cached entry for ``url`` under this client's credentials."""
+        if self._cache is None:
+            return None
+        return self._cache.get(self._cache_account, url)
+
+    def _cache_fresh(self, entry: Optional[CachedResponse]) -> bool:
+        return entry is not None and self._cache is not None and self._cache.is_fresh(entry)
+
+    def _cache_response(
+        self,
+        url: str,
+        resp: requests.Response,
+        entry: Optional[CachedResponse],
+        accept_xml: bool,
+    ) -> dict | str:
+        """Serve a 304 from ``entry`` or store a fresh 200; returns the parsed body."""
+        if resp.status_code == 304 and entry is not None:
+            self._cache.refresh(self._cache_account, url)
+            return self._parse_cached(entry, accept_xml)
+        if resp.status_code == 200 and resp.text and self._cache is not None:
+            self._cache.put(
+                self._cache_account, url, resp.text,
+                content_type=resp.headers.get("Content-Type", ""),
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
         return self._parse_response(resp, accept_xml=accept_xml)
 
+    @staticmethod
+    def _parse_cached(entry: CachedResponse, accept_xml: bool = False) -> dict | str:
+        """Parse a cached body the same way as ``_parse_response``."""
+        if "xml" in entry.content_type or accept_xml:
+            return entry.body.lstrip("\ufeff")
+        return json.loads(entry.body)
+
+    def invalidate_cached(self, url: str) -> None:
+        """Drop cached reads of ``url`` (all credentials, all query strings)."""
+        if self._cache is not None:
+            self._cache.invalidate(url)
+
+    def _hedged_get(self, url: str, hedge: bool, **kwargs: Any) -> requests.Response:
+        """GET ``url``, duplicated once it is slower than the endpoint's p95.
+
+        Without hedging (or before the endpoint has enough samples) this is
+        a plain ``_request``.  Otherwise both copies run on the hedge pool;
+        the first success wins and the slower copy finishes unobserved.
+        """
+        delay = self._timeouts.hedge_delay("GET", url) if hedge and self._hedge else None
+        if delay is None:
+            return self._request("GET", url, **kwargs)
+        pool = self._get_hedge_executor()
+        primary = pool.submit(self._request, "GET", url, **kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        logger.debug("GET %s slower than p95 (%.2fs), sending hedge", url, delay)
+        pending = {primary, pool.submit(self._request, "GET", url, **kwargs)}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded = [f for f in done if f.exception() is None]
+            if succeeded:
+                return succeeded[0].result()
+            if not pending:
+                return done.pop().result()
+
+    def get(
+        self,
+        url: str,
+        accept_xml: bool = False,
+        cache: bool = False,
+        hedge: bool = False,
+        **kwargs: Any,
+    ) -> dict | str:
+        """HTTP GET, returns parsed JSON dict or XML string.
+
+        With ``cache=True`` (and a cache configured), repeat reads are served
+        from the response cache.  ``hedge=True`` marks the read as safe to
+        duplicate when the client hedges (see ``_hedged_get``).  Concurrent
+        identical calls share one exchange; extra ``kwargs`` opt out.
+        """
+        if kwargs:
+            return self._get(url, accept_xml, cache, hedge, **kwargs)
+        result, shared = self._inflight.do(
+            (self._cache_account, url, accept_xml, cache),
+            lambda: self._get(url, accept_xml, cache, hedge),
+        )
+        return copy.deepcopy(result) if shared else result
+
+    def _get(
+        self, url: str, accept_xml: bool, cache: bool, hedge: bool, **kwargs: Any,
+    ) -> dict | str:
+        if not cache or self._cache is None:
+            resp = self._hedged_get(url, hedge, accept_xml=accept_xml, **kwargs)
+            return self._parse_response(resp, accept_xml=accept_xml)
+        entry = self._cache_lookup(url)
+        if self._cache_fresh(entry):
+            return self._parse_cached(entry, accept_xml)
+        resp = self._hedged_get(
+            url, hedge, accept_xml=accept_xml,
+            extra_headers=entry.conditional_headers() if entry else None, **kwargs,
+        )
+        return self._cache_response(url, resp, entry, accept_xml)
+
+    def stream_xml(
+        self,
+        url: str,
+        tag: str,
+        method: str = "GET",
+        data: Optional[str] = None,
+        content_type: str = "application/xml",
+        cache: bool = False,
+        root: Optional[dict[str, str]] = None,
+    ) -> Iterator[ET.Element]:
+        """Yield ``tag`` elements of an XML response as they are downloaded.
+
+        The response body is parsed incrementally from the socket (see
+        ``iter_elements``), so large result sets never sit in memory as a
+        whole and processing starts before the download finishes.  The
+        request is sent on the first ``next()``; retries happen before any
+        element is yielded.  ``root`` receives the document element's
+        attributes.  A GET with ``cache=True`` and a cache configured is
+        served through the response cache instead (parsed from the stored
+        body).
+        """
+        if method == "GET" and cache and self._cache is not None:
+            body = self.get(url, accept_xml=True, cache=True)
+            if isinstance(body, str) and body:
+                yield from iter_elements(io.BytesIO(body.encode("utf-8")), tag, root)
+            return
+        resp = self._request(
+            method, url, data=data, content_type=content_type, accept_xml=True, stream=True,
+        )
+        body = _CountingReader(resp.raw)
+        try:
+            resp.raw.decode_content = True
+            yield from iter_elements(body, tag, root)
+        finally:
+            self._close_response(resp, bytes_in=body.count)
+
     def post(
         self,
         url: str,
@@ -0,0 +1,156 @@
+"""Local name → componentId index built from ComponentMetadata scans."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from setup.api.platform_api import ComponentSummary, PlatformApi
+
+logger = logging.getLogger(__name__)
+
+
+class ComponentIndex:
+    """Current components whose names start with ``scope``, indexed in memory.
+
+    The first lookup runs one paginated ``name LIKE '<scope>%'`` scan; after
+    that, lookups by exact name, prefix counts and per-type lists are dict
+    reads.  Later refreshes are incremental: they ask for every component
+    modified since the newest ``modifiedDate`` seen, whatever its name, so
+    they also pick up deletions and renames — including a component
+    renamed out of scope, which is dropped.
+
+    Freshness: ``id_for`` refreshes on a miss (a component just created by
+    hand in the Boomi UI is found on the first try), ``count_prefix`` and
+    ``by_type`` when the index is older than ``max_age`` seconds, and
+    ``add`` records components this tool writes as soon as they exist.
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        platform_api: PlatformApi,
+        scope: str = "PROMO",
+        max_age: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._platform = platform_api
+        self.scope = scope
+        self.max_age = max_age
+        self._clock = clock
+        self._by_id: dict[str, ComponentSummary] = {}
+        self._by_name: dict[str, list[str]] = {}
+        self._by_type: dict[str, set[str]] = {}
+        self._prefix_counts: dict[str, int] = {}
+        self._since = ""
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def covers(self, name: str) -> bool:
+        """True if names like ``name`` fall inside the indexed scope."""
+        return name.startswith(self.scope)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._by_id)
+
+    # -- Maintenance --
+
+    def _insert(self, summary: ComponentSummary) -> None:
+        self._by_name.setdefault(summary.name, []).append(summary.component_id)
+        self._by_type.setdefault(summary.type, set()).add(summary.component_id)
+        for end in range(len(summary.name) + 1):
+            key = summary.name[:end]
+            self._prefix_counts[key] = self._prefix_counts.get(key, 0) + 1
+
+    def _discard(self, component_id: str) -> None:
+        old = self._by_id.pop(component_id, None)
+        if old is None:
+            return
+        ids = self._by_name.get(old.name, [])
+        if component_id in ids:
+            ids.remove(component_id)
+        if not ids:
+            self._by_name.pop(old.name, None)
+        self._by_type.get(old.type, set()).discard(component_id)
+        for end in range(len(old.name) + 1):
+            key = old.name[:end]
+            self._prefix_counts[key] -= 1
+            if not self._prefix_counts[key]:
+                del self._prefix_counts[key]
+
+    def _apply(self, summary: ComponentSummary) -> None:
+        if not summary.component_id:
+            return
+        self._discard(summary.component_id)
+        if summary.modified_date > self._since:
+            self._since = summary.modified_date
+        if summary.deleted or not self.covers(summary.name):
+            return
+        self._by_id[summary.component_id] = summary
+        self._insert(summary)
+
+    def add(self, summary: ComponentSummary) -> None:
+        """Record a component created or updated through this process."""
+        with self._lock:
+            if self._refreshed_at is not None:
+                self._apply(summary)
+
+    def refresh(self, full: bool = False) -> int:
+        """Scan for changes (everything if ``full`` or never scanned); returns records read."""
+        with self._lock:
+            incremental = not full and self._refreshed_at is not None and bool(self._since)
+            if incremental:
+                # No name filter: a component renamed out of scope must show up to be dropped
+                conditions = [{
+                    "operator": "GREATER_THAN_OR_EQUAL",
+                    "property": "modifiedDate",
+                    "argument": [self._since],
+                }]
+            else:
+                conditions = [{"operator": "LIKE", "property": "name", "argument": [f"{self.scope}%"]}]
+                self._by_id.clear()
+                self._by_name.clear()
+                self._by_type.clear()
+                self._prefix_counts.clear()
+                self._since = ""
+            query = self._platform.component_filter(*conditions, include_deleted=incremental)
+            read = 0
+            for summary in self._platform.iter_component_metadata(query, prefetch=True):
+                self._apply(summary)
+                read += 1
+            self._refreshed_at = self._clock()
+            logger.debug(
+                "Component index %s refresh: %d records, %d components",
+                "incremental" if incremental else "full", read, len(self._by_id),
+            )
+            return read
+
+    def _ensure_fresh(self) -> None:
+        if self._refreshed_at is None or self._clock() - self._refreshed_at >= self.max_age:
+            self.refresh()
+
+    # -- Lookups --
+
+    def id_for(self, name: str) -> Optional[str]:
+        """componentId of the current component named ``name``, or None."""
+        with self._lock:
+            if self._refreshed_at is None or name not in self._by_name:
+                self.refresh()
+            ids = self._by_name.get(name)
+            return ids[0] if ids else None
+
+    def count_prefix(self, prefix: str) -> int:
+        """Number of current components whose name starts with ``prefix``."""
+        with self._lock:
+            self._ensure_fresh()
+            return self._prefix_counts.get(prefix, 0)
+
+    def by_type(self, component_type: str) -> list[ComponentSummary]:
+        """Current components of ``component_type`` (e.g. ``connector-action``), by name."""
+        with self._lock:
+            self._ensure_fresh()
+            ids = self._by_type.get(component_type, set())
+            return sorted((self._by_id[i] for i in ids), key=lambda s: s.name)
@@ -0,0 +1,169 @@
+"""Adaptive (AIMD) limit on in-flight Boomi API calls per host."""
+from __future__ import annotations
+
+import threading
+from typing import NamedTuple, Optional
+
+from setup.api.rate_limit import HostRateLimiter
+
+
+class WindowTicket(NamedTuple):
+    """Handed out by ``AimdWindow.acquire`` and passed back on release."""
+
+    epoch: int
+    # True when this call filled the window, i.e. the window was the limit
+    limited: bool
+
+
+class AimdWindow:
+    """Additive-increase / multiplicative-decrease in-flight window.
+
+    A successful response grows the window by ``1 / window`` (about one
+    slot per window's worth of successes), but only if its call filled the
+    window when admitted: sequential or lightly concurrent traffic never
+    tested the limit, so it says nothing about a larger one.  A throttled
+    response (429/503) multiplies the window by ``decrease``.  Only the
+    first throttle from calls admitted under the current window shrinks it,
+    so one burst of 429s halves the window once rather than collapsing it
+    to the minimum.
+    """
+
+    def __init__(
+        self,
+        initial: float = 2.0,
+        minimum: float = 1.0,
+        maximum: float = 16.0,
+        decrease: float = 0.5,
+    ) -> None:
+        if not 1 <= minimum <= maximum:
+            raise ValueError(f"need 1 <= minimum <= maximum, got {minimum}, {maximum}")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self._window = min(max(initial, minimum), maximum)
+        self._in_flight = 0
+        self._epoch = 0
+        self._successes = 0
+        self._throttled = 0
+        self._decreases = 0
+        self._cond = threading.Condition()
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _has_room(self) -> bool:
+        return self._in_flight < max(1, int(self._window))
+
+    def acquire(self, timeout: Optional[float] = None) -> WindowTicket:
+        """Block until a slot is free; returns a ticket for the release call."""
+        with self._cond:
+            if not self._cond.wait_for(self._has_room, timeout=timeout):
+                raise TimeoutError("no in-flight slot became available")
+            self._in_flight += 1
+            limited = self._in_flight >= int(self._window)
+            return WindowTicket(self._epoch, limited)
+
+    def _finish(self) -> None:
+        self._in_flight -= 1
+        self._cond.notify_all()
+
+    def on_success(self, ticket: WindowTicket) -> None:
+        """Release a slot after a successful response; grow if it was window-limited."""
+        with self._cond:
+            self._successes += 1
+            if ticket.limited:
+                self._window = min(self.maximum, self._window + 1.0 / self._window)
+            self._finish()
+
+    def on_throttle(self, ticket: WindowTicket) -> None:
+        """Release a slot after a 429/503 and shrink the window."""
+        with self._cond:
+            self._throttled += 1
+            if ticket.epoch == self._epoch:
+                self._window = max(self.minimum, self._window * self.decrease)
+                self._epoch += 1
+                self._decreases += 1
+            self._finish()
+
+    def release(self, ticket: WindowTicket) -> None:
+        """Release a slot without adjusting the window (errors, exceptions)."""
+        with self._cond:
+            self._finish()
+
+    def snapshot(self) -> dict:
+        """Current window and counters, JSON-serializable."""
+        with self._cond:
+            return {
+                "window": round(self._window, 2),
+                "in_flight": self._in_flight,
+                "successes": self._successes,
+                "throttled": self._throttled,
+                "decreases": self._decreases,
+            }
+
+
+class HostConcurrency:
+    """One AimdWindow per host.
+
+    The Platform API and the DataHub Repository API throttle independently,
+    so each host learns its own safe window.  Share one instance between
+    the Platform and Repository API clients.
+    """
+
+    def __init__(self, initial: float = 2.0, maximum: float = 16.0) -> None:
+        AimdWindow(initial, maximum=maximum)
+        self.initial = initial
+        self.maximum = maximum
+        self._windows: dict[str, AimdWindow] = {}
+        self._lock = threading.Lock()
+
+    def window_for(self, url: str) -> AimdWindow:
+        """Return the window for the URL's host, creating it on first use."""
+        host = HostRateLimiter.host_of(url)
+        with self._lock:
+            window = self._windows.get(host)
+            if window is None:
+                window = AimdWindow(self.initial, maximum=self.maximum)
+                self._windows[host] = window
+            return window
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-host window snapshots keyed by host."""
+        with self._lock:
+            windows = dict(self._windows)
+        return {host: window.snapshot() for host, window in sorted(windows.items())}
+
+
+class _OpenWindow(AimdWindow):
+    """Window that never blocks and never adapts."""
+
+    def acquire(self, timeout: Optional[float] = None) -> WindowTicket:
+        return WindowTicket(0, False)
+
+    def on_success(self, ticket: WindowTicket) -> None:
+        return None
+
+    def on_throttle(self, ticket: WindowTicket) -> None:
+        return None
+
+    def release(self, ticket: WindowTicket) -> None:
+        return None
+
+
+class NullConcurrency(HostConcurrency):
+    """No in-flight limit, for cassette replay; reports no windows."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._open = _OpenWindow()
+
+    def window_for(self, url: str) -> AimdWindow:
+        return self._open
+
+    def snapshot(self) -> dict[str, dict]:
+        return {}
@@ -11,14 +11,22 @@ Two separate API surfaces:
 from __future__ import annotations
 
 import base64
+import functools
+import itertools
 import logging
 import re
-import time
+import threading
 import xml.etree.ElementTree as ET
-from typing import Optional
-from xml.sax.saxutils import escape as xml_escape
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple, Optional
+from xml.sax.saxutils import escape as xml_escape, quoteattr
 
+from setup.api.cache import account_key
 from setup.api.client import BoomiClient, BoomiApiError
+from setup.api.polling import (
+    DEFAULT_BACKOFF, DEFAULT_MAX_INTERVAL, PollOp, default_deadline, poll, poll_many,
+)
+from setup.api.xmlstream import child_text, local_name
 from setup.config import BoomiConfig
 
 logger = logging.getLogger(__name__)
@@ -39,6 +47,65 @@ _FIELD_TYPE_MAP = {
 _MDM_NS = "http://mdm.api.platform.boomi.com/"
 _XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
 
+# Records per <batch> document sent by upsert_records
+_UPSERT_CHUNK_SIZE = 200
+# Records per RecordQueryRequest page read by iter_records
+_QUERY_PAGE_SIZE = 200
+# Rejections that apply to every record in a batch (wrong entity tag or
+# endpoint), so splitting the batch to find the bad record is pointless
+_BATCH_LEVEL_ERRORS = ("entity of unknown type",)
+
+
+class GoldenRecord:
+    """One record yielded by ``DataHubApi.iter_records``.
+
+    ``fields`` maps field names (e.g. ``devComponentId``) to their text.
+    """
+
+    __slots__ = ("record_id", "created_date", "updated_date", "fields")
+
+    def __init__(
+        self, record_id: str, created_date: str, updated_date: str, fields: dict[str, str],
+    ) -> None:
+        self.record_id = record_id
+        self.created_date = created_date
+        self.updated_date = updated_date
+        self.fields = fields
+
+    @classmethod
+    def from_element(cls, element: ET.Element) -> GoldenRecord:
+        """Build from a ``<Record>`` element of a RecordQueryResponse."""
+        fields: dict[str, str] = {}
+        for holder in element:
+            if local_name(holder.tag) != "Fields":
+                continue
+            # Field values sit inside the model's entity element
+            for entity in holder:
+                for field in entity if len(entity) else [entity]:
+                    fields[local_name(field.tag)] = field.text or ""
+        return cls(
+            element.get("recordId", ""), element.get("createdDate", ""),
+            element.get("updatedDate", ""), fields,
+        )
+
+    def get(self, name: str, default: str = "") -> str:
+        return self.fields.get(name, default)
+
+    def __repr__(self) -> str:
+        return f"GoldenRecord({self.record_id!r}, {self.fields!r})"
+
+
+class RecordOutcome(NamedTuple):
+    """Result of one record sent by ``DataHubApi.upsert_records``."""
+
+    index: int
+    record_id: str
+    error: Optional[BoomiApiError] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 class DataHubApi:
     """Wrapper for Boomi DataHub MDM REST API v1 operations.
@@ -57,6 +124,7 @@ class DataHubApi:
         )
         # Lazily initialized Repository API client (different host + credentials)
         self._repo_client_instance: Optional[BoomiClient] = None
+        self._repo_client_lock = threading.Lock()
 
     # Auth format candidates for the Repository API (tried in order).
     # The correct username is the GENERATED USERNAME from the DataHub repo's
@@ -145,16 +213,12 @@ class DataHubApi:
         return "\n".join(lines)
 
     def _make_repo_client(self, auth_header: str) -> BoomiClient:
-        """Build a BoomiClient for Repository API with a pre-built auth header."""
-        import requests as _requests  # noqa: PLC0415
+        """Build a BoomiClient for Repository API with a pre-built auth header.
 
-        repo_client = BoomiClient.__new__(BoomiClient)
-        repo_client._auth_header = auth_header
-        repo_client._last_call_time = 0.0
-        repo_client._session = _requests.Session()
-        repo_client._session.headers["Authorization"] = auth_header
-        repo_client._session.headers["Accept"] = "application/json"
-        return repo_client
+        Shares the Platform client's rate limiter; the hub cloud host gets
+        its own token bucket, independent of api.boomi.com.
+        """
+        return self._client.with_auth_header(auth_header)
 
     @property
     def _repo_client(self) -> BoomiClient:
@@ -164,10 +228,18 @@ class DataHubApi:
         is the generated username from the DataHub repo's Authentication Token
         page (NOT the Boomi account ID).  Falls back to accountId formats if
         the generated username is not configured.
+
+        The format that passed the last probe is kept on config
+        (``repo_auth_format`` plus a fingerprint of its credentials, saved
+        to state by the CLI); while the credentials are unchanged it is
+        used without probing again.
         """
-        if self._repo_client_instance is not None:
+        with self._repo_client_lock:
+            if self._repo_client_instance is None:
+                self._repo_client_instance = self._init_repo_client()
             return self._repo_client_instance
 
+    def _init_repo_client(self) -> BoomiClient:
         hub_url = self._config.hub_cloud_url
 
         # Build candidate headers (primary format first)
@@ -188,11 +260,17 @@ class DataHubApi:
                 "",
             )
 
+        saved = self._saved_auth_header(candidates)
+        if saved:
+            logger.info(
+                "Repository API auth: %s (saved from an earlier probe, credentials unchanged)",
+                self._config.repo_auth_format,
+            )
+            return self._make_repo_client(saved)
+
         # Can we do a live probe? Need both hub_url and a deployed universe.
         probe_url = self._build_probe_url(hub_url)
         if probe_url:
-            import requests as _requests  # noqa: PLC0415
-
             # Log credential diagnostics (masked) for debugging
             cfg = self._config
             logger.info(
@@ -206,36 +284,15 @@ class DataHubApi:
             )
 
             probe_body = '<RecordQueryRequest limit="1"/>'
-            results: list[tuple[str, int, str]] = []
-
-            for fmt, header in candidates:
-                try:
-                    hdrs = {
-                        "Authorization": header,
-                        "Content-Type": "application/xml",
-                    }
-                    resp = _requests.post(
-                        probe_url, data=probe_body, headers=hdrs, timeout=15,
-                    )
-                    # Capture response body (truncated) for 401 diagnostics
-                    body_preview = resp.text[:200].strip() if resp.text else ""
-                    results.append((fmt, resp.status_code, body_preview))
-                    logger.info(
-                        "  Auth probe %s → HTTP %d (%s) body=%s",
-                        fmt, resp.status_code, self._mask_header(header),
-                        body_preview[:100],
-                    )
-
-                    # Accept any status that confirms auth worked
-                    # (401 = wrong creds, 404 = ambiguous, anything else = auth OK)
-                    if resp.status_code in self._AUTH_OK_CODES:
-                        logger.info("Repository API auth: %s (HTTP %d)", fmt, resp.status_code)
-                        self._repo_client_instance = self._make_repo_client(header)
-                        return self._repo_client_instance
-                except _requests.RequestException as exc:
-                    results.append((fmt, -1, str(exc)))
-                    logger.warning("  Auth probe %s → network error: %s", fmt, exc)
-                    continue
+            winner, results = self._probe_auth_formats(probe_url, probe_body, candidates)
+            if winner is not None:
+                fmt, header = winner
+                status = next(code for name, code, _ in results if name == fmt)
+                # Only a definitive success is saved; a 403/5xx merely didn't rule it out
+                if status < 400:
+                    self._config.repo_auth_format = fmt
+                    self._config.repo_auth_fingerprint = account_key(header)
+                return self._make_repo_client(header)
 
             # No format produced a definitive auth-OK response
             detail_lines = [f"  {fmt}: HTTP {code}" for fmt, code, _ in results]
@@ -271,8 +328,71 @@ class DataHubApi:
         logger.info(
             "Repository API auth: using %s (no universe available for probe)", fmt,
         )
-        self._repo_client_instance = self._make_repo_client(header)
-        return self._repo_client_instance
+        return self._make_repo_client(header)
+
+    def _saved_auth_header(self, candidates: list[tuple[str, str]]) -> str | None:
+        """Header of the saved auth format, if its credentials are unchanged."""
+        cfg = self._config
+        for fmt, header in candidates:
+            if fmt == cfg.repo_auth_format and account_key(header) == cfg.repo_auth_fingerprint:
+                return header
+        return None
+
+    def _probe_auth_formats(
+        self, probe_url: str, probe_body: str, candidates: list[tuple[str, str]],
+    ) -> tuple[Optional[tuple[str, str]], list[tuple[str, int, str]]]:
+        """Send one probe per candidate at once; the best auth-OK response wins.
+
+        Candidate order is priority order: an auth-OK answer wins as soon as
+        every higher-priority probe has answered with a non-OK code, so a
+        legacy format that fails fast (403, 5xx) cannot beat a slower
+        primary.  Returns ``((fmt, header) or None, [(fmt, status, body
+        preview)])`` in candidate order; probes still in flight when the
+        winner is known finish unobserved.
+        """
+        import requests as _requests  # noqa: PLC0415
+
+        def probe(candidate: tuple[str, str]) -> tuple[str, int, str]:
+            fmt, header = candidate
+            try:
+                # Through the Platform client's session (pooling,
+                # rate limiting, cassette); hdrs override its auth
+                resp = self._client.raw_request(
+                    "POST", probe_url, data=probe_body,
+                    headers={"Authorization": header, "Content-Type": "application/xml"},
+                    timeout=15,
+                )
+            except _requests.RequestException as exc:
+                logger.warning("  Auth probe %s → network error: %s", fmt, exc)
+                return fmt, -1, str(exc)
+            # Capture response body (truncated) for 401 diagnostics
+            body_preview = resp.text[:200].strip() if resp.text else ""
+            logger.info(
+                "  Auth probe %s → HTTP %d (%s) body=%s",
+                fmt, resp.status_code, self._mask_header(header), body_preview[:100],
+            )
+            return fmt, resp.status_code, body_preview
+
+        # A pool of its own: probes may run while the worker pool is busy
+        pool = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="boomi-auth-probe")
+        try:
+            futures = [pool.submit(probe, candidate) for candidate in candidates]
+            pending = set(futures)
+            while True:
+                for candidate, future in zip(candidates, futures):
+                    if not future.done():
+                        break  # a higher-priority probe may still win
+                    fmt, status, _ = future.result()
+                    # Accept any status that confirms auth worked
+                    # (401 = wrong creds, 404 = ambiguous, anything else = auth OK)
+                    if status in self._AUTH_OK_CODES:
+                        logger.info("Repository API auth: %s (HTTP %d)", fmt, status)
+                        return candidate, [f.result() for f in futures if f.done()]
+                else:
+                    return None, [f.result() for f in futures]
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def _build_probe_url(self, hub_url: str) -> str | None:
         """Build a probe URL for auth testing, or None if probing isn't possible.
@@ -296,14 +416,16 @@ class DataHubApi:
         """Invalidate the cached Repository API client.
 
         Call after changing credentials on config so the next _repo_client
-        access re-probes and rebuilds the client with fresh credentials.
+        access rebuilds the client with fresh credentials.  It re-probes
+        unless the saved auth format's credentials are unchanged.
         """
         self._repo_client_instance = None
 
     def verify_repo_auth(self) -> bool:
         """Test whether _repo_client can authenticate.
 
-        Triggers the lazy init which probes auth if a universe is available.
+        Triggers the lazy init which probes auth if a universe is available
+        (a saved format with unchanged credentials counts as verified).
         Returns True if auth appears valid or cannot be tested yet.
         Returns False only on definitive 401.
 
@@ -359,39 +481,19 @@ class DataHubApi:
         Returns list of dicts with keys: cloudId, containerId, name.
         """
         url = f"{self._base}/clouds"
-        result = self._client.get(url, accept_xml=True)
-        if isinstance(result, str):
-            return self._parse_clouds_xml(result)
-        return []
-
-    @staticmethod
-    def _parse_clouds_xml(xml_str: str) -> list[dict[str, str]]:
-        """Parse <mdm:Clouds> XML response into list of cloud dicts.
-
-        M13 fix: Use xml.etree.ElementTree instead of a regex that assumes
-        fixed XML attribute ordering (XML attributes are unordered per spec).
-        """
-        clouds = []
         try:
-            root = ET.fromstring(xml_str)
-            # Try namespace-aware search first
-            ns = {"mdm": "http://mdm.api.platform.boomi.com/"}
-            cloud_elements = root.findall(".//mdm:Cloud", ns)
-            if not cloud_elements:
-                # Fall back to namespace-unaware search in case namespace differs
-                cloud_elements = [
-                    el for el in root.iter()
-                    if el.tag.endswith("}Cloud") or el.tag == "Cloud"
-                ]
-            for cloud in cloud_elements:
-                clouds.append({
+            return [
+                {
                     "cloudId": cloud.get("cloudId", ""),
                     "containerId": cloud.get("containerId", ""),
                     "name": cloud.get("name", ""),
-                })
+                }
+                # M13 fix: attributes are read by name, never by position
+                for cloud in self._client.stream_xml(url, "Cloud", cache=True)
+            ]
         except ET.ParseError as exc:
             logger.warning("Failed to parse clouds XML: %s", exc)
-        return clouds
+            return []
 
     # ------------------------------------------------------------------
     # Repository operations
@@ -434,26 +536,30 @@ class DataHubApi:
                 return match.group(1)
         return "UNKNOWN"
 
+    @staticmethod
+    def is_repo_created(repo_id: str, status: str) -> bool:
+        """True on SUCCESS; raises a 410 BoomiApiError if the repo was DELETED."""
+        if status == "DELETED":
+            raise BoomiApiError(
+                410, f"Repository {repo_id} was deleted during creation", ""
+            )
+        return status == "SUCCESS"
+
     def poll_repo_created(
-        self, repo_id: str, interval: int = 3, max_retries: int = 20
+        self,
+        repo_id: str,
+        interval: int = 3,
+        max_retries: int = 20,
+        deadline: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> str:
         """Poll get_repo_creation_status until SUCCESS or failure."""
-        for attempt in range(max_retries):
-            status = self.get_repo_creation_status(repo_id)
-            if status == "SUCCESS":
-                logger.info("Repository %s creation succeeded", repo_id)
-                return status
-            if status == "DELETED":
-                raise BoomiApiError(
-                    410, f"Repository {repo_id} was deleted during creation", ""
-                )
-            logger.debug(
-                "Repository %s status=%s (attempt %d/%d)",
-                repo_id, status, attempt + 1, max_retries,
-            )
-            time.sleep(interval)
-        raise BoomiApiError(
-            408, f"Repository {repo_id} not ready after {max_retries} polls", ""
+        return poll(
+            lambda: self.get_repo_creation_status(repo_id),
+            lambda status: self.is_repo_created(repo_id, status),
+            f"Repository {repo_id}", "ready", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL,
+            deadline=default_deadline(interval, max_retries, deadline), cancel=cancel,
         )
 
     def list_repositories(self) -> dict | str:
@@ -630,9 +736,13 @@ class DataHubApi:
         """
         url = f"{self._base}/models"
         body = self._model_spec_to_xml(model_spec_dict)
-        result = self._client.post(
-            url, data=body, content_type="application/xml", accept_xml=True,
-        )
+        try:
+            result = self._client.post(
+                url, data=body, content_type="application/xml", accept_xml=True,
+            )
+        finally:
+            # Also on "already exists" errors — callers recover via list_models()
+            self._invalidate_model()
         if isinstance(result, str):
             match = re.search(r"<mdm:id>([^<]+)</mdm:id>", result)
             if match:
@@ -644,45 +754,21 @@ class DataHubApi:
     def list_models(self) -> list[dict[str, str]]:
         """GET /models — list all models in the account.
 
-        Returns list of dicts with keys: id, name.
+        Returns list of dicts with keys: id, name.  The response is parsed
+        as it streams in.
         """
         url = f"{self._base}/models"
-        result = self._client.get(url, accept_xml=True)
-        if isinstance(result, str):
-            return self._parse_models_xml(result)
-        return []
-
-    @staticmethod
-    def _parse_models_xml(xml_str: str) -> list[dict[str, str]]:
-        """Parse <mdm:Models> XML response into list of model dicts."""
         models: list[dict[str, str]] = []
         try:
-            root = ET.fromstring(xml_str)
-            ns = {"mdm": _MDM_NS}
-            # Try namespace-aware search first
-            model_elements = root.findall(".//mdm:Model", ns)
-            if not model_elements:
-                # Fall back to namespace-unaware search
-                model_elements = [
-                    el for el in root.iter()
-                    if el.tag.endswith("}Model") or el.tag == "Model"
-                ]
-            for model in model_elements:
-                model_id = model.get("id", "")
-                name = model.get("name", "")
+            for model in self._client.stream_xml(url, "Model", cache=True):
                 # Some responses use child elements instead of attributes
-                if not model_id:
-                    id_el = model.find("mdm:id", ns)
-                    if id_el is not None and id_el.text:
-                        model_id = id_el.text
-                if not name:
-                    name_el = model.find("mdm:name", ns)
-                    if name_el is not None and name_el.text:
-                        name = name_el.text
+                model_id = model.get("id") or child_text(model, "id")
+                name = model.get("name") or child_text(model, "name")
                 if model_id:
                     models.append({"id": model_id, "name": name})
         except ET.ParseError as exc:
             logger.warning("Failed to parse models XML: %s", exc)
+            return []
         return models
 
     def find_model_by_name(self, model_name: str) -> str | None:
@@ -692,10 +778,20 @@ class DataHubApi:
                 return model["id"]
         return None
 
-    def get_model(self, model_id: str) -> dict | str:
-        """GET /models/{modelId}."""
+    def get_model(self, model_id: str, cache: bool = False) -> dict | str:
+        """GET /models/{modelId}.
+
+        ``cache=True`` serves it from the response cache when one is
+        configured (for repeat reads within a run).
+        """
         url = f"{self._base}/models/{model_id}"
-        return self._client.get(url, accept_xml=True)
+        return self._client.get(url, accept_xml=True, cache=cache)
+
+    def _invalidate_model(self, model_id: str = "") -> None:
+        """Drop cached model reads after a write (the list, and the model itself)."""
+        self._client.invalidate_cached(f"{self._base}/models")
+        if model_id:
+            self._client.invalidate_cached(f"{self._base}/models/{model_id}")
 
     def get_model_root_element(self, model_name: str) -> str | None:
         """Discover the root element name for a model's batch XML entity tag.
@@ -765,9 +861,12 @@ class DataHubApi:
             f"<mdm:notes>Initial publication</mdm:notes>"
             f"</mdm:PublishModelRequest>"
         )
-        return self._client.post(
-            url, data=body, content_type="application/xml", accept_xml=True,
-        )
+        try:
+            return self._client.post(
+                url, data=body, content_type="application/xml", accept_xml=True,
+            )
+        finally:
+            self._invalidate_model(model_id)
 
     def deploy_model(self, model_id: str) -> str:
         """POST /universe/{modelId}/deploy?repositoryId={repoId}.
@@ -777,7 +876,10 @@ class DataHubApi:
         """
         repo_id = self._config.boomi_repo_id
         url = f"{self._base}/universe/{model_id}/deploy?repositoryId={repo_id}"
-        result = self._client.post(url, accept_xml=True)
+        try:
+            result = self._client.post(url, accept_xml=True)
+        finally:
+            self._invalidate_model(model_id)
         if isinstance(result, str):
             match = re.search(r"<mdm:id>([^<]+)</mdm:id>", result)
             if match:
@@ -799,41 +901,78 @@ class DataHubApi:
             f"{self._base}/universe/{universe_id}"
             f"/deployments/{deployment_id}"
         )
-        result = self._client.get(url, accept_xml=True)
+        result = self._client.get(url, accept_xml=True, hedge=True)
         if isinstance(result, str):
             match = re.search(r"<mdm:status>([^<]+)</mdm:status>", result)
             if match:
                 return match.group(1)
         return "UNKNOWN"
 
+    @staticmethod
+    def is_model_deployed(model_id: str, status: str) -> bool:
+        """True on SUCCESS; raises a 410 BoomiApiError if the deployment was CANCELED."""
+        if status == "CANCELED":
+            raise BoomiApiError(410, f"Model {model_id} deployment was canceled", "")
+        return status == "SUCCESS"
+
     def poll_model_deployed(
         self,
         model_id: str,
         deployment_id: str,
         interval: int = 3,
         max_retries: int = 20,
+        deadline: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> str:
         """Poll deployment status until SUCCESS or failure."""
-        for attempt in range(max_retries):
-            status = self.get_deployment_status(model_id, deployment_id)
-            if status == "SUCCESS":
-                logger.info("Model %s deployment succeeded", model_id)
-                return status
-            if status == "CANCELED":
-                raise BoomiApiError(
-                    410,
-                    f"Model {model_id} deployment was canceled",
-                    "",
-                )
-            logger.debug(
-                "Model %s deployment status=%s (attempt %d/%d)",
-                model_id, status, attempt + 1, max_retries,
+        return poll(
+            lambda: self.get_deployment_status(model_id, deployment_id),
+            lambda status: self.is_model_deployed(model_id, status),
+            f"Model {model_id}", "deployed", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL,
+            deadline=default_deadline(interval, max_retries, deadline), cancel=cancel,
+        )
+
+    def poll_models_deployed(
+        self,
+        deployments: Mapping[str, str],
+        interval: int = 3,
+        max_retries: int = 20,
+        deadline: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+        return_exceptions: bool = False,
+    ) -> dict[str, str | BoomiApiError]:
+        """Poll several deployments (model ID → deployment ID) from one scheduler.
+
+        Each tick reads every deployment that is due in parallel
+        (``client.map``); returns model ID → final status.
+        """
+        ops = [
+            PollOp(
+                model_id,
+                functools.partial(self.get_deployment_status, model_id, deployment_id),
+                functools.partial(self.is_model_deployed, model_id),
+                f"Model {model_id}",
             )
-            time.sleep(interval)
-        raise BoomiApiError(
-            408, f"Model {model_id} not deployed after {max_retries} polls", ""
+            for model_id, deployment_id in deployments.items()
+        ]
+        return poll_many(
+            ops, "deployed", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL,
+            deadline=default_deadline(interval, max_retries, deadline), cancel=cancel, map_fn=self._client.map,
+            return_exceptions=return_exceptions,
         )
 
+    def map(
+        self, fn: Callable[[Any], Any], items: Iterable[Any], return_exceptions: bool = False,
+    ) -> list[Any]:
+        """``fn(item)`` for every item in parallel on the client's worker pool.
+
+        For per-item call sequences such as create → publish → deploy of
+        each model; results keep input order (see ``BoomiClient.map``).
+        """
+        return self._client.map(fn, items, return_exceptions=return_exceptions)
+
     # ------------------------------------------------------------------
     # Record operations  (Repository API — hub_cloud_url, repo credentials)
     # ------------------------------------------------------------------
@@ -849,6 +988,76 @@ class DataHubApi:
             url, data=filter_xml, content_type="application/xml", accept_xml=True,
         )
 
+    def stream_records(
+        self, model_name: str, filter_xml: str, root: Optional[dict[str, str]] = None,
+    ) -> Iterator[ET.Element]:
+        """``query_records``, yielding each ``<Record>`` element as it arrives.
+
+        Elements are cleared once the caller advances; ``root`` receives the
+        ``RecordQueryResponse`` attributes (e.g. ``totalCount``).
+        """
+        url = f"{self._record_base(model_name)}/records/query"
+        return self._repo_client.stream_xml(
+            url, "Record", method="POST", data=filter_xml, root=root,
+        )
+
+    def iter_records(
+        self,
+        model_name: str,
+        filter: Mapping[str, str] | str | None = None,
+        fields: Iterable[str] = (),
+        page_size: int = _QUERY_PAGE_SIZE,
+    ) -> Iterator[GoldenRecord]:
+        """Yield every record matching ``filter``, following ``offsetToken`` pages.
+
+        ``filter`` is either field uniqueId → value (all must be EQUALS,
+        e.g. ``{"DEV_COMPONENT_ID": "c-1"}``) or a ready ``<filter>``
+        element; ``fields`` lists the uniqueIds to return (``<view>``).
+        Each page is parsed as it streams in and the next page is only
+        requested once the caller has consumed this one, so scanning a
+        large universe holds one record at a time.
+        """
+        offset_token = ""
+        while True:
+            root: dict[str, str] = {}
+            query = self.record_query_xml(filter, fields, page_size, offset_token)
+            for element in self.stream_records(model_name, query, root=root):
+                yield GoldenRecord.from_element(element)
+            offset_token = root.get("offsetToken", "")
+            if not offset_token or root.get("resultCount") == "0":
+                return
+
+    @staticmethod
+    def record_query_xml(
+        filter: Mapping[str, str] | str | None = None,
+        fields: Iterable[str] = (),
+        limit: int = _QUERY_PAGE_SIZE,
+        offset_token: str = "",
+    ) -> str:
+        """``<RecordQueryRequest>`` body for ``iter_records``."""
+        offset = f" offsetToken={quoteattr(offset_token)}" if offset_token else ""
+        lines = [f'<RecordQueryRequest limit="{limit}"{offset}>']
+        fields = list(fields)
+        if fields:
+            lines.append("  <view>")
+            lines.extend(f"    <fieldId>{xml_escape(f)}</fieldId>" for f in fields)
+            lines.append("  </view>")
+        if isinstance(filter, str):
+            lines.append(filter)
+        elif filter:
+            lines.append('  <filter op="AND">')
+            for field_id, value in filter.items():
+                lines.extend([
+                    "    <fieldValue>",
+                    f"      <fieldId>{xml_escape(field_id)}</fieldId>",
+                    "      <operator>EQUALS</operator>",
+                    f"      <value>{xml_escape(value)}</value>",
+                    "    </fieldValue>",
+                ])
+            lines.append("  </filter>")
+        lines.append("</RecordQueryRequest>")
+        return "\n".join(lines)
+
     def create_record(self, model_name: str, record_xml: str, source: str) -> dict | str:
         """POST https://{hub_cloud_url}/mdm/universes/{universeId}/records.
 
@@ -892,6 +1101,95 @@ class DataHubApi:
             url, data=delete_xml, content_type="application/xml", accept_xml=True,
         )
 
+    def upsert_records(
+        self,
+        model_name: str,
+        records: Iterable[Mapping[str, Any]],
+        source: str,
+        chunk_size: int = _UPSERT_CHUNK_SIZE,
+        entity_tag: Optional[str] = None,
+        staging: bool = False,
+    ) -> list[RecordOutcome]:
+        """Upsert many records as chunked ``<batch src="{source}">`` documents.
+
+        Each record is a field → value dict; its ``id`` key becomes the
+        source entity ``<id>``, ``None`` values are left out.  Records are
+        grouped into batches of ``chunk_size`` (serialized on the worker that
+        sends them) and the batches go out in parallel on the client's worker
+        pool, within the hub host's rate budget.  ``records`` is read only a
+        few batches ahead of the sends, so it can be a generator over a
+        large export.  ``entity_tag`` overrides
+        the element name (default: the model name); ``staging=True`` posts
+        to ``/staging/{source}`` instead of ``/records``.
+
+        Returns one ``RecordOutcome`` per record, in input order.  A rejected
+        batch is split in half and resent until the failing records are
+        isolated, so one bad row costs a few extra calls rather than its
+        whole batch; batch-level rejections (unknown entity type) and
+        non-400 errors are reported for every record of the batch.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        base = self._record_base(model_name)
+        url = f"{base}/staging/{source}" if staging else f"{base}/records"
+        tag = entity_tag or model_name
+        indexed = enumerate(records)
+        chunks = iter(lambda: list(itertools.islice(indexed, chunk_size)), [])
+        outcomes: list[RecordOutcome] = []
+        batches = 0
+        for chunk_outcomes in self._repo_client.imap(
+            lambda chunk: self._upsert_chunk(url, tag, source, chunk), chunks,
+        ):
+            outcomes.extend(chunk_outcomes)
+            batches += 1
+        failed = sum(1 for outcome in outcomes if not outcome.ok)
+        logger.info(
+            "Upserted %d %s records (%d batches, %d rejected)",
+            len(outcomes) - failed, model_name, batches, failed,
+        )
+        return outcomes
+
+    def _upsert_chunk(
+        self, url: str, tag: str, source: str, chunk: list[tuple[int, Mapping[str, Any]]],
+    ) -> list[RecordOutcome]:
+        try:
+            self._repo_client.post(
+                url, data=self.records_to_batch_xml(tag, source, [r for _, r in chunk]),
+                content_type="application/xml", accept_xml=True,
+            )
+        except BoomiApiError as exc:
+            batch_level = any(e in exc.body.lower() for e in _BATCH_LEVEL_ERRORS)
+            if exc.status_code == 400 and len(chunk) > 1 and not batch_level:
+                half = len(chunk) // 2
+                return (
+                    self._upsert_chunk(url, tag, source, chunk[:half])
+                    + self._upsert_chunk(url, tag, source, chunk[half:])
+                )
+            return [RecordOutcome(i, str(r.get("id", "")), exc) for i, r in chunk]
+        return [RecordOutcome(i, str(r.get("id", ""))) for i, r in chunk]
+
+    @staticmethod
+    def records_to_batch_xml(
+        entity_tag: str, source: str, records: Iterable[Mapping[str, Any]],
+    ) -> str:
+        """``<batch src="...">`` document with one ``<{entity_tag}>`` element per record.
+
+        No XML declaration — Boomi docs show batch XML without one.
+        """
+        tag = xml_escape(entity_tag)
+        lines = [f"<batch src={quoteattr(source)}>"]
+        for record in records:
+            lines.append(f"  <{tag}>")
+            for field, value in record.items():
+                if value is None:
+                    continue
+                if isinstance(value, bool):
+                    value = "true" if value else "false"
+                lines.append(f"    <{field}>{xml_escape(str(value))}</{field}>")
+            lines.append(f"  </{tag}>")
+        lines.append("</batch>")
+        return "\n".join(lines)
+
     # ------------------------------------------------------------------
     # XML builders
     # ------------------------------------------------------------------
@@ -0,0 +1,215 @@
+"""On-disk replica of the ComponentMapping golden records."""
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Optional
+from xml.sax.saxutils import escape as xml_escape
+
+if TYPE_CHECKING:
+    from setup.api.datahub_api import DataHubApi, GoldenRecord
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAPPING_FILE = ".boomi-component-mappings.sqlite"
+
+_MODEL = "ComponentMapping"
+
+# Records written per SQLite transaction during a sync
+_WRITE_BATCH = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mappings (
+    record_id         TEXT PRIMARY KEY,
+    dev_component_id  TEXT NOT NULL,
+    dev_account_id    TEXT NOT NULL,
+    prod_component_id TEXT NOT NULL,
+    updated_date      TEXT NOT NULL,
+    fields            TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS mappings_dev ON mappings (dev_component_id, dev_account_id);
+CREATE INDEX IF NOT EXISTS mappings_account ON mappings (dev_account_id);
+CREATE INDEX IF NOT EXISTS mappings_prod ON mappings (prod_component_id);
+CREATE TABLE IF NOT EXISTS sync (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = "record_id, dev_component_id, dev_account_id, prod_component_id, updated_date, fields"
+
+
+class ComponentMappingEntry(NamedTuple):
+    """One replicated ComponentMapping record; ``fields`` holds every model field."""
+
+    record_id: str
+    dev_component_id: str
+    dev_account_id: str
+    prod_component_id: str
+    updated_date: str
+    fields: dict[str, str]
+
+    @classmethod
+    def _from_row(cls, row: tuple) -> ComponentMappingEntry:
+        return cls(*row[:5], json.loads(row[5]))
+
+
+class ComponentMappingIndex:
+    """SQLite copy of ComponentMapping, indexed by dev ID, dev account and prod ID.
+
+    The first ``sync`` pulls every record (``DataHubApi.iter_records``);
+    later ones ask only for records whose ``updatedDate`` is at or after
+    the newest one already stored (records sharing that timestamp are
+    read again, so none updated within the same second is missed).
+    Lookups are indexed reads of the local file and make no API calls, so
+    they also work offline once synced.
+
+    Golden records ended in DataHub are not returned by queries, so an
+    incremental sync cannot see them; ``sync(full=True)`` rebuilds the
+    replica and drops them.  A failed sync keeps the previous watermark (and
+    every record already stored), so the next one reads the same range
+    again.  Safe to share between threads; lookups never wait on the network.
+    """
+
+    def __init__(
+        self, path: Path | str = DEFAULT_MAPPING_FILE, datahub_api: Optional[DataHubApi] = None,
+    ) -> None:
+        self.path = Path(path)
+        self._datahub = datahub_api
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    # -- Sync --
+
+    @property
+    def synced_through(self) -> str:
+        """Newest ``updatedDate`` stored ('' before the first sync)."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM sync WHERE key = 'since'").fetchone()
+        return row[0] if row else ""
+
+    @staticmethod
+    def _updated_since_filter(since: str) -> str:
+        return (
+            '  <filter op="AND">\n'
+            f"    <updatedDate><from>{xml_escape(since)}</from></updatedDate>\n"
+            "  </filter>"
+        )
+
+    def sync(self, full: bool = False) -> int:
+        """Pull new and changed records (everything if ``full`` or never synced).
+
+        Pages are fetched without holding the index lock, so lookups keep
+        answering from the current replica while a sync runs; each batch is
+        written in one short transaction.  A full sync drops records it did
+        not see only at the end, and the watermark moves only once every
+        page has been read.  Concurrent syncs run one at a time.
+
+        Returns the number of records read.
+        """
+        if self._datahub is None:
+            raise ValueError("ComponentMappingIndex.sync needs a DataHubApi")
+        with self._sync_lock:
+            since = "" if full else self.synced_through
+            records = self._datahub.iter_records(
+                _MODEL, self._updated_since_filter(since) if since else None,
+            )
+            seen: list[str] = []
+            newest = since
+            for batch in iter(lambda: list(itertools.islice(records, _WRITE_BATCH)), []):
+                with self._lock, self._conn:
+                    for record in batch:
+                        self._store(record)
+                for record in batch:
+                    newest = max(newest, record.updated_date)
+                    seen.append(record.record_id)
+            with self._lock, self._conn:
+                if not since:
+                    self._drop_unseen(seen)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync (key, value) VALUES ('since', ?)", (newest,),
+                )
+        logger.debug(
+            "ComponentMapping %s sync: %d records read",
+            "incremental" if since else "full", len(seen),
+        )
+        return len(seen)
+
+    def _drop_unseen(self, seen: list[str]) -> None:
+        self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen (record_id TEXT PRIMARY KEY)")
+        self._conn.execute("DELETE FROM seen")
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO seen (record_id) VALUES (?)", ((rid,) for rid in seen),
+        )
+        self._conn.execute("DELETE FROM mappings WHERE record_id NOT IN (SELECT record_id FROM seen)")
+        self._conn.execute("DELETE FROM seen")
+
+    def _store(self, record: GoldenRecord) -> None:
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO mappings ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                record.record_id,
+                record.get("devComponentId"),
+                record.get("devAccountId"),
+                record.get("prodComponentId"),
+                record.updated_date,
+                json.dumps(record.fields, sort_keys=True),
+            ),
+        )
+
+    # -- Lookups --
+
+    def _select(self, where: str, *args: str) -> list[ComponentMappingEntry]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM mappings WHERE {where} ORDER BY record_id", args,
+            ).fetchall()
+        return [ComponentMappingEntry._from_row(row) for row in rows]
+
+    def prod_id_for(self, dev_component_id: str, dev_account_id: str) -> Optional[str]:
+        """Prod componentId mapped from a dev component, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT prod_component_id FROM mappings "
+                "WHERE dev_component_id = ? AND dev_account_id = ?",
+                (dev_component_id, dev_account_id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def by_dev_component(self, dev_component_id: str) -> list[ComponentMappingEntry]:
+        """Mappings of a dev component (one per dev account it was promoted from)."""
+        return self._select("dev_component_id = ?", dev_component_id)
+
+    def by_dev_account(self, dev_account_id: str) -> list[ComponentMappingEntry]:
+        """Every mapping promoted from one dev sub-account."""
+        return self._select("dev_account_id = ?", dev_account_id)
+
+    def by_prod_component(self, prod_component_id: str) -> list[ComponentMappingEntry]:
+        """Dev components that map to a prod component."""
+        return self._select("prod_component_id = ?", prod_component_id)
+
+    def mapping_cache(self, dev_account_id: str) -> dict[str, str]:
+        """Dev ID → prod ID for one account (the ``componentMappingCache`` shape)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT dev_component_id, prod_component_id FROM mappings "
+                "WHERE dev_account_id = ? ORDER BY dev_component_id",
+                (dev_account_id,),
+            ).fetchall()
+        return dict(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM mappings").fetchone()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
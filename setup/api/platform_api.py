@@ -1,19 +1,73 @@
 """Boomi Partner Platform API wrapper."""
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import logging
-import time
-from typing import Any, Optional
+import re
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
 
 from setup.api.client import BoomiClient, BoomiApiError
+from setup.api.component_index import ComponentIndex
+from setup.api.polling import (
+    DEFAULT_BACKOFF, DEFAULT_MAX_INTERVAL, PollOp, default_deadline, poll, poll_many,
+)
 from setup.config import BoomiConfig
 
 logger = logging.getLogger(__name__)
 
+_MERGE_TERMINAL_STAGES = frozenset({"MERGED", "FAILED_TO_MERGE"})
+
+# Component/bulk accepts at most this many IDs per call
+_BULK_GET_MAX = 100
+_BNS = "http://api.platform.boomi.com/"
+_XSI_TYPE = "{http://www.w3.org/2001/XMLSchema-instance}type"
+# Re-serialized components keep the prefix single GETs return
+ET.register_namespace("bns", _BNS)
+_ROOT_TAG_RE = re.compile(r"<(?P<tag>(?:\w+:)?Component)\b(?P<attrs>[^>]*)")
+# Root attributes the platform assigns; they never count as a content change
+_SERVER_ATTRS = frozenset({
+    "componentId", "version", "currentVersion", "deleted", "branchId", "branchName",
+    "createdDate", "createdBy", "modifiedDate", "modifiedBy",
+})
+
+
+class ComponentSummary(NamedTuple):
+    """Compact ComponentMetadata record yielded by ``iter_component_metadata``."""
+
+    component_id: str
+    name: str
+    type: str
+    folder_id: str
+    version: str
+    modified_date: str = ""
+    deleted: bool = False
+
+    @classmethod
+    def from_json(cls, item: dict) -> ComponentSummary:
+        """From a ComponentMetadata JSON object (or Component XML root attributes)."""
+        return cls(
+            item.get("componentId", ""),
+            item.get("name", ""),
+            item.get("type", ""),
+            item.get("folderId", ""),
+            str(item.get("version", "")),
+            item.get("modifiedDate", ""),
+            str(item.get("deleted", "false")).lower() == "true",
+        )
+
 
 class PlatformApi:
-    """Wrapper for Boomi Partner REST API v1 operations."""
+    """Wrapper for Boomi Partner REST API v1 operations.
+
+    Name lookups and prefix counts for PROMO components are answered from
+    ``component_index`` (see ``ComponentIndex``), built by one paginated
+    metadata scan, instead of one query each.
+    """
 
     def __init__(self, client: BoomiClient, config: BoomiConfig) -> None:
         self._client = client
@@ -21,28 +75,170 @@ class PlatformApi:
         self._base = (
             f"{config.cloud_base_url}/partner/api/rest/v1/{config.boomi_account_id}"
         )
+        self.component_index = ComponentIndex(self)
 
     # -- Component operations --
 
     def get_component(
-        self, component_id: str, account_id: Optional[str] = None
+        self, component_id: str, account_id: Optional[str] = None, cache: bool = False,
     ) -> dict | str:
-        """GET /Component/{id}. Use overrideAccount for cross-account reads."""
+        """GET /Component/{id}. Use overrideAccount for cross-account reads.
+
+        ``cache=True`` serves it from the response cache when one is
+        configured.  Template discovery reads fresh (the default), since
+        templates are edited by hand in the Boomi UI.
+        """
         url = f"{self._base}/Component/{component_id}"
         if account_id and account_id != self._config.boomi_account_id:
             url += f"?overrideAccount={account_id}"
-        return self._client.get(url, accept_xml=True)
+        return self._client.get(url, accept_xml=True, cache=cache, hedge=True)
+
+    def get_components_bulk(self, component_ids: Iterable[str]) -> dict[str, str]:
+        """POST /Component/bulk — component XML for many IDs in a few calls.
+
+        IDs are sent in chunks of up to 100 (the API maximum), the chunks in
+        parallel on the client's worker pool.  Each result is returned as
+        the ``<bns:Component>`` document ``get_component`` would return.
+        IDs the API could not read (unknown, no access) are missing from
+        the mapping and logged.
+        """
+        ids = list(dict.fromkeys(component_ids))
+        chunks = [ids[i:i + _BULK_GET_MAX] for i in range(0, len(ids), _BULK_GET_MAX)]
+        components: dict[str, str] = {}
+        for chunk_result in self._client.map(self._get_components_chunk, chunks):
+            components.update(chunk_result)
+        return components
+
+    def _get_components_chunk(self, component_ids: list[str]) -> dict[str, str]:
+        url = f"{self._base}/Component/bulk"
+        body = json.dumps({"type": "GET", "request": [{"id": cid} for cid in component_ids]})
+        components: dict[str, str] = {}
+        for response in self._client.stream_xml(
+            url, "response", method="POST", data=body, content_type="application/json",
+        ):
+            cid = response.get("id", "")
+            result = next(iter(response), None)
+            if response.get("statusCode") != "200" or result is None:
+                logger.warning(
+                    "Bulk GET of component %s failed (%s): %s", cid,
+                    response.get("statusCode"), response.get("errorMessage", ""),
+                )
+                continue
+            result.tag = f"{{{_BNS}}}Component"
+            result.attrib.pop(_XSI_TYPE, None)
+            components[cid] = ET.tostring(result, encoding="unicode")
+        return components
 
     def create_component(self, xml_body: str) -> dict | str:
-        """POST /Component with XML body."""
-        url = f"{self._base}/Component"
-        return self._client.post(url, data=xml_body, content_type="application/xml", accept_xml=True)
+        """POST /Component with XML body.
+
+        A body carrying an existing componentId updates that component, so
+        cached reads of the returned component are invalidated.  The
+        component is recorded in ``component_index``.
+        """
+        return self._post_component(f"{self._base}/Component", xml_body)
+
+    def update_component(self, component_id: str, xml_body: str) -> dict | str:
+        """POST /Component/{id} — replace the component with ``xml_body``.
+
+        ``xml_body`` may be a freshly generated body without a componentId;
+        the ID is set on its root element before sending.
+        """
+        root = _ROOT_TAG_RE.search(xml_body)
+        if root and "componentId=" not in root.group("attrs"):
+            xml_body = xml_body[:root.end("tag")] + f' componentId="{component_id}"' + xml_body[root.end("tag"):]
+        return self._post_component(f"{self._base}/Component/{component_id}", xml_body)
+
+    def _post_component(self, url: str, xml_body: str) -> dict | str:
+        result = self._client.post(url, data=xml_body, content_type="application/xml", accept_xml=True)
+        component_id = self.parse_component_id(result)
+        if component_id:
+            self._client.invalidate_cached(f"{self._base}/Component/{component_id}")
+        if isinstance(result, str):
+            try:
+                attrs = ET.fromstring(result.lstrip("\ufeff")).attrib
+            except ET.ParseError:
+                attrs = {}
+            if attrs.get("componentId"):
+                self.component_index.add(ComponentSummary.from_json(attrs))
+        return result
+
+    def create_components(self, xml_bodies: list[str]) -> list[dict | str | Exception]:
+        """POST /Component for each body in parallel on the client's worker pool.
+
+        Results keep input order.  A failed create yields its exception in
+        place of the response so callers can record the successes.
+        """
+        return self._client.map(self.create_component, xml_bodies, return_exceptions=True)
+
+    def save_components(
+        self, items: list[tuple[Optional[str], str]],
+    ) -> list[dict | str | Exception]:
+        """Create (ID None) or update each ``(component_id, xml)`` in parallel.
+
+        Same result contract as ``create_components``.
+        """
+        return self._client.map(
+            lambda item: self.update_component(*item) if item[0] else self.create_component(item[1]),
+            items, return_exceptions=True,
+        )
+
+    @staticmethod
+    def fingerprint(xml_body: str) -> str:
+        """SHA-256 of a component body in canonical form (C14N 2.0).
+
+        Attribute order, namespace prefixes, comments, whitespace around
+        text and between elements, and the root attributes the platform
+        assigns (componentId, version, dates, ...) do not change the hash;
+        any change to names, folders, configuration or script text does.
+        """
+        root = ET.fromstring(xml_body.lstrip("\ufeff"))
+        for attr in _SERVER_ATTRS:
+            root.attrib.pop(attr, None)
+        canonical = ET.canonicalize(ET.tostring(root, encoding="unicode"), strip_text=True)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
     def query_component_metadata(self, query_filter: str) -> dict | str:
-        """POST /ComponentMetadata/query with JSON filter body."""
+        """POST /ComponentMetadata/query with JSON filter body (first page only)."""
         url = f"{self._base}/ComponentMetadata/query"
         return self._client.post(url, data=query_filter)
 
+    def query_component_metadata_more(self, query_token: str) -> dict | str:
+        """POST /ComponentMetadata/queryMore with the previous page's queryToken."""
+        url = f"{self._base}/ComponentMetadata/queryMore"
+        return self._client.post(url, data=query_token, content_type="text/plain")
+
+    def iter_component_metadata(
+        self, query_filter: str, prefetch: bool = False,
+    ) -> Iterator[ComponentSummary]:
+        """Yield every match of a ComponentMetadata query, page by page.
+
+        Follows ``queryToken`` through queryMore only as the caller advances,
+        so stopping early (e.g. after the first match) costs no extra pages.
+        With ``prefetch=True`` the next page is requested on a background
+        thread as soon as the current one arrives, overlapping the round
+        trip with the caller's work on the current page.
+        """
+        executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="boomi-prefetch")
+            if prefetch else None
+        )
+        try:
+            page = self.query_component_metadata(query_filter)
+            while isinstance(page, dict):
+                token = page.get("queryToken")
+                upcoming: Optional[Future] = None
+                if token and executor is not None:
+                    upcoming = executor.submit(self.query_component_metadata_more, token)
+                for item in page.get("result", []):
+                    yield ComponentSummary.from_json(item)
+                if not token:
+                    return
+                page = upcoming.result() if upcoming else self.query_component_metadata_more(token)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
     # -- Folder operations --
 
     def create_folder(self, name: str, parent_id: str = "") -> dict | str:
@@ -62,23 +258,52 @@ class PlatformApi:
     def get_branch(self, branch_id: str) -> dict | str:
         """GET /Branch/{id}."""
         url = f"{self._base}/Branch/{branch_id}"
-        return self._client.get(url)
+        return self._client.get(url, hedge=True)
+
+    @staticmethod
+    def is_branch_ready(result: dict | str) -> bool:
+        """True once a GET /Branch/{id} response reports ready=true."""
+        return isinstance(result, dict) and result.get("ready") == "true"
 
     def poll_branch_ready(
-        self, branch_id: str, interval: int = 5, max_retries: int = 6
+        self,
+        branch_id: str,
+        interval: int = 5,
+        max_retries: int = 6,
+        deadline: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> dict | str:
         """Poll GET /Branch/{id} until ready=true."""
-        for attempt in range(max_retries):
-            result = self.get_branch(branch_id)
-            if isinstance(result, dict) and result.get("ready") == "true":
-                logger.info("Branch %s is ready", branch_id)
-                return result
-            logger.debug(
-                "Branch %s not ready (attempt %d/%d)", branch_id, attempt + 1, max_retries
-            )
-            time.sleep(interval)
-        raise BoomiApiError(
-            408, f"Branch {branch_id} not ready after {max_retries} polls", ""
+        return poll(
+            lambda: self.get_branch(branch_id), self.is_branch_ready,
+            f"Branch {branch_id}", "ready", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL,
+            deadline=default_deadline(interval, max_retries, deadline), cancel=cancel,
+        )
+
+    def poll_branches_ready(
+        self,
+        branch_ids: Iterable[str],
+        interval: int = 5,
+        max_retries: int = 6,
+        deadline: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+        return_exceptions: bool = False,
+    ) -> dict[str, dict | str | BoomiApiError]:
+        """Poll several branches from one scheduler; returns branch id → GET /Branch result.
+
+        Each tick reads every branch that is due in parallel (``client.map``).
+        """
+        ops = [
+            PollOp(branch_id, functools.partial(self.get_branch, branch_id),
+                   self.is_branch_ready, f"Branch {branch_id}")
+            for branch_id in dict.fromkeys(branch_ids)
+        ]
+        return poll_many(
+            ops, "ready", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL,
+            deadline=default_deadline(interval, max_retries, deadline), cancel=cancel, map_fn=self._client.map,
+            return_exceptions=return_exceptions,
         )
 
     def delete_branch(self, branch_id: str) -> dict | str:
@@ -115,29 +340,27 @@ class PlatformApi:
     def get_merge_request(self, merge_request_id: str) -> dict | str:
         """GET /MergeRequest/{id}."""
         url = f"{self._base}/MergeRequest/{merge_request_id}"
-        return self._client.get(url)
+        return self._client.get(url, hedge=True)
+
+    @staticmethod
+    def is_merge_finished(result: dict | str) -> bool:
+        """True once a GET /MergeRequest/{id} response is MERGED or FAILED_TO_MERGE."""
+        return isinstance(result, dict) and result.get("stage", "") in _MERGE_TERMINAL_STAGES
 
     def poll_merge_status(
-        self, merge_request_id: str, interval: int = 5, max_retries: int = 12
+        self,
+        merge_request_id: str,
+        interval: int = 5,
+        max_retries: int = 12,
+        deadline: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> dict | str:
         """Poll GET /MergeRequest/{id} until MERGED or FAILED_TO_MERGE."""
-        terminal_statuses = {"MERGED", "FAILED_TO_MERGE"}
-        for attempt in range(max_retries):
-            result = self.get_merge_request(merge_request_id)
-            if isinstance(result, dict):
-                status = result.get("stage", "")
-                if status in terminal_statuses:
-                    logger.info("Merge %s reached status: %s", merge_request_id, status)
-                    return result
-            logger.debug(
-                "Merge %s pending (attempt %d/%d)",
-                merge_request_id, attempt + 1, max_retries,
-            )
-            time.sleep(interval)
-        raise BoomiApiError(
-            408,
-            f"Merge {merge_request_id} not complete after {max_retries} polls",
-            "",
+        return poll(
+            lambda: self.get_merge_request(merge_request_id), self.is_merge_finished,
+            f"Merge {merge_request_id}", "complete", interval, max_retries,
+            backoff=DEFAULT_BACKOFF, max_interval=DEFAULT_MAX_INTERVAL,
+            deadline=default_deadline(interval, max_retries, deadline), cancel=cancel,
         )
 
     # -- PackagedComponent operations --
@@ -208,76 +431,63 @@ class PlatformApi:
 
     # -- Utility --
 
-    def count_components_by_prefix(self, prefix: str) -> int:
-        """Query current (non-deleted) components with name starting with prefix."""
-        query_json = json.dumps({
+    @staticmethod
+    def component_filter(*conditions: dict, include_deleted: bool = False) -> str:
+        """ComponentMetadata QueryFilter JSON: all ``conditions`` on current versions.
+
+        Each condition is ``{"operator": ..., "property": ..., "argument": [...]}``.
+        Deleted components are excluded unless ``include_deleted``.
+        """
+        nested = [{"@type": "SimpleExpression", **c} for c in conditions]
+        nested.append({
+            "@type": "SimpleExpression",
+            "operator": "EQUALS",
+            "property": "currentVersion",
+            "argument": ["true"],
+        })
+        if not include_deleted:
+            nested.append({
+                "@type": "SimpleExpression",
+                "operator": "EQUALS",
+                "property": "deleted",
+                "argument": ["false"],
+            })
+        return json.dumps({
             "QueryFilter": {
                 "expression": {
                     "@type": "GroupingExpression",
                     "operator": "and",
-                    "nestedExpression": [
-                        {
-                            "@type": "SimpleExpression",
-                            "operator": "LIKE",
-                            "property": "name",
-                            "argument": [f"{prefix}%"],
-                        },
-                        {
-                            "@type": "SimpleExpression",
-                            "operator": "EQUALS",
-                            "property": "currentVersion",
-                            "argument": ["true"],
-                        },
-                        {
-                            "@type": "SimpleExpression",
-                            "operator": "EQUALS",
-                            "property": "deleted",
-                            "argument": ["false"],
-                        },
-                    ],
+                    "nestedExpression": nested,
                 }
             }
         })
-        result = self.query_component_metadata(query_json)
-        if isinstance(result, dict):
-            return int(result.get("numberOfResults", 0))
-        return 0
+
+    def count_components_by_prefix(self, prefix: str) -> int:
+        """Count current (non-deleted) components with name starting with prefix.
+
+        PROMO prefixes are counted in ``component_index``; others by a query
+        across every queryMore page.
+        """
+        if self.component_index.covers(prefix):
+            return self.component_index.count_prefix(prefix)
+        query_json = self.component_filter(
+            {"operator": "LIKE", "property": "name", "argument": [f"{prefix}%"]}
+        )
+        return sum(1 for _ in self.iter_component_metadata(query_json, prefetch=True))
 
     def find_component_id_by_name(self, name: str) -> Optional[str]:
-        """Find a current, non-deleted component by exact name. Returns componentId or None."""
-        query_json = json.dumps({
-            "QueryFilter": {
-                "expression": {
-                    "@type": "GroupingExpression",
-                    "operator": "and",
-                    "nestedExpression": [
-                        {
-                            "@type": "SimpleExpression",
-                            "operator": "EQUALS",
-                            "property": "name",
-                            "argument": [name],
-                        },
-                        {
-                            "@type": "SimpleExpression",
-                            "operator": "EQUALS",
-                            "property": "currentVersion",
-                            "argument": ["true"],
-                        },
-                        {
-                            "@type": "SimpleExpression",
-                            "operator": "EQUALS",
-                            "property": "deleted",
-                            "argument": ["false"],
-                        },
-                    ],
-                }
-            }
-        })
-        result = self.query_component_metadata(query_json)
-        if isinstance(result, dict) and int(result.get("numberOfResults", 0)) > 0:
-            results = result.get("result", [])
-            if results:
-                return results[0].get("componentId", None)
+        """Find a current, non-deleted component by exact name. Returns componentId or None.
+
+        PROMO names are looked up in ``component_index``.
+        """
+        if self.component_index.covers(name):
+            return self.component_index.id_for(name)
+        query_json = self.component_filter(
+            {"operator": "EQUALS", "property": "name", "argument": [name]}
+        )
+        for summary in self.iter_component_metadata(query_json):
+            if summary.component_id:
+                return summary.component_id
         return None
 
     @staticmethod
@@ -0,0 +1,319 @@
+"""Poll loops shared by the blocking and asyncio API wrappers.
+
+A poll is a ``fetch`` (one status read) plus a ``done`` predicate that
+returns True once the operation has finished and raises ``BoomiApiError``
+if it failed terminally.  ``poll`` sleeps between attempts; ``apoll`` is the
+same loop as a coroutine.
+
+Schedule: the first wait is ``interval`` seconds and each later wait is
+``backoff`` times the previous one, capped at ``max_interval``
+(``backoff=1`` keeps a fixed interval); there is no wait after the last
+read.  A poll gives up with a 408 ``BoomiApiError`` after ``max_retries``
+reads or, with ``deadline``, once that many seconds have passed,
+whichever comes first.  The API poll methods back off by default and, unless
+given a deadline, stop after ``interval × max_retries`` seconds
+(``default_deadline``): the wall time of their old fixed schedules, in
+fewer reads.  ``cancel`` (a
+``threading.Event``) stops a blocking poll between reads with a 499;
+coroutine polls are cancelled the asyncio way, through their task.
+
+``poll_many`` watches several operations from one thread: each scheduler
+tick reads every operation that is due (through ``map_fn``, e.g.
+``BoomiClient.map``, so the reads of one tick run in parallel), then
+sleeps until the next one is due.  ``apoll_many`` is its coroutine form.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Iterator, NamedTuple, Optional
+
+from setup.api.client import BoomiApiError
+
+logger = logging.getLogger(__name__)
+
+# Status code for a poll stopped through its ``cancel`` event
+CANCELLED_STATUS = 499
+
+# Schedule used by the API poll methods: waits grow ×1.5 per read, up to 30s
+DEFAULT_BACKOFF = 1.5
+DEFAULT_MAX_INTERVAL = 30.0
+
+
+class PollOp(NamedTuple):
+    """One pending operation for ``poll_many`` (``apoll_many``: ``fetch`` is async)."""
+
+    key: Hashable
+    fetch: Callable[[], Any]
+    done: Callable[[Any], bool]
+    what: str
+
+
+def default_deadline(
+    interval: float, max_retries: int, deadline: Optional[float] = None,
+) -> Optional[float]:
+    """``deadline``, or the length of a fixed ``interval`` × ``max_retries`` schedule."""
+    if deadline is not None or interval <= 0:
+        return deadline
+    return interval * max_retries
+
+
+def delays(interval: float, backoff: float = 1.0, max_interval: Optional[float] = None) -> Iterator[float]:
+    """Endless wait schedule: ``interval``, then ×``backoff`` up to ``max_interval``."""
+    delay = interval
+    while True:
+        yield delay if max_interval is None else min(delay, max_interval)
+        delay *= backoff
+
+
+class _Clock:
+    """Seconds since the poll started; never behind the sleeps already taken.
+
+    Counting requested sleeps keeps deadlines and the ``poll_many`` schedule
+    consistent even when ``time.sleep`` returns early (or is patched out).
+    """
+
+    def __init__(self) -> None:
+        self._start = time.monotonic()
+        self._floor = 0.0
+
+    def elapsed(self) -> float:
+        return max(time.monotonic() - self._start, self._floor)
+
+    def advance(self, seconds: float) -> None:
+        self._floor = self.elapsed() + seconds
+
+
+def _pending(what: str, attempt: int, max_retries: int) -> None:
+    logger.debug("%s pending (attempt %d/%d)", what, attempt + 1, max_retries)
+
+
+def _timed_out(what: str, goal: str, max_retries: int) -> BoomiApiError:
+    return BoomiApiError(408, f"{what} not {goal} after {max_retries} polls", "")
+
+
+def _past_deadline(what: str, goal: str, deadline: float) -> BoomiApiError:
+    return BoomiApiError(408, f"{what} not {goal} within {deadline:g}s", "")
+
+
+def _cancelled(what: str) -> BoomiApiError:
+    return BoomiApiError(CANCELLED_STATUS, f"{what} polling cancelled", "")
+
+
+def _wait(seconds: float, cancel: Optional[threading.Event], what: str) -> None:
+    if cancel is None:
+        time.sleep(seconds)
+    elif cancel.wait(seconds):
+        raise _cancelled(what)
+
+
+def _next_wait(
+    clock: _Clock, delay: float, deadline: Optional[float], what: str, goal: str,
+) -> float:
+    """``delay``, shortened to end at the deadline; raises once it has passed."""
+    if deadline is None:
+        return delay
+    remaining = deadline - clock.elapsed()
+    if remaining <= 0:
+        raise _past_deadline(what, goal, deadline)
+    return min(delay, remaining)
+
+
+def poll(
+    fetch: Callable[[], Any],
+    done: Callable[[Any], bool],
+    what: str,
+    goal: str,
+    interval: float,
+    max_retries: int,
+    *,
+    backoff: float = 1.0,
+    max_interval: Optional[float] = None,
+    deadline: Optional[float] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Any:
+    """Call ``fetch`` on the backoff schedule until ``done``; return its result.
+
+    ``what`` and ``goal`` only label log lines and the timeout error, e.g.
+    ``"Branch b-1"`` / ``"ready"``.
+    """
+    clock = _Clock()
+    schedule = delays(interval, backoff, max_interval)
+    for attempt in range(max_retries):
+        if cancel is not None and cancel.is_set():
+            raise _cancelled(what)
+        result = fetch()
+        if done(result):
+            logger.info("%s %s", what, goal)
+            return result
+        _pending(what, attempt, max_retries)
+        if attempt + 1 == max_retries:
+            break
+        wait = _next_wait(clock, next(schedule), deadline, what, goal)
+        clock.advance(wait)
+        _wait(wait, cancel, what)
+    if deadline is not None and clock.elapsed() >= deadline:
+        raise _past_deadline(what, goal, deadline)
+    raise _timed_out(what, goal, max_retries)
+
+
+async def apoll(
+    fetch: Callable[[], Awaitable[Any]],
+    done: Callable[[Any], bool],
+    what: str,
+    goal: str,
+    interval: float,
+    max_retries: int,
+    *,
+    backoff: float = 1.0,
+    max_interval: Optional[float] = None,
+    deadline: Optional[float] = None,
+) -> Any:
+    """Coroutine version of ``poll``: awaits ``fetch`` and ``asyncio.sleep``."""
+    clock = _Clock()
+    schedule = delays(interval, backoff, max_interval)
+    for attempt in range(max_retries):
+        result = await fetch()
+        if done(result):
+            logger.info("%s %s", what, goal)
+            return result
+        _pending(what, attempt, max_retries)
+        if attempt + 1 == max_retries:
+            break
+        wait = _next_wait(clock, next(schedule), deadline, what, goal)
+        clock.advance(wait)
+        await asyncio.sleep(wait)
+    if deadline is not None and clock.elapsed() >= deadline:
+        raise _past_deadline(what, goal, deadline)
+    raise _timed_out(what, goal, max_retries)
+
+
+class _Pending:
+    """Scheduler bookkeeping for one ``poll_many`` operation."""
+
+    def __init__(self, op: PollOp, schedule: Iterator[float]) -> None:
+        self.op = op
+        self.schedule = schedule
+        self.attempts = 0
+        self.due = 0.0
+
+
+def _sequential_map(
+    fn: Callable[[Any], Any], items: Iterable[Any], return_exceptions: bool = False,
+) -> list[Any]:
+    results: list[Any] = []
+    for item in items:
+        try:
+            results.append(fn(item))
+        except Exception as exc:  # noqa: BLE001 — handed back like BoomiClient.map
+            if not return_exceptions:
+                raise
+            results.append(exc)
+    return results
+
+
+def poll_many(
+    ops: Iterable[PollOp],
+    goal: str,
+    interval: float,
+    max_retries: int,
+    *,
+    backoff: float = 1.0,
+    max_interval: Optional[float] = None,
+    deadline: Optional[float] = None,
+    cancel: Optional[threading.Event] = None,
+    map_fn: Optional[Callable[..., list[Any]]] = None,
+    return_exceptions: bool = False,
+) -> dict[Hashable, Any]:
+    """Poll every op until each is ``done``; returns ``{op.key: result}``.
+
+    Each op keeps its own backoff schedule and retry count; ``deadline``
+    applies to the whole batch.  ``map_fn(fn, items, return_exceptions=True)``
+    runs the reads of one tick (default: one after another on this thread).
+
+    With ``return_exceptions=True`` an op that fails or times out maps to
+    its exception (a ``BoomiApiError``, or whatever its ``fetch`` or
+    ``done`` raised) and the others keep polling; otherwise the first
+    failure is raised as soon as it is seen.  Cancellation always raises.
+    """
+    map_fn = map_fn or _sequential_map
+    clock = _Clock()
+    waiting = [_Pending(op, delays(interval, backoff, max_interval)) for op in ops]
+    results: dict[Hashable, Any] = {}
+
+    def settle(entry: _Pending, outcome: Any) -> None:
+        if isinstance(outcome, Exception) and not return_exceptions:
+            raise outcome
+        results[entry.op.key] = outcome
+
+    while waiting:
+        if cancel is not None and cancel.is_set():
+            raise _cancelled(f"{len(waiting)} operation(s)")
+        now = clock.elapsed()
+        due = [entry for entry in waiting if entry.due <= now]
+        fetched = map_fn(lambda entry: entry.op.fetch(), due, return_exceptions=True)
+        for entry, result in zip(due, fetched):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                finished = entry.op.done(result)
+            except Exception as exc:  # noqa: BLE001 — settled like a terminal failure
+                waiting.remove(entry)
+                settle(entry, exc)
+                continue
+            entry.attempts += 1
+            if finished:
+                logger.info("%s %s", entry.op.what, goal)
+                waiting.remove(entry)
+                settle(entry, result)
+            elif entry.attempts >= max_retries:
+                waiting.remove(entry)
+                settle(entry, _timed_out(entry.op.what, goal, max_retries))
+            else:
+                _pending(entry.op.what, entry.attempts - 1, max_retries)
+                entry.due = now + next(entry.schedule)
+        if not waiting:
+            break
+        wait = max(0.0, min(entry.due for entry in waiting) - now)
+        if deadline is not None:
+            remaining = deadline - clock.elapsed()
+            if remaining <= 0:
+                for entry in list(waiting):
+                    waiting.remove(entry)
+                    settle(entry, _past_deadline(entry.op.what, goal, deadline))
+                break
+            wait = min(wait, remaining)
+        if wait > 0:
+            clock.advance(wait)
+            _wait(wait, cancel, f"{len(waiting)} operation(s)")
+    return results
+
+
+async def apoll_many(
+    ops: Iterable[PollOp],
+    goal: str,
+    interval: float,
+    max_retries: int,
+    *,
+    backoff: float = 1.0,
+    max_interval: Optional[float] = None,
+    deadline: Optional[float] = None,
+    return_exceptions: bool = False,
+) -> dict[Hashable, Any]:
+    """Coroutine version of ``poll_many``: one ``apoll`` per op on one event loop."""
+    ops = list(ops)
+    tasks = [
+        asyncio.ensure_future(apoll(
+            op.fetch, op.done, op.what, goal, interval, max_retries,
+            backoff=backoff, max_interval=max_interval, deadline=deadline,
+        ))
+        for op in ops
+    ]
+    try:
+        outcomes = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        for task in tasks:
+            task.cancel()  # no-op once finished; stops the rest after a failure
+    return {op.key: outcome for op, outcome in zip(ops, outcomes)}
@@ -0,0 +1,102 @@
+"""Client-side rate limiting for Boomi API hosts."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Token bucket with a sustained refill rate and a burst capacity.
+
+    Each call reserves one token.  The bucket may go into debt, so callers
+    that arrive back-to-back queue up behind each other instead of racing
+    for the next refill.  Reservation is locked; the wait happens outside
+    the lock, so one bucket can be shared by many worker threads.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait (seconds)."""
+        with self._lock:
+            now = time.monotonic()
+            if self._updated is not None:
+                elapsed = max(0.0, now - self._updated)
+                self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """One TokenBucket per host.
+
+    The Platform API (api.boomi.com) and the DataHub hub cloud host have
+    independent rate budgets, so each gets its own bucket.  Share a single
+    instance between the Platform and Repository API clients.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        # Validate eagerly so misconfiguration fails at startup, not first call
+        TokenBucket(rate, burst)
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Return the lower-cased host (netloc) of a URL."""
+        return urlsplit(url).netloc.lower()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """Return the bucket for the URL's host, creating it on first use."""
+        host = self.host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def reserve(self, url: str) -> float:
+        """Reserve a token for the URL's host; returns the wait in seconds."""
+        return self.bucket_for(url).reserve()
+
+    def acquire(self, url: str) -> None:
+        """Block until the URL's host has a token available."""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class NullRateLimiter(HostRateLimiter):
+    """Limiter that never waits, for cassette replay (no server to protect)."""
+
+    def __init__(self) -> None:
+        super().__init__(rate=1.0)
+
+    def reserve(self, url: str) -> float:
+        return 0.0
+
+    def acquire(self, url: str) -> None:
+        return None
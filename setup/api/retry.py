@@ -0,0 +1,121 @@
+"""Retry policy for Boomi API calls: Retry-After, jittered backoff, budget."""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+# HTTP methods that are safe to resend after the request may have reached
+# the server (connection reset mid-response, read timeout).
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryBudget:
+    """Cap on the total backoff time spent across all retries in a run.
+
+    Every retry draws its wait from the budget; once it is spent, further
+    retries are refused and the error surfaces instead.  A throttling storm
+    therefore adds at most ``seconds`` to the run.  Thread-safe; share one
+    instance between all clients of a run.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        if seconds < 0:
+            raise ValueError(f"retry budget must be non-negative, got {seconds}")
+        self.seconds = seconds
+        self._spent = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def spent(self) -> float:
+        return self._spent
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.seconds - self._spent)
+
+    def spend(self, wait: float) -> bool:
+        """Withdraw ``wait`` seconds; False (nothing withdrawn) if it would overdraw."""
+        with self._lock:
+            if self._spent + wait > self.seconds:
+                return False
+            self._spent += wait
+            return True
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed call.
+
+    - A ``Retry-After`` header (seconds or HTTP-date) is honored as-is.
+    - Otherwise the wait uses decorrelated jitter:
+      ``min(cap, uniform(base, previous_wait * 3))``, so parallel workers
+      that were throttled together spread out instead of retrying in step.
+    - Every wait is drawn from the optional ``RetryBudget``.
+
+    Transport errors are retried for idempotent methods; for other methods
+    (POST) only connect timeouts are, since the request never left.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base: float = 1.0,
+        cap: float = 30.0,
+        budget: Optional[RetryBudget] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.max_retries = max_retries
+        self.base = base
+        self.cap = cap
+        self.budget = budget
+        self._rng = rng or random.Random()
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header; None if absent or malformed."""
+        if not value:
+            return None
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def is_retryable_exception(self, method: str, exc: BaseException) -> bool:
+        """True if a transport error may be retried for this method."""
+        if isinstance(exc, requests.exceptions.ConnectTimeout):
+            return True
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return False
+        return isinstance(
+            exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+        )
+
+    def next_wait(
+        self,
+        attempt: int,
+        previous_wait: float = 0.0,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """Backoff (seconds) before retry number ``attempt + 1``.
+
+        Returns None when retries or the budget are exhausted.
+        """
+        if attempt >= self.max_retries:
+            return None
+        wait = self.parse_retry_after(retry_after)
+        if wait is None:
+            upper = max(self.base, (previous_wait or self.base) * 3)
+            wait = min(self.cap, self._rng.uniform(self.base, upper))
+        if self.budget is not None and not self.budget.spend(wait):
+            return None
+        return wait
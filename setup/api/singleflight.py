@@ -0,0 +1,69 @@
+"""Coalescing of identical concurrent calls (single flight)."""
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Folds identical concurrent calls into one.
+
+    The first caller for a key runs ``fn``; callers that arrive with the
+    same key while it runs wait for it and share its result (or
+    exception).  A call that starts after the flight finished runs again,
+    so results are never reused beyond the calls they overlapped with.
+    Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Run ``fn`` once per concurrent ``key``; returns ``(result, shared)``.
+
+        ``shared`` is True for every caller whose result object went to
+        more than one caller, so callers that may mutate it should copy.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            # After this no caller can join, so ``waiters`` is final
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result, call.waiters > 0
+
+    def forget(self) -> None:
+        """Make later callers start new flights instead of joining running ones."""
+        with self._lock:
+            self._calls.clear()
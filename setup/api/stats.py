@@ -0,0 +1,244 @@
+"""Per-endpoint API call statistics: counts, bytes, status codes, latency."""
+from __future__ import annotations
+
+import math
+import re
+import threading
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+# Path prefixes that carry the account ID ahead of the resource path
+_ACCOUNT_PREFIX_RE = re.compile(r"^/(?:partner/api/rest/v1|mdm/api/rest/v1)/[^/]+")
+_UUID_RE = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+# Histogram resolution: 10 buckets per decade (~26% wide) of milliseconds
+_BUCKETS_PER_DECADE = 10
+
+
+def _is_id_segment(segment: str) -> bool:
+    if _UUID_RE.match(segment) or segment.isdigit():
+        return True
+    # Account IDs, component IDs and similar: long tokens containing digits
+    return len(segment) >= 8 and any(ch.isdigit() for ch in segment)
+
+
+def endpoint_template(method: str, url: str) -> str:
+    """Collapse a request URL into an endpoint template.
+
+    ``GET https://api.boomi.com/partner/api/rest/v1/acct-123/Component/<uuid>?x=1``
+    becomes ``GET /Component/{id}``; the account prefix and query string
+    are dropped and ID-like path segments replaced with ``{id}``.
+    """
+    path = _ACCOUNT_PREFIX_RE.sub("", urlsplit(url).path) or "/"
+    segments = [
+        "{id}" if _is_id_segment(seg) else seg
+        for seg in path.split("/")
+    ]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (milliseconds), mergeable and compact.
+
+    Percentiles are reported as the upper bound of the bucket they fall in,
+    so they are accurate to about one bucket width.
+    """
+
+    def __init__(self, buckets: Optional[dict[int, int]] = None) -> None:
+        self.buckets: dict[int, int] = dict(buckets or {})
+
+    @staticmethod
+    def bucket_of(ms: float) -> int:
+        if ms <= 1.0:
+            return 0
+        return math.ceil(_BUCKETS_PER_DECADE * math.log10(ms))
+
+    @staticmethod
+    def upper_bound(bucket: int) -> float:
+        return 10 ** (bucket / _BUCKETS_PER_DECADE)
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def add(self, ms: float) -> None:
+        bucket = self.bucket_of(ms)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for bucket, n in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + n
+
+    def percentile(self, q: float) -> float:
+        """Latency (ms) at quantile ``q`` in [0, 1]; 0.0 when empty."""
+        total = self.count
+        if total == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * total))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return round(self.upper_bound(bucket), 1)
+        return round(self.upper_bound(max(self.buckets)), 1)
+
+
+class EndpointStats:
+    """Accumulated stats for one endpoint template.
+
+    ``bytes_in``/``bytes_out`` count decoded bodies; ``wire_in``/``wire_out``
+    count what crossed the network, so the gap is the compression saving.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.status: dict[str, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.wire_in = 0
+        self.wire_out = 0
+        self.total_ms = 0.0
+        self.latency = LatencyHistogram()
+
+    def record(
+        self,
+        status: Optional[int],
+        elapsed_ms: float,
+        bytes_in: int,
+        bytes_out: int,
+        wire_in: Optional[int] = None,
+        wire_out: Optional[int] = None,
+    ) -> None:
+        self.count += 1
+        key = str(status) if status is not None else "error"
+        self.status[key] = self.status.get(key, 0) + 1
+        if status is None or status >= 400:
+            self.errors += 1
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.wire_in += bytes_in if wire_in is None else wire_in
+        self.wire_out += bytes_out if wire_out is None else wire_out
+        self.total_ms += elapsed_ms
+        self.latency.add(elapsed_ms)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "status": dict(self.status),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "wire_in": self.wire_in,
+            "wire_out": self.wire_out,
+            "total_ms": round(self.total_ms, 1),
+            "p50_ms": self.latency.percentile(0.50),
+            "p95_ms": self.latency.percentile(0.95),
+            "p99_ms": self.latency.percentile(0.99),
+            "hist": {str(b): n for b, n in sorted(self.latency.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> EndpointStats:
+        stats = cls()
+        stats.count = data.get("count", 0)
+        stats.errors = data.get("errors", 0)
+        stats.status = dict(data.get("status", {}))
+        stats.bytes_in = data.get("bytes_in", 0)
+        stats.bytes_out = data.get("bytes_out", 0)
+        # Stats saved before wire accounting: nothing was compressed
+        stats.wire_in = data.get("wire_in", stats.bytes_in)
+        stats.wire_out = data.get("wire_out", stats.bytes_out)
+        stats.total_ms = data.get("total_ms", 0.0)
+        stats.latency = LatencyHistogram(
+            {int(b): n for b, n in data.get("hist", {}).items()}
+        )
+        return stats
+
+    def merge(self, other: EndpointStats) -> None:
+        self.count += other.count
+        self.errors += other.errors
+        for key, n in other.status.items():
+            self.status[key] = self.status.get(key, 0) + n
+        self.bytes_in += other.bytes_in
+        self.bytes_out += other.bytes_out
+        self.wire_in += other.wire_in
+        self.wire_out += other.wire_out
+        self.total_ms += other.total_ms
+        self.latency.merge(other.latency)
+
+
+class ApiStats:
+    """Thread-safe per-endpoint statistics for a run.
+
+    Keeps a running total plus a window since the last ``take()``, which
+    the Engine uses to attribute calls to the step that made them.
+    """
+
+    def __init__(self) -> None:
+        self._total: dict[str, EndpointStats] = {}
+        self._window: dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        status: Optional[int],
+        elapsed_ms: float,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        wire_in: Optional[int] = None,
+        wire_out: Optional[int] = None,
+    ) -> None:
+        """Record one HTTP exchange (``status=None`` for a transport error).
+
+        ``wire_in``/``wire_out`` default to the decoded sizes (no compression).
+        """
+        endpoint = endpoint_template(method, url)
+        with self._lock:
+            for bucket in (self._total, self._window):
+                stats = bucket.get(endpoint)
+                if stats is None:
+                    stats = bucket[endpoint] = EndpointStats()
+                stats.record(status, elapsed_ms, bytes_in, bytes_out, wire_in, wire_out)
+
+    def latency_percentile(
+        self, method: str, url: str, q: float, min_count: int = 1,
+    ) -> Optional[float]:
+        """Run-wide latency (ms) at quantile ``q`` for the request's endpoint.
+
+        None until the endpoint has ``min_count`` recorded calls.
+        """
+        endpoint = endpoint_template(method, url)
+        with self._lock:
+            stats = self._total.get(endpoint)
+            if stats is None or stats.count < max(1, min_count):
+                return None
+            return stats.latency.percentile(q)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Totals for the whole run, keyed by endpoint template."""
+        with self._lock:
+            return {ep: s.to_dict() for ep, s in sorted(self._total.items())}
+
+    def take(self) -> dict[str, dict]:
+        """Stats since the previous ``take()``; starts a new window."""
+        with self._lock:
+            window, self._window = self._window, {}
+        return {ep: s.to_dict() for ep, s in sorted(window.items())}
+
+    @staticmethod
+    def merge_snapshots(snapshots: Iterable[dict[str, dict]]) -> dict[str, dict]:
+        """Combine snapshot dicts (e.g. per-step stats) into one."""
+        merged: dict[str, EndpointStats] = {}
+        for snapshot in snapshots:
+            for endpoint, data in snapshot.items():
+                stats = EndpointStats.from_dict(data)
+                if endpoint in merged:
+                    merged[endpoint].merge(stats)
+                else:
+                    merged[endpoint] = stats
+        return {ep: s.to_dict() for ep, s in sorted(merged.items())}
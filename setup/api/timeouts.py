@@ -0,0 +1,57 @@
+"""Per-endpoint timeouts and hedge delays from observed latency."""
+from __future__ import annotations
+
+from typing import Optional
+
+from setup.api.stats import ApiStats
+
+
+class AdaptiveTimeouts:
+    """Read timeouts and hedge delays derived from each endpoint's latency.
+
+    Until an endpoint has ``min_samples`` recorded calls, its read timeout
+    is ``default`` seconds and it is not hedged.  After that the read
+    timeout is ``multiplier`` times its p99, clamped to [``floor``,
+    ``ceiling``], so a stalled connection fails (and is retried) instead of
+    hanging a step.  The hedge delay is the endpoint's p95: an idempotent
+    GET still unanswered by then is worth sending a second time.
+
+    Latency comes from the shared ``ApiStats``, so sibling clients learn
+    from each other's calls.
+    """
+
+    def __init__(
+        self,
+        stats: ApiStats,
+        connect: float = 10.0,
+        default: float = 60.0,
+        floor: float = 5.0,
+        ceiling: float = 120.0,
+        multiplier: float = 4.0,
+        min_samples: int = 20,
+    ) -> None:
+        if not 0 < floor <= ceiling:
+            raise ValueError(f"need 0 < floor <= ceiling, got {floor}, {ceiling}")
+        self.stats = stats
+        self.connect = connect
+        self.default = min(max(default, floor), ceiling)
+        self.floor = floor
+        self.ceiling = ceiling
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+
+    def read_timeout(self, method: str, url: str) -> float:
+        """Seconds to wait for a response from this endpoint."""
+        p99 = self.stats.latency_percentile(method, url, 0.99, self.min_samples)
+        if p99 is None:
+            return self.default
+        return min(max(p99 / 1000 * self.multiplier, self.floor), self.ceiling)
+
+    def for_request(self, method: str, url: str) -> tuple[float, float]:
+        """``(connect, read)`` timeout for ``requests``."""
+        return (self.connect, self.read_timeout(method, url))
+
+    def hedge_delay(self, method: str, url: str) -> Optional[float]:
+        """Seconds before a hedged duplicate is sent; None until enough samples."""
+        p95 = self.stats.latency_percentile(method, url, 0.95, self.min_samples)
+        return None if p95 is None else p95 / 1000
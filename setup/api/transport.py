@@ -0,0 +1,127 @@
+"""HTTP transports for BoomiClient.
+
+A transport performs one HTTP exchange and nothing else: ``BoomiClient``
+adds credentials, rate limiting, retries and parsing on top.  Swapping the
+transport lets the full client stack run over a pooled ``requests``
+session (the default), a record/replay cassette (see ``Cassette.wrap``) or
+an in-process handler with no network at all (``InMemoryTransport``).
+"""
+from __future__ import annotations
+
+import io
+import json
+import threading
+from typing import Any, Callable, Optional, Protocol, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3 import HTTPResponse
+
+
+class Transport(Protocol):
+    """What BoomiClient needs from an HTTP layer."""
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> requests.Response: ...
+
+    def close(self) -> None: ...
+
+
+class RequestsTransport:
+    """Pooled ``requests.Session``; ``pool_size`` keep-alive connections per host.
+
+    Holds no credentials (the client sends them per request), so one
+    transport can serve clients with different auth.
+    """
+
+    def __init__(self, pool_size: int = 10) -> None:
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        return self.session.request(method, url, data=data, headers=headers, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+# What an InMemoryTransport handler may return: a Response, or
+# (status, body) / (status, body, headers) with a str, bytes, dict or list body
+HandlerResult = Union[requests.Response, tuple]
+Handler = Callable[[str, str, Any, dict[str, str]], HandlerResult]
+
+
+def make_response(
+    status: int,
+    body: Union[str, bytes, dict, list] = "",
+    headers: Optional[dict[str, str]] = None,
+    url: str = "",
+) -> requests.Response:
+    """Build a real ``requests.Response`` (dict/list bodies become JSON).
+
+    The body is both preloaded and available as ``resp.raw``.
+    """
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers = CaseInsensitiveDict(headers or {})
+    if isinstance(body, (dict, list)):
+        body = json.dumps(body)
+        resp.headers.setdefault("Content-Type", "application/json")
+    resp._content = body.encode("utf-8") if isinstance(body, str) else body
+    # Also readable as a stream, like a real ``stream=True`` response
+    resp.raw = HTTPResponse(
+        body=io.BytesIO(resp._content), headers=dict(resp.headers),
+        status=status, preload_content=False,
+    )
+    resp.encoding = "utf-8"
+    resp.url = url
+    return resp
+
+
+class InMemoryTransport:
+    """Answers requests by calling ``handler(method, url, data, headers)``.
+
+    No sockets are opened, so benchmarks measure the client stack itself.
+    Every request is appended to ``calls`` as ``(method, url, data, headers)``.
+    """
+
+    def __init__(self, handler: Handler) -> None:
+        self.handler = handler
+        self.calls: list[tuple[str, str, Any, dict[str, str]]] = []
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        headers = dict(headers or {})
+        with self._lock:
+            self.calls.append((method, url, data, headers))
+        result = self.handler(method, url, data, headers)
+        if isinstance(result, requests.Response):
+            return result
+        return make_response(*result, url=url)
+
+    def close(self) -> None:
+        return None
@@ -0,0 +1,45 @@
+"""Incremental parsing of XML API responses."""
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator, Optional
+
+
+def local_name(tag: str) -> str:
+    """Tag without its ``{namespace}`` prefix."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def child_text(element: ET.Element, name: str) -> str:
+    """Text of the first direct child with local name ``name`` ('' if none)."""
+    for child in element:
+        if local_name(child.tag) == name:
+            return child.text or ""
+    return ""
+
+
+def iter_elements(
+    source: IO[bytes], tag: str, root: Optional[dict[str, str]] = None,
+) -> Iterator[ET.Element]:
+    """Yield each complete element with local name ``tag`` as it is parsed.
+
+    ``source`` is read incrementally (e.g. a streamed ``resp.raw``), and each
+    yielded element is cleared and detached afterwards, so memory stays flat
+    however long the document is.  Use or copy what you need from an
+    element before advancing the iterator.  Namespaces are ignored when
+    matching.  If ``root`` is given, it is filled with the document
+    element's attributes as soon as its start tag has been read.
+    """
+    stack: list[ET.Element] = []
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if not stack and root is not None:
+                root.update(element.attrib)
+            stack.append(element)
+            continue
+        stack.pop()
+        if local_name(element.tag) == tag:
+            yield element
+            element.clear()
+            if stack:
+                stack[-1].remove(element)
@@ -35,6 +35,14 @@ class BoomiConfig(BaseModel):
         default="",
         description="DataHub auth username for Repository API Basic Auth (generated, not account ID)",
     )
+    repo_auth_format: str = Field(
+        default="",
+        description="Repository API auth format that last passed the probe (see DataHubApi._AUTH_FORMATS)",
+    )
+    repo_auth_fingerprint: str = Field(
+        default="",
+        description="Fingerprint of the credentials repo_auth_format was probed with",
+    )
     universe_ids: dict = Field(
         default_factory=dict,
         description="Mapping of model_name -> universe_id (model UUID) for record operations",
@@ -43,6 +51,66 @@ class BoomiConfig(BaseModel):
         default=False,
         description="Enable verbose/debug output (show full request details on error)",
     )
+    sync_components: bool = Field(
+        default=False,
+        description="Re-check created components by content hash and update only changed ones",
+    )
+    api_rate: Optional[float] = Field(
+        default=None,
+        description="Safety cap on API calls per second per host (default: 20)",
+    )
+    api_burst: Optional[int] = Field(
+        default=None,
+        description="API calls a host may receive back-to-back before the rate cap applies (default: 4)",
+    )
+    api_workers: Optional[int] = Field(
+        default=None,
+        description="Worker threads for parallel API calls (default: 4; 1 = sequential)",
+    )
+    api_pool_size: Optional[int] = Field(
+        default=None,
+        description="Pooled HTTP connections per host (default: 10)",
+    )
+    api_max_in_flight: Optional[int] = Field(
+        default=None,
+        description="Ceiling for the adaptive in-flight window per host (default: 16)",
+    )
+    api_cache: Optional[str] = Field(
+        default=None,
+        description="Opt-in response cache for repeat reads ('on' for .boomi-api-cache.sqlite, or a file path; default: off)",
+    )
+    api_cache_ttl: Optional[float] = Field(
+        default=None,
+        description="Seconds a cached read without ETag/Last-Modified stays valid (default: 300)",
+    )
+    api_cache_max_mb: Optional[int] = Field(
+        default=None,
+        description="Size cap for the response cache in MB (default: 64)",
+    )
+    api_retry_budget: Optional[float] = Field(
+        default=None,
+        description="Total seconds a run may spend in retry backoff (default: 120)",
+    )
+    api_timeout: Optional[float] = Field(
+        default=None,
+        description="Cap in seconds on the adaptive per-endpoint read timeout (default: 120)",
+    )
+    api_hedge: Optional[bool] = Field(
+        default=None,
+        description="Re-send idempotent status/component GETs slower than their p95 latency (default: off)",
+    )
+    api_compress: Optional[bool] = Field(
+        default=None,
+        description="Gzip request bodies of 1 KB or more, e.g. component XML (default: off)",
+    )
+    api_breaker_threshold: Optional[int] = Field(
+        default=None,
+        description="Consecutive failures (transport errors, 5xx) that open an endpoint's circuit; 0 disables (default: 5)",
+    )
+    api_breaker_reset: Optional[float] = Field(
+        default=None,
+        description="Seconds an open circuit fails fast before a probe call (default: 30)",
+    )
 
     @property
     def is_complete(self) -> bool:
@@ -71,6 +139,8 @@ class BoomiConfig(BaseModel):
             "cloud_base_url": self.cloud_base_url,
             "fss_environment_id": self.fss_environment_id,
             "hub_cloud_url": self.hub_cloud_url,
+            "repo_auth_format": self.repo_auth_format,
+            "repo_auth_fingerprint": self.repo_auth_fingerprint,
             "universe_ids": self.universe_ids,
         }
 
@@ -82,6 +152,21 @@ _ENV_MAP: dict[str, str] = {
     "BOOMI_ACCOUNT": "boomi_account_id",
     "BOOMI_REPO": "boomi_repo_id",
     "BOOMI_FSS_ENVIRONMENT": "fss_environment_id",
+    "BOOMI_CLOUD_BASE_URL": "cloud_base_url",
+    "BOOMI_API_RATE": "api_rate",
+    "BOOMI_API_BURST": "api_burst",
+    "BOOMI_API_WORKERS": "api_workers",
+    "BOOMI_API_POOL_SIZE": "api_pool_size",
+    "BOOMI_API_MAX_IN_FLIGHT": "api_max_in_flight",
+    "BOOMI_API_RETRY_BUDGET": "api_retry_budget",
+    "BOOMI_API_TIMEOUT": "api_timeout",
+    "BOOMI_API_HEDGE": "api_hedge",
+    "BOOMI_API_COMPRESS": "api_compress",
+    "BOOMI_API_BREAKER_THRESHOLD": "api_breaker_threshold",
+    "BOOMI_API_BREAKER_RESET": "api_breaker_reset",
+    "BOOMI_API_CACHE": "api_cache",
+    "BOOMI_API_CACHE_TTL": "api_cache_ttl",
+    "BOOMI_API_CACHE_MAX_MB": "api_cache_max_mb",
 }
 
 # Fields that should be prompted interactively (with labels).
@@ -111,7 +196,7 @@ def load_config(
     if existing_state_config:
         for key in (
             "boomi_account_id", "boomi_repo_id", "cloud_base_url", "fss_environment_id",
-            "hub_cloud_url", "datahub_token",
+            "hub_cloud_url", "datahub_token", "repo_auth_format", "repo_auth_fingerprint",
         ):
             val = existing_state_config.get(key, "")
             if val:
@@ -1,14 +1,24 @@
 """Step registry and execution engine for Boomi Build Guide Setup Automation."""
 from __future__ import annotations
 
+import time
 from collections import deque
 from enum import Enum
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Optional, Protocol, runtime_checkable
 
 import click
 
+from setup.api.circuit import OPEN, circuit_key
+from setup.api.client import BoomiApiError, CircuitOpenError
 from setup.state import SetupState
 
+if TYPE_CHECKING:
+    from setup.api.circuit import CircuitBreakers
+    from setup.api.stats import ApiStats
+
+# Times one step may be paused and re-run for open API circuits
+_MAX_CIRCUIT_PAUSES = 3
+
 
 class StepType(str, Enum):
     """Automation level for a build step."""
@@ -114,11 +124,85 @@ class StepRegistry:
 
 
 class Engine:
-    """Executes registered steps in dependency order, with resume support."""
-
-    def __init__(self, registry: StepRegistry, state: SetupState) -> None:
+    """Executes registered steps in dependency order, with resume support.
+
+    With ``api_stats``, the API calls made by each executed step are saved
+    to that step's state entry (``api_stats``).
+
+    With ``breakers``, circuit transitions are reported as they happen, and
+    a step that fails because of an open API circuit is paused until the
+    circuit takes its probe call and then run again (at most
+    ``max_circuit_pauses`` times), instead of stopping the run.  A failure
+    counts as circuit-related when the step raised ``CircuitOpenError`` or
+    an API error from an endpoint whose circuit is open, or, for a step
+    that reports FAILED itself, when one of its calls was refused by an
+    open circuit or tripped one.  Other failures (a 400, say) stop the run
+    as usual, so interactive steps are not prompted again.  Steps resume
+    from their completed items, so only the remaining work repeats.
+    """
+
+    def __init__(
+        self,
+        registry: StepRegistry,
+        state: SetupState,
+        api_stats: Optional[ApiStats] = None,
+        breakers: Optional[CircuitBreakers] = None,
+        max_circuit_pauses: int = _MAX_CIRCUIT_PAUSES,
+    ) -> None:
         self.registry = registry
         self.state = state
+        self.api_stats = api_stats
+        self.breakers = breakers
+        self.max_circuit_pauses = max_circuit_pauses
+        self._opened: set[str] = set()  # circuits opened since the current attempt began
+        if breakers is not None:
+            breakers.subscribe(self._on_circuit_change)
+
+    def _on_circuit_change(self, circuit: str, old: str, new: str) -> None:
+        click.echo(f"  [circuit] {circuit}: {old} -> {new}")
+        if new == OPEN:
+            self._opened.add(circuit)
+
+    def _circuit_failure(self, error: Optional[Exception], rejected_before: int) -> bool:
+        """True if the failed attempt is down to an open circuit (see class docstring)."""
+        assert self.breakers is not None
+        open_circuits = self.breakers.open_circuits()
+        if error is not None:
+            if isinstance(error, CircuitOpenError):
+                return True
+            return (
+                isinstance(error, BoomiApiError) and bool(error.url)
+                and circuit_key(error.url) in open_circuits
+            )
+        return (
+            self.breakers.rejected() > rejected_before
+            or bool(self._opened & open_circuits.keys())
+        )
+
+    def _pause_for_circuits(
+        self, step: Step, pauses: int, error: Optional[Exception], rejected_before: int,
+    ) -> bool:
+        """Wait out open circuits before re-running ``step``; False if it shouldn't re-run."""
+        if self.breakers is None or pauses >= self.max_circuit_pauses:
+            return False
+        open_circuits = self.breakers.open_circuits()
+        if not open_circuits or not self._circuit_failure(error, rejected_before):
+            return False
+        wait = max(open_circuits.values())
+        click.echo(
+            f"  [paused] {step.name} — circuit open for {', '.join(sorted(open_circuits))}; "
+            f"retrying in {wait:.0f}s ({pauses + 1}/{self.max_circuit_pauses})"
+        )
+        time.sleep(wait)
+        return True
+
+    def _record_api_stats(self, step: Step) -> None:
+        """Attribute API calls since the step started to that step."""
+        if self.api_stats is None:
+            return
+        snapshot = self.api_stats.take()
+        if snapshot:
+            self.state.set_step_api_stats(step.step_id, snapshot)
 
     def _is_satisfied(self, step: Step) -> bool:
         """Check if all dependencies of a step are completed."""
@@ -170,24 +254,41 @@ class Engine:
             # Execute (handles pending, in_progress, and failed)
             click.echo(f"  [run] {step.name} ({step.step_type.value})")
             self.state.set_step_status(step.step_id, StepStatus.IN_PROGRESS.value)
-
-            try:
-                result = step.execute(self.state, dry_run=dry_run)
-                self.state.set_step_status(step.step_id, result.value)
-
-                if result == StepStatus.FAILED:
-                    click.echo(f"  [FAILED] {step.name} — stopping execution")
+            if self.api_stats is not None:
+                self.api_stats.take()  # discard calls made between steps
+
+            pauses = 0
+            while True:
+                error: Optional[Exception] = None
+                self._opened.clear()
+                rejected = self.breakers.rejected() if self.breakers is not None else 0
+                try:
+                    result = step.execute(self.state, dry_run=dry_run)
+                except Exception as exc:
+                    result, error = StepStatus.FAILED, exc
+                if result != StepStatus.FAILED or not self._pause_for_circuits(
+                    step, pauses, error, rejected,
+                ):
                     break
+                pauses += 1
 
-                click.echo(f"  [done] {step.name} -> {result.value}")
-
-            except Exception as exc:
+            if error is not None:
                 self.state.set_step_status(
-                    step.step_id, StepStatus.FAILED.value, error=str(exc)
+                    step.step_id, StepStatus.FAILED.value, error=str(error)
                 )
-                click.echo(f"  [ERROR] {step.name}: {exc}")
+                self._record_api_stats(step)
+                click.echo(f"  [ERROR] {step.name}: {error}")
                 break
 
+            self.state.set_step_status(step.step_id, result.value)
+            self._record_api_stats(step)
+
+            if result == StepStatus.FAILED:
+                click.echo(f"  [FAILED] {step.name} — stopping execution")
+                break
+
+            click.echo(f"  [done] {step.name} -> {result.value}")
+
             if step.step_id == target_step:
                 break
 
@@ -92,20 +92,92 @@ def _build_registry(
     return registry
 
 
-def _init_apis(config: BoomiConfig):
-    """Initialize API clients from config. Returns (platform_api, datahub_api) or (None, None)."""
+def _init_apis(config: BoomiConfig, cassette=None):
+    """Initialize API clients from config. Returns (platform_api, datahub_api) or (None, None).
+
+    With a cassette (``--record`` / ``--replay``), all API traffic is recorded
+    or replayed and the response cache is bypassed so runs are repeatable.
+    """
     if not config.has_credentials:
         return None, None
+    from setup.api.cache import DEFAULT_CACHE_FILE, ResponseCache
     from setup.api.client import BoomiClient
     from setup.api.datahub_api import DataHubApi
     from setup.api.platform_api import PlatformApi
 
-    client = BoomiClient(config.boomi_user, config.boomi_token)
+    cache = None
+    cache_setting = (config.api_cache or "").strip()
+    if cassette is None and cache_setting.lower() not in ("", "off", "none", "0", "false"):
+        cache = ResponseCache(
+            DEFAULT_CACHE_FILE if cache_setting.lower() in ("on", "1", "true") else cache_setting,
+            max_bytes=(config.api_cache_max_mb or 64) * 1024 * 1024,
+            ttl=config.api_cache_ttl if config.api_cache_ttl is not None else 300.0,
+        )
+
+    client = BoomiClient(
+        config.boomi_user, config.boomi_token,
+        rate=config.api_rate, burst=config.api_burst,
+        max_workers=config.api_workers, pool_size=config.api_pool_size,
+        max_in_flight=config.api_max_in_flight,
+        retry_budget=config.api_retry_budget,
+        max_timeout=config.api_timeout,
+        hedge=bool(config.api_hedge),
+        compress_requests=bool(config.api_compress),
+        breaker_threshold=config.api_breaker_threshold,
+        breaker_reset=config.api_breaker_reset,
+        cache=cache,
+        cassette=cassette,
+    )
     platform_api = PlatformApi(client, config)
     datahub_api = DataHubApi(client, config)
     return platform_api, datahub_api
 
 
+def _record_api_concurrency(state: SetupState, platform_api) -> None:
+    """Persist the client's per-host AIMD windows so `status` can show them."""
+    if platform_api is None:
+        return
+    snapshot = platform_api._client.concurrency_snapshot()
+    if snapshot:
+        state.set_api_concurrency(snapshot)
+
+
+def _record_repo_auth(state: SetupState, config: BoomiConfig) -> None:
+    """Save the Repository API auth format that passed its probe, so later runs skip probing."""
+    if config.repo_auth_format and state.config.get("repo_auth_fingerprint") != config.repo_auth_fingerprint:
+        state.update_config({
+            "repo_auth_format": config.repo_auth_format,
+            "repo_auth_fingerprint": config.repo_auth_fingerprint,
+        })
+
+
+def _api_stats(platform_api):
+    """The client's ApiStats collector, or None without API clients."""
+    return platform_api._client.stats if platform_api is not None else None
+
+
+def _breakers(platform_api):
+    """The client's circuit breakers, or None without API clients."""
+    return platform_api._client.breakers if platform_api is not None else None
+
+
+def _open_cassette(ctx: click.Context):
+    """Cassette selected by --record / --replay, or None.
+
+    A recording is written when the command finishes (even if it fails).
+    """
+    from setup.api.cassette import Cassette
+
+    obj = ctx.find_root().obj
+    if obj.get("replay"):
+        return Cassette.replay(obj["replay"], latency_scale=obj.get("replay_latency", 0.0))
+    if obj.get("record"):
+        cassette = Cassette.record(obj["record"])
+        ctx.call_on_close(cassette.save)
+        return cassette
+    return None
+
+
 def _load_state(state_file: str) -> SetupState:
     """Load or create the state file."""
     path = Path(state_file)
@@ -124,8 +196,32 @@ def _load_state(state_file: str) -> SetupState:
     is_flag=True,
     help="Show full request details (URL, headers, body, credentials) on API errors.",
 )
+@click.option(
+    "--record",
+    type=click.Path(dir_okay=False),
+    help="Record all API traffic to this cassette file (gzip JSON, no credentials).",
+)
+@click.option(
+    "--replay",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Serve API calls from this cassette file instead of the network.",
+)
+@click.option(
+    "--replay-latency",
+    type=float,
+    default=0.0,
+    show_default=True,
+    help="With --replay, sleep this multiple of each recorded response time (1 = realistic).",
+)
 @click.pass_context
-def cli(ctx: click.Context, state_file: str, verbose: bool) -> None:
+def cli(
+    ctx: click.Context,
+    state_file: str,
+    verbose: bool,
+    record: str | None,
+    replay: str | None,
+    replay_latency: float,
+) -> None:
     """Boomi Build Guide Setup Automation.
 
     Automates the creation and configuration of Boomi components
@@ -134,6 +230,11 @@ def cli(ctx: click.Context, state_file: str, verbose: bool) -> None:
     ctx.ensure_object(dict)
     ctx.obj["state_file"] = state_file
     ctx.obj["verbose"] = verbose
+    if record and replay:
+        raise click.UsageError("--record and --replay are mutually exclusive.")
+    ctx.obj["record"] = record
+    ctx.obj["replay"] = replay
+    ctx.obj["replay_latency"] = replay_latency
 
 
 @cli.command()
@@ -164,10 +265,17 @@ def setup(ctx: click.Context, dry_run: bool) -> None:
         raise SystemExit(1)
 
     state.update_config(config.to_state_dict())
-    platform_api, datahub_api = _init_apis(config)
+    platform_api, datahub_api = _init_apis(config, _open_cassette(ctx))
     registry = _build_registry(config, platform_api, datahub_api)
-    engine = Engine(registry, state)
-    engine.run(dry_run=dry_run)
+    engine = Engine(
+        registry, state,
+        api_stats=_api_stats(platform_api), breakers=_breakers(platform_api),
+    )
+    try:
+        engine.run(dry_run=dry_run)
+    finally:
+        _record_api_concurrency(state, platform_api)
+        _record_repo_auth(state, config)
     click.echo("Setup complete.")
 
 
@@ -178,25 +286,32 @@ def verify(ctx: click.Context) -> None:
     state = _load_state(ctx.obj["state_file"])
     config = load_config(existing_state_config=state.config, interactive=True)
     config.verbose = ctx.obj.get("verbose", False)
-    platform_api, datahub_api = _init_apis(config)
+    platform_api, datahub_api = _init_apis(config, _open_cassette(ctx))
     registry = _build_registry(config, platform_api, datahub_api)
     ordered = registry.resolve_order()
 
-    for step in ordered:
-        current = state.get_step_status(step.step_id)
-        if current == StepStatus.COMPLETED.value:
-            click.echo(f"  [verify] {step.name}")
-            if step.step_type.value == "validate":
-                result = step.execute(state, dry_run=False)
-                status_label = "OK" if result == StepStatus.COMPLETED else "FAIL"
-                click.echo(f"    -> {status_label}")
-            else:
-                click.echo("    -> skipped (not a validation step)")
+    try:
+        for step in ordered:
+            current = state.get_step_status(step.step_id)
+            if current == StepStatus.COMPLETED.value:
+                click.echo(f"  [verify] {step.name}")
+                if step.step_type.value == "validate":
+                    result = step.execute(state, dry_run=False)
+                    status_label = "OK" if result == StepStatus.COMPLETED else "FAIL"
+                    click.echo(f"    -> {status_label}")
+                else:
+                    click.echo("    -> skipped (not a validation step)")
+    finally:
+        _record_repo_auth(state, config)
 
 
 @cli.command()
+@click.option(
+    "--api-stats", is_flag=True,
+    help="Show per-endpoint API call counts, bytes and latency from previous runs.",
+)
 @click.pass_context
-def status(ctx: click.Context) -> None:
+def status(ctx: click.Context, api_stats: bool) -> None:
     """Show the current status of all setup steps."""
     state = _load_state(ctx.obj["state_file"])
     # Status doesn't need real APIs — use dummy config
@@ -214,6 +329,64 @@ def status(ctx: click.Context) -> None:
     for entry in summary:
         click.echo(f"{entry['name']:<40} {entry['type']:<10} {entry['status']:<12}")
 
+    concurrency = state.api_concurrency
+    if concurrency.get("hosts"):
+        click.echo("")
+        click.echo(f"API concurrency (recorded {concurrency.get('recorded_at', '?')})")
+        click.echo(f"{'Host':<40} {'Window':>7} {'Throttled':>10} {'Decreases':>10}")
+        click.echo("-" * 70)
+        for host, snap in concurrency["hosts"].items():
+            click.echo(
+                f"{host:<40} {snap.get('window', 0):>7} "
+                f"{snap.get('throttled', 0):>10} {snap.get('decreases', 0):>10}"
+            )
+
+    if api_stats:
+        _print_api_stats(state)
+
+
+def _print_api_stats(state: SetupState) -> None:
+    """Print where API wall-clock time went: per endpoint, then per step."""
+    from setup.api.stats import ApiStats
+
+    per_step = state.get_step_api_stats()
+    click.echo("")
+    if not per_step:
+        click.echo("No API stats recorded yet. Run 'setup' or 'run-step' first.")
+        return
+
+    merged = ApiStats.merge_snapshots(per_step.values())
+    click.echo("API calls by endpoint (all steps, slowest total first)")
+    click.echo(
+        f"{'Endpoint':<52} {'Calls':>6} {'Err':>4} {'p50ms':>7} {'p95ms':>7} "
+        f"{'p99ms':>7} {'Total s':>8} {'KB in':>8} {'KB out':>7}"
+    )
+    click.echo("-" * 114)
+    for endpoint, st in sorted(merged.items(), key=lambda kv: -kv[1]["total_ms"]):
+        click.echo(
+            f"{endpoint[:52]:<52} {st['count']:>6} {st['errors']:>4} "
+            f"{st['p50_ms']:>7} {st['p95_ms']:>7} {st['p99_ms']:>7} "
+            f"{st['total_ms'] / 1000:>8.1f} {st['bytes_in'] / 1024:>8.1f} "
+            f"{st['bytes_out'] / 1024:>7.1f}"
+        )
+    bytes_total = sum(st["bytes_in"] + st["bytes_out"] for st in merged.values())
+    wire_total = sum(st["wire_in"] + st["wire_out"] for st in merged.values())
+    if wire_total < bytes_total:
+        click.echo(
+            f"Compression: {bytes_total / 1024:.1f} KB of bodies sent as "
+            f"{wire_total / 1024:.1f} KB ({100 * (1 - wire_total / bytes_total):.0f}% saved)"
+        )
+
+    click.echo("")
+    click.echo("API time by step")
+    click.echo(f"{'Step':<10} {'Calls':>6} {'Errors':>7} {'API s':>8}")
+    click.echo("-" * 34)
+    for step_id, stats in per_step.items():
+        calls = sum(st["count"] for st in stats.values())
+        errors = sum(st["errors"] for st in stats.values())
+        total_s = sum(st["total_ms"] for st in stats.values()) / 1000
+        click.echo(f"{step_id:<10} {calls:>6} {errors:>7} {total_s:>8.1f}")
+
 
 @cli.command("run-step")
 @click.argument("step_id")
@@ -230,7 +403,7 @@ def run_step(ctx: click.Context, step_id: str, dry_run: bool) -> None:
         raise SystemExit(1)
 
     state.update_config(config.to_state_dict())
-    platform_api, datahub_api = _init_apis(config)
+    platform_api, datahub_api = _init_apis(config, _open_cassette(ctx))
     registry = _build_registry(config, platform_api, datahub_api)
 
     try:
@@ -239,8 +412,66 @@ def run_step(ctx: click.Context, step_id: str, dry_run: bool) -> None:
         click.echo(f"Error: unknown step '{step_id}'")
         raise SystemExit(1)
 
-    engine = Engine(registry, state)
-    engine.run(dry_run=dry_run, target_step=step_id)
+    engine = Engine(
+        registry, state,
+        api_stats=_api_stats(platform_api), breakers=_breakers(platform_api),
+    )
+    try:
+        engine.run(dry_run=dry_run, target_step=step_id)
+    finally:
+        _record_api_concurrency(state, platform_api)
+        _record_repo_auth(state, config)
+
+
+# Steps that generate components from local specs and can be re-synced
+_SYNC_STEPS = ("2.3", "2.7", "3.1", "3.1b", "3.3")
+
+
+@cli.command()
+@click.argument("step_ids", nargs=-1)
+@click.pass_context
+def sync(ctx: click.Context, step_ids: tuple[str, ...]) -> None:
+    """Push local edits to already-created components (content-hash sync).
+
+    Regenerates each component of the given steps (default: 2.3 2.7 3.1
+    3.1b 3.3) and compares it with the hash stored when it was created;
+    only changed components are updated and missing ones created.
+    Components created before hashes were recorded are updated once.
+    """
+    state = _load_state(ctx.obj["state_file"])
+    config = load_config(existing_state_config=state.config, interactive=True)
+    config.verbose = ctx.obj.get("verbose", False)
+    config.sync_components = True
+
+    unknown = [sid for sid in step_ids if sid not in _SYNC_STEPS]
+    if unknown:
+        click.echo(f"Error: cannot sync {', '.join(unknown)} (choose from {', '.join(_SYNC_STEPS)})")
+        raise SystemExit(1)
+
+    platform_api, datahub_api = _init_apis(config, _open_cassette(ctx))
+    if platform_api is None:
+        click.echo("Error: configuration is incomplete. Run 'configure' first.")
+        raise SystemExit(1)
+    registry = _build_registry(config, platform_api, datahub_api)
+    failed = False
+    try:
+        for step_id in step_ids or _SYNC_STEPS:
+            step = registry.get(step_id)
+            if state.get_step_status(step_id) != StepStatus.COMPLETED.value:
+                click.echo(f"  [skip] {step.name} (not completed yet — run 'setup' first)")
+                continue
+            click.echo(f"  [sync] {step.name}")
+            if step.execute(state) == StepStatus.FAILED:
+                click.echo(f"  [FAILED] {step.name}")
+                failed = True
+                break
+    finally:
+        _record_api_concurrency(state, platform_api)
+        _record_repo_auth(state, config)
+    calls = sum(st["count"] for st in _api_stats(platform_api).snapshot().values())
+    click.echo(f"Sync {'failed' if failed else 'complete'} ({calls} API calls).")
+    if failed:
+        raise SystemExit(1)
 
 
 @cli.command()
@@ -314,16 +545,86 @@ def reset_step(ctx: click.Context, step_ids: tuple[str, ...]) -> None:
     click.echo("Done. Run 'setup' to re-execute reset steps.")
 
 
+@cli.command()
+@click.option("--sync", "do_sync", is_flag=True, help="Pull new and changed mappings from DataHub first.")
+@click.option("--full", is_flag=True, help="With --sync: rebuild the local copy from scratch.")
+@click.option("--dev", "dev_id", help="Mappings of a dev component ID.")
+@click.option("--prod", "prod_id", help="Dev components mapped to a prod component ID.")
+@click.option("--account", "account_id", help="Mappings of a dev account (narrows --dev).")
+@click.pass_context
+def mappings(
+    ctx: click.Context, do_sync: bool, full: bool,
+    dev_id: str | None, prod_id: str | None, account_id: str | None,
+) -> None:
+    """Answer dev → prod mapping questions from a local ComponentMapping copy.
+
+    The copy is a SQLite file next to the state file.  --sync pulls every
+    record the first time and only records changed since the last sync
+    after that (--full to rebuild); lookups read the local file only.
+    """
+    from setup.api.mapping_index import DEFAULT_MAPPING_FILE, ComponentMappingIndex
+
+    state_file = Path(ctx.obj["state_file"])
+    datahub_api = None
+    if do_sync:
+        state = _load_state(str(state_file))
+        config = load_config(existing_state_config=state.config, interactive=True)
+        config.verbose = ctx.obj.get("verbose", False)
+        _, datahub_api = _init_apis(config, _open_cassette(ctx))
+        if datahub_api is None or "ComponentMapping" not in config.universe_ids:
+            click.echo("Error: ComponentMapping is not deployed yet. Run 'setup' first.")
+            raise SystemExit(1)
+
+    index = ComponentMappingIndex(state_file.with_name(DEFAULT_MAPPING_FILE), datahub_api)
+    try:
+        if do_sync:
+            try:
+                read = index.sync(full=full)
+            except Exception as exc:
+                click.echo(f"Error: {exc}")
+                raise SystemExit(1)
+            finally:
+                _record_repo_auth(state, config)
+            click.echo(f"Synced {read} record(s); {len(index)} mapping(s) through {index.synced_through or '-'}.")
+        elif not index.synced_through:
+            click.echo("No local mappings yet. Run 'mappings --sync' first.")
+            return
+
+        if dev_id:
+            entries = [e for e in index.by_dev_component(dev_id)
+                       if not account_id or e.dev_account_id == account_id]
+        elif prod_id:
+            entries = index.by_prod_component(prod_id)
+        elif account_id:
+            entries = index.by_dev_account(account_id)
+        else:
+            if not do_sync:
+                click.echo(f"{len(index)} mapping(s) through {index.synced_through}.")
+            return
+        click.echo(f"{'Dev component':<38} {'Dev account':<24} {'Prod component':<38} Name")
+        for entry in entries:
+            click.echo(
+                f"{entry.dev_component_id:<38} {entry.dev_account_id:<24} "
+                f"{entry.prod_component_id:<38} {entry.fields.get('componentName', '')}"
+            )
+        if not entries:
+            click.echo("  (no mappings)")
+    finally:
+        index.close()
+
+
 @cli.command("discover-xml")
-@click.argument("component_id")
+@click.argument("component_ids", nargs=-1, required=True)
 @click.pass_context
-def discover_xml(ctx: click.Context, component_id: str) -> None:
+def discover_xml(ctx: click.Context, component_ids: tuple[str, ...]) -> None:
     """GET /Component/{id} and dump the raw XML structure.
 
     Use this for API-First Discovery: create a component manually in the
     Boomi UI, note its component ID from Revision History, then run:
 
         python -m setup discover-xml <component-id>
+
+    Several IDs are read with one bulk GET and dumped in the order given.
     """
     state = _load_state(ctx.obj["state_file"])
     config = load_config(existing_state_config=state.config, interactive=True)
@@ -333,13 +634,20 @@ def discover_xml(ctx: click.Context, component_id: str) -> None:
         click.echo("Error: no credentials configured. Run 'configure' first.")
         raise SystemExit(1)
 
-    platform_api, _ = _init_apis(config)
+    platform_api, _ = _init_apis(config, _open_cassette(ctx))
     try:
-        result = platform_api.get_component(component_id)
-        click.echo(result)
+        if len(component_ids) == 1:
+            click.echo(platform_api.get_component(component_ids[0]))
+            return
+        components = platform_api.get_components_bulk(component_ids)
     except Exception as exc:
         click.echo(f"Error: {exc}")
         raise SystemExit(1)
+    for component_id in component_ids:
+        click.echo(f"<!-- {component_id} -->")
+        click.echo(components.get(component_id, "<!-- not found -->"))
+    if len(components) < len(set(component_ids)):
+        raise SystemExit(1)
 
 
 def main() -> None:
@@ -0,0 +1,742 @@
+#!/usr/bin/env python3
+"""Local stand-in for the Boomi Platform and DataHub APIs, for load tests.
+
+Implements the endpoints ``PlatformApi`` and ``DataHubApi`` call (Component
+create/update and Component/bulk, ComponentMetadata/query and queryMore, Folder, Branch, MergeRequest, PackagedComponent,
+DeployedPackage, DataHub clouds/repositories/sources/staging areas/models/
+universes, and Repository API records) with in-memory state.  Responses
+are shaped like the real ones only as far as the API wrappers parse them.
+
+Knobs for benchmarking:
+  - ``latency`` / ``jitter``: seconds added to every response
+  - ``throttle_rate``: fraction of requests answered 429 with Retry-After
+  - ``max_in_flight``: concurrent requests above this get 429
+  - ``async_polls``: status reads before a branch, merge, repository or
+    model deployment reaches its terminal state
+  - ``deploy_outcome``: terminal deployment status (SUCCESS or CANCELED)
+  - ``page_size``: ComponentMetadata query results per page; the rest is
+    served through queryToken / queryMore
+  - ``gzip_requests``: accept gzip request bodies (False answers them 415);
+    responses are gzipped whenever the client accepts it
+
+Run it, then point the setup tool at it:
+    python -m setup.scripts.fake_boomi_server --port 8099 --latency 0.05
+    BOOMI_CLOUD_BASE_URL=http://127.0.0.1:8099 BOOMI_USER=u BOOMI_TOKEN=t \\
+        python -m setup.main setup
+
+For benchmarks of the client stack alone, skip HTTP entirely:
+``BoomiClient(user, token, transport=FakeBoomi().transport())``.
+
+Every request is counted in ``FakeBoomiServer.stats`` (per endpoint, plus
+throttled responses and peak concurrency).
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import click
+
+from setup.api.transport import InMemoryTransport, make_response
+
+_MDM_NS = "http://mdm.api.platform.boomi.com/"
+_BNS = "http://api.platform.boomi.com/"
+_XSI = "http://www.w3.org/2001/XMLSchema-instance"
+# Requests per Component/bulk call, as on the real API
+_BULK_MAX = 100
+
+_PLATFORM_PREFIX = re.compile(r"^/partner/api/rest/v1/[^/]+")
+_DATAHUB_PREFIX = re.compile(r"^/mdm/api/rest/v1/[^/]+")
+_REPOSITORY_PREFIX = re.compile(r"^/mdm/universes/(?P<universe>[^/]+)")
+
+_ROOT_NAME_RE = re.compile(r'<(?:\w+:)?Component\b[^>]*?\sname="([^"]*)"')
+_ROOT_ID_RE = re.compile(r'<(?:\w+:)?Component\b[^>]*?\scomponentId="([^"]*)"')
+_ROOT_TYPE_RE = re.compile(r'<(?:\w+:)?Component\b[^>]*?\stype="([^"]*)"')
+_ROOT_TAG_RE = re.compile(r"<((?:\w+:)?Component)\b")
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+class Reply:
+    """A canned HTTP response."""
+
+    def __init__(
+        self,
+        status: int = 200,
+        body: Any = "",
+        content_type: str = "application/xml",
+        headers: Optional[dict[str, str]] = None,
+    ) -> None:
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body)
+            content_type = "application/json"
+        self.status = status
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.content_type = content_type
+        self.headers = headers or {}
+
+
+class _Pending:
+    """An asynchronous operation that finishes after a number of status reads."""
+
+    def __init__(self, polls: int, outcome: str) -> None:
+        self.remaining = polls
+        self.outcome = outcome
+
+    def read(self, pending: str) -> str:
+        if self.remaining > 0:
+            self.remaining -= 1
+            return pending
+        return self.outcome
+
+
+class FakeBoomi:
+    """In-memory Boomi account: routing plus state for all endpoints."""
+
+    def __init__(
+        self,
+        base_url: str = "",
+        async_polls: int = 2,
+        deploy_outcome: str = "SUCCESS",
+        page_size: int = 100,
+    ) -> None:
+        self.base_url = base_url
+        self.async_polls = async_polls
+        self.deploy_outcome = deploy_outcome
+        self.page_size = page_size
+        self.components: dict[str, str] = {}
+        self.component_meta: dict[str, dict[str, str]] = {}
+        self.folders: dict[str, dict] = {}
+        self.branches: dict[str, dict] = {}
+        self.merges: dict[str, dict] = {}
+        self.packages: dict[str, dict] = {}
+        self.repositories: dict[str, _Pending] = {}
+        self.sources: list[str] = []
+        self.staging_areas: dict[str, str] = {}
+        self.models: dict[str, dict] = {}
+        self.deployments: dict[str, _Pending] = {}
+        self.records: dict[str, dict[str, str]] = {}
+        self.record_dates: dict[str, dict[str, tuple[str, str]]] = {}
+        self._pending: dict[str, _Pending] = {}
+        self._query_pages: dict[str, list[dict]] = {}
+        self._lock = threading.Lock()
+        self._routes: list[tuple[str, re.Pattern, Callable[..., Reply]]] = []
+        self._add_routes()
+
+    # -- Routing --
+
+    def _route(self, method: str, pattern: str, handler: Callable[..., Reply]) -> None:
+        self._routes.append((method, re.compile(f"^{pattern}$"), handler))
+
+    def _add_routes(self) -> None:
+        r = self._route
+        # Platform API (paths after /partner/api/rest/v1/{account})
+        r("GET", r"/Component/(?P<cid>[^/]+)", self.get_component)
+        r("POST", r"/Component", self.post_component)
+        r("POST", r"/Component/bulk", self.bulk_components)
+        r("POST", r"/Component/(?P<cid>[^/]+)", self.update_component)
+        r("POST", r"/ComponentMetadata/query", self.query_component_metadata)
+        r("POST", r"/ComponentMetadata/queryMore", self.query_more)
+        r("POST", r"/Folder", self.post_folder)
+        r("POST", r"/Branch", self.post_branch)
+        r("GET", r"/Branch/(?P<bid>[^/]+)", self.get_branch)
+        r("DELETE", r"/Branch/(?P<bid>[^/]+)", self.delete_branch)
+        r("POST", r"/MergeRequest", self.post_merge)
+        r("POST", r"/MergeRequest/(?P<mid>[^/]+)/execute", self.execute_merge)
+        r("GET", r"/MergeRequest/(?P<mid>[^/]+)", self.get_merge)
+        r("POST", r"/PackagedComponent", self.post_package)
+        r("POST", r"/PackagedComponent/query", self.query_packages)
+        r("POST", r"/DeployedPackage", self.post_deployed_package)
+        # DataHub Platform API (paths after /mdm/api/rest/v1/{account})
+        r("GET", r"/mdm/clouds", self.get_clouds)
+        r("POST", r"/mdm/clouds/(?P<cloud>[^/]+)/repositories/(?P<name>[^/]+)/create",
+          self.create_repository)
+        r("GET", r"/mdm/repositories/(?P<rid>[^/]+)/status", self.get_repository_status)
+        r("GET", r"/mdm/repositories", self.list_repositories)
+        r("POST", r"/mdm/sources/create", self.create_source)
+        r("GET", r"/mdm/sources", self.list_sources)
+        staging = r"/mdm/repositories/[^/]+/universes/(?P<uid>[^/]+)/sources/(?P<sid>[^/]+)"
+        r("POST", staging + r"/stagingArea/create", self.create_staging_area)
+        r("GET", staging + r"/stagingArea/(?P<said>[^/]+)/status", self.get_staging_status)
+        r("POST", staging + r"/(?:enable|finish)InitialLoad", self.true_reply)
+        r("POST", r"/mdm/models", self.create_model)
+        r("GET", r"/mdm/models", self.list_models)
+        r("GET", r"/mdm/models/(?P<uid>[^/]+)", self.get_model)
+        r("POST", r"/mdm/models/(?P<uid>[^/]+)/publish", self.publish_model)
+        r("POST", r"/mdm/universe/(?P<uid>[^/]+)/deploy", self.deploy_model)
+        r("GET", r"/mdm/universe/(?P<uid>[^/]+)/deployments/(?P<did>[^/]+)",
+          self.get_deployment)
+        # Repository API (paths after /mdm/universes/{universe})
+        r("POST", r"/repo/records/query", self.query_records)
+        r("POST", r"/repo/records", self.post_records)
+        r("POST", r"/repo/staging/(?P<src>[^/]+)", self.post_records)
+
+    @staticmethod
+    def endpoint_path(path: str) -> tuple[str, dict[str, str]]:
+        """Strip the account / universe prefix; returns (route path, prefix params)."""
+        match = _REPOSITORY_PREFIX.match(path)
+        if match:
+            return "/repo" + path[match.end():], {"universe": match.group("universe")}
+        if _DATAHUB_PREFIX.match(path):
+            return "/mdm" + _DATAHUB_PREFIX.sub("", path), {}
+        return _PLATFORM_PREFIX.sub("", path), {}
+
+    def handle(self, method: str, path: str, query: dict[str, list[str]], body: str) -> Reply:
+        route_path, params = self.endpoint_path(path)
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(route_path)
+            if route_method == method and match:
+                with self._lock:
+                    return handler(body=body, query=query, **params, **match.groupdict())
+        return Reply(404, f"<error>No fake endpoint for {method} {path}</error>")
+
+    def transport(self) -> InMemoryTransport:
+        """An ``InMemoryTransport`` answered by this fake, with no server or sockets.
+
+        ``BoomiClient(..., transport=fake.transport())`` runs the full client
+        stack against the fake in-process.
+        """
+        def answer(method: str, url: str, data: Any, headers: dict[str, str]) -> Any:
+            parts = urlsplit(url)
+            if headers.get("Content-Encoding") == "gzip":
+                data = gzip.decompress(data)
+            body = data.decode("utf-8") if isinstance(data, bytes) else (data or "")
+            reply = self.handle(method.upper(), parts.path, parse_qs(parts.query), body)
+            return make_response(
+                reply.status, reply.body,
+                {"Content-Type": reply.content_type, **reply.headers}, url=url,
+            )
+
+        return InMemoryTransport(answer)
+
+    # -- Platform API --
+
+    def get_component(self, cid: str, **_: Any) -> Reply:
+        if cid not in self.components:
+            return Reply(404, f"<error>Component {cid} not found</error>")
+        return Reply(200, self.components[cid])
+
+    def bulk_components(self, body: str, **_: Any) -> Reply:
+        try:
+            requests_ = json.loads(body or "{}").get("request", [])
+        except ValueError:
+            return Reply(400, {"message": "Invalid BulkRequest JSON"})
+        if len(requests_) > _BULK_MAX:
+            return Reply(400, {"message": f"At most {_BULK_MAX} requests per bulk call"})
+        responses = []
+        for index, item in enumerate(requests_):
+            cid = item.get("id", "")
+            if cid not in self.components:
+                responses.append(
+                    f'<bns:response index="{index}" id="{cid}" statusCode="400"'
+                    f' errorMessage="Component {cid} not found"/>'
+                )
+                continue
+            result = ET.fromstring(self.components[cid])
+            result.tag = f"{{{_BNS}}}Result"
+            result.set(f"{{{_XSI}}}type", "Component")
+            xml = ET.tostring(result, encoding="unicode")
+            responses.append(f'<bns:response index="{index}" id="{cid}" statusCode="200">{xml}</bns:response>')
+        return Reply(200, (
+            f'<bns:BulkResult xmlns:bns="{_BNS}" xmlns:xsi="{_XSI}">'
+            f'{"".join(responses)}</bns:BulkResult>'
+        ))
+
+    def post_component(self, body: str, **_: Any) -> Reply:
+        tag = _ROOT_TAG_RE.search(body)
+        if not tag:
+            return Reply(400, "<error>Body is not a Component</error>")
+        existing = _ROOT_ID_RE.search(body)
+        cid = existing.group(1) if existing and existing.group(1) else _new_id()
+        if not existing:
+            body = body[:tag.end()] + f' componentId="{cid}"' + body[tag.end():]
+        name = _ROOT_NAME_RE.search(body)
+        ctype = _ROOT_TYPE_RE.search(body)
+        version = int(self.component_meta.get(cid, {}).get("version", "0")) + 1
+        self.components[cid] = body
+        self.component_meta[cid] = {
+            "componentId": cid,
+            "name": name.group(1) if name else "",
+            "type": ctype.group(1) if ctype else "",
+            "version": str(version),
+            "currentVersion": "true",
+            "deleted": "false",
+            "modifiedDate": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        return Reply(200, body)
+
+    def update_component(self, cid: str, body: str, **_: Any) -> Reply:
+        if cid not in self.components:
+            return Reply(404, f"<error>Component {cid} not found</error>")
+        existing = _ROOT_ID_RE.search(body)
+        if existing and existing.group(1) != cid:
+            return Reply(400, f"<error>componentId {existing.group(1)} does not match {cid}</error>")
+        return self.post_component(body=body)
+
+    @staticmethod
+    def _conditions(expression: dict) -> list[tuple[str, str, str]]:
+        """(property, operator, argument) for every simple condition in a QueryFilter."""
+        found: list[tuple[str, str, str]] = []
+        if expression.get("property") and expression.get("argument"):
+            found.append((
+                expression["property"], expression.get("operator", "EQUALS"),
+                expression["argument"][0],
+            ))
+        for nested in expression.get("nestedExpression", []):
+            found.extend(FakeBoomi._conditions(nested))
+        return found
+
+    @staticmethod
+    def _matches(meta: dict[str, str], conditions: list[tuple[str, str, str]]) -> bool:
+        for prop, operator, argument in conditions:
+            value = meta.get(prop, "")
+            if operator == "LIKE":
+                ok = value.startswith(argument.rstrip("%"))
+            elif operator == "GREATER_THAN_OR_EQUAL":
+                ok = value >= argument
+            else:
+                ok = value == argument
+            if not ok:
+                return False
+        return True
+
+    def query_component_metadata(self, body: str, **_: Any) -> Reply:
+        try:
+            expression = json.loads(body or "{}").get("QueryFilter", {}).get("expression", {})
+        except ValueError:
+            return Reply(400, {"message": "Invalid QueryFilter JSON"})
+        conditions = self._conditions(expression)
+        results = [
+            {"@type": "ComponentMetadata", **meta}
+            for meta in self.component_meta.values()
+            if self._matches(meta, conditions)
+        ]
+        return self._query_page(results)
+
+    def _query_page(self, results: list[dict]) -> Reply:
+        """First ``page_size`` results; a queryToken holds on to the rest."""
+        page, rest = results[:self.page_size], results[self.page_size:]
+        reply = {"@type": "QueryResult", "numberOfResults": len(page), "result": page}
+        if rest:
+            token = _new_id()
+            self._query_pages[token] = rest
+            reply["queryToken"] = token
+        return Reply(200, reply)
+
+    def query_more(self, body: str, **_: Any) -> Reply:
+        rest = self._query_pages.pop(body.strip(), None)
+        if rest is None:
+            return Reply(400, {"message": "Invalid or expired queryToken"})
+        return self._query_page(rest)
+
+    def post_folder(self, body: str, **_: Any) -> Reply:
+        data = json.loads(body or "{}")
+        folder = {"id": _new_id(), "name": data.get("name", ""), "parentId": data.get("parentId", "")}
+        self.folders[folder["id"]] = folder
+        return Reply(200, folder)
+
+    def post_branch(self, body: str, **_: Any) -> Reply:
+        data = json.loads(body or "{}")
+        branch = {"id": _new_id(), "name": data.get("name", ""), "ready": "false"}
+        self.branches[branch["id"]] = branch
+        self._pending[branch["id"]] = _Pending(self.async_polls, "true")
+        return Reply(200, branch)
+
+    def get_branch(self, bid: str, **_: Any) -> Reply:
+        if bid not in self.branches:
+            return Reply(404, {"message": f"Branch {bid} not found"})
+        branch = self.branches[bid]
+        branch["ready"] = self._pending[bid].read("false")
+        return Reply(200, branch)
+
+    def delete_branch(self, bid: str, **_: Any) -> Reply:
+        if self.branches.pop(bid, None) is None:
+            return Reply(404, {"message": f"Branch {bid} not found"})
+        return Reply(200, {})
+
+    def post_merge(self, body: str, **_: Any) -> Reply:
+        merge = {"id": _new_id(), **json.loads(body or "{}"), "stage": "DRAFTED"}
+        self.merges[merge["id"]] = merge
+        return Reply(200, merge)
+
+    def execute_merge(self, mid: str, **_: Any) -> Reply:
+        if mid not in self.merges:
+            return Reply(404, {"message": f"MergeRequest {mid} not found"})
+        self.merges[mid]["stage"] = "MERGING"
+        self._pending[mid] = _Pending(self.async_polls, "MERGED")
+        return Reply(200, self.merges[mid])
+
+    def get_merge(self, mid: str, **_: Any) -> Reply:
+        if mid not in self.merges:
+            return Reply(404, {"message": f"MergeRequest {mid} not found"})
+        merge = self.merges[mid]
+        if mid in self._pending:
+            merge["stage"] = self._pending[mid].read("MERGING")
+        return Reply(200, merge)
+
+    def post_package(self, body: str, **_: Any) -> Reply:
+        package = {"packageId": _new_id(), **json.loads(body or "{}")}
+        self.packages[package["packageId"]] = package
+        return Reply(200, package)
+
+    def query_packages(self, **_: Any) -> Reply:
+        return Reply(200, {"@type": "QueryResult", "numberOfResults": 0, "result": []})
+
+    def post_deployed_package(self, body: str, **_: Any) -> Reply:
+        return Reply(200, {"deploymentId": _new_id(), **json.loads(body or "{}"), "active": True})
+
+    # -- DataHub Platform API --
+
+    def true_reply(self, **_: Any) -> Reply:
+        return Reply(200, "<true/>")
+
+    def get_clouds(self, **_: Any) -> Reply:
+        return Reply(200, (
+            f'<mdm:Clouds xmlns:mdm="{_MDM_NS}">'
+            '<mdm:Cloud cloudId="fake-cloud" containerId="fake-container" name="Fake Hub Cloud"/>'
+            "</mdm:Clouds>"
+        ))
+
+    def create_repository(self, cloud: str, name: str, **_: Any) -> Reply:
+        rid = _new_id()
+        self.repositories[rid] = _Pending(self.async_polls, "SUCCESS")
+        return Reply(200, rid)
+
+    def get_repository_status(self, rid: str, **_: Any) -> Reply:
+        if rid not in self.repositories:
+            return Reply(404, f"<error>Repository {rid} not found</error>")
+        status = self.repositories[rid].read("PENDING")
+        return Reply(200, f'<mdm:RepositoryStatus xmlns:mdm="{_MDM_NS}" status="{status}"/>')
+
+    def list_repositories(self, **_: Any) -> Reply:
+        repos = "".join(
+            f'<mdm:Repository id="{rid}" name="repo" repositoryBaseUrl="{self.base_url}"/>'
+            for rid in self.repositories
+        )
+        return Reply(200, f'<mdm:Repositories xmlns:mdm="{_MDM_NS}">{repos}</mdm:Repositories>')
+
+    def create_source(self, body: str, **_: Any) -> Reply:
+        match = re.search(r"<mdm:sourceId>([^<]*)</mdm:sourceId>", body)
+        if match and match.group(1) not in self.sources:
+            self.sources.append(match.group(1))
+        return Reply(200, "<true/>")
+
+    def list_sources(self, **_: Any) -> Reply:
+        items = "".join(f'<mdm:Source sourceId="{s}" name="{s}"/>' for s in self.sources)
+        return Reply(200, f'<mdm:AccountSources xmlns:mdm="{_MDM_NS}">{items}</mdm:AccountSources>')
+
+    def create_staging_area(self, uid: str, sid: str, **_: Any) -> Reply:
+        said = _new_id()
+        self.staging_areas[said] = "READY"
+        return Reply(200, f'<mdm:StagingArea xmlns:mdm="{_MDM_NS}"><mdm:id>{said}</mdm:id></mdm:StagingArea>')
+
+    def get_staging_status(self, said: str, **_: Any) -> Reply:
+        state = self.staging_areas.get(said, "DELETED")
+        return Reply(200, f'<mdm:StagingAreaStatus xmlns:mdm="{_MDM_NS}"><mdm:state>{state}</mdm:state></mdm:StagingAreaStatus>')
+
+    def create_model(self, body: str, **_: Any) -> Reply:
+        match = re.search(r"<mdm:name>([^<]*)</mdm:name>", body)
+        name = match.group(1) if match else ""
+        if any(m["name"] == name for m in self.models.values()):
+            return Reply(400, f"<error>Model {name} already exists</error>")
+        uid = _new_id()
+        self.models[uid] = {"name": name, "body": body, "published": False}
+        return Reply(200, f'<mdm:CreateModelResponse xmlns:mdm="{_MDM_NS}"><mdm:id>{uid}</mdm:id></mdm:CreateModelResponse>')
+
+    def list_models(self, **_: Any) -> Reply:
+        items = "".join(
+            f'<mdm:Model id="{uid}" name="{m["name"]}"/>' for uid, m in self.models.items()
+        )
+        return Reply(200, f'<mdm:Models xmlns:mdm="{_MDM_NS}">{items}</mdm:Models>')
+
+    def get_model(self, uid: str, **_: Any) -> Reply:
+        model = self.models.get(uid)
+        if model is None:
+            return Reply(404, f"<error>Model {uid} not found</error>")
+        return Reply(200, (
+            f'<mdm:Model xmlns:mdm="{_MDM_NS}" id="{uid}" name="{model["name"]}"'
+            f' rootElement="{model["name"]}"/>'
+        ))
+
+    def publish_model(self, uid: str, **_: Any) -> Reply:
+        if uid not in self.models:
+            return Reply(404, f"<error>Model {uid} not found</error>")
+        self.models[uid]["published"] = True
+        return Reply(200, f'<mdm:PublishModelResponse xmlns:mdm="{_MDM_NS}"><mdm:version>1</mdm:version></mdm:PublishModelResponse>')
+
+    def deploy_model(self, uid: str, **_: Any) -> Reply:
+        if uid not in self.models:
+            return Reply(404, f"<error>Model {uid} not found</error>")
+        did = _new_id()
+        self.deployments[did] = _Pending(self.async_polls, self.deploy_outcome)
+        return Reply(200, f'<mdm:UniverseDeployment xmlns:mdm="{_MDM_NS}"><mdm:id>{did}</mdm:id></mdm:UniverseDeployment>')
+
+    def get_deployment(self, uid: str, did: str, **_: Any) -> Reply:
+        if did not in self.deployments:
+            return Reply(404, f"<error>Deployment {did} not found</error>")
+        status = self.deployments[did].read("PENDING")
+        return Reply(200, f'<mdm:UniverseDeployment xmlns:mdm="{_MDM_NS}"><mdm:status>{status}</mdm:status></mdm:UniverseDeployment>')
+
+    # -- Repository API --
+
+    def post_records(self, universe: str, body: str, **_: Any) -> Reply:
+        try:
+            batch = ET.fromstring(body)
+        except ET.ParseError as exc:
+            return Reply(400, f"<error>Malformed batch: {exc}</error>")
+        records = self.records.setdefault(universe, {})
+        dates = self.record_dates.setdefault(universe, {})
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        for entity in batch:
+            record_id = entity.findtext("id") or ""
+            if entity.get("op") == "DELETE":
+                records.pop(record_id, None)
+                dates.pop(record_id, None)
+                continue
+            record_id = record_id or _new_id()
+            records[record_id] = ET.tostring(entity, encoding="unicode")
+            dates[record_id] = (dates.get(record_id, (now, now))[0], now)
+        return Reply(200, "")
+
+    @staticmethod
+    def _field_name(unique_id: str) -> str:
+        """DEV_COMPONENT_ID -> devComponentId (the model's field uniqueId rule)."""
+        head, *rest = unique_id.lower().split("_")
+        return head + "".join(part.capitalize() for part in rest)
+
+    def query_records(self, universe: str, body: str, **_: Any) -> Reply:
+        records = self.records.get(universe, {})
+        dates = self.record_dates.get(universe, {})
+        request = ET.fromstring(body)
+        limit = min(int(request.get("limit", "200")), self.page_size)
+        offset = int(request.get("offsetToken") or 0)
+        wanted = [
+            (self._field_name(fv.findtext("fieldId", "")), fv.findtext("value", ""))
+            for fv in request.iter("fieldValue")
+        ]
+        updated_from = request.findtext("filter/updatedDate/from") or ""
+        matching = [
+            rid for rid, xml in records.items()
+            if all(ET.fromstring(xml).findtext(name) == value for name, value in wanted)
+            and dates.get(rid, ("", ""))[1] >= updated_from
+        ]
+        page = matching[offset:offset + limit]
+        items = "".join(
+            f'<Record recordId="{rid}" createdDate="{dates.get(rid, ("", ""))[0]}"'
+            f' updatedDate="{dates.get(rid, ("", ""))[1]}"><Fields>{records[rid]}</Fields></Record>'
+            for rid in page
+        )
+        more = offset + limit < len(matching)
+        token = f' offsetToken="{offset + limit}"' if more else ""
+        return Reply(200, (
+            f'<RecordQueryResponse resultCount="{len(page)}" totalCount="{len(matching)}"{token}>'
+            f"{items}</RecordQueryResponse>"
+        ))
+
+
+class FakeBoomiServer:
+    """Threaded HTTP server serving a ``FakeBoomi`` account.
+
+    Use as a context manager; ``url`` is the base URL to configure as
+    ``cloud_base_url``.  Port 0 picks a free port.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        max_in_flight: Optional[int] = None,
+        async_polls: int = 2,
+        deploy_outcome: str = "SUCCESS",
+        page_size: int = 100,
+        seed: Optional[int] = None,
+        gzip_requests: bool = True,
+    ) -> None:
+        self.latency = latency
+        self.gzip_requests = gzip_requests
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.max_in_flight = max_in_flight
+        self._rng = random.Random(seed)
+        self._stats: dict[str, int] = {}
+        self._throttled = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self.boomi = FakeBoomi(
+            self.url, async_polls=async_polls, deploy_outcome=deploy_outcome, page_size=page_size,
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FakeBoomiServer:
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05},
+            name="fake-boomi", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> FakeBoomiServer:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    @property
+    def stats(self) -> dict:
+        """Requests per endpoint, throttled count and peak concurrency."""
+        with self._lock:
+            return {
+                "requests": dict(sorted(self._stats.items())),
+                "throttled": self._throttled,
+                "peak_in_flight": self._peak_in_flight,
+            }
+
+    # -- Request handling --
+
+    def _admit(self) -> bool:
+        """Count the request in flight; False if it must be throttled."""
+        with self._lock:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            over_limit = self.max_in_flight is not None and self._in_flight > self.max_in_flight
+            throttled = over_limit or (
+                self.throttle_rate > 0 and self._rng.random() < self.throttle_rate
+            )
+            if throttled:
+                self._throttled += 1
+            return not throttled
+
+    def _done(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _count(self, method: str, path: str) -> None:
+        route_path, _ = FakeBoomi.endpoint_path(path)
+        key = f"{method} {re.sub(r'[0-9a-f]{8}-[0-9a-f-]{27}', '{id}', route_path)}"
+        with self._lock:
+            self._stats[key] = self._stats.get(key, 0) + 1
+
+    def serve(self, method: str, raw_path: str, body: str) -> Reply:
+        parts = urlsplit(raw_path)
+        self._count(method, parts.path)
+        admitted = self._admit()
+        try:
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            if delay > 0:
+                time.sleep(delay)
+            if not admitted:
+                return Reply(
+                    429, "<error>Rate limit exceeded</error>",
+                    headers={"Retry-After": str(self.retry_after)},
+                )
+            return self.boomi.handle(method, parts.path, parse_qs(parts.query), body)
+        finally:
+            self._done()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _dispatch(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                if self.headers.get("Content-Encoding") != "gzip":
+                    reply = server.serve(self.command, self.path, raw.decode("utf-8"))
+                elif server.gzip_requests:
+                    reply = server.serve(self.command, self.path, gzip.decompress(raw).decode("utf-8"))
+                else:
+                    reply = Reply(415, "<error>Content-Encoding gzip not supported</error>")
+                payload = reply.body
+                gzipped = "gzip" in self.headers.get("Accept-Encoding", "") and bool(payload)
+                if gzipped:
+                    payload = gzip.compress(payload)
+                self.send_response(reply.status)
+                self.send_header("Content-Type", reply.content_type)
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in reply.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        return Handler
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", default=8099, show_default=True, type=int)
+@click.option("--latency", default=0.0, show_default=True, type=float,
+              help="Seconds added to every response")
+@click.option("--jitter", default=0.0, show_default=True, type=float,
+              help="Extra random latency, up to this many seconds")
+@click.option("--throttle-rate", default=0.0, show_default=True, type=float,
+              help="Fraction of requests answered 429")
+@click.option("--retry-after", default=1, show_default=True, type=int,
+              help="Retry-After seconds sent with 429s")
+@click.option("--max-in-flight", default=None, type=int,
+              help="Answer 429 when more requests than this are in flight")
+@click.option("--async-polls", default=2, show_default=True, type=int,
+              help="Status reads before branches, merges, repos and deployments finish")
+@click.option("--deploy-outcome", default="SUCCESS", show_default=True,
+              type=click.Choice(["SUCCESS", "CANCELED"]))
+@click.option("--page-size", default=100, show_default=True, type=int,
+              help="ComponentMetadata query results per page (rest via queryMore)")
+@click.option("--seed", default=None, type=int, help="Seed for latency jitter and 429 injection")
+@click.option("--gzip-requests/--no-gzip-requests", default=True, show_default=True,
+              help="Accept gzip request bodies (otherwise answer 415)")
+def main(**options: Any) -> None:
+    """Serve a fake Boomi Platform + DataHub API until interrupted."""
+    server = FakeBoomiServer(**options)
+    print(f"Fake Boomi API listening on {server.url}")
+    print(f"  export BOOMI_CLOUD_BASE_URL={server.url}")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
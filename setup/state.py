@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -58,9 +59,13 @@ def _empty_state() -> dict:
             "datahub_user": "",
             "hub_cloud_url": "",
             "hub_cloud_name": "",
+            "repo_auth_format": "",
+            "repo_auth_fingerprint": "",
             "universe_ids": {},
         },
         "component_ids": _empty_component_ids(),
+        "component_hashes": {},
+        "model_progress": {},
         "steps": {},
         "api_first_discovery": _empty_api_first_discovery(),
     }
@@ -70,11 +75,13 @@ class SetupState:
     """Manages persistent state for the setup automation.
 
     Every mutation calls save() immediately (write-through).
+    ``set_model_progress`` may be called from worker threads.
     """
 
     def __init__(self, data: dict, path: Path) -> None:
         self._data = data
         self._path = path
+        self._lock = threading.RLock()
 
     # -- Construction ----------------------------------------------------------
 
@@ -106,6 +113,8 @@ class SetupState:
             if key not in existing:
                 existing[key] = default_val
         data["component_ids"] = existing
+        data.setdefault("component_hashes", {})
+        data.setdefault("model_progress", {})
         # Backfill api_first_discovery keys added after this state file was created
         disc_defaults = _empty_api_first_discovery()
         existing_disc = data.get("api_first_discovery", {})
@@ -127,9 +136,10 @@ class SetupState:
 
     def save(self) -> None:
         """Write state to disk."""
-        self._data["updated_at"] = _now_iso()
-        with open(self._path, "w") as f:
-            json.dump(self._data, f, indent=2)
+        with self._lock:
+            self._data["updated_at"] = _now_iso()
+            with open(self._path, "w") as f:
+                json.dump(self._data, f, indent=2)
 
     @property
     def path(self) -> Path:
@@ -176,10 +186,29 @@ class SetupState:
             self._data["steps"][step_id][key] = value
         self.save()
 
+    def set_step_api_stats(self, step_id: str, api_stats: dict) -> None:
+        """Store per-endpoint API stats for the step's latest run and save."""
+        self._data["steps"].setdefault(step_id, {})["api_stats"] = api_stats
+        self.save()
+
+    def get_step_api_stats(self) -> dict[str, dict]:
+        """Per-step API stats keyed by step ID (steps without stats omitted)."""
+        return {
+            step_id: step_data["api_stats"]
+            for step_id, step_data in self._data["steps"].items()
+            if step_data.get("api_stats")
+        }
+
     # -- Component IDs ---------------------------------------------------------
 
-    def store_component_id(self, category: str, name: str, value: str) -> None:
-        """Store a component ID under a category and save."""
+    def store_component_id(
+        self, category: str, name: str, value: str, content_hash: Optional[str] = None,
+    ) -> None:
+        """Store a component ID under a category and save.
+
+        ``content_hash`` (see ``PlatformApi.fingerprint``) records the body
+        the component was last created or updated from.
+        """
         bucket = self._data["component_ids"].get(category)
         if bucket is None:
             raise KeyError(f"Unknown component category: {category}")
@@ -188,6 +217,9 @@ class SetupState:
         else:
             # flow_service is a scalar
             self._data["component_ids"][category] = value
+        if content_hash is not None:
+            hashes = self._data.setdefault("component_hashes", {})
+            hashes.setdefault(category, {})[name] = content_hash
         self.save()
 
     def get_component_id(self, category: str, name: str) -> Optional[str]:
@@ -200,6 +232,24 @@ class SetupState:
         # Scalar (flow_service) — name is ignored
         return bucket
 
+    def get_component_hash(self, category: str, name: str) -> Optional[str]:
+        """Content hash stored with a component ID, or None if never recorded."""
+        return self._data.get("component_hashes", {}).get(category, {}).get(name)
+
+    # -- DataHub Model Pipeline ------------------------------------------------
+
+    def get_model_progress(self, model_name: str) -> dict:
+        """Pipeline progress of a model (``model_id``, ``stage``, ``deployment_id``)."""
+        with self._lock:
+            return dict(self._data.get("model_progress", {}).get(model_name, {}))
+
+    def set_model_progress(self, model_name: str, **fields: str) -> None:
+        """Merge ``fields`` into a model's pipeline progress and save."""
+        with self._lock:
+            progress = self._data.setdefault("model_progress", {})
+            progress.setdefault(model_name, {}).update(fields)
+            self.save()
+
     # -- Step Item Tracking ----------------------------------------------------
 
     def mark_step_item_complete(self, step_id: str, item: str) -> None:
@@ -226,3 +276,15 @@ class SetupState:
         """Store an API-first discovery template XML and save."""
         self._data["api_first_discovery"][key] = xml
         self.save()
+
+    # -- API Concurrency -------------------------------------------------------
+
+    @property
+    def api_concurrency(self) -> dict:
+        """Per-host AIMD window snapshot from the most recent run."""
+        return self._data.get("api_concurrency", {})
+
+    def set_api_concurrency(self, snapshot: dict) -> None:
+        """Store the per-host AIMD window snapshot and save."""
+        self._data["api_concurrency"] = {"recorded_at": _now_iso(), "hosts": snapshot}
+        self.save()
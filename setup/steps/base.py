@@ -1,6 +1,7 @@
 """Abstract base class for all build steps."""
 from __future__ import annotations
 
+import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -47,3 +48,78 @@ class BaseStep(ABC):
 
     @abstractmethod
     def execute(self, state: SetupState, dry_run: bool = False) -> StepStatus: ...
+
+    def _component_items(self, state: SetupState, tracker_id: str, all_items: list[str]) -> list[str]:
+        """Items still to create, or all of them when syncing components."""
+        if self.config.sync_components:
+            return list(all_items)
+        return state.get_remaining_items(tracker_id, all_items)
+
+    def _create_components(
+        self,
+        state: SetupState,
+        tracker_id: str,
+        category: str,
+        items: list[tuple[str, str, str]],
+        done_before: int = 0,
+        total: Optional[int] = None,
+    ) -> bool:
+        """Create components in parallel and record each success in state.
+
+        ``items`` holds ``(item_key, display_name, component_xml)`` tuples.
+        Requests go out concurrently on the client's worker pool; results are
+        written to state in item order on this thread, so a partial failure
+        still records every component that was created.  Each ID is stored
+        with the fingerprint of the body it was created from; an item whose
+        XML does not parse is reported as a failed create.  Returns True
+        only if every item succeeded.
+
+        With ``config.sync_components``, items whose component already exists
+        are compared by fingerprint instead: unchanged ones are skipped
+        without an API call and changed ones are updated in place.
+        """
+        total = total or done_before + len(items)
+        all_ok = True
+        hashes: list[Optional[str]] = []
+        for _, display_name, xml in items:
+            try:
+                hashes.append(self.platform_api.fingerprint(xml))
+            except ET.ParseError as exc:
+                ui.print_error(f"Failed to create '{display_name}': component XML does not parse ({exc})")
+                all_ok = False
+                hashes.append(None)
+        targets: list[Optional[str]] = [None] * len(items)
+        pending = [idx for idx, digest in enumerate(hashes) if digest is not None]
+        if self.config.sync_components:
+            parsed = len(pending)
+            pending = []
+            for idx, ((item_key, _, _), digest) in enumerate(zip(items, hashes)):
+                if digest is None:
+                    continue
+                targets[idx] = state.get_component_id(category, item_key)
+                if targets[idx] and state.get_component_hash(category, item_key) == digest:
+                    state.mark_step_item_complete(tracker_id, item_key)
+                    continue
+                pending.append(idx)
+            unchanged = parsed - len(pending)
+            if unchanged:
+                ui.print_info(f"{unchanged} of {len(items)} unchanged — skipped")
+
+        results = self.platform_api.save_components([(targets[i], items[i][2]) for i in pending])
+        for done, (idx, result) in enumerate(zip(pending, results), 1):
+            item_key, display_name, _ = items[idx]
+            verb = "update" if targets[idx] else "create"
+            ui.print_progress(done_before + done, total, display_name)
+            if isinstance(result, Exception):
+                ui.print_error(f"Failed to {verb} '{display_name}': {result}")
+                all_ok = False
+                continue
+            comp_id = self.platform_api.parse_component_id(result)
+            if not comp_id:
+                ui.print_error(f"No component ID returned for '{display_name}'")
+                all_ok = False
+                continue
+            state.store_component_id(category, item_key, comp_id, content_hash=hashes[idx])
+            state.mark_step_item_complete(tracker_id, item_key)
+            ui.print_success(f"{verb.capitalize()}d {display_name} -> {comp_id}")
+        return all_ok
@@ -1,9 +1,11 @@
 """Phase 1 — DataHub setup steps (1.0 through 1.4)."""
 from __future__ import annotations
 
-import time
+from typing import Optional
 
 from setup.api.client import BoomiApiError
+from setup.api.datahub_api import DataHubApi, RecordOutcome
+from setup.api.polling import poll
 from setup.engine import StepStatus, StepType
 from setup.state import SetupState
 from setup.steps.base import BaseStep
@@ -200,11 +202,22 @@ class CreateSources(BaseStep):
         return StepStatus.COMPLETED
 
 
+# The models deployed in steps 1.2a-c, in step order
+_PIPELINE_MODELS = ["ComponentMapping", "DevAccountAccess", "PromotionLog"]
+
+
 class CreateModel(BaseStep):
-    """Step 1.2x — Create, publish, and deploy a single DataHub model.
+    """Step 1.2x — Create, publish, and deploy a DataHub model.
 
     Instantiate one per model: ComponentMapping (1.2a), DevAccountAccess (1.2b),
     PromotionLog (1.2c).
+
+    The first of these steps to run pipelines every model not yet deployed:
+    create → publish → deploy runs for all of them in parallel, then one
+    poll loop waits for every deployment, so the phase takes about as long
+    as the slowest deployment.  The later steps find their model already
+    deployed.  Each model's stage (and deployment ID) is kept in state, so
+    a rerun resumes where the model stopped instead of starting over.
     """
 
     def __init__(self, *args, model_name: str, sub_id: str, **kwargs) -> None:  # type: ignore[override]
@@ -249,63 +262,130 @@ class CreateModel(BaseStep):
             ui.print_info(f"Would create model '{self._model_name}'")
             return StepStatus.COMPLETED
 
-        try:
-            spec = load_model_spec(self._model_name)
+        pending = [self._model_name] + [
+            name for name in _PIPELINE_MODELS
+            if name != self._model_name and not state.get_component_id("models", name)
+        ]
+        if len(pending) > 1:
+            ui.print_info(f"Deploying {len(pending)} models together: {', '.join(pending)}")
 
-            # Try to create; recover if model already exists in Boomi but
-            # not in our state (e.g. state was reset after a prior run).
-            try:
-                model_id = self.datahub_api.create_model(spec)
-                ui.print_info(f"Created model '{self._model_name}' (ID: {model_id})")
-            except BoomiApiError as create_exc:
-                if create_exc.status_code in (400, 409) and "already" in create_exc.body.lower():
-                    ui.print_info(
-                        f"Model '{self._model_name}' already exists in Boomi — recovering ID..."
-                    )
-                    model_id = self.datahub_api.find_model_by_name(self._model_name)
-                    if not model_id:
-                        ui.print_error(
-                            f"Model '{self._model_name}' reportedly exists but "
-                            "could not be found via GET /models"
-                        )
-                        return StepStatus.FAILED
-                    ui.print_info(f"Recovered model ID: {model_id}")
+        # Create, publish and start the deployment of every model in parallel
+        started = self.datahub_api.map(
+            lambda name: self._start_model(state, name), pending, return_exceptions=True,
+        )
+        failures: dict[str, BoomiApiError] = {}
+        deploying: dict[str, tuple[str, str]] = {}  # model ID → (name, deployment ID)
+        for name, outcome in zip(pending, started):
+            if isinstance(outcome, BoomiApiError):
+                failures[name] = outcome
+            elif isinstance(outcome, Exception):
+                raise outcome
+            elif outcome[1]:
+                deploying[outcome[0]] = (name, outcome[1])
+            else:
+                self._record_model(state, name, outcome[0])
+
+        # One poll loop for every deployment in flight
+        if deploying:
+            statuses = self.datahub_api.poll_models_deployed(
+                {model_id: dep_id for model_id, (_, dep_id) in deploying.items()},
+                return_exceptions=True,
+            )
+            for model_id, status in statuses.items():
+                name = deploying[model_id][0]
+                if isinstance(status, BoomiApiError):
+                    failures[name] = status
+                    if status.status_code == 410:
+                        # Canceled: deploy again next time instead of re-polling
+                        state.set_model_progress(name, stage="published", deployment_id="")
                 else:
-                    raise
+                    ui.print_success(f"Model '{name}' deployed (ID: {model_id})")
+                    self._record_model(state, name, model_id)
+
+        for name, exc in failures.items():
+            ui.print_error(f"Failed to create model '{name}': {exc}")
+        if self._model_name in failures:
+            return StepStatus.FAILED
+        return StepStatus.COMPLETED
 
+    def _start_model(self, state: SetupState, name: str) -> tuple[str, str]:
+        """Create, publish and deploy ``name`` from its saved stage onward.
+
+        Returns ``(model_id, deployment_id)``; the deployment ID is empty
+        when the model turned out to be deployed already.
+        """
+        progress = state.get_model_progress(name)
+        model_id = progress.get("model_id", "")
+        stage = progress.get("stage", "") if model_id else ""
+
+        if not model_id:
+            model_id = self._create_model(name)
+            stage = "created"
+            state.set_model_progress(name, model_id=model_id, stage=stage, deployment_id="")
+
+        if stage == "created":
             # Publish (idempotent — ignore "already published" errors)
             try:
                 self.datahub_api.publish_model(model_id)
-                ui.print_info(f"Published model '{self._model_name}'")
+                ui.print_info(f"Published model '{name}'")
             except BoomiApiError as pub_exc:
                 if pub_exc.status_code == 400:
-                    ui.print_info(f"Model '{self._model_name}' already published")
+                    ui.print_info(f"Model '{name}' already published")
                 else:
                     raise
+            stage = "published"
+            state.set_model_progress(name, stage=stage)
 
-            # Deploy (may already be deployed — 400 is acceptable)
-            try:
-                deployment_id = self.datahub_api.deploy_model(model_id)
-                ui.print_info(f"Deploying model '{self._model_name}'...")
-                self.datahub_api.poll_model_deployed(model_id, deployment_id)
-                ui.print_success(f"Model '{self._model_name}' deployed (ID: {model_id})")
-            except BoomiApiError as dep_exc:
-                if dep_exc.status_code == 400:
-                    ui.print_info(
-                        f"Model '{self._model_name}' already deployed (ID: {model_id})"
-                    )
-                else:
-                    raise
+        if stage == "deploying":
+            ui.print_info(f"Resuming deployment of model '{name}'...")
+            return model_id, progress["deployment_id"]
+        if stage == "deployed":
+            return model_id, ""
 
-            state.store_component_id("models", self._model_name, model_id)
-            # C2a fix: store universe_id (= model_id) so record operations can build
-            # the correct Repository API URL: /mdm/universes/{universeId}/records
-            state.store_universe_id(self._model_name, model_id)
-            self.datahub_api._config.universe_ids[self._model_name] = model_id
-            return StepStatus.COMPLETED
-        except BoomiApiError as exc:
-            ui.print_error(f"Failed to create model '{self._model_name}': {exc}")
-            return StepStatus.FAILED
+        # Deploy (may already be deployed — 400 is acceptable)
+        try:
+            deployment_id = self.datahub_api.deploy_model(model_id)
+        except BoomiApiError as dep_exc:
+            if dep_exc.status_code != 400:
+                raise
+            ui.print_info(f"Model '{name}' already deployed (ID: {model_id})")
+            state.set_model_progress(name, stage="deployed")
+            return model_id, ""
+        ui.print_info(f"Deploying model '{name}'...")
+        state.set_model_progress(name, stage="deploying", deployment_id=deployment_id)
+        return model_id, deployment_id
+
+    def _create_model(self, name: str) -> str:
+        """POST the model spec; recover the ID if it already exists in Boomi."""
+        spec = load_model_spec(name)
+
+        # Try to create; recover if model already exists in Boomi but
+        # not in our state (e.g. state was reset after a prior run).
+        try:
+            model_id = self.datahub_api.create_model(spec)
+            ui.print_info(f"Created model '{name}' (ID: {model_id})")
+            return model_id
+        except BoomiApiError as create_exc:
+            if create_exc.status_code not in (400, 409) or "already" not in create_exc.body.lower():
+                raise
+        ui.print_info(f"Model '{name}' already exists in Boomi — recovering ID...")
+        model_id = self.datahub_api.find_model_by_name(name)
+        if not model_id:
+            raise BoomiApiError(
+                404,
+                f"Model '{name}' reportedly exists but could not be found via GET /models",
+                "",
+            )
+        ui.print_info(f"Recovered model ID: {model_id}")
+        return model_id
+
+    def _record_model(self, state: SetupState, name: str, model_id: str) -> None:
+        state.set_model_progress(name, stage="deployed")
+        state.store_component_id("models", name, model_id)
+        # C2a fix: store universe_id (= model_id) so record operations can build
+        # the correct Repository API URL: /mdm/universes/{universeId}/records
+        state.store_universe_id(name, model_id)
+        self.datahub_api._config.universe_ids[name] = model_id
 
 
 class StageSources(BaseStep):
@@ -325,7 +405,7 @@ class StageSources(BaseStep):
     """
 
     # The three models deployed in steps 1.2a-c and their spec names
-    _MODELS = ["ComponentMapping", "DevAccountAccess", "PromotionLog"]
+    _MODELS = _PIPELINE_MODELS
 
     @property
     def step_id(self) -> str:
@@ -359,6 +439,22 @@ class StageSources(BaseStep):
                 pairs.append((src["name"], model_name))
         return pairs
 
+    def _try_add_staging_area(self, universe_id: str, source_name: str) -> Optional[str]:
+        """Create the staging area; None while the source is not in a valid state yet."""
+        try:
+            return self.datahub_api.add_staging_area(
+                universe_id=universe_id,
+                source_id=source_name,
+                name=source_name,
+                staging_id=source_name,
+            )
+        except BoomiApiError as exc:
+            if exc.status_code == 400 and "not in a valid state" in exc.body.lower():
+                ui.print_info(f"Source '{source_name}' not ready yet, retrying...")
+                self._not_ready_error = exc
+                return None
+            raise  # Non-retryable error — propagate to the caller's handler
+
     def execute(self, state: SetupState, dry_run: bool = False) -> StepStatus:
         ui.print_step(self.step_id, self.name, self.step_type.value)
 
@@ -408,30 +504,19 @@ class StageSources(BaseStep):
                         raise
 
                 # Step 2: Create staging area (retry — enableInitialLoad has variable propagation delay)
-                system_id = None
-                last_exc = None
-                for attempt in range(6):
-                    try:
-                        system_id = self.datahub_api.add_staging_area(
-                            universe_id=universe_id,
-                            source_id=source_name,
-                            name=source_name,
-                            staging_id=source_name,
-                        )
-                        break
-                    except BoomiApiError as staging_exc:
-                        last_exc = staging_exc
-                        if staging_exc.status_code == 400 and "not in a valid state" in staging_exc.body.lower():
-                            wait = 2 * (attempt + 1)
-                            ui.print_info(
-                                f"Source not ready yet, retrying in {wait}s "
-                                f"(attempt {attempt + 1}/6)..."
-                            )
-                            time.sleep(wait)
-                            continue
-                        raise  # Non-retryable error — propagate to outer handler
-                if system_id is None:
-                    raise last_exc  # type: ignore[misc]
+                self._not_ready_error: Optional[BoomiApiError] = None
+                try:
+                    system_id = poll(
+                        lambda: self._try_add_staging_area(universe_id, source_name),
+                        lambda sid: sid is not None,
+                        f"Source '{source_name}'", "ready for staging",
+                        interval=2, max_retries=6, backoff=2, max_interval=10,
+                    )
+                except BoomiApiError as exc:
+                    # Out of retries: report DataHub's last answer, not the poll timeout
+                    if exc.status_code == 408 and self._not_ready_error is not None:
+                        raise self._not_ready_error from exc
+                    raise
 
                 # Step 3: Finish Initial Load — release lock for next source
                 try:
@@ -478,6 +563,49 @@ class StageSources(BaseStep):
         return StepStatus.COMPLETED
 
 
+def _upsert_with_tag_fallback(
+    datahub_api: DataHubApi,
+    model_name: str,
+    records: list[dict[str, str]],
+    source: str,
+    entity_tags: list[str],
+) -> tuple[str, list[RecordOutcome]]:
+    """Upsert ``records``, first finding the entity tag DataHub accepts.
+
+    The first record probes each tag via /records, then via
+    /staging/{source} when /records answers "entity of unknown type";
+    the remaining records are sent in batches with whatever worked.
+    Returns the working tag and one outcome per record.
+    """
+    last_exc: Optional[BoomiApiError] = None
+    for tag in entity_tags:
+        ui.print_info(f"Trying entity tag '<{tag}>' via /records...")
+        probe = datahub_api.upsert_records(model_name, records[:1], source, entity_tag=tag)[0]
+        staging = False
+        if not probe.ok:
+            last_exc = probe.error
+            if not (probe.error.status_code == 400
+                    and "entity of unknown type" in probe.error.body.lower()):
+                raise probe.error  # Non-retryable error
+            ui.print_info(f"  '<{tag}>' rejected — trying /staging/{source}...")
+            probe = datahub_api.upsert_records(
+                model_name, records[:1], source, entity_tag=tag, staging=True,
+            )[0]
+            if not probe.ok:
+                last_exc = probe.error
+                ui.print_info(f"  '<{tag}>' also rejected by staging: {probe.error.body[:200]}")
+                continue
+            staging = True
+        ui.print_success(f"Entity tag '<{tag}>' accepted by {'/staging' if staging else '/records'}")
+        rest = datahub_api.upsert_records(
+            model_name, records[1:], source, entity_tag=tag, staging=staging,
+        )
+        return tag, [probe] + [outcome._replace(index=outcome.index + 1) for outcome in rest]
+
+    ui.print_error(f"No entity tag variant worked. Tried: {entity_tags}")
+    raise last_exc  # type: ignore[misc]
+
+
 class SeedDevAccess(BaseStep):
     """Step 1.3 — Seed DevAccountAccess records via interactive prompts."""
 
@@ -497,30 +625,22 @@ class SeedDevAccess(BaseStep):
     def depends_on(self) -> list[str]:
         return ["1.2d", "2.4"]
 
-    def _build_record_xml(
-        self,
+    @staticmethod
+    def _build_record(
         sso_group_id: str,
         group_name: str,
         dev_account_id: str,
         dev_account_name: str,
-        entity_tag: str = "DevAccountAccess",
-    ) -> str:
+    ) -> dict[str, str]:
         # C2c fix: include <id> source entity ID so DataHub does not quarantine the record.
         # The composite key uses the two match fields separated by colon.
-        # NOTE: No XML declaration — Boomi docs show batch XML without <?xml?> header,
-        # and some parsers may mis-detect the entity type when the declaration is present.
-        entity_id = f"{sso_group_id}:{dev_account_id}"
-        return (
-            '<batch src="ADMIN_CONFIG">\n'
-            f"  <{entity_tag}>\n"
-            f"    <id>{entity_id}</id>\n"
-            f"    <ssoGroupId>{sso_group_id}</ssoGroupId>\n"
-            f"    <ssoGroupName>{group_name}</ssoGroupName>\n"
-            f"    <devAccountId>{dev_account_id}</devAccountId>\n"
-            f"    <devAccountName>{dev_account_name}</devAccountName>\n"
-            f"  </{entity_tag}>\n"
-            "</batch>"
-        )
+        return {
+            "id": f"{sso_group_id}:{dev_account_id}",
+            "ssoGroupId": sso_group_id,
+            "ssoGroupName": group_name,
+            "devAccountId": dev_account_id,
+            "devAccountName": dev_account_name,
+        }
 
     def _validate_universe_ids(self, state: SetupState) -> bool:
         """Pre-flight check: verify universe_ids are populated and unique.
@@ -570,7 +690,7 @@ class SeedDevAccess(BaseStep):
         da_uid = uids.get("DevAccountAccess", "")
         if da_uid:
             try:
-                model_resp = self.datahub_api.get_model(da_uid)
+                model_resp = self.datahub_api.get_model(da_uid, cache=True)
                 if isinstance(model_resp, str):
                     import xml.etree.ElementTree as ET
                     actual_name = "UNKNOWN"
@@ -700,7 +820,9 @@ class SeedDevAccess(BaseStep):
 
         ui.print_info(f"Entity tag candidates: {entity_tags}")
 
-        record_count = 0
+        # Each record is sent as soon as it is entered, so an error never
+        # costs the records typed before it
+        sent = failed = 0
         while True:
             sso_group_id = guide_and_collect(
                 "Enter the SSO group ID for this dev account access record.\n"
@@ -719,59 +841,29 @@ class SeedDevAccess(BaseStep):
                 "Enter the dev account display name.",
                 "Dev Account Name",
             )
+            record = self._build_record(sso_group_id, group_name, dev_account_id, dev_account_name)
+            label = f"{sso_group_id} -> {dev_account_name}"
+            number = sent + failed + 1
 
             try:
-                # Try each entity tag variant until one succeeds
-                created = False
-                last_exc = None
-                for tag in entity_tags:
-                    record_xml = self._build_record_xml(
-                        sso_group_id, group_name, dev_account_id, dev_account_name,
-                        entity_tag=tag,
-                    )
-                    ui.print_info(f"Trying entity tag '<{tag}>' via /records...")
-                    try:
-                        self.datahub_api.create_record(
-                            "DevAccountAccess", record_xml, "ADMIN_CONFIG"
-                        )
-                        ui.print_success(f"Entity tag '<{tag}>' accepted by /records")
-                        created = True
-                        break
-                    except BoomiApiError as exc:
-                        last_exc = exc
-                        if exc.status_code == 400 and "entity of unknown type" in exc.body.lower():
-                            ui.print_info(f"  '<{tag}>' rejected — entity of unknown type")
-                            # Also try staging endpoint with this tag
-                            ui.print_info(f"  Trying '<{tag}>' via /staging/ADMIN_CONFIG...")
-                            try:
-                                self.datahub_api.create_record_staging(
-                                    "DevAccountAccess", record_xml, "ADMIN_CONFIG"
-                                )
-                                ui.print_success(f"Entity tag '<{tag}>' accepted by /staging")
-                                created = True
-                                break
-                            except BoomiApiError as staging_exc:
-                                ui.print_info(f"  '<{tag}>' also rejected by staging: {staging_exc.body[:200]}")
-                                continue
-                        raise  # Non-retryable error
-
-                if not created:
+                # With one record, any rejection is raised rather than returned
+                tag, _ = _upsert_with_tag_fallback(
+                    self.datahub_api, "DevAccountAccess", [record], "ADMIN_CONFIG", entity_tags,
+                )
+            except BoomiApiError as exc:
+                ui.print_error(f"Failed to create record #{number} ({label}): {exc}")
+                if len(entity_tags) > 1:
                     ui.print_error(
-                        f"No entity tag variant worked. Tried: {entity_tags}\n"
                         "Check the model's root element name in the DataHub UI:\n"
                         "  Services > DataHub > Models > DevAccountAccess > "
                         "look for 'Root Element' or 'Element Name' property"
                     )
-                    raise last_exc  # type: ignore[misc]
-
-                record_count += 1
-                ui.print_success(
-                    f"Created DevAccountAccess record #{record_count} "
-                    f"({sso_group_id} -> {dev_account_name})"
-                )
-            except BoomiApiError as exc:
-                ui.print_error(f"Failed to create record: {exc}")
-                return StepStatus.FAILED
+                    return StepStatus.FAILED
+                failed += 1  # only one tag left to try: report the record and carry on
+            else:
+                entity_tags = [tag]  # known now; later records skip the probing
+                sent += 1
+                ui.print_success(f"Created DevAccountAccess record #{number} ({label})")
 
             if not guide_and_confirm(
                 "Add another DevAccountAccess record?",
@@ -779,7 +871,11 @@ class SeedDevAccess(BaseStep):
             ):
                 break
 
-        ui.print_success(f"Seeded {record_count} DevAccountAccess record(s)")
+        if failed:
+            ui.print_error(f"{failed} of {sent + failed} DevAccountAccess record(s) failed")
+            return StepStatus.FAILED
+
+        ui.print_success(f"Seeded {sent} DevAccountAccess record(s)")
         return StepStatus.COMPLETED
 
 
@@ -838,115 +934,57 @@ class TestCrud(BaseStep):
             entity_tags = SeedDevAccess._entity_tag_variants("ComponentMapping")
         ui.print_info(f"Entity tag candidates: {entity_tags}")
 
-        def _build_test_xml(tag: str) -> str:
-            return (
-                '<batch src="PROMOTION_ENGINE">\n'
-                f"  <{tag}>\n"
-                f"    <id>{test_entity_id}</id>\n"
-                f"    <devComponentId>{test_dev_id}</devComponentId>\n"
-                f"    <devAccountId>{test_account_id}</devAccountId>\n"
-                "    <prodComponentId>test-prod-00000000</prodComponentId>\n"
-                "    <componentName>CRUD Test Record</componentName>\n"
-                "    <componentType>process</componentType>\n"
-                f"  </{tag}>\n"
-                "</batch>"
-            )
+        test_record = {
+            "id": test_entity_id,
+            "devComponentId": test_dev_id,
+            "devAccountId": test_account_id,
+            "prodComponentId": "test-prod-00000000",
+            "componentName": "CRUD Test Record",
+            "componentType": "process",
+        }
 
         try:
             # Create — try each entity tag variant + staging fallback
             ui.print_info("Creating test ComponentMapping record...")
-            created = False
-            last_exc = None
-            working_tag = entity_tags[0]  # default for query/delete
-
-            for tag in entity_tags:
-                record_xml = _build_test_xml(tag)
-                ui.print_info(f"Trying entity tag '<{tag}>' via /records...")
-                try:
-                    self.datahub_api.create_record(
-                        "ComponentMapping", record_xml, "PROMOTION_ENGINE"
-                    )
-                    ui.print_success(f"Entity tag '<{tag}>' accepted")
-                    working_tag = tag
-                    created = True
-                    break
-                except BoomiApiError as exc:
-                    last_exc = exc
-                    if exc.status_code == 400 and "entity of unknown type" in exc.body.lower():
-                        ui.print_info(f"  '<{tag}>' rejected — trying staging...")
-                        try:
-                            self.datahub_api.create_record_staging(
-                                "ComponentMapping", record_xml, "PROMOTION_ENGINE"
-                            )
-                            ui.print_success(f"Entity tag '<{tag}>' accepted by staging")
-                            working_tag = tag
-                            created = True
-                            break
-                        except BoomiApiError as staging_exc:
-                            ui.print_info(f"  staging also rejected: {staging_exc.body[:200]}")
-                            continue
-                    raise
-
-            if not created:
-                ui.print_error(f"No entity tag variant worked. Tried: {entity_tags}")
-                raise last_exc  # type: ignore[misc]
+            _upsert_with_tag_fallback(
+                self.datahub_api, "ComponentMapping", [test_record], "PROMOTION_ENGINE",
+                entity_tags,
+            )
             ui.print_success("Test record created")
 
             # Query
             # M3 fix: fieldId values must use UPPER_SNAKE_CASE uniqueId format
             # (DEV_COMPONENT_ID, DEV_ACCOUNT_ID) to match the model's field uniqueId.
             ui.print_info("Querying test record...")
-            query_xml = (
-                '<RecordQueryRequest limit="10">\n'
-                "  <view>\n"
-                "    <fieldId>DEV_COMPONENT_ID</fieldId>\n"
-                "    <fieldId>DEV_ACCOUNT_ID</fieldId>\n"
-                "  </view>\n"
-                '  <filter op="AND">\n'
-                "    <fieldValue>\n"
-                "      <fieldId>DEV_COMPONENT_ID</fieldId>\n"
-                "      <operator>EQUALS</operator>\n"
-                f"      <value>{test_dev_id}</value>\n"
-                "    </fieldValue>\n"
-                "  </filter>\n"
-                "</RecordQueryRequest>"
-            )
-            query_result = self.datahub_api.query_records("ComponentMapping", query_xml)
-            if not query_result:
-                ui.print_error("Query returned no result")
-                return StepStatus.FAILED
+            # DataHub ingests upserts asynchronously: the record may take a few seconds to show
+            try:
+                record = poll(
+                    lambda: next(self.datahub_api.iter_records(
+                        "ComponentMapping",
+                        {"DEV_COMPONENT_ID": test_dev_id},
+                        fields=["DEV_COMPONENT_ID", "DEV_ACCOUNT_ID"],
+                        page_size=10,
+                    ), None),
+                    lambda found: found is not None,
+                    "Test record", "queryable",
+                    interval=2, max_retries=6, backoff=1.5, max_interval=8,
+                )
+            except BoomiApiError as exc:
+                if exc.status_code != 408:
+                    raise
+                ui.print_warning(
+                    "Test record was accepted but is not queryable yet; "
+                    f"delete the '{test_entity_id}' record manually if it remains"
+                )
+                return StepStatus.COMPLETED
             ui.print_success("Test record queried successfully")
 
-            # Delete — extract record ID from query result
-            # DataHub query returns XML; parse for recordId
-            record_id = self._extract_record_id(query_result)
-            if record_id:
-                ui.print_info("Deleting test record...")
-                self.datahub_api.delete_record("ComponentMapping", record_id)
-                ui.print_success("Test record deleted")
-            else:
-                ui.print_warning("Could not extract record ID for cleanup; manual cleanup may be needed")
+            ui.print_info("Deleting test record...")
+            self.datahub_api.delete_record("ComponentMapping", record.record_id)
+            ui.print_success("Test record deleted")
 
             ui.print_success("DataHub CRUD validation passed")
             return StepStatus.COMPLETED
         except BoomiApiError as exc:
             ui.print_error(f"CRUD validation failed: {exc}")
             return StepStatus.FAILED
-
-    @staticmethod
-    def _extract_record_id(result: dict | str) -> str | None:
-        """Extract the first recordId from a DataHub query response."""
-        if isinstance(result, str):
-            # XML response — look for recordId attribute or element
-            import re
-            match = re.search(r'recordId="([^"]+)"', result)
-            if match:
-                return match.group(1)
-            match = re.search(r"<recordId>([^<]+)</recordId>", result)
-            if match:
-                return match.group(1)
-        elif isinstance(result, dict):
-            records = result.get("records", [])
-            if records:
-                return records[0].get("recordId")
-        return None
@@ -343,7 +343,7 @@ class CreateHttpOps(BaseStep):
         ui.print_step(self.step_id, self.name, self.step_type.value)
 
         all_op_names = [op[0] for op in HTTP_OPERATIONS]
-        remaining = state.get_remaining_items("2.3_create_http_ops", all_op_names)
+        remaining = self._component_items(state, "2.3_create_http_ops", all_op_names)
 
         if not remaining:
             ui.print_success(f"All {len(HTTP_OPERATIONS)} HTTP operations already created")
@@ -361,7 +361,8 @@ class CreateHttpOps(BaseStep):
         ops_folder_id = state.get_component_id("folders", "Operations") or ""
         total = len(remaining)
 
-        for idx, op_name in enumerate(remaining, 1):
+        items: list[tuple[str, str, str]] = []
+        for op_name in remaining:
             # Find the matching operation definition
             op_def = next((o for o in HTTP_OPERATIONS if o[0] == op_name), None)
             if not op_def:
@@ -369,24 +370,16 @@ class CreateHttpOps(BaseStep):
                 return StepStatus.FAILED
 
             _, method, url_path, var_names, content_type = op_def
-            ui.print_progress(idx, total, op_name)
-
             parameterized = self._parameterize_template(
                 template_xml, op_name, method, url_path, ops_folder_id,
                 variable_names=var_names, content_type=content_type
             )
+            items.append((op_name, op_name, parameterized))
 
-            try:
-                result = self.platform_api.create_component(parameterized)
-                comp_id = self._extract_id(result)
-                if not comp_id:
-                    ui.print_error(f"No component ID returned for '{op_name}'")
-                    return StepStatus.FAILED
-                state.store_component_id("http_operations", op_name, comp_id)
-                state.mark_step_item_complete("2.3_create_http_ops", op_name)
-            except BoomiApiError as exc:
-                ui.print_error(f"Failed to create '{op_name}': {exc}")
-                return StepStatus.FAILED
+        if not self._create_components(
+            state, "2.3_create_http_ops", "http_operations", items,
+        ):
+            return StepStatus.FAILED
 
         ui.print_success(f"Created {total} HTTP operations")
         return StepStatus.COMPLETED
@@ -429,7 +429,7 @@ class CreateDhOps(BaseStep):
         ui.print_step(self.step_id, self.name, self.step_type.value)
 
         all_op_names = [op[0] for op in DH_OPERATIONS]
-        remaining = state.get_remaining_items("2.7_create_dh_ops", all_op_names)
+        remaining = self._component_items(state, "2.7_create_dh_ops", all_op_names)
 
         if not remaining:
             ui.print_success(f"All {len(DH_OPERATIONS)} DataHub operations already created")
@@ -444,7 +444,8 @@ class CreateDhOps(BaseStep):
         ops_folder_id = state.get_component_id("folders", "Operations") or ""
         total = len(remaining)
 
-        for idx, op_name in enumerate(remaining, 1):
+        items: list[tuple[str, str, str]] = []
+        for op_name in remaining:
             op_def = next((o for o in DH_OPERATIONS if o[0] == op_name), None)
             if not op_def:
                 ui.print_error(f"Unknown operation: {op_name}")
@@ -465,24 +466,16 @@ class CreateDhOps(BaseStep):
                 )
                 return StepStatus.FAILED
 
-            ui.print_progress(idx, total, op_name)
-
             parameterized = _parameterize_dh_template(
                 template_xml, op_name, entity, ops_folder_id,
                 action=action if use_legacy else None,
             )
+            items.append((op_name, op_name, parameterized))
 
-            try:
-                result = self.platform_api.create_component(parameterized)
-                comp_id = _extract_id(result)
-                if not comp_id:
-                    ui.print_error(f"No component ID returned for '{op_name}'")
-                    return StepStatus.FAILED
-                state.store_component_id("dh_operations", op_name, comp_id)
-                state.mark_step_item_complete("2.7_create_dh_ops", op_name)
-            except BoomiApiError as exc:
-                ui.print_error(f"Failed to create '{op_name}': {exc}")
-                return StepStatus.FAILED
+        if not self._create_components(
+            state, "2.7_create_dh_ops", "dh_operations", items,
+        ):
+            return StepStatus.FAILED
 
         ui.print_success(f"Created {total} DataHub operations")
         return StepStatus.COMPLETED
@@ -567,8 +560,21 @@ class VerifyPhase2(BaseStep):
         ops_folder_id = state.get_component_id("folders", "Operations") or ""
         repaired = 0
 
+        # One bulk read for every stored op instead of a GET per op
+        stored_ids = {
+            op_name: state.get_component_id("dh_operations", op_name)
+            for op_name, _, _ in DH_OPERATIONS
+        }
+        try:
+            components = self.platform_api.get_components_bulk(
+                cid for cid in stored_ids.values() if cid
+            )
+        except BoomiApiError as exc:
+            ui.print_error(f"  Bulk GET of stored DH ops failed — {exc}")
+            components = {}
+
         for op_name, entity, action in DH_OPERATIONS:
-            stored_id = state.get_component_id("dh_operations", op_name)
+            stored_id = stored_ids[op_name]
             if not stored_id:
                 ui.print_error(f"  {op_name}: NO stored ID")
                 repaired += self._try_create_dh_op(
@@ -576,24 +582,30 @@ class VerifyPhase2(BaseStep):
                 )
                 continue
 
-            # Fetch component and check its actual name
-            try:
-                comp_xml = self.platform_api.get_component(stored_id)
-                comp_str = comp_xml if isinstance(comp_xml, str) else str(comp_xml)
-                name_match = _re.search(r'name="([^"]*)"', comp_str)
-                actual_name = name_match.group(1) if name_match else "(unknown)"
-                if actual_name == op_name:
-                    ui.print_success(f"  {op_name}: OK ({stored_id})")
-                else:
-                    ui.print_error(
-                        f"  {op_name}: NAME MISMATCH — stored ID {stored_id} "
-                        f"has name '{actual_name}'"
-                    )
+            # Check the fetched component's actual name
+            comp_str = components.get(stored_id)
+            if comp_str is None:
+                # Not in the bulk response: only a confirmed 404 means it's gone
+                try:
+                    comp_str = self.platform_api.get_component(stored_id)
+                except BoomiApiError as exc:
+                    if exc.status_code != 404:
+                        ui.print_error(f"  {op_name}: GET failed ({stored_id}) — {exc}")
+                        continue
+                    ui.print_error(f"  {op_name}: NOT FOUND ({stored_id})")
                     repaired += self._try_create_dh_op(
                         state, discovery, op_name, entity, action, ops_folder_id
                     )
-            except BoomiApiError as exc:
-                ui.print_error(f"  {op_name}: GET failed ({stored_id}) — {exc}")
+                    continue
+            name_match = _re.search(r'name="([^"]*)"', comp_str)
+            actual_name = name_match.group(1) if name_match else "(unknown)"
+            if actual_name == op_name:
+                ui.print_success(f"  {op_name}: OK ({stored_id})")
+            else:
+                ui.print_error(
+                    f"  {op_name}: NAME MISMATCH — stored ID {stored_id} "
+                    f"has name '{actual_name}'"
+                )
                 repaired += self._try_create_dh_op(
                     state, discovery, op_name, entity, action, ops_folder_id
                 )
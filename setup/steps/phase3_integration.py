@@ -160,42 +160,40 @@ class CreateProfiles(BaseStep):
         ui.print_step(self.step_id, self.name, self.step_type.value)
 
         all_profiles = list_profiles()
-        remaining = state.get_remaining_items(self.step_id, all_profiles)
+        remaining = self._component_items(state, self.step_id, all_profiles)
 
         if not remaining:
             ui.print_success("All 42 profiles already created.")
             return StepStatus.COMPLETED
 
         ui.print_info(f"Creating {len(remaining)} of {len(all_profiles)} profiles...")
+        done_before = len(all_profiles) - len(remaining)
 
-        for i, stem in enumerate(remaining, 1):
-            display_name = _profile_display_name(stem)
-            ui.print_progress(
-                len(all_profiles) - len(remaining) + i, len(all_profiles), display_name
-            )
-
-            if dry_run:
+        if dry_run:
+            for i, stem in enumerate(remaining, 1):
+                ui.print_progress(done_before + i, len(all_profiles), _profile_display_name(stem))
                 state.mark_step_item_complete(self.step_id, stem)
-                continue
-
-            # Load JSON schema and generate profile XML
-            schema_str = load_template(f"integration/profiles/{stem}.json")
-            schema = json_mod.loads(schema_str)
+            ui.print_success(f"All {len(all_profiles)} profiles created.")
+            return StepStatus.COMPLETED
 
+        items: list[tuple[str, str, str]] = []
+        for stem in remaining:
+            display_name = _profile_display_name(stem)
             try:
+                # Load JSON schema and generate profile XML
+                schema_str = load_template(f"integration/profiles/{stem}.json")
+                schema = json_mod.loads(schema_str)
                 profile_xml = generate_profile_xml(schema, display_name, "PROMO/Profiles")
-                result = self.platform_api.create_component(profile_xml)
-                comp_id = self.platform_api.parse_component_id(result)
-                if comp_id:
-                    state.store_component_id("profiles", stem, comp_id)
-                    state.mark_step_item_complete(self.step_id, stem)
-                    ui.print_success(f"Created {display_name} -> {comp_id}")
-                else:
-                    ui.print_error(f"No component ID returned for {display_name}")
-                    return StepStatus.FAILED
             except Exception as exc:
-                ui.print_error(f"Failed to create {display_name}: {exc}")
+                ui.print_error(f"Failed to generate {display_name}: {exc}")
                 return StepStatus.FAILED
+            items.append((stem, display_name, profile_xml))
+
+        if not self._create_components(
+            state, self.step_id, "profiles", items,
+            done_before=done_before, total=len(all_profiles),
+        ):
+            return StepStatus.FAILED
 
         ui.print_success(f"All {len(all_profiles)} profiles created.")
         return StepStatus.COMPLETED
@@ -226,42 +224,42 @@ class CreateScripts(BaseStep):
         ui.print_step(self.step_id, self.name, self.step_type.value)
 
         all_scripts = sorted(SCRIPT_NAME_MAP.keys())
-        remaining = state.get_remaining_items(self.step_id, all_scripts)
+        remaining = self._component_items(state, self.step_id, all_scripts)
 
         if not remaining:
             ui.print_success("All 11 scripts already created.")
             return StepStatus.COMPLETED
 
         ui.print_info(f"Creating {len(remaining)} of {len(all_scripts)} scripts...")
+        done_before = len(all_scripts) - len(remaining)
 
-        for i, stem in enumerate(remaining, 1):
-            component_name = script_stem_to_component_name(stem)
-            ui.print_progress(
-                len(all_scripts) - len(remaining) + i, len(all_scripts), component_name
-            )
-
-            if dry_run:
+        if dry_run:
+            for i, stem in enumerate(remaining, 1):
+                ui.print_progress(
+                    done_before + i, len(all_scripts), script_stem_to_component_name(stem)
+                )
                 state.mark_step_item_complete(self.step_id, stem)
-                continue
-
-            groovy_content = load_template(f"integration/scripts/{stem}.groovy")
+            ui.print_success(f"All {len(all_scripts)} scripts created.")
+            return StepStatus.COMPLETED
 
+        items: list[tuple[str, str, str]] = []
+        for stem in remaining:
+            component_name = script_stem_to_component_name(stem)
             try:
+                groovy_content = load_template(f"integration/scripts/{stem}.groovy")
                 script_xml = generate_script_xml(
                     groovy_content, component_name, "Promoted/Scripts"
                 )
-                result = self.platform_api.create_component(script_xml)
-                comp_id = self.platform_api.parse_component_id(result)
-                if comp_id:
-                    state.store_component_id("scripts", stem, comp_id)
-                    state.mark_step_item_complete(self.step_id, stem)
-                    ui.print_success(f"Created {component_name} -> {comp_id}")
-                else:
-                    ui.print_error(f"No component ID returned for {component_name}")
-                    return StepStatus.FAILED
             except Exception as exc:
-                ui.print_error(f"Failed to create {component_name}: {exc}")
+                ui.print_error(f"Failed to generate {component_name}: {exc}")
                 return StepStatus.FAILED
+            items.append((stem, component_name, script_xml))
+
+        if not self._create_components(
+            state, self.step_id, "scripts", items,
+            done_before=done_before, total=len(all_scripts),
+        ):
+            return StepStatus.FAILED
 
         ui.print_success(f"All {len(all_scripts)} scripts created.")
         return StepStatus.COMPLETED
@@ -414,7 +412,7 @@ class CreateFssOps(BaseStep):
             return StepStatus.FAILED
 
         all_ops = [key for key, _ in FSS_OPS]
-        remaining = state.get_remaining_items(self.step_id, all_ops)
+        remaining = self._component_items(state, self.step_id, all_ops)
 
         if not remaining:
             ui.print_success(f"All {len(all_ops)} FSS operations already created.")
@@ -422,12 +420,18 @@ class CreateFssOps(BaseStep):
 
         ops_lookup = dict(FSS_OPS)
         ui.print_info(f"Creating {len(remaining)} of {len(all_ops)} FSS operations...")
+        done_before = len(all_ops) - len(remaining)
 
-        for i, action_key in enumerate(remaining, 1):
+        if dry_run:
+            for i, action_key in enumerate(remaining, 1):
+                ui.print_progress(done_before + i, len(all_ops), ops_lookup[action_key])
+                state.mark_step_item_complete(self.step_id, action_key)
+            ui.print_success(f"All {len(all_ops)} FSS operations created.")
+            return StepStatus.COMPLETED
+
+        items: list[tuple[str, str, str]] = []
+        for action_key in remaining:
             display_name = ops_lookup[action_key]
-            ui.print_progress(
-                len(all_ops) - len(remaining) + i, len(all_ops), display_name
-            )
 
             # Look up request/response profile IDs
             req_profile_id = state.get_component_id(
@@ -437,30 +441,20 @@ class CreateFssOps(BaseStep):
                 "profiles", f"{action_key}-response"
             )
 
-            if dry_run:
-                state.mark_step_item_complete(self.step_id, action_key)
-                continue
+            # Build FSS operation XML using the captured template as the
+            # structural basis, replacing name and profile IDs. This
+            # ensures the bns: namespace, folderFullPath, and all required
+            # attributes are present exactly as the API expects them.
+            fss_xml = _build_fss_op_xml(
+                template_xml, display_name, req_profile_id, resp_profile_id
+            )
+            items.append((action_key, display_name, fss_xml))
 
-            try:
-                # Build FSS operation XML using the captured template as the
-                # structural basis, replacing name and profile IDs. This
-                # ensures the bns: namespace, folderFullPath, and all required
-                # attributes are present exactly as the API expects them.
-                fss_xml = _build_fss_op_xml(
-                    template_xml, display_name, req_profile_id, resp_profile_id
-                )
-                result = self.platform_api.create_component(fss_xml)
-                comp_id = self.platform_api.parse_component_id(result)
-                if comp_id:
-                    state.store_component_id("fss_operations", action_key, comp_id)
-                    state.mark_step_item_complete(self.step_id, action_key)
-                    ui.print_success(f"Created {display_name} -> {comp_id}")
-                else:
-                    ui.print_error(f"No component ID returned for {display_name}")
-                    return StepStatus.FAILED
-            except Exception as exc:
-                ui.print_error(f"Failed to create {display_name}: {exc}")
-                return StepStatus.FAILED
+        if not self._create_components(
+            state, self.step_id, "fss_operations", items,
+            done_before=done_before, total=len(all_ops),
+        ):
+            return StepStatus.FAILED
 
         ui.print_success(f"All {len(all_ops)} FSS operations created.")
         return StepStatus.COMPLETED
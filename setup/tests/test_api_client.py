@@ -6,8 +6,9 @@ import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
-from setup.api.client import BoomiApiError, BoomiClient, _MIN_CALL_INTERVAL
+from setup.api.client import BoomiApiError, BoomiClient, _MAX_CALL_RATE
 
 
 def _mock_response(
@@ -35,7 +36,11 @@ class TestAuthentication:
         expected_encoded = base64.b64encode(expected_raw.encode()).decode()
         expected_header = f"Basic {expected_encoded}"
 
-        assert client._session.headers["Authorization"] == expected_header
+        client._transport.request = MagicMock(return_value=_mock_response(200, {}))
+        client.get("https://api.boomi.com/x")
+
+        headers = client._transport.request.call_args.kwargs["headers"]
+        assert headers["Authorization"] == expected_header
 
 
 class TestRateLimiting:
@@ -44,26 +49,55 @@ class TestRateLimiting:
     def test_rate_limiting_delay(
         self, mock_monotonic: MagicMock, mock_sleep: MagicMock
     ) -> None:
-        """Two rapid calls should trigger sleep to enforce >= 120ms gap."""
-        client = BoomiClient(user="u", token="t")
+        """With burst=1, two rapid calls should sleep to enforce the 120ms gap."""
+        client = BoomiClient(user="u", token="t", rate=1 / 0.120, burst=1)
 
-        # First call: monotonic returns 100.0, no prior call (last_call_time=0)
-        # so elapsed = 100.0 > _MIN_CALL_INTERVAL, no sleep
-        # After rate_limit, monotonic() is called again to set _last_call_time
-        mock_monotonic.side_effect = [100.0, 100.0, 100.05, 100.12]
-        #                             ^1st _rate_limit now, ^set last, ^2nd now, ^set last
+        # First call at t=100.0 uses the single burst token; second call
+        # arrives 50ms later and must wait the remaining 70ms.
+        mock_monotonic.side_effect = [100.0, 100.05]
 
         mock_response = _mock_response(200, {"ok": True})
-        client._session.request = MagicMock(return_value=mock_response)
+        client._transport.request = MagicMock(return_value=mock_response)
 
         client.get("https://api.boomi.com/test1")
         client.get("https://api.boomi.com/test2")
 
-        # Second call: elapsed = 100.05 - 100.0 = 0.05 < 0.120
-        # Should sleep for 0.120 - 0.05 = 0.07
-        mock_sleep.assert_called()
-        sleep_call_args = [call.args[0] for call in mock_sleep.call_args_list]
-        assert any(0 < arg <= _MIN_CALL_INTERVAL for arg in sleep_call_args)
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(0.07)
+
+    @patch("setup.api.client.time.sleep")
+    @patch("setup.api.client.time.monotonic", return_value=100.0)
+    def test_burst_calls_do_not_sleep(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Calls within the burst size go out back-to-back."""
+        client = BoomiClient(user="u", token="t", burst=3)
+        client._transport.request = MagicMock(return_value=_mock_response(200, {"ok": True}))
+
+        for _ in range(3):
+            client.get("https://api.boomi.com/test")
+
+        mock_sleep.assert_not_called()
+
+    @patch("setup.api.client.time.sleep")
+    @patch("setup.api.client.time.monotonic", return_value=100.0)
+    def test_hosts_have_separate_buckets(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Platform and hub cloud hosts are throttled independently."""
+        client = BoomiClient(user="u", token="t", burst=1)
+        repo_client = client.with_auth_header("Basic cmVwbzp0b2tlbg==")
+        client._transport.request = MagicMock(return_value=_mock_response(200, {"ok": True}))
+        repo_client._transport.request = MagicMock(return_value=_mock_response(200, {"ok": True}))
+
+        client.get("https://api.boomi.com/test")
+        repo_client.get("https://c01-usa-east.hub.boomi.com/mdm/test")
+        mock_sleep.assert_not_called()
+
+        # Same host again (via the sibling) shares the Platform bucket
+        repo_client.get("https://api.boomi.com/test")
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(1 / _MAX_CALL_RATE)
 
 
 class TestRetryBehavior:
@@ -77,11 +111,11 @@ class TestRetryBehavior:
         resp_429 = _mock_response(429, text="Rate limited")
         resp_200 = _mock_response(200, {"result": "ok"})
 
-        client._session.request = MagicMock(side_effect=[resp_429, resp_200])
+        client._transport.request = MagicMock(side_effect=[resp_429, resp_200])
 
         result = client.get("https://api.boomi.com/test")
         assert result == {"result": "ok"}
-        assert client._session.request.call_count == 2
+        assert client._transport.request.call_count == 2
 
     @patch("setup.api.client.time.sleep")
     @patch("setup.api.client.time.monotonic", return_value=0.0)
@@ -93,11 +127,11 @@ class TestRetryBehavior:
         resp_503 = _mock_response(503, text="Service unavailable")
         resp_200 = _mock_response(200, {"healthy": True})
 
-        client._session.request = MagicMock(side_effect=[resp_503, resp_200])
+        client._transport.request = MagicMock(side_effect=[resp_503, resp_200])
 
         result = client.get("https://api.boomi.com/health")
         assert result == {"healthy": True}
-        assert client._session.request.call_count == 2
+        assert client._transport.request.call_count == 2
 
     @patch("setup.api.client.time.sleep")
     @patch("setup.api.client.time.monotonic", return_value=0.0)
@@ -108,13 +142,13 @@ class TestRetryBehavior:
         client = BoomiClient(user="u", token="t")
         resp_401 = _mock_response(401, text="Unauthorized")
 
-        client._session.request = MagicMock(return_value=resp_401)
+        client._transport.request = MagicMock(return_value=resp_401)
 
         with pytest.raises(BoomiApiError) as exc_info:
             client.get("https://api.boomi.com/test")
 
         assert exc_info.value.status_code == 401
-        assert client._session.request.call_count == 1
+        assert client._transport.request.call_count == 1
 
     @patch("setup.api.client.time.sleep")
     @patch("setup.api.client.time.monotonic", return_value=0.0)
@@ -126,14 +160,80 @@ class TestRetryBehavior:
         resp_429 = _mock_response(429, text="Rate limited")
 
         # _MAX_RETRIES = 3, so total attempts = 3 + 1 = 4
-        client._session.request = MagicMock(return_value=resp_429)
+        client._transport.request = MagicMock(return_value=resp_429)
 
         with pytest.raises(BoomiApiError) as exc_info:
             client.get("https://api.boomi.com/test")
 
         assert exc_info.value.status_code == 429
         # 1 initial + 3 retries = 4 calls
-        assert client._session.request.call_count == 4
+        assert client._transport.request.call_count == 4
+
+
+    @patch("setup.api.client.time.sleep")
+    @patch("setup.api.client.time.monotonic", return_value=0.0)
+    def test_retry_after_honored(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """A Retry-After header sets the wait instead of the jittered backoff."""
+        client = BoomiClient(user="u", token="t")
+        resp_429 = _mock_response(429, text="Rate limited")
+        resp_429.headers["Retry-After"] = "3"
+        client._transport.request = MagicMock(
+            side_effect=[resp_429, _mock_response(200, {"ok": True})]
+        )
+
+        client.get("https://api.boomi.com/test")
+
+        mock_sleep.assert_called_once_with(3.0)
+
+    @patch("setup.api.client.time.sleep")
+    @patch("setup.api.client.time.monotonic", return_value=0.0)
+    def test_connection_error_retried_for_get(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        client = BoomiClient(user="u", token="t")
+        client._transport.request = MagicMock(
+            side_effect=[requests.ConnectionError("reset"), _mock_response(200, {"ok": True})]
+        )
+
+        assert client.get("https://api.boomi.com/test") == {"ok": True}
+        assert client._transport.request.call_count == 2
+
+    @patch("setup.api.client.time.sleep")
+    @patch("setup.api.client.time.monotonic", return_value=0.0)
+    def test_connection_error_not_retried_for_post(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """A POST may have reached the server, so a reset is not resent."""
+        client = BoomiClient(user="u", token="t")
+        client._transport.request = MagicMock(side_effect=requests.ConnectionError("reset"))
+
+        with pytest.raises(requests.ConnectionError):
+            client.post("https://api.boomi.com/test", data="{}")
+        assert client._transport.request.call_count == 1
+
+    @patch("setup.api.client.time.sleep")
+    @patch("setup.api.client.time.monotonic", return_value=0.0)
+    def test_retry_budget_shared_with_siblings(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Once the shared budget is spent, errors surface without waiting."""
+        client = BoomiClient(user="u", token="t", retry_budget=5.0)
+        sibling = client.with_auth_header("Basic other")
+        resp_429 = _mock_response(429, text="Rate limited")
+        resp_429.headers["Retry-After"] = "4"
+        # Siblings share one transport
+        client._transport.request = MagicMock(
+            side_effect=[resp_429, _mock_response(200, {"ok": True}), resp_429]
+        )
+
+        client.get("https://api.boomi.com/a")
+        with pytest.raises(BoomiApiError):
+            sibling.get("https://hub.boomi.com/b")
+
+        assert client._transport.request.call_count == 3
+        mock_sleep.assert_called_once_with(4.0)
 
 
 class TestResponseParsing:
@@ -146,7 +246,7 @@ class TestResponseParsing:
         client = BoomiClient(user="u", token="t")
         resp = _mock_response(200, json_data={"name": "test", "version": 1})
 
-        client._session.request = MagicMock(return_value=resp)
+        client._transport.request = MagicMock(return_value=resp)
 
         result = client.get("https://api.boomi.com/component/123")
         assert isinstance(result, dict)
@@ -163,7 +263,7 @@ class TestResponseParsing:
         resp = _mock_response(200, text=xml_text, content_type="application/xml")
         resp.json = MagicMock(side_effect=ValueError("Not JSON"))
 
-        client._session.request = MagicMock(return_value=resp)
+        client._transport.request = MagicMock(return_value=resp)
 
         result = client.get("https://api.boomi.com/component/123", accept_xml=True)
         assert isinstance(result, str)
@@ -178,7 +278,76 @@ class TestResponseParsing:
         client = BoomiClient(user="u", token="t")
         resp = _mock_response(204, text="", content_type="application/json")
 
-        client._session.request = MagicMock(return_value=resp)
+        client._transport.request = MagicMock(return_value=resp)
 
         result = client.delete("https://api.boomi.com/branch/123")
         assert result == {}
+
+
+class TestConcurrency:
+    def test_map_preserves_order(self) -> None:
+        """map() returns results in input order even when run on worker threads."""
+        client = BoomiClient(user="u", token="t", max_workers=4)
+        try:
+            results = client.map(lambda n: n * n, range(20))
+        finally:
+            client.close()
+        assert results == [n * n for n in range(20)]
+
+    def test_map_return_exceptions(self) -> None:
+        """A failing item yields its exception instead of discarding the rest."""
+        client = BoomiClient(user="u", token="t", max_workers=2)
+
+        def _work(n: int) -> int:
+            if n == 1:
+                raise BoomiApiError(400, "bad", "")
+            return n
+
+        try:
+            results = client.map(_work, [0, 1, 2], return_exceptions=True)
+            assert results[0] == 0 and results[2] == 2
+            assert isinstance(results[1], BoomiApiError)
+            with pytest.raises(BoomiApiError):
+                client.map(_work, [0, 1, 2])
+        finally:
+            client.close()
+
+    def test_imap_reads_items_lazily(self) -> None:
+        """imap() yields in input order and pulls items only a little ahead."""
+        client = BoomiClient(user="u", token="t", max_workers=2)
+        pulled: list[int] = []
+
+        def items():
+            for n in range(50):
+                pulled.append(n)
+                yield n
+
+        try:
+            results = client.imap(lambda n: n * n, items())
+            assert next(results) == 0
+            assert len(pulled) <= 4 + 1
+            assert list(results) == [n * n for n in range(1, 50)]
+        finally:
+            client.close()
+
+    def test_pool_sized_to_workers(self) -> None:
+        """Connection pool is never smaller than the worker count."""
+        client = BoomiClient(user="u", token="t", max_workers=16, pool_size=4)
+        adapter = client._transport.session.get_adapter("https://api.boomi.com")
+        assert adapter._pool_maxsize == 16
+
+    @patch("setup.api.client.time.sleep")
+    @patch("setup.api.client.time.monotonic", return_value=100.0)
+    def test_limiter_is_thread_safe(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Concurrent reservations each get a distinct slot in the queue."""
+        client = BoomiClient(user="u", token="t", rate=10.0, burst=1, max_workers=8)
+        try:
+            waits = client.map(
+                lambda _: client._limiter.reserve("https://api.boomi.com/x"), range(40)
+            )
+        finally:
+            client.close()
+        # One burst token, then 39 callers queued 100ms apart
+        assert sorted(waits) == pytest.approx([i / 10 for i in range(40)])
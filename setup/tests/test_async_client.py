@@ -0,0 +1,171 @@
+"""Tests for setup.api.async_client — AsyncBoomiClient and async API adapters."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from setup.api.async_client import AsyncBoomiClient, AsyncDataHubApi, AsyncPlatformApi
+from setup.api.client import BoomiApiError, BoomiClient
+from setup.config import BoomiConfig
+
+
+def _mock_response(
+    status_code: int = 200,
+    json_data: dict | None = None,
+    text: str = "",
+    content_type: str = "application/json",
+) -> MagicMock:
+    """Create a mock requests.Response."""
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.text = text or (str(json_data) if json_data else "")
+    resp.headers = {"Content-Type": content_type}
+    if json_data is not None:
+        resp.json.return_value = json_data
+        resp.text = str(json_data)
+    return resp
+
+
+def _client(*responses: MagicMock) -> AsyncBoomiClient:
+    client = AsyncBoomiClient(user="u", token="t", rate=1000, burst=100)
+    client.sync_client._transport.request = MagicMock(side_effect=list(responses))
+    return client
+
+
+class TestAsyncClient:
+    @patch("setup.api.async_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_retry_on_429(self, mock_sleep: AsyncMock) -> None:
+        """429 then 200 retries once after Retry-After, without blocking."""
+        resp_429 = _mock_response(429, text="slow")
+        resp_429.headers["Retry-After"] = "2"
+        client = _client(resp_429, _mock_response(200, {"ok": True}))
+
+        result = asyncio.run(client.get("https://api.boomi.com/test"))
+
+        assert result == {"ok": True}
+        mock_sleep.assert_awaited_once_with(2.0)
+        resp_429.close.assert_called_once()  # connection handed back before the retry
+
+    @patch("setup.api.async_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_no_retry_on_401(self, mock_sleep: AsyncMock) -> None:
+        client = _client(_mock_response(401, text="Unauthorized"))
+
+        with pytest.raises(BoomiApiError) as exc_info:
+            asyncio.run(client.get("https://api.boomi.com/test"))
+
+        assert exc_info.value.status_code == 401
+        assert client.sync_client._transport.request.call_count == 1
+        mock_sleep.assert_not_awaited()
+
+    @patch("setup.api.async_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_max_retries_exceeded(self, mock_sleep: AsyncMock) -> None:
+        client = _client(*[_mock_response(503, text="busy") for _ in range(4)])
+
+        with pytest.raises(BoomiApiError) as exc_info:
+            asyncio.run(client.post("https://api.boomi.com/test", data="{}"))
+
+        assert exc_info.value.status_code == 503
+        waits = [c.args[0] for c in mock_sleep.await_args_list]
+        assert len(waits) == 3
+        assert all(1.0 <= w <= 30.0 for w in waits)
+
+    def test_xml_bom_stripped(self) -> None:
+        client = _client(
+            _mock_response(200, text="\ufeff<Component/>", content_type="application/xml")
+        )
+
+        result = asyncio.run(client.get("https://api.boomi.com/c", accept_xml=True))
+
+        assert result == "<Component/>"
+
+    def test_from_client_shares_session_and_limiter(self) -> None:
+        sync = BoomiClient(user="u", token="t")
+        client = AsyncBoomiClient.from_client(sync)
+        sibling = client.with_auth_header("Basic other")
+
+        assert client.sync_client is sync
+        assert sibling.sync_client._limiter is sync._limiter
+
+    def test_concurrent_requests(self) -> None:
+        """Many coroutines share one client and each gets its own response."""
+        client = AsyncBoomiClient(user="u", token="t", rate=1000, burst=100)
+        client.sync_client._transport.request = MagicMock(
+            side_effect=lambda method, url, **kw: _mock_response(200, {"url": url})
+        )
+
+        async def run() -> list:
+            urls = [f"https://api.boomi.com/c/{i}" for i in range(50)]
+            return await asyncio.gather(*(client.get(u) for u in urls))
+
+        results = asyncio.run(run())
+
+        assert [r["url"] for r in results] == [f"https://api.boomi.com/c/{i}" for i in range(50)]
+
+
+class TestAsyncApi:
+    def test_api_methods_are_awaitable(self, mock_config: BoomiConfig) -> None:
+        xml = '<Component componentId="comp-1"/>'
+        client = _client(_mock_response(200, text=xml, content_type="application/xml"))
+        api = AsyncPlatformApi(client, mock_config)
+
+        result = asyncio.run(api.get_component("comp-1"))
+
+        assert result == xml
+        url = client.sync_client._transport.request.call_args.args[1]
+        assert url.endswith("/Component/comp-1")
+
+    def test_unknown_attribute_raises(self, mock_config: BoomiConfig) -> None:
+        api = AsyncPlatformApi(_client(), mock_config)
+
+        with pytest.raises(AttributeError):
+            api.no_such_method  # noqa: B018
+
+    @patch("setup.api.async_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_poll_branch_ready(self, mock_sleep: AsyncMock, mock_config: BoomiConfig) -> None:
+        client = _client(
+            _mock_response(200, {"ready": "false"}),
+            _mock_response(200, {"ready": "true"}),
+        )
+        api = AsyncPlatformApi(client, mock_config)
+
+        result = asyncio.run(api.poll_branch_ready("b-1", interval=5))
+
+        assert result == {"ready": "true"}
+        mock_sleep.assert_awaited_once_with(5)
+
+    @patch("setup.api.async_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_poll_model_deployed_canceled(
+        self, mock_sleep: AsyncMock, mock_config: BoomiConfig
+    ) -> None:
+        xml = "<mdm:status>CANCELED</mdm:status>"
+        client = _client(_mock_response(200, text=xml, content_type="application/xml"))
+        api = AsyncDataHubApi(client, mock_config)
+
+        with pytest.raises(BoomiApiError) as exc_info:
+            asyncio.run(api.poll_model_deployed("m-1", "d-1"))
+
+        assert exc_info.value.status_code == 410
+
+    @patch("setup.api.async_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_poll_merge_status_times_out(
+        self, mock_sleep: AsyncMock, mock_config: BoomiConfig
+    ) -> None:
+        client = _client(*[_mock_response(200, {"stage": "MERGING"}) for _ in range(3)])
+        api = AsyncPlatformApi(client, mock_config)
+
+        with pytest.raises(BoomiApiError) as exc_info:
+            asyncio.run(api.poll_merge_status("mr-1", interval=1, max_retries=3))
+
+        assert exc_info.value.status_code == 408
+        assert mock_sleep.await_count == 2  # no wait after the last read
+
+    def test_delete_accept_xml(self) -> None:
+        client = _client(_mock_response(200, text="﻿<ok/>", content_type="application/xml"))
+
+        result = asyncio.run(client.delete("https://api.boomi.com/x", accept_xml=True))
+
+        assert result == "<ok/>"
+        headers = client.sync_client._transport.request.call_args.kwargs["headers"]
+        assert headers["Accept"] == "application/xml"
@@ -0,0 +1,171 @@
+"""Tests for setup.api.cache — ResponseCache and cached client reads."""
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from setup.api.cache import DEFAULT_CACHE_FILE, ResponseCache
+from setup.api.client import BoomiApiError, BoomiClient
+from setup.api.datahub_api import DataHubApi
+from setup.api.platform_api import PlatformApi
+from setup.config import BoomiConfig
+from setup.main import _init_apis
+
+_COMPONENT_XML = '<bns:Component componentId="comp-1" name="X"/>'
+
+
+def _xml_response(
+    status_code: int = 200, text: str = _COMPONENT_XML, headers: dict | None = None,
+) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.text = text
+    resp.headers = {"Content-Type": "application/xml", **(headers or {})}
+    return resp
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResponseCache:
+    return ResponseCache(tmp_path / "cache.sqlite", max_bytes=1024, ttl=60)
+
+
+class TestResponseCache:
+    def test_put_and_get(self, cache: ResponseCache) -> None:
+        cache.put("acct", "https://x/Component/1", "<a/>", "application/xml", etag='"v1"')
+
+        entry = cache.get("acct", "https://x/Component/1")
+
+        assert entry.body == "<a/>"
+        assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+        assert cache.get("other-acct", "https://x/Component/1") is None
+
+    def test_ttl_applies_only_without_validators(self, cache: ResponseCache) -> None:
+        cache.put("acct", "https://x/a", "<a/>")
+        cache.put("acct", "https://x/b", "<b/>", last_modified="Mon, 01 Jan 2026 00:00:00 GMT")
+
+        assert cache.is_fresh(cache.get("acct", "https://x/a"))
+        assert not cache.is_fresh(cache.get("acct", "https://x/b"))
+        with patch("setup.api.cache.time.time", return_value=10**12):
+            assert not cache.is_fresh(cache.get("acct", "https://x/a"))
+
+    def test_lru_eviction_respects_size_cap(self, cache: ResponseCache) -> None:
+        body = "x" * 400
+        with patch("setup.api.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put("acct", "https://x/1", body)
+            cache.put("acct", "https://x/2", body)
+            cache.get("acct", "https://x/1")  # 1 is now more recent than 2
+        cache.put("acct", "https://x/3", body)
+
+        assert cache.get("acct", "https://x/2") is None
+        assert cache.get("acct", "https://x/1") is not None
+        assert cache.stats()["bytes"] <= 1024
+
+    def test_invalidate_covers_query_variants(self, cache: ResponseCache) -> None:
+        cache.put("acct", "https://x/Component/1", "<a/>")
+        cache.put("acct", "https://x/Component/1?overrideAccount=b", "<a/>")
+        cache.put("acct", "https://x/Component/12", "<a/>")
+
+        cache.invalidate("https://x/Component/1")
+
+        assert cache.get("acct", "https://x/Component/1") is None
+        assert cache.get("acct", "https://x/Component/1?overrideAccount=b") is None
+        assert cache.get("acct", "https://x/Component/12") is not None
+
+
+class TestCachedClient:
+    def test_ttl_hit_skips_network(self, cache: ResponseCache) -> None:
+        client = BoomiClient(user="u", token="t", cache=cache)
+        client._transport.request = MagicMock(return_value=_xml_response())
+
+        first = client.get("https://api.boomi.com/c/1", accept_xml=True, cache=True)
+        second = client.get("https://api.boomi.com/c/1", accept_xml=True, cache=True)
+
+        assert first == second == _COMPONENT_XML
+        assert client._transport.request.call_count == 1
+
+    def test_etag_revalidation_serves_304(self, cache: ResponseCache) -> None:
+        client = BoomiClient(user="u", token="t", cache=cache)
+        client._transport.request = MagicMock(side_effect=[
+            _xml_response(headers={"ETag": '"v1"'}),
+            _xml_response(304, text=""),
+        ])
+
+        client.get("https://api.boomi.com/c/1", accept_xml=True, cache=True)
+        result = client.get("https://api.boomi.com/c/1", accept_xml=True, cache=True)
+
+        assert result == _COMPONENT_XML
+        second_headers = client._transport.request.call_args_list[1].kwargs["headers"]
+        assert second_headers["If-None-Match"] == '"v1"'
+
+    def test_uncached_get_ignores_cache(self, cache: ResponseCache) -> None:
+        client = BoomiClient(user="u", token="t", cache=cache)
+        client._transport.request = MagicMock(return_value=_xml_response())
+
+        client.get("https://api.boomi.com/c/1", accept_xml=True)
+        client.get("https://api.boomi.com/c/1", accept_xml=True)
+
+        assert client._transport.request.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_create_component_invalidates(
+        self, cache: ResponseCache, mock_config: BoomiConfig
+    ) -> None:
+        client = BoomiClient(user="u", token="t", cache=cache)
+        client._transport.request = MagicMock(return_value=_xml_response())
+        api = PlatformApi(client, mock_config)
+
+        api.get_component("comp-1", cache=True)
+        api.create_component(_COMPONENT_XML)
+        api.get_component("comp-1", cache=True)
+
+        methods = [c.args[0] for c in client._transport.request.call_args_list]
+        assert methods == ["GET", "POST", "GET"]
+
+    def test_component_reads_default_to_fresh(
+        self, cache: ResponseCache, mock_config: BoomiConfig
+    ) -> None:
+        """Template discovery must see hand edits, so get_component skips the cache."""
+        client = BoomiClient(user="u", token="t", cache=cache)
+        client._transport.request = MagicMock(return_value=_xml_response())
+        api = PlatformApi(client, mock_config)
+
+        api.get_component("comp-1")
+        api.get_component("comp-1")
+
+        assert client._transport.request.call_count == 2
+
+    def test_failed_publish_still_invalidates(
+        self, cache: ResponseCache, mock_config: BoomiConfig
+    ) -> None:
+        client = BoomiClient(user="u", token="t", cache=cache)
+        client._transport.request = MagicMock(side_effect=[
+            _xml_response(text="<mdm:Model/>"),
+            _xml_response(400, text="<error/>"),
+            _xml_response(text="<mdm:Model/>"),
+        ])
+        api = DataHubApi(client, mock_config)
+
+        api.get_model("model-1", cache=True)
+        with pytest.raises(BoomiApiError):
+            api.publish_model("model-1")
+        api.get_model("model-1", cache=True)
+
+        methods = [c.args[0] for c in client._transport.request.call_args_list]
+        assert methods == ["GET", "POST", "GET"]
+
+
+class TestCacheConfig:
+    def test_cache_is_opt_in(self, mock_config: BoomiConfig) -> None:
+        platform_api, _ = _init_apis(mock_config)
+        assert platform_api._client._cache is None
+
+    def test_cache_on_uses_default_file(
+        self, mock_config: BoomiConfig, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        mock_config.api_cache = "on"
+        platform_api, _ = _init_apis(mock_config)
+        assert platform_api._client._cache is not None
+        assert (tmp_path / DEFAULT_CACHE_FILE).exists()
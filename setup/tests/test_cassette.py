@@ -0,0 +1,140 @@
+"""Tests for setup.api.cassette — record/replay of API traffic."""
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from setup.api.cassette import Cassette, CassetteMissError
+from setup.api.client import BoomiClient
+
+
+def _response(status_code: int, text: str, content_type: str = "application/json") -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp._content = text.encode()
+    resp.encoding = "utf-8"
+    resp.headers["Content-Type"] = content_type
+    resp.headers["Set-Cookie"] = "session=secret"
+    return resp
+
+
+def _record(path: Path, responses: list[requests.Response]) -> BoomiClient:
+    """Run calls through a recording client backed by canned responses."""
+    cassette = Cassette.record(path)
+    client = BoomiClient(user="u", token="t", rate=1000, burst=100, cassette=cassette)
+    client._transport._transport.request = MagicMock(side_effect=responses)
+    return client
+
+
+class TestRecordReplay:
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette.json.gz"
+        client = _record(path, [
+            _response(200, '{"id": 1}'),
+            _response(200, "<Component/>", "application/xml"),
+        ])
+        client.get("https://api.boomi.com/a")
+        client.post("https://api.boomi.com/b", data="<x/>", accept_xml=True)
+        client._cassette.save()
+
+        replay = Cassette.replay(path)
+        offline = BoomiClient(user="u", token="t", rate=1000, burst=100, cassette=replay)
+
+        assert offline.get("https://api.boomi.com/a") == {"id": 1}
+        assert offline.post("https://api.boomi.com/b", data="<x/>", accept_xml=True) == "<Component/>"
+
+    def test_no_credentials_or_extra_headers_stored(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette.json.gz"
+        client = _record(path, [_response(200, "{}")])
+        client.get("https://api.boomi.com/a")
+        client._cassette.save()
+
+        raw = gzip.open(path, "rt").read()
+        assert client._auth_header.split()[1] not in raw
+        assert "Authorization" not in raw
+        assert "secret" not in raw
+
+    def test_sibling_traffic_is_recorded(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette.json.gz"
+        client = _record(path, [_response(200, "{}"), _response(200, "{}")])
+        sibling = client.with_auth_header("Basic other")
+
+        client.get("https://api.boomi.com/a")
+        sibling.get("https://hub.boomi.com/b")
+
+        assert len(client._cassette) == 2
+
+    def test_same_url_replays_in_recorded_order(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette.json.gz"
+        client = _record(path, [
+            _response(200, '{"stage": "PENDING"}'),
+            _response(200, '{"stage": "MERGED"}'),
+        ])
+        client.get("https://api.boomi.com/MergeRequest/1")
+        client.get("https://api.boomi.com/MergeRequest/1")
+        client._cassette.save()
+
+        offline = BoomiClient(user="u", token="t", cassette=Cassette.replay(path))
+
+        assert offline.get("https://api.boomi.com/MergeRequest/1")["stage"] == "PENDING"
+        assert offline.get("https://api.boomi.com/MergeRequest/1")["stage"] == "MERGED"
+
+    def test_body_mismatch_falls_back_to_url(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette.json.gz"
+        client = _record(path, [_response(200, '{"ok": true}')])
+        client.post("https://api.boomi.com/Folder", data='{"ts": 1}')
+        client._cassette.save()
+
+        offline = BoomiClient(user="u", token="t", cassette=Cassette.replay(path))
+
+        assert offline.post("https://api.boomi.com/Folder", data='{"ts": 2}') == {"ok": True}
+
+    def test_miss_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.cassette.json.gz"
+        Cassette.record(path).save()
+        offline = BoomiClient(user="u", token="t", cassette=Cassette.replay(path))
+
+        with pytest.raises(CassetteMissError):
+            offline.get("https://api.boomi.com/unknown")
+
+    def test_miss_is_a_request_exception(self, tmp_path: Path) -> None:
+        """Probes that tolerate transport errors also tolerate a miss."""
+        path = tmp_path / "empty.cassette.json.gz"
+        Cassette.record(path).save()
+        offline = BoomiClient(user="u", token="t", cassette=Cassette.replay(path))
+
+        with pytest.raises(requests.RequestException):
+            offline.raw_request("POST", "https://hub.boomi.com/probe")
+
+    @patch("setup.api.client.time.sleep")
+    def test_replay_skips_rate_limit_and_window(
+        self, mock_sleep: MagicMock, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "run.cassette.json.gz"
+        cassette = Cassette.record(path)
+        for _ in range(20):
+            cassette.append("GET", "https://api.boomi.com/a", None, _response(200, "{}"), 0.1)
+        cassette.save()
+
+        offline = BoomiClient(user="u", token="t", cassette=Cassette.replay(path))
+        for _ in range(20):
+            offline.get("https://api.boomi.com/a")
+
+        mock_sleep.assert_not_called()
+        assert offline.concurrency_snapshot() == {}
+
+    def test_replay_latency(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette.json.gz"
+        cassette = Cassette.record(path)
+        cassette.append("GET", "https://api.boomi.com/a", None, _response(200, "{}"), 0.5)
+        cassette.save()
+
+        replay = Cassette.replay(path, latency_scale=2.0)
+        with patch("setup.api.cassette.time.sleep") as mock_sleep:
+            replay.play("GET", "https://api.boomi.com/a")
+
+        mock_sleep.assert_called_once_with(1.0)
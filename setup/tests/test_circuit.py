@@ -0,0 +1,144 @@
+"""Tests for setup.api.circuit and circuit breaking in BoomiClient."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from setup.api.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers, circuit_key
+from setup.api.client import BoomiApiError, BoomiClient, CircuitOpenError
+from setup.api.transport import InMemoryTransport
+
+_BASE = "https://api.boomi.com/partner/api/rest/v1/acct-123456"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(transport: InMemoryTransport, **kw: object) -> BoomiClient:
+    return BoomiClient(user="u", token="t", rate=1000, burst=100, transport=transport, **kw)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self) -> None:
+        breaker = CircuitBreaker("api Component", failure_threshold=3, reset_timeout=10)
+
+        for _ in range(2):
+            breaker.on_failure()
+        breaker.on_success()  # a success resets the count
+        for _ in range(2):
+            breaker.on_failure()
+        assert breaker.state == CLOSED and breaker.allow()
+
+        breaker.on_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+        assert breaker.snapshot()["rejected"] == 1
+
+    def test_half_open_admits_one_probe(self) -> None:
+        clock = _Clock()
+        breaker = CircuitBreaker("c", failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.on_failure()
+        clock.now += 4
+        assert breaker.retry_in() == pytest.approx(6)
+
+        clock.now += 6
+        assert breaker.allow()
+        assert breaker.state == HALF_OPEN
+        assert not breaker.allow()  # probe already in flight
+
+        breaker.on_failure()
+        assert breaker.state == OPEN and breaker.retry_in() == pytest.approx(10)
+
+        clock.now += 10
+        assert breaker.allow()
+        breaker.on_success()
+        assert breaker.state == CLOSED and breaker.allow()
+
+    def test_transitions_reach_subscribers(self) -> None:
+        clock = _Clock()
+        breakers = CircuitBreakers(failure_threshold=1, reset_timeout=5, clock=clock)
+        seen: list[tuple[str, str, str]] = []
+        breakers.subscribe(lambda *change: seen.append(change))
+        breaker = breakers.breaker_for(f"{_BASE}/Component/c-1")
+
+        breaker.on_failure()
+        assert breakers.open_circuits() == {"api.boomi.com Component": 5.0}
+        clock.now += 5
+        breaker.allow()
+        breaker.on_success()
+
+        assert [(old, new) for _, old, new in seen] == [
+            (CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED),
+        ]
+        assert breakers.open_circuits() == {}
+
+    def test_circuit_key_groups_endpoint_families(self) -> None:
+        assert circuit_key(f"{_BASE}/Component/0f8fad5b-d9cb-469f-a165-70867728950e") == "api.boomi.com Component"
+        assert circuit_key(f"{_BASE}/ComponentMetadata/query") == "api.boomi.com ComponentMetadata"
+        assert circuit_key("https://c01-usa-east.hub.boomi.com/mdm/universes/u-123456789/records") == (
+            "c01-usa-east.hub.boomi.com mdm"
+        )
+
+
+class TestClientBreaker:
+    def test_fails_fast_once_open(self) -> None:
+        transport = InMemoryTransport(lambda *args: (500, "internal error"))
+        client = _client(transport, breaker_threshold=3)
+
+        for _ in range(3):
+            with pytest.raises(BoomiApiError):
+                client.get(f"{_BASE}/Component/c-12345678")
+        with pytest.raises(CircuitOpenError) as info:
+            client.get(f"{_BASE}/Component/c-12345678")
+
+        assert len(transport.calls) == 3
+        assert info.value.status_code == 503
+        assert info.value.circuit == "api.boomi.com Component"
+        # Other endpoint families are unaffected
+        transport.handler = lambda *args: (200, {})
+        assert client.get(f"{_BASE}/Branch/b-12345678") == {}
+
+    @patch("setup.api.client.time.sleep")
+    def test_retries_stop_when_circuit_opens(self, mock_sleep: object) -> None:
+        transport = InMemoryTransport(lambda *args: (503, "down"))
+        client = _client(transport, breaker_threshold=2)
+
+        with pytest.raises(CircuitOpenError):
+            client.get(f"{_BASE}/Component/c-12345678")
+
+        assert len(transport.calls) == 2
+
+    def test_client_errors_do_not_trip(self) -> None:
+        transport = InMemoryTransport(lambda *args: (404, "missing"))
+        client = _client(transport, breaker_threshold=2)
+
+        for _ in range(4):
+            with pytest.raises(BoomiApiError) as info:
+                client.get(f"{_BASE}/Component/c-12345678")
+            assert not isinstance(info.value, CircuitOpenError)
+
+    def test_threshold_zero_disables(self) -> None:
+        transport = InMemoryTransport(lambda *args: (500, "internal error"))
+        client = _client(transport, breaker_threshold=0)
+
+        for _ in range(8):
+            with pytest.raises(BoomiApiError) as info:
+                client.get(f"{_BASE}/Component/c-12345678")
+            assert not isinstance(info.value, CircuitOpenError)
+        assert client.breakers.snapshot() == {}
+
+    def test_siblings_share_breakers(self) -> None:
+        transport = InMemoryTransport(lambda *args: (500, "internal error"))
+        client = _client(transport, breaker_threshold=1)
+        sibling = client.with_auth_header("Basic other")
+
+        with pytest.raises(BoomiApiError):
+            client.get(f"{_BASE}/Component/c-12345678")
+        with pytest.raises(CircuitOpenError):
+            sibling.get(f"{_BASE}/Component/c-12345678")
@@ -0,0 +1,131 @@
+"""Tests for setup.api.component_index and its use by PlatformApi."""
+from __future__ import annotations
+
+import json
+
+from setup.api.client import BoomiClient
+from setup.api.platform_api import PlatformApi
+from setup.config import BoomiConfig
+from setup.scripts.fake_boomi_server import FakeBoomi
+
+_XML = (
+    '<bns:Component xmlns:bns="http://api.platform.boomi.com/"'
+    ' name="{name}" type="{type}"><bns:object/></bns:Component>'
+)
+
+
+def _platform(fake: FakeBoomi) -> PlatformApi:
+    config = BoomiConfig(
+        boomi_account_id="acct-1", cloud_base_url="https://fake.boomi.local",
+        boomi_user="u", boomi_token="t",
+    )
+    client = BoomiClient("u", "t", rate=1000, burst=100, transport=fake.transport())
+    return PlatformApi(client, config)
+
+
+def _seed(fake: FakeBoomi) -> dict[str, str]:
+    """Create components through a separate client; returns name → id."""
+    seeder = _platform(fake)
+    ids = {}
+    for name, ctype in [
+        ("PROMO - HTTP Op - A", "connector-action"),
+        ("PROMO - HTTP Op - B", "connector-action"),
+        ("PROMO - DH Op - A", "connector-action"),
+        ("PROMO - Profile - A", "profile.json"),
+        ("Other - Thing", "process"),
+    ]:
+        ids[name] = seeder.parse_component_id(seeder.create_component(_XML.format(name=name, type=ctype)))
+    return ids
+
+
+def _metadata_queries(platform: PlatformApi) -> list[dict]:
+    return [
+        json.loads(data) for _, url, data, _ in platform._client._transport.calls
+        if url.endswith("/ComponentMetadata/query")
+    ]
+
+
+class TestComponentIndex:
+    def test_one_scan_serves_all_lookups(self) -> None:
+        fake = FakeBoomi()
+        ids = _seed(fake)
+        platform = _platform(fake)
+
+        assert platform.find_component_id_by_name("PROMO - HTTP Op - A") == ids["PROMO - HTTP Op - A"]
+        assert platform.find_component_id_by_name("PROMO - DH Op - A") == ids["PROMO - DH Op - A"]
+        assert platform.count_components_by_prefix("PROMO - HTTP Op") == 2
+        assert platform.count_components_by_prefix("PROMO -") == 4
+        assert [s.name for s in platform.component_index.by_type("connector-action")] == [
+            "PROMO - DH Op - A", "PROMO - HTTP Op - A", "PROMO - HTTP Op - B",
+        ]
+
+        assert len(_metadata_queries(platform)) == 1
+
+    def test_own_creates_recorded_without_queries(self) -> None:
+        fake = FakeBoomi()
+        _seed(fake)
+        platform = _platform(fake)
+        platform.count_components_by_prefix("PROMO")
+
+        created = platform.create_component(_XML.format(name="PROMO - FSS Op - New", type="connector-action"))
+
+        assert platform.find_component_id_by_name("PROMO - FSS Op - New") == platform.parse_component_id(created)
+        assert platform.count_components_by_prefix("PROMO - FSS Op") == 1
+        assert len(_metadata_queries(platform)) == 1
+
+    def test_miss_refreshes_incrementally(self) -> None:
+        fake = FakeBoomi()
+        _seed(fake)
+        platform = _platform(fake)
+        platform.count_components_by_prefix("PROMO")
+
+        # Created elsewhere (e.g. by hand in the Boomi UI)
+        _platform(fake).create_component(_XML.format(name="PROMO - DH Op - Manual", type="connector-action"))
+
+        assert platform.find_component_id_by_name("PROMO - DH Op - Manual")
+        queries = _metadata_queries(platform)
+        assert len(queries) == 2
+        conditions = queries[1]["QueryFilter"]["expression"]["nestedExpression"]
+        assert {c["property"] for c in conditions} == {"modifiedDate", "currentVersion"}
+
+    def test_rename_out_of_scope_drops_entry(self) -> None:
+        fake = FakeBoomi()
+        ids = _seed(fake)
+        platform = _platform(fake)
+        assert platform.count_components_by_prefix("PROMO - HTTP Op") == 2
+
+        fake.component_meta[ids["PROMO - HTTP Op - B"]].update(
+            name="Archived - HTTP Op - B", modifiedDate="2999-01-01T00:00:00Z",
+        )
+        platform.component_index.refresh()
+
+        assert platform.count_components_by_prefix("PROMO - HTTP Op") == 1
+        assert "Archived - HTTP Op - B" not in platform.component_index._by_name
+        assert platform.component_index.id_for("PROMO - HTTP Op - B") is None
+
+    def test_stale_counts_pick_up_deletions(self) -> None:
+        fake = FakeBoomi()
+        ids = _seed(fake)
+        platform = _platform(fake)
+        index = platform.component_index
+        now = [0.0]
+        index._clock = lambda: now[0]
+        assert platform.count_components_by_prefix("PROMO - HTTP Op") == 2
+
+        fake.component_meta[ids["PROMO - HTTP Op - B"]].update(
+            deleted="true", modifiedDate="2999-01-01T00:00:00Z",
+        )
+        assert platform.count_components_by_prefix("PROMO - HTTP Op") == 2  # still fresh
+
+        now[0] += index.max_age
+        assert platform.count_components_by_prefix("PROMO - HTTP Op") == 1
+        assert platform.find_component_id_by_name("PROMO - HTTP Op - B") is None
+
+    def test_names_outside_scope_query_the_api(self) -> None:
+        fake = FakeBoomi()
+        ids = _seed(fake)
+        platform = _platform(fake)
+
+        assert platform.find_component_id_by_name("Other - Thing") == ids["Other - Thing"]
+        assert len(platform.component_index) == 0
+        assert len(_metadata_queries(platform)) == 1
@@ -0,0 +1,121 @@
+"""Tests for content-hash component sync — PlatformApi.fingerprint and
+BaseStep._create_components with ``sync_components``."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from setup.api.client import BoomiClient
+from setup.api.platform_api import PlatformApi
+from setup.config import BoomiConfig
+from setup.engine import StepStatus
+from setup.scripts.fake_boomi_server import FakeBoomi
+from setup.state import SetupState
+from setup.steps.phase3_integration import CreateScripts
+from setup.templates.loader import load_template
+
+_SCRIPT = (
+    '<bns:Component xmlns:bns="http://api.platform.boomi.com/" name="S" type="script.processing">'
+    "<bns:object><script>{body}</script></bns:object></bns:Component>"
+)
+
+
+def _platform(config: BoomiConfig, fake: FakeBoomi) -> PlatformApi:
+    client = BoomiClient("u", "t", rate=1000, burst=100, transport=fake.transport())
+    return PlatformApi(client, config)
+
+
+def _posts(platform: PlatformApi) -> list[str]:
+    return [url.rsplit("/rest/v1/", 1)[1] for method, url, _, _ in platform._client._transport.calls
+            if method == "POST"]
+
+
+def _edited(stem: str):
+    """load_template that changes one Groovy script."""
+    def load(path: str) -> str:
+        content = load_template(path)
+        return content + "\n// tweaked\n" if path.endswith(f"/{stem}.groovy") else content
+    return load
+
+
+class TestFingerprint:
+    def test_ignores_formatting_and_server_attributes(self) -> None:
+        generated = _SCRIPT.format(body="return 1")
+        fetched = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<bns:Component xmlns:bns="http://api.platform.boomi.com/" type="script.processing"'
+            ' name="S" componentId="c-1" version="4" modifiedDate="2026-01-01T00:00:00Z">\n'
+            "  <bns:object>\n    <script>return 1</script>\n  </bns:object>\n</bns:Component>"
+        )
+
+        assert PlatformApi.fingerprint(generated) == PlatformApi.fingerprint(fetched)
+
+    def test_content_changes_change_the_hash(self) -> None:
+        base = PlatformApi.fingerprint(_SCRIPT.format(body="return 1"))
+
+        assert PlatformApi.fingerprint(_SCRIPT.format(body="return 2")) != base
+        assert PlatformApi.fingerprint(_SCRIPT.format(body="return 1").replace('name="S"', 'name="T"')) != base
+
+
+class TestComponentSync:
+    def test_edit_one_script_costs_one_call(
+        self, mock_config: BoomiConfig, mock_state: SetupState
+    ) -> None:
+        fake = FakeBoomi()
+        assert CreateScripts(mock_config, platform_api=_platform(mock_config, fake)).execute(
+            mock_state
+        ) == StepStatus.COMPLETED
+        stem = sorted(mock_state.data["component_ids"]["scripts"])[0]
+        comp_id = mock_state.get_component_id("scripts", stem)
+        old_hash = mock_state.get_component_hash("scripts", stem)
+        assert old_hash
+
+        mock_config.sync_components = True
+        platform = _platform(mock_config, fake)
+        with patch("setup.steps.phase3_integration.load_template", _edited(stem)):
+            assert CreateScripts(mock_config, platform_api=platform).execute(mock_state) == (
+                StepStatus.COMPLETED
+            )
+
+        assert _posts(platform) == [f"test-account-123/Component/{comp_id}"]
+        assert mock_state.get_component_id("scripts", stem) == comp_id
+        assert mock_state.get_component_hash("scripts", stem) != old_hash
+        assert "// tweaked" in fake.components[comp_id]
+        assert len(fake.components) == 11
+
+    def test_unchanged_sync_makes_no_calls(
+        self, mock_config: BoomiConfig, mock_state: SetupState
+    ) -> None:
+        fake = FakeBoomi()
+        CreateScripts(mock_config, platform_api=_platform(mock_config, fake)).execute(mock_state)
+
+        mock_config.sync_components = True
+        platform = _platform(mock_config, fake)
+        CreateScripts(mock_config, platform_api=platform).execute(mock_state)
+
+        assert _posts(platform) == []
+
+    def test_components_without_hash_are_updated_once(
+        self, mock_config: BoomiConfig, mock_state: SetupState
+    ) -> None:
+        fake = FakeBoomi()
+        CreateScripts(mock_config, platform_api=_platform(mock_config, fake)).execute(mock_state)
+        del mock_state.data["component_hashes"]["scripts"]  # state from before hashing
+
+        mock_config.sync_components = True
+        first = _platform(mock_config, fake)
+        CreateScripts(mock_config, platform_api=first).execute(mock_state)
+        second = _platform(mock_config, fake)
+        CreateScripts(mock_config, platform_api=second).execute(mock_state)
+
+        assert len(_posts(first)) == 11
+        assert all("/Component/" in path for path in _posts(first))
+        assert _posts(second) == []
+        assert len(fake.components) == 11
+
+    def test_hashes_persist(self, mock_state: SetupState) -> None:
+        mock_state.store_component_id("scripts", "a", "c-1", content_hash="h-1")
+        mock_state.store_component_id("scripts", "b", "c-2")
+
+        reloaded = SetupState.load(mock_state.path)
+        assert reloaded.get_component_hash("scripts", "a") == "h-1"
+        assert reloaded.get_component_hash("scripts", "b") is None
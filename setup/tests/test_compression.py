@@ -0,0 +1,92 @@
+"""Tests for gzip request/response compression and wire byte accounting."""
+from __future__ import annotations
+
+import gzip
+from typing import Iterator
+
+import pytest
+
+from setup.api.client import BoomiClient
+from setup.api.platform_api import PlatformApi
+from setup.api.stats import EndpointStats
+from setup.config import BoomiConfig
+from setup.scripts.fake_boomi_server import FakeBoomiServer
+
+_BIG_XML = (
+    '<bns:Component xmlns:bns="http://api.platform.boomi.com/" name="PROMO - Profile" type="profile.json">'
+    + "<bns:object>" + "<Element name='field' dataType='character'/>" * 200 + "</bns:object>"
+    + "</bns:Component>"
+)
+
+
+def _platform(server: FakeBoomiServer, compress: bool = True) -> PlatformApi:
+    config = BoomiConfig(
+        boomi_account_id="acct-1", cloud_base_url=server.url, boomi_user="u", boomi_token="t",
+    )
+    client = BoomiClient("u", "t", rate=1000, burst=100, compress_requests=compress)
+    return PlatformApi(client, config)
+
+
+def _totals(platform: PlatformApi, endpoint: str) -> dict:
+    return platform._client.stats.snapshot()[endpoint]
+
+
+@pytest.fixture
+def server() -> Iterator[FakeBoomiServer]:
+    with FakeBoomiServer() as srv:
+        yield srv
+
+
+class TestEncodeBody:
+    def test_only_large_bodies_when_enabled(self) -> None:
+        client = BoomiClient("u", "t", compress_requests=True)
+        headers = {"Content-Type": "application/xml"}
+
+        small, small_headers = client._encode_body("https://api.boomi.com/x", "<a/>", headers)
+        big, big_headers = client._encode_body("https://api.boomi.com/x", _BIG_XML, headers)
+
+        assert small == "<a/>" and small_headers is headers
+        assert gzip.decompress(big).decode() == _BIG_XML
+        assert big_headers["Content-Encoding"] == "gzip"
+        # Deterministic output keeps cassette digests stable
+        assert client._encode_body("https://api.boomi.com/x", _BIG_XML, headers)[0] == big
+
+    def test_off_by_default(self) -> None:
+        client = BoomiClient("u", "t")
+
+        assert client._encode_body("https://api.boomi.com/x", _BIG_XML, {})[0] is _BIG_XML
+
+
+class TestAgainstFakeServer:
+    def test_compressed_create_and_gzipped_read(self, server: FakeBoomiServer) -> None:
+        platform = _platform(server)
+
+        created = platform.create_component(_BIG_XML)
+        comp_id = platform.parse_component_id(created)
+        fetched = platform.get_component(comp_id)
+
+        assert "PROMO - Profile" in fetched
+        post = _totals(platform, "POST /Component")
+        assert post["wire_out"] < post["bytes_out"] / 4
+        get = _totals(platform, "GET /Component/{id}")
+        assert 0 < get["wire_in"] < get["bytes_in"] / 4
+
+    def test_415_falls_back_to_plain_bodies(self) -> None:
+        with FakeBoomiServer(gzip_requests=False) as server:
+            platform = _platform(server)
+
+            platform.create_component(_BIG_XML)
+            platform.create_component(_BIG_XML.replace("Profile", "Profile 2"))
+
+            host = server.url.split("//")[1]
+            assert platform._client._gzip_refused == {host}
+            post = _totals(platform, "POST /Component")
+            assert post["status"] == {"200": 2}
+            assert post["wire_out"] == post["bytes_out"]
+
+
+class TestWireStats:
+    def test_old_snapshots_default_wire_to_decoded(self) -> None:
+        stats = EndpointStats.from_dict({"count": 1, "bytes_in": 10, "bytes_out": 4})
+
+        assert (stats.wire_in, stats.wire_out) == (10, 4)
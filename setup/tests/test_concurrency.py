@@ -0,0 +1,151 @@
+"""Tests for setup.api.concurrency — AIMD in-flight windows."""
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from setup.api.client import BoomiClient
+from setup.api.concurrency import AimdWindow, HostConcurrency
+
+
+class TestAimdWindow:
+    def test_additive_increase(self) -> None:
+        window = AimdWindow(initial=2.0, maximum=16.0)
+        for _ in range(4):
+            tickets = [window.acquire() for _ in range(int(window.window))]
+            for ticket in tickets:
+                window.on_success(ticket)
+        # One window-filling call per round adds 1/window each time
+        assert 3.0 < window.window < 4.0
+
+    def test_sequential_calls_do_not_grow(self) -> None:
+        """Calls that never fill the window leave it unchanged."""
+        window = AimdWindow(initial=2.0, maximum=16.0)
+        for _ in range(20):
+            window.on_success(window.acquire())
+        assert window.window == 2.0
+        assert window.snapshot()["successes"] == 20
+
+    def test_multiplicative_decrease(self) -> None:
+        window = AimdWindow(initial=8.0)
+        window.on_throttle(window.acquire())
+        assert window.window == 4.0
+        assert window.snapshot()["throttled"] == 1
+
+    def test_one_burst_halves_once(self) -> None:
+        """Throttles from calls admitted under the same window shrink it once."""
+        window = AimdWindow(initial=8.0)
+        tickets = [window.acquire() for _ in range(4)]
+        for ticket in tickets:
+            window.on_throttle(ticket)
+        snap = window.snapshot()
+        assert snap["window"] == 4.0
+        assert snap["throttled"] == 4
+        assert snap["decreases"] == 1
+
+    def test_bounded_by_min_and_max(self) -> None:
+        window = AimdWindow(initial=1.0, minimum=1.0, maximum=2.0)
+        window.on_throttle(window.acquire())
+        assert window.window == 1.0
+        for _ in range(20):
+            window.on_success(window.acquire())
+        assert window.window == 2.0
+
+    def test_acquire_blocks_when_full(self) -> None:
+        window = AimdWindow(initial=1.0)
+        ticket = window.acquire()
+        with pytest.raises(TimeoutError):
+            window.acquire(timeout=0.01)
+        window.release(ticket)
+        window.release(window.acquire(timeout=0.01))
+        assert window.in_flight == 0
+
+    def test_in_flight_never_exceeds_window(self) -> None:
+        window = AimdWindow(initial=3.0, maximum=3.0)
+        peak = 0
+        lock = threading.Lock()
+
+        def worker() -> None:
+            nonlocal peak
+            ticket = window.acquire()
+            with lock:
+                peak = max(peak, window.in_flight)
+            window.on_success(ticket)
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak <= 3
+
+
+class TestHostConcurrency:
+    def test_hosts_have_separate_windows(self) -> None:
+        hosts = HostConcurrency(initial=4.0)
+        platform = hosts.window_for("https://api.boomi.com/api/rest/v1/x")
+        repo = hosts.window_for("https://c01-usa-east.hub.boomi.com/mdm/y")
+        platform.on_throttle(platform.acquire())
+
+        snap = hosts.snapshot()
+        assert snap["api.boomi.com"]["window"] == 2.0
+        assert snap["c01-usa-east.hub.boomi.com"]["window"] == 4.0
+        assert repo is not platform
+
+
+class TestClientFeedback:
+    @patch("setup.api.client.time.sleep")
+    def test_sequential_gets_keep_window(self, mock_sleep: MagicMock) -> None:
+        client = BoomiClient(user="u", token="t")
+        ok = MagicMock(status_code=200, text="{}", headers={"Content-Type": "application/json"})
+        ok.json.return_value = {}
+        client._transport.request = MagicMock(return_value=ok)
+
+        for _ in range(20):
+            client.get("https://api.boomi.com/test")
+
+        assert client.concurrency_snapshot()["api.boomi.com"]["window"] == 2.0
+
+    def test_window_slot_taken_before_rate_token(self) -> None:
+        """A call blocked on a full window has not reserved a rate token."""
+        client = BoomiClient(user="u", token="t")
+        window = client._concurrency.window_for("https://api.boomi.com/x")
+        held = [window.acquire(), window.acquire()]
+        client._limiter.reserve = MagicMock(return_value=0.0)
+        client._transport.request = MagicMock(
+            return_value=MagicMock(status_code=200, text="{}", headers={}),
+        )
+
+        worker = threading.Thread(target=client.get, args=("https://api.boomi.com/x",))
+        worker.start()
+        worker.join(timeout=0.05)
+        assert worker.is_alive()
+        client._limiter.reserve.assert_not_called()
+
+        window.release(held.pop())
+        worker.join(timeout=2)
+        assert not worker.is_alive()
+        client._limiter.reserve.assert_called_once()
+        window.release(held.pop())
+
+    @patch("setup.api.client.time.sleep")
+    @patch("setup.api.client.time.monotonic", return_value=0.0)
+    def test_429_shrinks_window_shared_with_sibling(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        client = BoomiClient(user="u", token="t")
+        sibling = client.with_auth_header("Basic other")
+        throttled = MagicMock(status_code=429, text="slow", headers={})
+        ok = MagicMock(status_code=200, text="{}", headers={"Content-Type": "application/json"})
+        ok.json.return_value = {}
+        sibling._transport.request = MagicMock(side_effect=[throttled, ok])
+
+        sibling.get("https://api.boomi.com/test")
+
+        snap = client.concurrency_snapshot()["api.boomi.com"]
+        assert snap["throttled"] == 1
+        assert snap["decreases"] == 1
+        assert snap["successes"] == 1
+        assert snap["in_flight"] == 0
@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from setup.api.circuit import CircuitBreakers
+from setup.api.client import BoomiApiError, CircuitOpenError
 from setup.engine import Engine, StepRegistry, StepStatus, StepType
 from setup.state import SetupState
 
@@ -226,3 +228,118 @@ class TestEngine:
             "type": "auto",
             "status": "pending",
         }
+
+
+class TestEngineApiStats:
+    @patch("setup.engine.click.echo")
+    def test_calls_attributed_to_step(self, mock_echo: MagicMock, tmp_path: Path) -> None:
+        """Calls made during a step land in that step's state entry only."""
+        from setup.api.stats import ApiStats
+
+        stats = ApiStats()
+
+        class CallingStep(ConcreteStep):
+            def execute(self, state: SetupState, dry_run: bool = False) -> StepStatus:
+                stats.record("GET", f"https://api.boomi.com/x/{self.step_id}", 200, 12.0)
+                return StepStatus.COMPLETED
+
+        state = SetupState.create(path=tmp_path / "state.json")
+        registry = StepRegistry()
+        registry.register(CallingStep("a"))
+        registry.register(ConcreteStep("b", depends_on=["a"]))
+        stats.record("GET", "https://api.boomi.com/before", 200, 5.0)  # not a step's call
+
+        Engine(registry, state, api_stats=stats).run()
+
+        per_step = state.get_step_api_stats()
+        assert list(per_step) == ["a"]
+        assert per_step["a"]["GET /x/a"]["count"] == 1
+
+
+class TestEngineCircuitPause:
+    @patch("setup.engine.time.sleep")
+    def test_failed_step_paused_and_rerun_while_circuit_open(
+        self, mock_sleep: object, tmp_path: Path,
+    ) -> None:
+        clock = [100.0]
+        breakers = CircuitBreakers(failure_threshold=1, reset_timeout=30, clock=lambda: clock[0])
+        breaker = breakers.breaker_for("https://api.boomi.com/partner/api/rest/v1/acct-123456/Component/c-1")
+        runs: list[int] = []
+
+        class FlakyStep(ConcreteStep):
+            def execute(self, state: SetupState, dry_run: bool = False) -> StepStatus:
+                runs.append(1)
+                if len(runs) == 1:
+                    breaker.on_failure()
+                    raise CircuitOpenError(breaker.name, 30.0)
+                clock[0] += 30
+                breaker.allow()
+                breaker.on_success()
+                return StepStatus.COMPLETED
+
+        state = SetupState.create(path=tmp_path / "state.json")
+        registry = StepRegistry()
+        registry.register(FlakyStep("a"))
+
+        Engine(registry, state, breakers=breakers).run()
+
+        assert len(runs) == 2
+        mock_sleep.assert_called_once_with(30.0)
+        assert state.get_step_status("a") == StepStatus.COMPLETED.value
+
+    @patch("setup.engine.time.sleep")
+    def test_gives_up_after_max_pauses(self, mock_sleep: object, tmp_path: Path) -> None:
+        breakers = CircuitBreakers(failure_threshold=1, reset_timeout=30)
+        breaker = breakers.breaker_for("https://api.boomi.com/partner/api/rest/v1/acct-123456/Component/c-1")
+        breaker.on_failure()
+
+        class RefusedStep(ConcreteStep):
+            def execute(self, state: SetupState, dry_run: bool = False) -> StepStatus:
+                assert not breaker.allow()  # its call is refused; it reports FAILED itself
+                return StepStatus.FAILED
+
+        step = RefusedStep("a")
+        state = SetupState.create(path=tmp_path / "state.json")
+        registry = StepRegistry()
+        registry.register(step)
+
+        Engine(registry, state, breakers=breakers, max_circuit_pauses=2).run()
+
+        assert mock_sleep.call_count == 2
+        assert state.get_step_status("a") == StepStatus.FAILED.value
+
+    @patch("setup.engine.time.sleep")
+    def test_no_pause_without_open_circuit(self, mock_sleep: object, tmp_path: Path) -> None:
+        state = SetupState.create(path=tmp_path / "state.json")
+        registry = StepRegistry()
+        registry.register(ConcreteStep("a", execute_result=StepStatus.FAILED))
+
+        Engine(registry, state, breakers=CircuitBreakers()).run()
+
+        mock_sleep.assert_not_called()
+
+    @patch("setup.engine.time.sleep")
+    def test_unrelated_failure_not_rerun_while_circuit_open(
+        self, mock_sleep: object, tmp_path: Path,
+    ) -> None:
+        breakers = CircuitBreakers(failure_threshold=1, reset_timeout=30)
+        breakers.breaker_for("https://api.boomi.com/partner/api/rest/v1/acct-123456/Component/c-1").on_failure()
+        folder_url = "https://api.boomi.com/partner/api/rest/v1/acct-123456/Folder"
+        runs: list[str] = []
+
+        class BadRequestStep(ConcreteStep):
+            def execute(self, state: SetupState, dry_run: bool = False) -> StepStatus:
+                runs.append(self.step_id)
+                if self.step_id == "a":
+                    raise BoomiApiError(400, "bad folder name", folder_url)
+                return StepStatus.FAILED
+
+        for step_id in ("a", "b"):
+            state = SetupState.create(path=tmp_path / f"{step_id}.json")
+            registry = StepRegistry()
+            registry.register(BadRequestStep(step_id))
+            Engine(registry, state, breakers=breakers).run()
+            assert state.get_step_status(step_id) == StepStatus.FAILED.value
+
+        assert runs == ["a", "b"]
+        mock_sleep.assert_not_called()
@@ -0,0 +1,461 @@
+"""Tests for setup.scripts.fake_boomi_server — the API wrappers against the fake."""
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from setup.api.client import BoomiApiError, BoomiClient
+from setup.api.datahub_api import DataHubApi
+from setup.api.platform_api import ComponentSummary, PlatformApi
+from setup.config import BoomiConfig
+from setup.engine import StepStatus
+from setup.scripts.fake_boomi_server import FakeBoomi, FakeBoomiServer
+
+_OP_XML = (
+    '<bns:Component xmlns:bns="http://api.platform.boomi.com/"'
+    ' name="PROMO - HTTP Op - GetThing" type="connector-action"><bns:object/></bns:Component>'
+)
+
+
+@pytest.fixture
+def server() -> Iterator[FakeBoomiServer]:
+    with FakeBoomiServer(async_polls=1, seed=7) as srv:
+        yield srv
+
+
+def _apis(server: FakeBoomiServer, **client_kw: object) -> tuple[PlatformApi, DataHubApi]:
+    config = BoomiConfig(
+        boomi_account_id="acct-1", boomi_repo_id="repo-1", cloud_base_url=server.url,
+        boomi_user="u", boomi_token="t",
+    )
+    client = BoomiClient(config.boomi_user, config.boomi_token, rate=1000, burst=100, **client_kw)
+    return PlatformApi(client, config), DataHubApi(client, config)
+
+
+class TestPlatformEndpoints:
+    def test_component_roundtrip_and_query(self, server: FakeBoomiServer) -> None:
+        platform, _ = _apis(server)
+
+        created = platform.create_component(_OP_XML)
+        comp_id = platform.parse_component_id(created)
+
+        assert comp_id
+        assert 'name="PROMO - HTTP Op - GetThing"' in platform.get_component(comp_id)
+        assert platform.find_component_id_by_name("PROMO - HTTP Op - GetThing") == comp_id
+        assert platform.count_components_by_prefix("PROMO - HTTP") == 1
+
+    @patch("setup.api.polling.time.sleep")
+    def test_branch_and_merge_finish_after_polls(
+        self, mock_sleep: MagicMock, server: FakeBoomiServer
+    ) -> None:
+        platform, _ = _apis(server)
+
+        branch = platform.create_branch("promo-1")
+        assert platform.poll_branch_ready(branch["id"], interval=0)["ready"] == "true"
+        merge = platform.create_merge_request(branch["id"], "main")
+        platform.execute_merge(merge["id"])
+
+        assert platform.poll_merge_status(merge["id"], interval=0)["stage"] == "MERGED"
+        assert mock_sleep.call_count == 2
+
+    def test_unknown_component_is_404(self, server: FakeBoomiServer) -> None:
+        platform, _ = _apis(server)
+
+        with pytest.raises(BoomiApiError) as exc_info:
+            platform.get_component("missing")
+
+        assert exc_info.value.status_code == 404
+
+
+class TestBulkComponentGet:
+    def test_chunks_in_parallel_and_matches_single_get(self, server: FakeBoomiServer) -> None:
+        platform, _ = _apis(server, max_workers=4)
+        ids = [
+            platform.parse_component_id(platform.create_component(_OP_XML.replace("GetThing", f"T{i}")))
+            for i in range(5)
+        ]
+
+        with patch("setup.api.platform_api._BULK_GET_MAX", 2):
+            components = platform.get_components_bulk(ids + ["missing-id", ids[0]])
+
+        assert list(components) == ids
+        assert server.stats["requests"]["POST /Component/bulk"] == 3
+        for cid in ids:
+            single = ET.fromstring(platform.get_component(cid))
+            bulk = ET.fromstring(components[cid])
+            assert (bulk.tag, bulk.attrib) == (single.tag, single.attrib)
+            assert components[cid].startswith("<bns:Component ")
+
+    def test_empty_request_makes_no_calls(self, server: FakeBoomiServer) -> None:
+        platform, _ = _apis(server)
+
+        assert platform.get_components_bulk([]) == {}
+        assert "POST /Component/bulk" not in server.stats["requests"]
+
+
+class TestDataHubEndpoints:
+    @patch("setup.api.polling.time.sleep")
+    def test_model_lifecycle(self, mock_sleep: MagicMock, server: FakeBoomiServer) -> None:
+        _, datahub = _apis(server)
+        spec = {"modelName": "ComponentMapping", "fields": [{"name": "devComponentId", "type": "String"}]}
+
+        model_id = datahub.create_model(spec)
+        datahub.publish_model(model_id)
+        deployment_id = datahub.deploy_model(model_id)
+
+        assert datahub.find_model_by_name("ComponentMapping") == model_id
+        assert datahub.poll_model_deployed(model_id, deployment_id, interval=0) == "SUCCESS"
+
+    def test_canceled_deployment(self) -> None:
+        with FakeBoomiServer(async_polls=0, deploy_outcome="CANCELED") as srv:
+            _, datahub = _apis(srv)
+            model_id = datahub.create_model({"modelName": "PromotionLog", "fields": []})
+
+            with pytest.raises(BoomiApiError) as exc_info:
+                datahub.poll_model_deployed(model_id, datahub.deploy_model(model_id))
+
+        assert exc_info.value.status_code == 410
+
+    @patch("setup.api.polling.time.sleep")
+    def test_repository_and_records(self, mock_sleep: MagicMock, server: FakeBoomiServer) -> None:
+        _, datahub = _apis(server)
+
+        repo_id = datahub.create_repository("fake-cloud", "PromotionHub")
+        assert datahub.poll_repo_created(repo_id, interval=0) == "SUCCESS"
+        datahub.list_repositories()
+        assert datahub._config.hub_cloud_url == server.url
+
+        datahub._config.universe_ids = {"ComponentMapping": "u-1"}
+        datahub._config.hub_auth_token = "hub-token"
+        datahub.create_record(
+            "ComponentMapping",
+            '<batch src="PROMOTION_ENGINE"><ComponentMapping><id>r-1</id></ComponentMapping></batch>',
+            "PROMOTION_ENGINE",
+        )
+        result = datahub.query_records("ComponentMapping", '<RecordQueryRequest limit="10"/>')
+
+        assert 'resultCount="1"' in result
+
+
+class TestLoadKnobs:
+    @patch("setup.api.client.time.sleep")
+    def test_throttled_requests_are_retried(self, mock_sleep: MagicMock) -> None:
+        with FakeBoomiServer(throttle_rate=0.5, seed=1) as srv:
+            platform, _ = _apis(srv)
+            for _ in range(6):
+                platform.create_folder("Promo")
+
+            stats = srv.stats
+
+        assert stats["throttled"] > 0
+        assert platform._client.concurrency_snapshot()[srv.url.split("//")[1]]["throttled"] == (
+            stats["throttled"]
+        )
+
+    def test_stats_count_endpoints(self, server: FakeBoomiServer) -> None:
+        platform, _ = _apis(server)
+
+        platform.create_folder("A")
+        platform.create_folder("B")
+
+        assert server.stats["requests"]["POST /Folder"] == 2
+
+
+class TestComponentMetadataPaging:
+    @staticmethod
+    def _platform(count: int, page_size: int = 3) -> PlatformApi:
+        fake = FakeBoomi(page_size=page_size)
+        config = BoomiConfig(
+            boomi_account_id="acct-1", cloud_base_url="https://fake.boomi.local",
+            boomi_user="u", boomi_token="t",
+        )
+        client = BoomiClient("u", "t", rate=1000, burst=100, transport=fake.transport())
+        platform = PlatformApi(client, config)
+        for i in range(count):
+            platform.create_component(_OP_XML.replace("GetThing", f"Thing {i}"))
+        platform.create_component(_OP_XML.replace("PROMO - HTTP Op", "Other"))
+        return platform
+
+    @staticmethod
+    def _query_calls(platform: PlatformApi) -> list[str]:
+        return [url.rsplit("/", 1)[1] for _, url, _, _ in platform._client._transport.calls
+                if "/ComponentMetadata/" in url]
+
+    def test_count_follows_query_more(self) -> None:
+        platform = self._platform(8)
+
+        assert platform.count_components_by_prefix("PROMO - HTTP Op") == 8
+        assert self._query_calls(platform) == ["query", "queryMore", "queryMore"]
+
+    def test_pages_fetched_lazily(self) -> None:
+        platform = self._platform(8)
+        filter_json = json.dumps({"QueryFilter": {"expression": {
+            "operator": "LIKE", "property": "name", "argument": ["PROMO%"],
+        }}})
+
+        first = next(platform.iter_component_metadata(filter_json))
+
+        assert isinstance(first, ComponentSummary)
+        assert first.name.startswith("PROMO - HTTP Op - Thing") and first.version == "1"
+        assert self._query_calls(platform) == ["query"]
+
+    def test_prefetch_yields_same_records(self) -> None:
+        platform = self._platform(7)
+        filter_json = json.dumps({"QueryFilter": {"expression": {
+            "operator": "LIKE", "property": "name", "argument": ["PROMO%"],
+        }}})
+
+        plain = list(platform.iter_component_metadata(filter_json))
+        prefetched = list(platform.iter_component_metadata(filter_json, prefetch=True))
+
+        assert prefetched == plain
+        assert len({s.component_id for s in plain}) == 7
+
+    def test_find_by_name(self) -> None:
+        platform = self._platform(5)
+
+        assert platform.find_component_id_by_name("PROMO - HTTP Op - Thing 4")
+        assert platform.find_component_id_by_name("PROMO - HTTP Op - Missing") is None
+
+
+class TestRecordUpsert:
+    @staticmethod
+    def _datahub(fake: FakeBoomi, max_workers: int = 4) -> DataHubApi:
+        config = BoomiConfig(
+            boomi_account_id="acct-1", cloud_base_url="https://fake.boomi.local",
+            hub_cloud_url="https://fake.boomi.local", hub_auth_token="hub-token",
+            universe_ids={"DevAccountAccess": "u-1"}, boomi_user="u", boomi_token="t",
+        )
+        transport = fake.transport()
+        answer = transport.handler
+        # Reject any batch containing a record with an empty devAccountId
+        transport.handler = lambda method, url, data, headers: (
+            (400, "<error>devAccountId is required</error>")
+            if "/records" in url and data and "<devAccountId></devAccountId>" in data
+            else answer(method, url, data, headers)
+        )
+        client = BoomiClient("u", "t", rate=1000, burst=100, max_workers=max_workers, transport=transport)
+        return DataHubApi(client, config)
+
+    @staticmethod
+    def _record_posts(datahub: DataHubApi) -> int:
+        return sum(1 for method, url, _, _ in datahub._client._transport.calls
+                   if method == "POST" and url.endswith("/records"))
+
+    @staticmethod
+    def _rows(count: int) -> list[dict[str, str]]:
+        return [
+            {"id": f"g-{i}:a-{i}", "ssoGroupId": f"g-{i}", "devAccountId": f"a-{i}", "devAccountName": "A & B"}
+            for i in range(count)
+        ]
+
+    def test_chunks_sent_in_parallel_batches(self) -> None:
+        fake = FakeBoomi()
+        datahub = self._datahub(fake)
+
+        outcomes = datahub.upsert_records("DevAccountAccess", iter(self._rows(1000)), "ADMIN_CONFIG", chunk_size=150)
+
+        assert [o.index for o in outcomes] == list(range(1000))
+        assert all(o.ok for o in outcomes)
+        assert outcomes[5].record_id == "g-5:a-5"
+        assert self._record_posts(datahub) == 7
+        assert len(fake.records["u-1"]) == 1000
+        assert "<devAccountName>A &amp; B</devAccountName>" in fake.records["u-1"]["g-0:a-0"]
+
+    def test_bad_rows_isolated_by_splitting(self) -> None:
+        fake = FakeBoomi()
+        datahub = self._datahub(fake, max_workers=1)
+        rows = self._rows(16)
+        rows[11]["devAccountId"] = ""
+
+        outcomes = datahub.upsert_records("DevAccountAccess", rows, "ADMIN_CONFIG", chunk_size=8)
+
+        assert [o.index for o in outcomes if not o.ok] == [11]
+        assert outcomes[11].error.status_code == 400
+        assert len(fake.records["u-1"]) == 15
+        # 2 chunks, then halves 4+4, 2+2, 1+1 inside the bad chunk
+        assert self._record_posts(datahub) == 2 + 6
+
+    def test_batch_xml_shape(self) -> None:
+        xml = DataHubApi.records_to_batch_xml(
+            "devAccountAccess", "ADMIN_CONFIG", [{"id": "x:1", "active": True, "note": None}],
+        )
+
+        batch = ET.fromstring(xml)
+        assert batch.get("src") == "ADMIN_CONFIG"
+        [entity] = list(batch)
+        assert entity.tag == "devAccountAccess"
+        assert [(c.tag, c.text) for c in entity] == [("id", "x:1"), ("active", "true")]
+
+    def test_records_read_a_few_batches_ahead(self) -> None:
+        fake = FakeBoomi()
+        datahub = self._datahub(fake, max_workers=2)
+        transport = datahub._client._transport
+        answer = transport.handler
+        read: list[int] = []
+        read_at_first_post: list[int] = []
+
+        def rows() -> Iterator[dict[str, str]]:
+            for i, row in enumerate(self._rows(100)):
+                read.append(i)
+                yield row
+
+        def handler(method, url, data, headers):
+            if url.endswith("/records") and not read_at_first_post:
+                read_at_first_post.append(len(read))
+            return answer(method, url, data, headers)
+
+        transport.handler = handler
+        outcomes = datahub.upsert_records("DevAccountAccess", rows(), "ADMIN_CONFIG", chunk_size=5)
+
+        assert len(outcomes) == 100 and all(o.ok for o in outcomes)
+        # Two chunks per worker in flight, not all 20 chunks up front
+        assert read_at_first_post[0] <= 4 * 5
+
+    def test_source_attribute_is_quoted(self) -> None:
+        batch = ET.fromstring(DataHubApi.records_to_batch_xml("t", 'SRC "1" & <2>', [{"id": "x"}]))
+
+        assert batch.get("src") == 'SRC "1" & <2>'
+
+    @patch("setup.steps.phase1_datahub.guide_and_confirm")
+    @patch("setup.steps.phase1_datahub.guide_and_collect")
+    def test_seed_step_sends_each_record_as_entered(
+        self, mock_collect: MagicMock, mock_confirm: MagicMock,
+    ) -> None:
+        from setup.steps.phase1_datahub import SeedDevAccess
+
+        fake = FakeBoomi()
+        datahub = self._datahub(fake)
+        answers = iter(["g-1", "G1", "a-1", "A1", "g-2", "G2", "", "A2", "g-3", "G3", "a-3", "A3"])
+        mock_collect.side_effect = lambda *args: next(answers)
+        stored_at_prompt: list[int] = []
+        mock_confirm.side_effect = lambda *args: (
+            stored_at_prompt.append(len(fake.records["u-1"])) or len(stored_at_prompt) < 3
+        )
+        step = SeedDevAccess(datahub._config, datahub_api=datahub)
+
+        with patch.object(step, "_validate_universe_ids", return_value=True), \
+                patch.object(datahub, "get_model_root_element", return_value="devAccountAccess"):
+            assert step.execute(MagicMock()) == StepStatus.FAILED  # record 2 lacks an account
+
+        assert stored_at_prompt == [1, 1, 2]
+        assert sorted(fake.records["u-1"]) == ["g-1:a-1", "g-3:a-3"]
+
+    def test_tag_fallback_probes_with_one_record(self) -> None:
+        from setup.steps.phase1_datahub import _upsert_with_tag_fallback
+
+        fake = FakeBoomi()
+        datahub = self._datahub(fake)
+        transport = datahub._client._transport
+        answer = transport.handler
+        transport.handler = lambda method, url, data, headers: (
+            (400, "<error>Batch contains entity of unknown type DevAccountAccess</error>")
+            if data and "<DevAccountAccess>" in data else answer(method, url, data, headers)
+        )
+
+        tag, outcomes = _upsert_with_tag_fallback(
+            datahub, "DevAccountAccess", self._rows(5), "ADMIN_CONFIG",
+            ["DevAccountAccess", "devAccountAccess"],
+        )
+
+        assert tag == "devAccountAccess"
+        assert [o.index for o in outcomes] == [0, 1, 2, 3, 4] and all(o.ok for o in outcomes)
+        posts = [url.rsplit("/u-1/", 1)[1] for method, url, _, _ in transport.calls
+                 if method == "POST" and "/query" not in url]
+        # PascalCase probe rejected by /records and /staging, camelCase probe, then the rest
+        assert posts == ["records", "staging/ADMIN_CONFIG", "records", "records"]
+
+
+class TestRecordPaging:
+    @staticmethod
+    def _datahub(fake: FakeBoomi) -> DataHubApi:
+        config = BoomiConfig(
+            boomi_account_id="acct-1", cloud_base_url="https://fake.boomi.local",
+            hub_cloud_url="https://fake.boomi.local", hub_auth_token="hub-token",
+            universe_ids={"ComponentMapping": "u-1"}, boomi_user="u", boomi_token="t",
+        )
+        client = BoomiClient("u", "t", rate=1000, burst=100, transport=fake.transport())
+        return DataHubApi(client, config)
+
+    @staticmethod
+    def _queries(datahub: DataHubApi) -> list[ET.Element]:
+        return [ET.fromstring(data) for _, url, data, _ in datahub._client._transport.calls
+                if url.endswith("/records/query")]
+
+    @staticmethod
+    def _seed(datahub: DataHubApi, count: int) -> None:
+        datahub.upsert_records("ComponentMapping", [
+            {"id": f"m-{i}", "devComponentId": f"d-{i % 3}", "devAccountId": "a-1",
+             "prodComponentId": f"p-{i}"}
+            for i in range(count)
+        ], "PROMOTION_ENGINE", entity_tag="ComponentMapping")
+        datahub._client._transport.calls.clear()  # drop the auth probe and upserts
+
+    def test_follows_offset_token_lazily(self) -> None:
+        fake = FakeBoomi()
+        datahub = self._datahub(fake)
+        self._seed(datahub, 25)
+
+        records = datahub.iter_records("ComponentMapping", page_size=10)
+        first = [next(records) for _ in range(10)]
+        assert len(self._queries(datahub)) == 1
+        rest = list(records)
+
+        assert [r.get("prodComponentId") for r in first + rest] == [f"p-{i}" for i in range(25)]
+        queries = self._queries(datahub)
+        assert [q.get("offsetToken") for q in queries] == [None, "10", "20"]
+
+    def test_filter_and_fields(self) -> None:
+        fake = FakeBoomi()
+        datahub = self._datahub(fake)
+        self._seed(datahub, 9)
+
+        records = list(datahub.iter_records(
+            "ComponentMapping", {"DEV_COMPONENT_ID": "d-1"}, fields=["DEV_COMPONENT_ID"],
+        ))
+
+        assert [r.record_id for r in records] == ["m-1", "m-4", "m-7"]
+        assert records[0].get("devComponentId") == "d-1"
+        assert records[0].updated_date
+        [query] = self._queries(datahub)
+        assert [f.text for f in query.iter("fieldId")] == ["DEV_COMPONENT_ID", "DEV_COMPONENT_ID"]
+
+    def test_empty_result(self) -> None:
+        datahub = self._datahub(FakeBoomi())
+
+        assert list(datahub.iter_records("ComponentMapping", {"DEV_COMPONENT_ID": "none"})) == []
+
+    def test_query_xml_escapes_values(self) -> None:
+        query = ET.fromstring(DataHubApi.record_query_xml({"COMPONENT_NAME": "A & <B>"}, limit=5))
+
+        assert query.get("limit") == "5"
+        assert query.findtext("filter/fieldValue/value") == "A & <B>"
+        assert query.find("view") is None
+
+    @patch("setup.api.polling.time.sleep")
+    def test_crud_step_waits_for_ingested_record(self, mock_sleep: MagicMock) -> None:
+        from setup.steps.phase1_datahub import TestCrud
+
+        fake = FakeBoomi()
+        datahub = self._datahub(fake)
+        transport = datahub._client._transport
+        answer = transport.handler
+        queries: list[str] = []
+
+        def not_ingested_yet(method, url, data, headers):
+            if url.endswith("/records/query") and "fieldValue" in (data or ""):
+                queries.append(url)
+                if len(queries) < 3:
+                    return 200, "<RecordQueryResponse resultCount=\"0\" totalCount=\"0\"/>"
+            return answer(method, url, data, headers)
+
+        transport.handler = not_ingested_yet
+
+        assert TestCrud(datahub._config, datahub_api=datahub).execute(MagicMock()) == StepStatus.COMPLETED
+        assert len(queries) == 3
+        assert mock_sleep.call_count == 2
+        assert fake.records["u-1"] == {}
@@ -0,0 +1,130 @@
+"""Tests for setup.api.mapping_index — the local ComponentMapping replica."""
+from __future__ import annotations
+
+import threading
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from setup.api.client import BoomiClient
+from setup.api.datahub_api import DataHubApi
+from setup.api.mapping_index import ComponentMappingIndex
+from setup.config import BoomiConfig
+from setup.scripts.fake_boomi_server import FakeBoomi
+
+_OLD = "2000-01-01T00:00:{:02d}Z"
+
+
+def _datahub(fake: FakeBoomi) -> DataHubApi:
+    config = BoomiConfig(
+        boomi_account_id="acct-1", cloud_base_url="https://fake.boomi.local",
+        hub_cloud_url="https://fake.boomi.local", hub_auth_token="hub-token",
+        universe_ids={"ComponentMapping": "u-1"}, boomi_user="u", boomi_token="t",
+    )
+    client = BoomiClient("u", "t", rate=1000, burst=100, transport=fake.transport())
+    return DataHubApi(client, config)
+
+
+def _mapping(i: int, account: str = "dev-a", prod: str = "") -> dict[str, str]:
+    return {
+        "id": f"m-{i}", "devComponentId": f"d-{i}", "devAccountId": account,
+        "prodComponentId": prod or f"p-{i}", "componentName": f"Comp {i}",
+        "componentType": "process",
+    }
+
+
+def _upsert(datahub: DataHubApi, rows: list[dict[str, str]]) -> None:
+    datahub.upsert_records("ComponentMapping", rows, "PROMOTION_ENGINE", entity_tag="ComponentMapping")
+
+
+def _queries(datahub: DataHubApi) -> list[ET.Element]:
+    return [ET.fromstring(data) for _, url, data, _ in datahub._client._transport.calls
+            if url.endswith("/records/query") and data != '<RecordQueryRequest limit="1"/>']  # not the auth probe
+
+
+@pytest.fixture
+def fake() -> FakeBoomi:
+    fake = FakeBoomi()
+    _upsert(_datahub(fake), [_mapping(i, account=f"dev-{'ab'[i % 2]}") for i in range(30)])
+    dates = fake.record_dates["u-1"]
+    for i, (rid, (created, _)) in enumerate(dates.items()):
+        dates[rid] = (created, _OLD.format(i))
+    return fake
+
+
+class TestComponentMappingIndex:
+    def test_full_then_incremental_sync(self, fake: FakeBoomi, tmp_path: Path) -> None:
+        datahub = _datahub(fake)
+        index = ComponentMappingIndex(tmp_path / "m.sqlite", datahub)
+
+        assert index.sync() == 30
+        assert index.synced_through == _OLD.format(29)
+        _upsert(datahub, [_mapping(3, account="dev-b", prod="p-3b"), _mapping(30)])
+
+        # The two changes, plus m-29 again: ``from`` includes the watermark itself
+        assert index.sync() == 3
+        assert len(index) == 31
+        assert index.prod_id_for("d-3", "dev-b") == "p-3b"
+        assert index.synced_through > _OLD.format(29)
+        first, second = _queries(datahub)
+        assert first.find("filter") is None
+        assert second.findtext("filter/updatedDate/from") == _OLD.format(29)
+
+    def test_lookups(self, fake: FakeBoomi, tmp_path: Path) -> None:
+        index = ComponentMappingIndex(tmp_path / "m.sqlite", _datahub(fake))
+        index.sync()
+
+        assert index.prod_id_for("d-4", "dev-a") == "p-4"
+        assert index.prod_id_for("d-4", "dev-b") is None
+        [entry] = index.by_dev_component("d-5")
+        assert (entry.record_id, entry.dev_account_id) == ("m-5", "dev-b")
+        assert entry.fields["componentName"] == "Comp 5"
+        assert [e.dev_component_id for e in index.by_prod_component("p-7")] == ["d-7"]
+        assert len(index.by_dev_account("dev-a")) == 15
+        assert index.mapping_cache("dev-b")["d-9"] == "p-9"
+
+    def test_replica_persists_and_answers_without_calls(
+        self, fake: FakeBoomi, tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "m.sqlite"
+        ComponentMappingIndex(path, _datahub(fake)).sync()
+
+        offline = ComponentMappingIndex(path)
+
+        assert offline.prod_id_for("d-2", "dev-a") == "p-2"
+        assert len(offline) == 30
+        assert offline.synced_through == _OLD.format(29)
+        with pytest.raises(ValueError):
+            offline.sync()
+
+    def test_full_sync_drops_ended_records(self, fake: FakeBoomi, tmp_path: Path) -> None:
+        datahub = _datahub(fake)
+        index = ComponentMappingIndex(tmp_path / "m.sqlite", datahub)
+        index.sync()
+        del fake.records["u-1"]["m-0"]
+
+        assert index.sync() == 1
+        assert index.prod_id_for("d-0", "dev-a") == "p-0"
+        assert index.sync(full=True) == 29
+        assert index.prod_id_for("d-0", "dev-a") is None
+
+    def test_lookups_answer_while_a_sync_fetches(self, fake: FakeBoomi, tmp_path: Path) -> None:
+        datahub = _datahub(fake)
+        index = ComponentMappingIndex(tmp_path / "m.sqlite", datahub)
+        index.sync()
+        transport = datahub._client._transport
+        answer = transport.handler
+        during_fetch: list[str | None] = []
+
+        def handler(method, url, data, headers):
+            if url.endswith("/records/query"):
+                lookup = threading.Thread(target=lambda: during_fetch.append(index.prod_id_for("d-4", "dev-a")))
+                lookup.start()
+                lookup.join(timeout=2)
+            return answer(method, url, data, headers)
+
+        transport.handler = handler
+        assert index.sync(full=True) == 30
+
+        assert during_fetch and set(during_fetch) == {"p-4"}
@@ -0,0 +1,127 @@
+"""Tests for the DataHub model pipeline behind steps 1.2a-d (CreateModel, StageSources)."""
+from __future__ import annotations
+
+import re
+from unittest.mock import MagicMock, patch
+
+from setup.api.client import BoomiClient
+from setup.api.datahub_api import DataHubApi
+from setup.config import BoomiConfig
+from setup.engine import StepStatus
+from setup.scripts.fake_boomi_server import FakeBoomi
+from setup.state import SetupState
+from setup.steps.phase1_datahub import CreateModel, StageSources
+
+_MODELS = [("ComponentMapping", "a"), ("DevAccountAccess", "b"), ("PromotionLog", "c")]
+
+
+def _steps(config: BoomiConfig, fake: FakeBoomi, max_workers: int = 4) -> list[CreateModel]:
+    client = BoomiClient("u", "t", rate=1000, burst=100, max_workers=max_workers, transport=fake.transport())
+    datahub = DataHubApi(client, config)
+    return [CreateModel(config, datahub_api=datahub, model_name=name, sub_id=sub) for name, sub in _MODELS]
+
+
+def _count(step: CreateModel, method: str, pattern: str) -> int:
+    return sum(1 for m, url, _, _ in step.datahub_api._client._transport.calls
+               if m == method and re.search(pattern, url))
+
+
+class TestModelPipeline:
+    @patch("setup.api.polling.time.sleep")
+    def test_all_models_deploy_in_one_poll_loop(
+        self, mock_sleep: MagicMock, mock_config: BoomiConfig, mock_state: SetupState,
+    ) -> None:
+        fake = FakeBoomi(async_polls=3)
+        first, second, third = _steps(mock_config, fake)
+
+        assert first.execute(mock_state) == StepStatus.COMPLETED
+
+        assert set(mock_state.data["component_ids"]["models"]) == {name for name, _ in _MODELS}
+        assert set(mock_state.config["universe_ids"]) == {name for name, _ in _MODELS}
+        assert _count(first, "GET", r"/deployments/") == 3 * 4
+        # One schedule for all three: 3 waits, not 3 per model
+        assert mock_sleep.call_count == 3
+        calls = len(first.datahub_api._client._transport.calls)
+        assert second.execute(mock_state) == StepStatus.COMPLETED
+        assert third.execute(mock_state) == StepStatus.COMPLETED
+        assert len(first.datahub_api._client._transport.calls) == calls
+
+    @patch("setup.api.polling.time.sleep")
+    def test_failed_model_resumes_from_its_stage(
+        self, mock_sleep: MagicMock, mock_config: BoomiConfig, mock_state: SetupState,
+    ) -> None:
+        fake = FakeBoomi(async_polls=1)
+        [step, *_] = _steps(mock_config, fake, max_workers=1)
+        transport = step.datahub_api._client._transport
+        answer = transport.handler
+        rejected: list[str] = []
+
+        def reject_first_deploy(method, url, data, headers):
+            if "/deploy?" in url and not rejected:
+                rejected.append(url)
+                return 403, "<error>Repository is locked</error>"
+            return answer(method, url, data, headers)
+
+        transport.handler = reject_first_deploy
+
+        assert step.execute(mock_state) == StepStatus.FAILED
+        assert mock_state.get_model_progress("ComponentMapping")["stage"] == "published"
+        assert mock_state.get_component_id("models", "ComponentMapping") is None
+        assert mock_state.get_component_id("models", "PromotionLog")
+
+        assert step.execute(mock_state) == StepStatus.COMPLETED
+        assert mock_state.get_component_id("models", "ComponentMapping")
+        assert _count(step, "POST", r"/models$") == 3
+        assert _count(step, "POST", r"/publish$") == 3
+        assert _count(step, "POST", r"/deploy\?") == 4
+
+    @patch("setup.api.polling.time.sleep")
+    def test_rerun_polls_saved_deployments(
+        self, mock_sleep: MagicMock, mock_config: BoomiConfig, mock_state: SetupState,
+    ) -> None:
+        fake = FakeBoomi(async_polls=10)  # longer than one run's 60s of polls
+        [step, *_] = _steps(mock_config, fake)
+
+        assert step.execute(mock_state) == StepStatus.FAILED
+        assert {mock_state.get_model_progress(name)["stage"] for name, _ in _MODELS} == {"deploying"}
+
+        assert step.execute(mock_state) == StepStatus.COMPLETED
+        assert _count(step, "POST", r"/deploy\?") == 3
+        assert len(mock_state.data["component_ids"]["models"]) == 3
+
+    @patch("setup.api.polling.time.sleep")
+    def test_canceled_deployment_is_redeployed(
+        self, mock_sleep: MagicMock, mock_config: BoomiConfig, mock_state: SetupState,
+    ) -> None:
+        fake = FakeBoomi(async_polls=1, deploy_outcome="CANCELED")
+        [step, *_] = _steps(mock_config, fake)
+
+        assert step.execute(mock_state) == StepStatus.FAILED
+        assert mock_state.get_model_progress("ComponentMapping")["stage"] == "published"
+
+        fake.deploy_outcome = "SUCCESS"
+        assert step.execute(mock_state) == StepStatus.COMPLETED
+        assert _count(step, "POST", r"/deploy\?") == 6
+        assert _count(step, "POST", r"/models$") == 3
+
+
+class TestStageSources:
+    @patch("setup.api.polling.time.sleep")
+    def test_source_never_ready_reports_datahubs_error(
+        self, mock_sleep: MagicMock, mock_config: BoomiConfig, mock_state: SetupState,
+    ) -> None:
+        fake = FakeBoomi()
+        [step, *_] = _steps(mock_config, fake)
+        step.datahub_api._client._transport.handler = lambda method, url, data, headers: (
+            (400, "<error>Source PROMOTION_ENGINE is not in a valid state</error>")
+            if url.endswith("/stagingArea/create") else (200, "true")
+        )
+        for name, _ in _MODELS:
+            mock_state.store_universe_id(name, f"u-{name}")
+
+        with patch("setup.steps.phase1_datahub.ui.print_error") as print_error:
+            assert StageSources(mock_config, datahub_api=step.datahub_api).execute(mock_state) == StepStatus.FAILED
+
+        [message] = [c.args[0] for c in print_error.call_args_list]
+        assert "Boomi API error 400" in message and "not in a valid state" in message
+        assert _count(step, "POST", r"/stagingArea/create$") == 6
@@ -0,0 +1,53 @@
+"""Tests for the DH-op repair sweep of step 2.8 (VerifyPhase2)."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from setup.api.client import BoomiApiError
+from setup.config import BoomiConfig
+from setup.state import SetupState
+from setup.steps.phase2b_datahub_conn import DH_OPERATIONS, VerifyPhase2
+
+
+def _step(config: BoomiConfig, state: SetupState, fetch) -> VerifyPhase2:
+    for i, (op_name, _, _) in enumerate(DH_OPERATIONS):
+        state.store_component_id("dh_operations", op_name, f"op-{i}")
+    names = {f"op-{i}": op_name for i, (op_name, _, _) in enumerate(DH_OPERATIONS)}
+
+    def get_component(cid: str) -> str:
+        return fetch(cid, f'<bns:Component componentId="{cid}" name="{names[cid]}"/>')
+
+    platform_api = MagicMock()
+    platform_api.get_component.side_effect = get_component
+    step = VerifyPhase2(config, platform_api=platform_api)
+    step._try_create_dh_op = MagicMock(return_value=1)
+    return step
+
+
+class TestRepairSweep:
+    def test_failed_bulk_read_falls_back_to_per_id_gets(
+        self, mock_config: BoomiConfig, mock_state: SetupState,
+    ) -> None:
+        step = _step(mock_config, mock_state, lambda cid, xml: xml)
+        step.platform_api.get_components_bulk.side_effect = BoomiApiError(503, "unavailable")
+
+        assert not step._diagnose_and_repair_dh_ops(mock_state)
+        assert step.platform_api.get_component.call_count == len(DH_OPERATIONS)
+        step._try_create_dh_op.assert_not_called()
+
+    def test_only_confirmed_missing_ops_are_recreated(
+        self, mock_config: BoomiConfig, mock_state: SetupState,
+    ) -> None:
+        def fetch(cid: str, xml: str) -> str:
+            if cid == "op-0":
+                raise BoomiApiError(404, "not found")
+            if cid == "op-1":
+                raise BoomiApiError(500, "server error")
+            return xml.replace("PROMO", "Renamed") if cid == "op-2" else xml
+
+        step = _step(mock_config, mock_state, fetch)
+        step.platform_api.get_components_bulk.return_value = {}
+
+        assert step._diagnose_and_repair_dh_ops(mock_state)
+        recreated = [c.args[2] for c in step._try_create_dh_op.call_args_list]
+        assert recreated == [DH_OPERATIONS[0][0], DH_OPERATIONS[2][0]]
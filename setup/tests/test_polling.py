@@ -0,0 +1,216 @@
+"""Tests for setup.api.polling and the API poll methods built on it."""
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from setup.api.client import BoomiApiError, BoomiClient
+from setup.api.datahub_api import DataHubApi
+from setup.api.platform_api import PlatformApi
+from setup.api.polling import CANCELLED_STATUS, PollOp, apoll_many, delays, poll, poll_many
+from setup.api.transport import InMemoryTransport
+from setup.config import BoomiConfig
+
+
+def _countdown(reads_left: int, final: str = "SUCCESS") -> MagicMock:
+    """fetch that answers PENDING ``reads_left`` times, then ``final``."""
+    return MagicMock(side_effect=["PENDING"] * reads_left + [final])
+
+
+def _deployment_xml(status: str) -> str:
+    return f'<mdm:deployment xmlns:mdm="http://mdm.api.platform.boomi.com/"><mdm:status>{status}</mdm:status></mdm:deployment>'
+
+
+@patch("setup.api.polling.time.sleep")
+class TestPoll:
+    def test_returns_first_done_result(self, mock_sleep: MagicMock) -> None:
+        fetch = MagicMock(side_effect=["a", "b", "c"])
+
+        result = poll(fetch, lambda r: r == "b", "Thing 1", "ready", 2, 5)
+
+        assert result == "b"
+        mock_sleep.assert_called_once_with(2)
+
+    def test_timeout_raises_408(self, mock_sleep: MagicMock) -> None:
+        with pytest.raises(BoomiApiError) as exc_info:
+            poll(lambda: "x", lambda r: False, "Thing 1", "ready", 1, 3)
+
+        assert exc_info.value.status_code == 408
+        assert "Thing 1 not ready after 3 polls" in exc_info.value.body
+        assert mock_sleep.call_count == 2  # no wait after the last read
+
+    def test_done_error_propagates(self, mock_sleep: MagicMock) -> None:
+        with pytest.raises(BoomiApiError) as exc_info:
+            poll(lambda: "CANCELED", lambda s: DataHubApi.is_model_deployed("m-1", s),
+                 "Model m-1", "deployed", 1, 3)
+
+        assert exc_info.value.status_code == 410
+        mock_sleep.assert_not_called()
+
+    def test_backoff_grows_to_cap(self, mock_sleep: MagicMock) -> None:
+        poll(_countdown(5), lambda s: s == "SUCCESS", "Thing 1", "ready", 2, 10,
+             backoff=2, max_interval=10)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 4, 8, 10, 10]
+        assert list(zip(range(4), delays(3, 1.5, 5))) == [(0, 3), (1, 4.5), (2, 5), (3, 5)]
+
+    def test_deadline_cuts_short(self, mock_sleep: MagicMock) -> None:
+        with pytest.raises(BoomiApiError) as exc_info:
+            poll(lambda: "x", lambda r: False, "Thing 1", "ready", 4, 100, deadline=10)
+
+        assert exc_info.value.status_code == 408
+        assert "within 10s" in exc_info.value.body
+        # Last wait shortened so the poll ends at the deadline
+        assert [c.args[0] for c in mock_sleep.call_args_list] == pytest.approx([4, 4, 2], abs=0.05)
+
+    def test_cancel_stops_between_reads(self, mock_sleep: MagicMock) -> None:
+        cancel = threading.Event()
+        fetch = MagicMock(side_effect=lambda: cancel.set() or "PENDING")
+
+        with pytest.raises(BoomiApiError) as exc_info:
+            poll(fetch, lambda s: False, "Thing 1", "ready", 30, 5, cancel=cancel)
+
+        assert exc_info.value.status_code == CANCELLED_STATUS
+        assert fetch.call_count == 1
+
+
+@patch("setup.api.polling.time.sleep")
+class TestPollMany:
+    def test_one_read_per_due_op_per_tick(self, mock_sleep: MagicMock) -> None:
+        ticks: list[list[str]] = []
+
+        def map_fn(fn, items, return_exceptions=False):
+            ticks.append([entry.op.key for entry in items])
+            return [fn(entry) for entry in items]
+
+        fetches = {"a": _countdown(0), "b": _countdown(2), "c": _countdown(1)}
+        ops = [PollOp(key, fetch, lambda s: s == "SUCCESS", f"Op {key}") for key, fetch in fetches.items()]
+
+        results = poll_many(ops, "deployed", 2, 5, backoff=2, map_fn=map_fn)
+
+        assert results == {"a": "SUCCESS", "b": "SUCCESS", "c": "SUCCESS"}
+        assert ticks == [["a", "b", "c"], ["b", "c"], ["b"]]
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 4]
+
+    def test_failures_and_timeouts_with_return_exceptions(self, mock_sleep: MagicMock) -> None:
+        ops = [
+            PollOp("ok", _countdown(1), lambda s: DataHubApi.is_model_deployed("ok", s), "Model ok"),
+            PollOp("gone", _countdown(0, "CANCELED"), lambda s: DataHubApi.is_model_deployed("gone", s), "Model gone"),
+            PollOp("slow", lambda: "PENDING", lambda s: False, "Model slow"),
+        ]
+
+        results = poll_many(ops, "deployed", 1, 3, return_exceptions=True)
+
+        assert results["ok"] == "SUCCESS"
+        assert results["gone"].status_code == 410
+        assert results["slow"].status_code == 408
+
+    def test_fetch_errors_collected_with_return_exceptions(self, mock_sleep: MagicMock) -> None:
+        ops = [
+            PollOp("ok", _countdown(0), lambda s: s == "SUCCESS", "Op ok"),
+            PollOp("broken", MagicMock(side_effect=ValueError("bad XML")), lambda s: False, "Op broken"),
+        ]
+
+        results = poll_many(ops, "ready", 1, 3, return_exceptions=True)
+
+        assert results["ok"] == "SUCCESS"
+        assert isinstance(results["broken"], ValueError)
+
+    def test_first_failure_raises(self, mock_sleep: MagicMock) -> None:
+        slow = MagicMock(return_value="PENDING")
+        ops = [
+            PollOp("slow", slow, lambda s: False, "Model slow"),
+            PollOp("gone", _countdown(1, "CANCELED"), lambda s: DataHubApi.is_model_deployed("gone", s), "Model gone"),
+        ]
+
+        with pytest.raises(BoomiApiError) as exc_info:
+            poll_many(ops, "deployed", 1, 20)
+
+        assert exc_info.value.status_code == 410
+        assert slow.call_count == 2
+
+    def test_deadline_applies_to_batch(self, mock_sleep: MagicMock) -> None:
+        ops = [PollOp(k, lambda: "PENDING", lambda s: False, f"Op {k}") for k in "ab"]
+
+        results = poll_many(ops, "ready", 4, 100, deadline=10, return_exceptions=True)
+
+        assert {k: e.status_code for k, e in results.items()} == {"a": 408, "b": 408}
+        assert sum(c.args[0] for c in mock_sleep.call_args_list) == pytest.approx(10, abs=0.05)
+
+    def test_apoll_many_runs_on_one_loop(self, mock_sleep: MagicMock) -> None:
+        async def fetch(key: str, reads: list[str]) -> str:
+            return reads.pop(0)
+
+        ops = [
+            PollOp(k, lambda k=k, r=["PENDING"] * n + ["SUCCESS"]: fetch(k, r), lambda s: s == "SUCCESS", f"Op {k}")
+            for k, n in [("a", 2), ("b", 0)]
+        ]
+        with patch("setup.api.polling.asyncio.sleep", new_callable=AsyncMock) as async_sleep:
+            results = asyncio.run(apoll_many(ops, "ready", 1, 5, backoff=3))
+
+        assert results == {"a": "SUCCESS", "b": "SUCCESS"}
+        assert [c.args[0] for c in async_sleep.call_args_list] == [1, 3]
+
+
+@patch("setup.api.polling.time.sleep")
+class TestApiPolls:
+    def test_poll_branch_ready(self, mock_sleep: MagicMock, mock_config: BoomiConfig) -> None:
+        client = MagicMock()
+        client.get.side_effect = [{"ready": "false"}, {"ready": "true"}]
+        api = PlatformApi(client, mock_config)
+
+        assert api.poll_branch_ready("b-1", interval=5) == {"ready": "true"}
+        mock_sleep.assert_called_once_with(5)
+
+    def test_poll_merge_status_failed_is_terminal(
+        self, mock_sleep: MagicMock, mock_config: BoomiConfig
+    ) -> None:
+        client = MagicMock()
+        client.get.return_value = {"stage": "FAILED_TO_MERGE"}
+        api = PlatformApi(client, mock_config)
+
+        assert api.poll_merge_status("mr-1")["stage"] == "FAILED_TO_MERGE"
+        mock_sleep.assert_not_called()
+
+    def test_backoff_keeps_the_old_fixed_schedule_length(
+        self, mock_sleep: MagicMock, mock_config: BoomiConfig
+    ) -> None:
+        transport = InMemoryTransport(lambda method, url, data, headers: (200, _deployment_xml("PENDING")))
+        api = DataHubApi(BoomiClient("u", "t", rate=1000, burst=100, transport=transport), mock_config)
+
+        with pytest.raises(BoomiApiError) as exc_info:
+            api.poll_model_deployed("m-1", "d-1")  # 3s × 20 reads before backoff
+
+        assert exc_info.value.status_code == 408
+        assert sum(c.args[0] for c in mock_sleep.call_args_list) == pytest.approx(60, abs=0.05)
+        assert len(transport.calls) < 20
+
+    def test_repo_deleted_raises_410(self, mock_sleep: MagicMock) -> None:
+        with pytest.raises(BoomiApiError) as exc_info:
+            DataHubApi.is_repo_created("r-1", "DELETED")
+
+        assert exc_info.value.status_code == 410
+        assert DataHubApi.is_repo_created("r-1", "SUCCESS") is True
+        assert DataHubApi.is_repo_created("r-1", "PENDING") is False
+
+    def test_poll_models_deployed_batches_reads(
+        self, mock_sleep: MagicMock, mock_config: BoomiConfig
+    ) -> None:
+        reads = {"m-1": ["PENDING", "SUCCESS"], "m-2": ["SUCCESS"], "m-3": ["PENDING", "PENDING", "SUCCESS"]}
+
+        def handler(method, url, data, headers):
+            model_id = url.split("/universe/")[1].split("/")[0]
+            return 200, _deployment_xml(reads[model_id].pop(0))
+
+        transport = InMemoryTransport(handler)
+        api = DataHubApi(BoomiClient("u", "t", rate=1000, burst=100, transport=transport), mock_config)
+
+        results = api.poll_models_deployed({"m-1": "d-1", "m-2": "d-2", "m-3": "d-3"})
+
+        assert results == {"m-1": "SUCCESS", "m-2": "SUCCESS", "m-3": "SUCCESS"}
+        assert len(transport.calls) == 6
+        # One scheduler: waits of 3s then 4.5s (backoff), not one sleep per model
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [3, 4.5]
@@ -0,0 +1,149 @@
+"""Tests for DataHubApi Repository API auth probing and the saved auth format."""
+from __future__ import annotations
+
+import base64
+import threading
+import time
+
+import pytest
+
+from setup.api.client import BoomiApiError, BoomiClient
+from setup.api.datahub_api import DataHubApi
+from setup.api.transport import InMemoryTransport
+from setup.config import BoomiConfig, load_config
+
+_FORMATS = ["generated_hub", "account_hub", "boomi_token", "account_api"]
+
+
+def _config(**overrides: object) -> BoomiConfig:
+    values = dict(
+        boomi_account_id="acct-1", cloud_base_url="https://api.fake.local",
+        hub_cloud_url="https://hub.fake.local", universe_ids={"ComponentMapping": "u-1"},
+        hub_auth_user="gen-user", hub_auth_token="hub-token",
+        boomi_user="user", boomi_token="api-token",
+    )
+    values.update(overrides)
+    return BoomiConfig(**values)
+
+
+def _format_of(headers: dict[str, str]) -> str:
+    user, token = base64.b64decode(headers["Authorization"].split(" ", 1)[1]).decode().split(":")
+    if user.startswith("BOOMI_TOKEN."):
+        return "boomi_token"
+    if user == "gen-user":
+        return "generated_hub"
+    return "account_api" if token == "api-token" else "account_hub"
+
+
+def _datahub(config: BoomiConfig, handler) -> DataHubApi:
+    client = BoomiClient("user", "api-token", rate=1000, burst=100, transport=InMemoryTransport(handler))
+    return DataHubApi(client, config)
+
+
+def _probes(datahub: DataHubApi) -> list[str]:
+    return [_format_of(headers) for _, url, _, headers in datahub._client._transport.calls
+            if url.endswith("/records/query")]
+
+
+class TestAuthProbe:
+    def test_probes_run_concurrently(self) -> None:
+        barrier = threading.Barrier(4, timeout=5)
+
+        def handler(method, url, data, headers):
+            barrier.wait()  # only passes once all four probes are in flight
+            return (200, "<RecordQueryResponse/>") if _format_of(headers) == "account_api" else (401, "no")
+
+        config = _config()
+        datahub = _datahub(config, handler)
+
+        assert datahub.verify_repo_auth()
+        assert sorted(_probes(datahub)) == sorted(_FORMATS)
+        assert config.repo_auth_format == "account_api"
+        assert config.repo_auth_fingerprint
+
+    def test_slower_higher_priority_format_wins(self) -> None:
+        def handler(method, url, data, headers):
+            fmt = _format_of(headers)
+            if fmt == "generated_hub":
+                time.sleep(0.2)  # answers after the legacy formats
+                return 200, ""
+            return (403, "") if fmt == "account_hub" else (200, "")
+
+        config = _config()
+        _ = _datahub(config, handler)._repo_client
+
+        assert config.repo_auth_format == "generated_hub"
+
+    def test_lower_priority_wins_once_higher_ones_fail(self) -> None:
+        release = threading.Event()
+
+        def handler(method, url, data, headers):
+            fmt = _format_of(headers)
+            if fmt == "generated_hub":
+                release.wait(5)
+                return 401, ""
+            if fmt == "account_api":
+                release.wait(5)  # a stalled lower-priority probe is not waited for
+                return 200, ""
+            return (200, "") if fmt == "boomi_token" else (401, "")
+
+        config = _config()
+        datahub = _datahub(config, handler)
+        threading.Timer(0.2, release.set).start()
+        start = time.monotonic()
+        try:
+            _ = datahub._repo_client
+        finally:
+            release.set()
+
+        assert time.monotonic() - start < 2
+        assert config.repo_auth_format == "boomi_token"
+
+    def test_ambiguous_win_is_used_but_not_saved(self) -> None:
+        def handler(method, url, data, headers):
+            return (403, "Forbidden") if _format_of(headers) == "account_api" else (401, "")
+
+        config = _config()
+        datahub = _datahub(config, handler)
+
+        assert datahub.verify_repo_auth()
+        assert (config.repo_auth_format, config.repo_auth_fingerprint) == ("", "")
+
+    def test_saved_format_skips_probing_until_credentials_change(self) -> None:
+        handler = lambda method, url, data, headers: (
+            (200, "") if _format_of(headers) == "generated_hub" else (401, "")
+        )
+        config = _config()
+        _ = _datahub(config, handler)._repo_client
+        assert config.repo_auth_format == "generated_hub"
+
+        # A later run: same credentials, format loaded back from state
+        rerun = _datahub(_config(
+            repo_auth_format=config.repo_auth_format, repo_auth_fingerprint=config.repo_auth_fingerprint,
+        ), handler)
+        assert rerun.verify_repo_auth()
+        assert _probes(rerun) == []
+
+        rerun._config.hub_auth_token = "new-hub-token"
+        rerun.reset_repo_client()
+        _ = rerun._repo_client
+        assert len(_probes(rerun)) >= 1
+        assert rerun._config.repo_auth_fingerprint != config.repo_auth_fingerprint
+
+    def test_all_formats_rejected(self) -> None:
+        datahub = _datahub(_config(), lambda method, url, data, headers: (401, "Unauthorized"))
+
+        with pytest.raises(BoomiApiError) as exc_info:
+            _ = datahub._repo_client
+
+        assert exc_info.value.status_code == 401
+        assert "generated_hub: HTTP 401\n  account_hub: HTTP 401" in str(exc_info.value)
+        assert not datahub.verify_repo_auth()
+        assert datahub._config.repo_auth_format == ""
+
+    def test_saved_format_round_trips_through_state_config(self) -> None:
+        config = _config(repo_auth_format="account_hub", repo_auth_fingerprint="f-1")
+
+        loaded = load_config(existing_state_config=config.to_state_dict(), interactive=False)
+
+        assert (loaded.repo_auth_format, loaded.repo_auth_fingerprint) == ("account_hub", "f-1")
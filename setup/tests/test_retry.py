@@ -0,0 +1,76 @@
+"""Tests for setup.api.retry — RetryPolicy and RetryBudget."""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from setup.api.retry import RetryBudget, RetryPolicy
+
+
+class TestRetryAfter:
+    def test_seconds(self) -> None:
+        assert RetryPolicy.parse_retry_after("7") == 7.0
+
+    def test_http_date(self) -> None:
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        parsed = RetryPolicy.parse_retry_after(format_datetime(when, usegmt=True))
+        assert parsed == pytest.approx(30, abs=2)
+
+    def test_missing_or_malformed(self) -> None:
+        assert RetryPolicy.parse_retry_after(None) is None
+        assert RetryPolicy.parse_retry_after("soon") is None
+
+    def test_retry_after_overrides_jitter(self) -> None:
+        policy = RetryPolicy()
+        assert policy.next_wait(0, retry_after="12") == 12.0
+
+
+class TestBackoff:
+    def test_decorrelated_jitter_bounds(self) -> None:
+        policy = RetryPolicy(base=1.0, cap=10.0, rng=random.Random(42))
+        wait = 0.0
+        for attempt in range(3):
+            previous = wait
+            wait = policy.next_wait(attempt, previous)
+            assert 1.0 <= wait <= min(10.0, max(1.0, (previous or 1.0) * 3))
+
+    def test_jitter_spreads_parallel_workers(self) -> None:
+        policy = RetryPolicy(rng=random.Random(1))
+        first_waits = {policy.next_wait(0) for _ in range(20)}
+        assert len(first_waits) > 1
+
+    def test_max_retries(self) -> None:
+        policy = RetryPolicy(max_retries=2)
+        assert policy.next_wait(2) is None
+
+
+class TestBudget:
+    def test_budget_refuses_overdraw(self) -> None:
+        budget = RetryBudget(5.0)
+        policy = RetryPolicy(budget=budget)
+
+        assert policy.next_wait(0, retry_after="4") == 4.0
+        assert policy.next_wait(1, retry_after="4") is None
+        assert budget.spent == 4.0
+        assert budget.remaining == 1.0
+
+    def test_negative_budget_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            RetryBudget(-1)
+
+
+class TestRetryableExceptions:
+    def test_idempotent_methods_retry_transport_errors(self) -> None:
+        policy = RetryPolicy()
+        assert policy.is_retryable_exception("GET", requests.ConnectionError())
+        assert policy.is_retryable_exception("PUT", requests.ReadTimeout())
+
+    def test_post_only_retries_connect_timeout(self) -> None:
+        policy = RetryPolicy()
+        assert not policy.is_retryable_exception("POST", requests.ConnectionError())
+        assert not policy.is_retryable_exception("POST", requests.ReadTimeout())
+        assert policy.is_retryable_exception("POST", requests.ConnectTimeout())
@@ -0,0 +1,164 @@
+"""Tests for setup.api.singleflight and GET coalescing in the clients."""
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from setup.api.async_client import AsyncBoomiClient
+from setup.api.client import BoomiApiError, BoomiClient
+from setup.api.singleflight import SingleFlight
+from setup.api.transport import InMemoryTransport
+
+_URL = "https://api.boomi.com/partner/api/rest/v1/acct-1/Component/c-1"
+
+
+def _gated_transport(gate: threading.Event, reply: tuple = (200, {"items": [1]})) -> InMemoryTransport:
+    """GETs wait for ``gate`` before answering; other methods answer at once."""
+    def handler(method: str, url: str, data: object, headers: dict) -> tuple:
+        if method == "GET":
+            gate.wait(5)
+        return reply
+
+    return InMemoryTransport(handler)
+
+
+def _wait_for_calls(transport: InMemoryTransport, n: int) -> None:
+    for _ in range(500):
+        if len(transport.calls) >= n:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError(f"expected {n} calls, saw {len(transport.calls)}")
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self) -> None:
+        flight = SingleFlight()
+        gate = threading.Event()
+        calls: list[int] = []
+
+        def fn() -> dict:
+            calls.append(1)
+            gate.wait(5)
+            return {"ok": True}
+
+        with ThreadPoolExecutor(4) as pool:
+            futures = [pool.submit(flight.do, "k", fn) for _ in range(4)]
+            while flight.shared < 3:
+                threading.Event().wait(0.01)
+            gate.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert all(result == ({"ok": True}, True) for result in results)
+
+    def test_sequential_calls_run_again(self) -> None:
+        flight = SingleFlight()
+        calls: list[int] = []
+
+        assert flight.do("k", lambda: calls.append(1) or "a") == ("a", False)
+        assert flight.do("k", lambda: calls.append(1) or "b") == ("b", False)
+        assert len(calls) == 2
+
+    def test_error_reaches_every_caller(self) -> None:
+        flight = SingleFlight()
+        gate = threading.Event()
+
+        def fn() -> None:
+            gate.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(flight.do, "k", fn) for _ in range(2)]
+            while flight.shared < 1:
+                threading.Event().wait(0.01)
+            gate.set()
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result()
+
+
+class TestClientCoalescing:
+    def test_identical_gets_share_one_exchange(self) -> None:
+        gate = threading.Event()
+        transport = _gated_transport(gate)
+        client = BoomiClient(user="u", token="t", rate=1000, burst=100, transport=transport)
+
+        with ThreadPoolExecutor(3) as pool:
+            futures = [pool.submit(client.get, _URL) for _ in range(3)]
+            while client._inflight.shared < 2:
+                threading.Event().wait(0.01)
+            gate.set()
+            results = [f.result() for f in futures]
+
+        assert len(transport.calls) == 1
+        assert results == [{"items": [1]}] * 3
+        # Each caller gets its own copy to mutate
+        assert len({id(r) for r in results}) == 3
+
+    def test_different_credentials_not_coalesced(self) -> None:
+        gate = threading.Event()
+        transport = _gated_transport(gate)
+        client = BoomiClient(user="u", token="t", rate=1000, burst=100, transport=transport)
+        sibling = client.with_auth_header("Basic other")
+
+        with ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(client.get, _URL), pool.submit(sibling.get, _URL)]
+            _wait_for_calls(transport, 2)
+            gate.set()
+            [f.result() for f in futures]
+
+        assert len(transport.calls) == 2
+
+    def test_write_ends_coalescing_window(self) -> None:
+        gate = threading.Event()
+        transport = _gated_transport(gate)
+        client = BoomiClient(user="u", token="t", rate=1000, burst=100, transport=transport)
+
+        with ThreadPoolExecutor(2) as pool:
+            before = pool.submit(client.get, _URL)
+            _wait_for_calls(transport, 1)
+            client.post(_URL, data="<x/>")
+            after = pool.submit(client.get, _URL)
+            _wait_for_calls(transport, 3)
+            gate.set()
+            before.result(), after.result()
+
+        assert [c[0] for c in transport.calls] == ["GET", "POST", "GET"]
+
+    def test_shared_error_raised_to_all(self) -> None:
+        gate = threading.Event()
+        transport = _gated_transport(gate, reply=(404, "missing"))
+        client = BoomiClient(user="u", token="t", rate=1000, burst=100, transport=transport)
+
+        with ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(client.get, _URL) for _ in range(2)]
+            while client._inflight.shared < 1:
+                threading.Event().wait(0.01)
+            gate.set()
+            for future in futures:
+                with pytest.raises(BoomiApiError):
+                    future.result()
+        assert len(transport.calls) == 1
+
+
+class TestAsyncCoalescing:
+    def test_identical_gets_share_one_exchange(self) -> None:
+        transport = InMemoryTransport(lambda *args: (200, {"items": [1]}))
+        client = AsyncBoomiClient.from_client(
+            BoomiClient(user="u", token="t", rate=1000, burst=100, transport=transport)
+        )
+
+        async def run() -> list:
+            try:
+                return await asyncio.gather(*(client.get(_URL) for _ in range(5)))
+            finally:
+                await client.aclose()
+
+        results = asyncio.run(run())
+
+        assert len(transport.calls) == 1
+        assert results == [{"items": [1]}] * 5
+        assert len({id(r) for r in results}) == 5
@@ -170,3 +170,39 @@ class TestApiFirstDiscovery:
 
         reloaded = SetupState.load(path=state_path)
         assert reloaded.api_first_discovery["profile_template_xml"] == "<profile/>"
+
+
+class TestApiConcurrency:
+    def test_snapshot_persists_to_disk(self, tmp_path: Path) -> None:
+        state_path = tmp_path / "state.json"
+        state = SetupState.create(path=state_path)
+        assert state.api_concurrency == {}
+
+        state.set_api_concurrency({"api.boomi.com": {"window": 4.5, "throttled": 2}})
+
+        reloaded = SetupState.load(path=state_path)
+        assert reloaded.api_concurrency["hosts"]["api.boomi.com"]["window"] == 4.5
+        assert "recorded_at" in reloaded.api_concurrency
+
+
+class TestModelProgress:
+    def test_progress_merges_and_persists(self, tmp_path: Path) -> None:
+        state_path = tmp_path / "state.json"
+        state = SetupState.create(path=state_path)
+        assert state.get_model_progress("ComponentMapping") == {}
+
+        state.set_model_progress("ComponentMapping", model_id="m-1", stage="created")
+        state.set_model_progress("ComponentMapping", stage="deploying", deployment_id="d-1")
+
+        reloaded = SetupState.load(path=state_path)
+        assert reloaded.get_model_progress("ComponentMapping") == {
+            "model_id": "m-1", "stage": "deploying", "deployment_id": "d-1",
+        }
+
+    def test_old_state_files_are_backfilled(self, tmp_path: Path) -> None:
+        state_path = tmp_path / "state.json"
+        data = SetupState.create(path=state_path).data
+        del data["model_progress"]
+        state_path.write_text(json.dumps(data))
+
+        assert SetupState.load(path=state_path).data["model_progress"] == {}
@@ -0,0 +1,95 @@
+"""Tests for setup.api.stats — endpoint templates, histograms, ApiStats."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from setup.api.client import BoomiClient
+from setup.api.stats import ApiStats, LatencyHistogram, endpoint_template
+
+
+class TestEndpointTemplate:
+    @pytest.mark.parametrize("method, url, expected", [
+        (
+            "get",
+            "https://api.boomi.com/partner/api/rest/v1/acct-123456/Component/"
+            "0f8fad5b-d9cb-469f-a165-70867728950e?overrideAccount=x",
+            "GET /Component/{id}",
+        ),
+        (
+            "POST",
+            "https://api.boomi.com/partner/api/rest/v1/acct-123456/ComponentMetadata/query",
+            "POST /ComponentMetadata/query",
+        ),
+        (
+            "POST",
+            "https://c01-usa-east.hub.boomi.com/mdm/universes/"
+            "0f8fad5b-d9cb-469f-a165-70867728950e/records",
+            "POST /mdm/universes/{id}/records",
+        ),
+        (
+            "GET",
+            "https://api.boomi.com/mdm/api/rest/v1/acct-123456/models/m1234567/publish",
+            "GET /models/{id}/publish",
+        ),
+    ])
+    def test_ids_collapsed(self, method: str, url: str, expected: str) -> None:
+        assert endpoint_template(method, url) == expected
+
+
+class TestLatencyHistogram:
+    def test_percentiles(self) -> None:
+        hist = LatencyHistogram()
+        for ms in [10] * 90 + [100] * 9 + [1000]:
+            hist.add(ms)
+
+        assert hist.percentile(0.50) == pytest.approx(10, rel=0.26)
+        assert hist.percentile(0.95) == pytest.approx(100, rel=0.26)
+        assert hist.percentile(0.99) == pytest.approx(100, rel=0.26)
+        assert hist.percentile(1.0) == pytest.approx(1000, rel=0.26)
+
+    def test_empty(self) -> None:
+        assert LatencyHistogram().percentile(0.5) == 0.0
+
+
+class TestApiStats:
+    def test_take_returns_window_and_resets(self) -> None:
+        stats = ApiStats()
+        stats.record("GET", "https://api.boomi.com/a", 200, 10.0, bytes_in=100)
+        first = stats.take()
+        stats.record("GET", "https://api.boomi.com/a", 503, 20.0)
+        second = stats.take()
+
+        assert first["GET /a"]["count"] == 1
+        assert first["GET /a"]["bytes_in"] == 100
+        assert second["GET /a"]["errors"] == 1
+        assert second["GET /a"]["status"] == {"503": 1}
+        assert stats.snapshot()["GET /a"]["count"] == 2
+
+    def test_merge_snapshots(self) -> None:
+        a, b = ApiStats(), ApiStats()
+        a.record("GET", "https://api.boomi.com/a", 200, 10.0)
+        b.record("GET", "https://api.boomi.com/a", 200, 1000.0)
+        b.record("POST", "https://api.boomi.com/b", None, 5.0)
+
+        merged = ApiStats.merge_snapshots([a.snapshot(), b.snapshot()])
+
+        assert merged["GET /a"]["count"] == 2
+        assert merged["GET /a"]["total_ms"] == pytest.approx(1010.0)
+        assert merged["GET /a"]["p99_ms"] == pytest.approx(1000, rel=0.26)
+        assert merged["POST /b"]["status"] == {"error": 1}
+
+    def test_client_records_exchanges(self) -> None:
+        client = BoomiClient(user="u", token="t", rate=1000, burst=100)
+        resp = MagicMock(status_code=200, text="{}", headers={"Content-Type": "application/json"})
+        resp._content = b"{}"
+        resp.json.return_value = {}
+        client._transport.request = MagicMock(return_value=resp)
+
+        client.post("https://api.boomi.com/partner/api/rest/v1/acct-123456/Folder", data='{"a": 1}')
+
+        snap = client.stats.snapshot()["POST /Folder"]
+        assert snap["count"] == 1
+        assert snap["bytes_in"] == 2
+        assert snap["bytes_out"] == 8
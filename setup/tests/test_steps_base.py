@@ -0,0 +1,124 @@
+"""Tests for parallel component creation — PlatformApi.create_components and
+BaseStep._create_components."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from setup.api.client import BoomiApiError, BoomiClient
+from setup.api.platform_api import PlatformApi
+from setup.config import BoomiConfig
+from setup.engine import StepStatus, StepType
+from setup.state import SetupState
+from setup.steps.base import BaseStep
+
+
+def _response(status_code: int, text: str) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.text = text
+    resp.headers = {"Content-Type": "application/xml"}
+    return resp
+
+
+# Request body -> canned response: one success, one API failure, one reply without an ID
+_RESPONSES = {
+    "<op-a/>": _response(200, '<bns:Component componentId="id-a" name="A"/>'),
+    "<op-b/>": _response(400, "<error>bad template</error>"),
+    "<op-c/>": _response(200, '<bns:Component name="C"/>'),
+}
+
+
+def _platform_api(config: BoomiConfig, max_workers: int = 4) -> PlatformApi:
+    client = BoomiClient(user="u", token="t", rate=1000, burst=100, max_workers=max_workers)
+    client._transport.request = MagicMock(
+        side_effect=lambda method, url, data=None, **kw: _RESPONSES[data]
+    )
+    return PlatformApi(client, config)
+
+
+class _CreateStep(BaseStep):
+    @property
+    def step_id(self) -> str:
+        return "9.9"
+
+    @property
+    def name(self) -> str:
+        return "Create Test Components"
+
+    @property
+    def step_type(self) -> StepType:
+        return StepType.AUTO
+
+    def execute(self, state: SetupState, dry_run: bool = False) -> StepStatus:
+        return StepStatus.COMPLETED
+
+
+class TestCreateComponents:
+    def test_results_keep_input_order(self, mock_config: BoomiConfig) -> None:
+        api = _platform_api(mock_config)
+
+        results = api.create_components(["<op-a/>", "<op-b/>", "<op-c/>"])
+
+        assert api.parse_component_id(results[0]) == "id-a"
+        assert isinstance(results[1], BoomiApiError)
+        assert results[1].status_code == 400
+        assert api.parse_component_id(results[2]) == ""
+
+    def test_single_worker_runs_inline(self, mock_config: BoomiConfig) -> None:
+        api = _platform_api(mock_config, max_workers=1)
+
+        results = api.create_components(["<op-b/>", "<op-a/>"])
+
+        assert isinstance(results[0], BoomiApiError)
+        assert api.parse_component_id(results[1]) == "id-a"
+
+
+class TestBaseStepCreateComponents:
+    def test_mixed_results_record_only_successes(
+        self, mock_config: BoomiConfig, mock_state: SetupState
+    ) -> None:
+        step = _CreateStep(mock_config, platform_api=_platform_api(mock_config))
+        items = [
+            ("Op A", "HTTP Op A", "<op-a/>"),
+            ("Op B", "HTTP Op B", "<op-b/>"),
+            ("Op C", "HTTP Op C", "<op-c/>"),
+        ]
+
+        ok = step._create_components(mock_state, "9.9_create", "http_operations", items)
+
+        assert ok is False
+        assert mock_state.data["steps"]["9.9_create"]["completed_items"] == ["Op A"]
+        assert mock_state.get_component_id("http_operations", "Op A") == "id-a"
+        assert mock_state.get_component_id("http_operations", "Op B") is None
+        assert mock_state.get_component_id("http_operations", "Op C") is None
+        assert mock_state.get_remaining_items("9.9_create", ["Op A", "Op B", "Op C"]) == [
+            "Op B", "Op C",
+        ]
+
+    def test_all_success_returns_true_and_persists(
+        self, mock_config: BoomiConfig, mock_state: SetupState
+    ) -> None:
+        step = _CreateStep(mock_config, platform_api=_platform_api(mock_config))
+
+        ok = step._create_components(
+            mock_state, "9.9_create", "http_operations", [("Op A", "HTTP Op A", "<op-a/>")],
+        )
+
+        assert ok is True
+        reloaded = SetupState.load(mock_state.path)
+        assert reloaded.get_component_id("http_operations", "Op A") == "id-a"
+        assert reloaded.data["steps"]["9.9_create"]["completed_items"] == ["Op A"]
+
+    def test_unparseable_item_fails_alone(
+        self, mock_config: BoomiConfig, mock_state: SetupState
+    ) -> None:
+        platform_api = _platform_api(mock_config)
+        step = _CreateStep(mock_config, platform_api=platform_api)
+        items = [("Op X", "HTTP Op X", "<op-x"), ("Op A", "HTTP Op A", "<op-a/>")]
+
+        ok = step._create_components(mock_state, "9.9_create", "http_operations", items)
+
+        assert ok is False
+        assert mock_state.get_component_id("http_operations", "Op A") == "id-a"
+        assert mock_state.get_remaining_items("9.9_create", ["Op X", "Op A"]) == ["Op X"]
+        assert platform_api._client._transport.request.call_count == 1
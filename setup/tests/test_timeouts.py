@@ -0,0 +1,153 @@
+"""Tests for setup.api.timeouts and hedged GETs in BoomiClient."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from setup.api.async_client import AsyncBoomiClient
+from setup.api.client import BoomiApiError, BoomiClient
+from setup.api.stats import ApiStats
+from setup.api.timeouts import AdaptiveTimeouts
+from setup.api.transport import InMemoryTransport, make_response
+
+_URL = "https://api.boomi.com/partner/api/rest/v1/acct-123456/Branch/0f8fad5b-d9cb-469f-a165-70867728950e"
+
+
+def _prime(stats: ApiStats, ms: float, n: int = 20, url: str = _URL) -> None:
+    for _ in range(n):
+        stats.record("GET", url, 200, ms)
+
+
+class TestAdaptiveTimeouts:
+    def test_default_until_enough_samples(self) -> None:
+        stats = ApiStats()
+        timeouts = AdaptiveTimeouts(stats, default=60.0, min_samples=20)
+        _prime(stats, 2000.0, n=19)
+
+        assert timeouts.read_timeout("GET", _URL) == 60.0
+        assert timeouts.hedge_delay("GET", _URL) is None
+
+    def test_scales_with_p99_within_bounds(self) -> None:
+        stats = ApiStats()
+        timeouts = AdaptiveTimeouts(stats, floor=5.0, ceiling=120.0, multiplier=4.0)
+
+        _prime(stats, 10.0)
+        assert timeouts.read_timeout("GET", _URL) == 5.0
+
+        other = _URL.replace("Branch", "MergeRequest")
+        _prime(stats, 3000.0, url=other)
+        assert 12.0 <= timeouts.read_timeout("GET", other) <= 16.0
+
+        _prime(stats, 60000.0, n=200)
+        assert timeouts.read_timeout("GET", _URL) == 120.0
+
+    def test_hedge_delay_is_p95(self) -> None:
+        stats = ApiStats()
+        _prime(stats, 100.0)
+
+        delay = AdaptiveTimeouts(stats).hedge_delay("GET", _URL)
+
+        assert delay is not None and 0.1 <= delay <= 0.13
+
+    def test_floor_above_ceiling_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            AdaptiveTimeouts(ApiStats(), floor=10.0, ceiling=5.0)
+
+
+class TestClientTimeouts:
+    def test_adaptive_timeout_sent_with_request(self) -> None:
+        transport = MagicMock()
+        transport.request.return_value = make_response(200, {})
+        client = BoomiClient(user="u", token="t", transport=transport, max_timeout=30.0)
+
+        client.get(_URL)
+        client.get(_URL, timeout=3)
+
+        timeouts = [c.kwargs["timeout"] for c in transport.request.call_args_list]
+        assert timeouts == [(10.0, 30.0), 3]
+
+
+def _racing_transport(slow_reply: tuple, fast_reply: tuple) -> InMemoryTransport:
+    """First call stalls until the second (the hedge) has answered, then a bit longer."""
+    answered = threading.Event()
+    lock = threading.Lock()
+    count = [0]
+
+    def handler(method: str, url: str, data: object, headers: dict) -> tuple:
+        with lock:
+            count[0] += 1
+            n = count[0]
+        if n == 1:
+            answered.wait(5)
+            # Let the hedge's reply land first rather than in the same wakeup
+            time.sleep(0.1)
+            return slow_reply
+        answered.set()
+        return fast_reply
+
+    return InMemoryTransport(handler)
+
+
+def _hedging_client(transport: InMemoryTransport, hedge: bool = True) -> BoomiClient:
+    client = BoomiClient(
+        user="u", token="t", rate=1000, burst=100, transport=transport, hedge=hedge,
+    )
+    _prime(client.stats, 5.0)
+    return client
+
+
+class TestHedgedGet:
+    def test_hedge_beats_stalled_primary(self) -> None:
+        transport = _racing_transport((200, {"from": "primary"}), (200, {"from": "hedge"}))
+        client = _hedging_client(transport)
+
+        try:
+            assert client.get(_URL, hedge=True) == {"from": "hedge"}
+        finally:
+            client.close()
+        assert len(transport.calls) == 2
+
+    def test_failed_copy_falls_back_to_other(self) -> None:
+        transport = _racing_transport((200, {"from": "primary"}), (404, "gone"))
+        client = _hedging_client(transport)
+
+        try:
+            assert client.get(_URL, hedge=True) == {"from": "primary"}
+        finally:
+            client.close()
+
+    def test_both_copies_failing_raises(self) -> None:
+        transport = _racing_transport((404, "gone"), (404, "gone"))
+        client = _hedging_client(transport)
+
+        try:
+            with pytest.raises(BoomiApiError):
+                client.get(_URL, hedge=True)
+        finally:
+            client.close()
+
+    def test_not_hedged_unless_enabled_and_requested(self) -> None:
+        transport = InMemoryTransport(lambda *args: (200, {}))
+        client = _hedging_client(transport, hedge=False)
+        client.get(_URL, hedge=True)
+
+        hedging = _hedging_client(transport)
+        hedging.get(_URL)
+
+        assert len(transport.calls) == 2
+
+    def test_async_hedge_beats_stalled_primary(self) -> None:
+        transport = _racing_transport((200, {"from": "primary"}), (200, {"from": "hedge"}))
+        client = AsyncBoomiClient.from_client(_hedging_client(transport))
+
+        async def run() -> dict | str:
+            try:
+                return await client.get(_URL, hedge=True)
+            finally:
+                await client.aclose()
+
+        assert asyncio.run(run()) == {"from": "hedge"}
@@ -0,0 +1,117 @@
+"""Tests for setup.api.transport — pluggable HTTP layer under BoomiClient."""
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import requests
+
+from setup.api.cassette import Cassette
+from setup.api.client import BoomiClient
+from setup.api.platform_api import PlatformApi
+from setup.api.transport import InMemoryTransport, RequestsTransport, make_response
+from setup.config import BoomiConfig
+from setup.scripts.fake_boomi_server import FakeBoomi
+
+
+def _client(transport: object, **kw: object) -> BoomiClient:
+    return BoomiClient(user="u", token="t", rate=1000, burst=100, transport=transport, **kw)
+
+
+class TestMakeResponse:
+    def test_dict_body_is_json(self) -> None:
+        resp = make_response(201, {"id": "c-1"}, {"ETag": '"v1"'})
+
+        assert isinstance(resp, requests.Response)
+        assert resp.json() == {"id": "c-1"}
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.headers["ETag"] == '"v1"'
+
+
+class TestInMemoryTransport:
+    def test_client_stack_runs_over_handler(self) -> None:
+        transport = InMemoryTransport(lambda method, url, data, headers: (200, {"url": url}))
+        client = _client(transport)
+
+        assert client.get("https://api.boomi.com/a") == {"url": "https://api.boomi.com/a"}
+        method, url, data, headers = transport.calls[0]
+        assert (method, url, data) == ("GET", "https://api.boomi.com/a", None)
+        assert headers["Authorization"] == client._auth_header
+        assert headers["Accept"] == "application/json"
+        assert sum(s["count"] for s in client.stats.snapshot().values()) == 1
+
+    def test_retries_through_transport(self) -> None:
+        replies = iter([(503, "busy", {"Retry-After": "0"}), (200, "<ok/>")])
+        transport = InMemoryTransport(lambda *args: next(replies))
+        client = _client(transport)
+
+        assert client.get("https://api.boomi.com/a", accept_xml=True) == "<ok/>"
+        assert len(transport.calls) == 2
+
+    def test_siblings_share_transport_with_own_credentials(self) -> None:
+        transport = InMemoryTransport(lambda *args: (200, {}))
+        client = _client(transport)
+        sibling = client.with_auth_header("Basic other")
+
+        client.get("https://api.boomi.com/a")
+        sibling.get("https://hub.boomi.com/b")
+
+        assert sibling._transport is client._transport
+        assert [c[3]["Authorization"] for c in transport.calls] == [
+            client._auth_header, "Basic other",
+        ]
+
+    def test_raw_request_headers_override_auth(self) -> None:
+        transport = InMemoryTransport(lambda *args: (401, ""))
+        client = _client(transport)
+
+        resp = client.raw_request("POST", "https://hub.boomi.com/probe", headers={"Authorization": "Basic x"})
+
+        assert resp.status_code == 401
+        assert transport.calls[0][3]["Authorization"] == "Basic x"
+
+    def test_cassette_records_over_transport(self, tmp_path: Path) -> None:
+        cassette = Cassette.record(tmp_path / "run.cassette.json.gz")
+        client = _client(InMemoryTransport(lambda *args: (200, {"ok": True})), cassette=cassette)
+
+        client.get("https://api.boomi.com/a")
+
+        assert len(cassette) == 1
+
+
+class TestTransportOwnership:
+    def test_caller_transport_left_open(self) -> None:
+        transport = MagicMock()
+        client = _client(transport)
+
+        client.with_auth_header("Basic other").close()
+        client.close()
+
+        transport.close.assert_not_called()
+
+    def test_default_transport_closed_by_owner_only(self) -> None:
+        client = BoomiClient(user="u", token="t")
+        assert isinstance(client._transport, RequestsTransport)
+        client._transport.close = MagicMock()
+
+        client.with_auth_header("Basic other").close()
+        client._transport.close.assert_not_called()
+        client.close()
+        client._transport.close.assert_called_once()
+
+
+class TestFakeBoomiTransport:
+    def test_platform_api_against_fake_in_process(self) -> None:
+        config = BoomiConfig(
+            boomi_account_id="acct-1", cloud_base_url="https://fake.boomi.local",
+            boomi_user="u", boomi_token="t",
+        )
+        fake = FakeBoomi()
+        platform = PlatformApi(_client(fake.transport()), config)
+
+        created = platform.create_component(
+            '<bns:Component xmlns:bns="http://api.platform.boomi.com/" name="X" type="process"/>'
+        )
+
+        assert "componentId=" in created
+        assert len(fake.components) == 1
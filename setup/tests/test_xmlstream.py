@@ -0,0 +1,154 @@
+"""Tests for setup.api.xmlstream and streamed XML responses."""
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from unittest.mock import patch
+
+from setup.api.cache import ResponseCache
+from setup.api.client import BoomiClient
+from setup.api.datahub_api import DataHubApi
+from setup.api.transport import InMemoryTransport, make_response
+from setup.api.xmlstream import child_text, iter_elements
+from setup.config import BoomiConfig
+from setup.scripts.fake_boomi_server import FakeBoomi
+
+_RECORDS = (
+    '<RecordQueryResponse resultCount="3" totalCount="3" offsetToken="tok-1">'
+    + "".join(
+        f'<Record recordId="r-{i}"><Fields><CM><DEV_COMPONENT_ID>d-{i}</DEV_COMPONENT_ID></CM></Fields></Record>'
+        for i in range(3)
+    )
+    + "</RecordQueryResponse>"
+)
+
+
+class _TrickleReader(io.RawIOBase):
+    """Byte source that hands out small chunks and remembers how far it got."""
+
+    def __init__(self, data: bytes, chunk: int = 64) -> None:
+        self._data = data
+        self._chunk = chunk
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        size = self._chunk if size < 0 else min(size, self._chunk)
+        piece = self._data[self.position:self.position + size]
+        self.position += len(piece)
+        return piece
+
+
+def _client(transport: InMemoryTransport, **kw: object) -> BoomiClient:
+    return BoomiClient(user="u", token="t", rate=1000, burst=100, transport=transport, **kw)
+
+
+class TestIterElements:
+    def test_yields_matching_elements_and_root_attributes(self) -> None:
+        root: dict[str, str] = {}
+        ids = []
+        for record in iter_elements(io.BytesIO(_RECORDS.encode()), "Record", root):
+            ids.append((record.get("recordId"), record.find(".//DEV_COMPONENT_ID").text))
+
+        assert ids == [("r-0", "d-0"), ("r-1", "d-1"), ("r-2", "d-2")]
+        assert root["offsetToken"] == "tok-1"
+
+    def test_namespaces_ignored_and_child_text(self) -> None:
+        xml = (
+            '<mdm:Models xmlns:mdm="http://mdm.api.platform.boomi.com/">'
+            "<mdm:Model><mdm:id>m-1</mdm:id><mdm:name>CM</mdm:name></mdm:Model></mdm:Models>"
+        )
+        model = next(iter_elements(io.BytesIO(xml.encode()), "Model"))
+
+        assert child_text(model, "id") == "m-1"
+        assert child_text(model, "missing") == ""
+
+    def test_parses_incrementally_and_detaches(self) -> None:
+        source = _TrickleReader(_RECORDS.encode())
+        records = iter_elements(source, "Record")
+
+        first = next(records)
+        assert source.position < len(_RECORDS)
+        held = [first]
+        held.extend(records)
+        # Every yielded element was cleared once the iterator moved on
+        assert all(len(el) == 0 and not el.attrib for el in held)
+
+
+class TestStreamXml:
+    def test_streams_post_response(self) -> None:
+        transport = InMemoryTransport(lambda *args: (200, _RECORDS, {"Content-Type": "application/xml"}))
+        client = _client(transport)
+
+        ids = [r.get("recordId") for r in client.stream_xml(
+            "https://hub.boomi.com/mdm/universes/u-1/records/query", "Record",
+            method="POST", data="<RecordQueryRequest/>",
+        )]
+
+        assert ids == ["r-0", "r-1", "r-2"]
+        method, _, data, headers = transport.calls[0]
+        assert (method, data) == ("POST", "<RecordQueryRequest/>")
+        assert headers["Accept"] == "application/xml"
+
+    @patch("setup.api.client.time.sleep")
+    def test_retries_before_yielding(self, mock_sleep: object) -> None:
+        replies = iter([(503, "busy"), (200, _RECORDS)])
+        transport = InMemoryTransport(lambda *args: next(replies))
+
+        records = list(_client(transport).stream_xml("https://hub.boomi.com/q", "Record"))
+
+        assert len(records) == 3
+        assert len(transport.calls) == 2
+
+    @patch("setup.api.client.time.sleep")
+    def test_stats_count_the_streamed_body(self, mock_sleep: object) -> None:
+        def unread(status: int, body: str) -> object:
+            resp = make_response(status, body)
+            resp._content = False  # like a real stream=True response before the read
+            return resp
+
+        replies = iter([unread(503, "busy"), unread(200, _RECORDS)])
+        client = _client(InMemoryTransport(lambda *args: next(replies)))
+
+        records = client.stream_xml("https://hub.boomi.com/q", "Record")
+        next(records)
+        # The 200 is recorded once its body has been read, not when the headers arrive
+        assert client.stats.snapshot()["GET /q"]["status"] == {"503": 1}
+        list(records)
+
+        stats = client.stats.snapshot()["GET /q"]
+        assert stats["status"] == {"503": 1, "200": 1}
+        assert stats["bytes_in"] == len(_RECORDS)
+        assert stats["wire_in"] == len(_RECORDS)
+
+    def test_cached_get_served_from_cache(self, tmp_path: Path) -> None:
+        transport = InMemoryTransport(lambda *args: (200, _RECORDS, {"Content-Type": "application/xml"}))
+        client = _client(transport, cache=ResponseCache(tmp_path / "c.sqlite", ttl=60))
+
+        for _ in range(2):
+            assert len(list(client.stream_xml("https://hub.boomi.com/q", "Record", cache=True))) == 3
+
+        assert len(transport.calls) == 1
+
+
+class TestDataHubStreaming:
+    def test_list_models_and_clouds_against_fake(self) -> None:
+        config = BoomiConfig(
+            boomi_account_id="acct-1", cloud_base_url="https://fake.boomi.local",
+            boomi_user="u", boomi_token="t",
+        )
+        fake = FakeBoomi()
+        api = DataHubApi(_client(fake.transport()), config)
+        api.create_model({"modelName": "ComponentMapping", "fields": []})
+
+        assert [m["name"] for m in api.list_models()] == ["ComponentMapping"]
+        assert api.get_hub_clouds()[0]["cloudId"] == "fake-cloud"
+
+    def test_malformed_models_xml_yields_empty_list(self) -> None:
+        config = BoomiConfig(boomi_account_id="acct-1", boomi_user="u", boomi_token="t")
+        transport = InMemoryTransport(lambda *args: (200, "<Models><Model id='m-1'", {}))
+        api = DataHubApi(_client(transport), config)
+
+        assert api.list_models() == []